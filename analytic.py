@@ -0,0 +1,646 @@
+import numpy as np
+import sympy
+from scipy.special import erfc as scipy_erfc, gamma as gamma_fn
+
+from distributions import DISTRIBUTIONS
+from voting import is_voting, at_least_k_survival
+
+_t_sym = sympy.symbols("t", positive=True)
+_LAMBDIFY_MODULES = ["numpy", {"exp": np.exp, "log": np.log, "sqrt": np.sqrt, "erfc": scipy_erfc}]
+
+
+# =========================================================
+# 1) Tek bileşen için sayısal R(t) eğrisi
+# =========================================================
+def component_rt(data, t_grid):
+    t_grid = np.asarray(t_grid, dtype=float)
+
+    if data["dist"] == "static":
+        return np.ones_like(t_grid) * data["R"]
+
+    # k-out-of-n kapısı: üye eğrileri üzerinde Poisson-binomial DP
+    if is_voting(data):
+        members = [component_rt(m, t_grid) for m in data["members"].values()]
+        return at_least_k_survival(members, data["k"])
+
+    conf = DISTRIBUTIONS[data["dist"]]
+
+    # Sayısal (numpy) form varsa doğrudan kullanılır; lambdify sadece
+    # R_num tanımlanmamış sembolik dağılımlar için yedek yoldur
+    with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+        if "R_num" in conf:
+            rt = conf["R_num"](t_grid, data["params"])
+        elif conf.get("R_sym") is not None:
+            f = sympy.lambdify(_t_sym, conf["R_sym"](_t_sym, data["params"]), _LAMBDIFY_MODULES)
+            rt = f(t_grid)
+        else:
+            rt = np.ones_like(t_grid)
+
+    rt = np.asarray(rt, dtype=float) * np.ones_like(t_grid)
+    return np.nan_to_num(rt, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def survival_at_infinity(data):
+    # lim_{t→∞} R(t): statik R, kapıda üyelerin limitleri üzerinden DP
+    if data["dist"] == "static":
+        return float(data["R"])
+    if is_voting(data):
+        members = [survival_at_infinity(m) for m in data["members"].values()]
+        return float(at_least_k_survival(np.array(members), data["k"]))
+    return 0.0
+
+
+def component_mean(data):
+    # Kuadratür ölçeği için ortalama ömür (yoksa None)
+    if data["dist"] == "static":
+        return None
+    if is_voting(data):
+        means = [component_mean(m) for m in data["members"].values()]
+        means = [m for m in means if m is not None]
+        return float(np.median(means)) if means else None
+
+    mean_fn = DISTRIBUTIONS[data["dist"]].get("mean")
+    if mean_fn is None:
+        return None
+    m = float(mean_fn(data["params"]))
+    return m if np.isfinite(m) and m > 0 else None
+
+
+def component_descriptor(data):
+    # Dağılım + parametre anahtarı: aynı tanımlayıcı = aynı R(t) eğrisi
+    if data["dist"] == "static":
+        return ("static", float(data["R"]))
+    if is_voting(data):
+        return (data["dist"], int(data["k"]), tuple(
+            (m, component_descriptor(md)) for m, md in sorted(data["members"].items())
+        ))
+    return (data["dist"], tuple(sorted((k, float(v)) for k, v in data["params"].items())))
+
+
+# =========================================================
+# 2) Tüm bileşenler için R(t) (opsiyonel β-faktör CCF karışımı)
+#    ccf = (beta, R_ccf(t)) -> (1-β)·R_i + β·R_ccf
+#    Özdeş bileşenler (aynı dağılım + parametre) tek kez hesaplanır;
+#    dönen sözlükte aynı dizi paylaşılır (yerinde değiştirmeyin).
+# =========================================================
+def component_rt_curves(components, t_grid, ccf=None):
+    curves = {}
+    distinct = {}
+
+    for cname, data in components.items():
+        key = component_descriptor(data)
+
+        if key not in distinct:
+            rt = component_rt(data, t_grid)
+
+            if ccf is not None:
+                beta, R_ccf = ccf
+                rt = (1 - beta) * rt + beta * R_ccf
+
+            distinct[key] = rt
+
+        curves[cname] = distinct[key]
+
+    return curves
+
+
+# =========================================================
+# 3) Yol (minimal path) R(t) eğrileri
+# =========================================================
+def path_rt_curves(component_paths, comp_curves, t_grid):
+    path_rts = []
+
+    for pset in component_paths:
+        rt_path = np.ones_like(np.asarray(t_grid, dtype=float))
+        for cname in pset:
+            rt_path = rt_path * comp_curves[cname]
+        path_rts.append(rt_path)
+
+    return path_rts
+
+
+# =========================================================
+# 4) Yol kümelerini bit maskesine çevir
+#    names[i] <-> bit i,  path_masks[j] = P_j'deki bileşenlerin maskesi
+# =========================================================
+def path_bitmasks(component_paths):
+    names = sorted({c for pset in component_paths for c in pset})
+    index = {c: i for i, c in enumerate(names)}
+
+    path_masks = []
+    for pset in component_paths:
+        mask = 0
+        for c in pset:
+            mask |= 1 << index[c]
+        path_masks.append(mask)
+
+    return names, path_masks
+
+
+# =========================================================
+# 5) Inclusion–Exclusion terimlerini birleşim kümesine göre topla
+#    R = Σ_J (-1)^{|J|+1} Π_{c ∈ U_J} R_c  ->  {U: katsayı}
+#
+#    max_level=None: tam açılım, yollar tek tek eklenerek
+#    (terms ∪ {p} ∪ {u|p}) aynı birleşimler anında birleştirilir.
+#    max_level=k: sadece |J| ≤ k olan terimler (Bonferroni kısmi toplamı).
+#    progress(done, total): eklenen yol sayısı; iptal için istisna
+#    fırlatabilir.
+# =========================================================
+def union_coefficients(path_masks, max_level=None, progress=None):
+    if max_level is not None and max_level < len(path_masks):
+        coefs = {}
+        for k, counts in enumerate(union_level_counts(path_masks, max_level, progress=progress), 1):
+            sign = (-1) ** (k + 1)
+            for mask, n in counts.items():
+                coefs[mask] = coefs.get(mask, 0) + sign * n
+        return {m: c for m, c in coefs.items() if c != 0}
+
+    coefs = {}
+    for i, p in enumerate(path_masks):
+        if progress is not None:
+            progress(i, len(path_masks))
+        new = dict(coefs)
+        new[p] = new.get(p, 0) + 1
+        for u, c in coefs.items():
+            up = u | p
+            new[up] = new.get(up, 0) - c
+        coefs = {m: c for m, c in new.items() if c != 0}
+
+    return coefs
+
+
+# =========================================================
+# 5b) Seviye seviye birleşim sayıları (Bonferroni için)
+#    levels[k-1] = {U: |J|=k olup ∪_{j∈J} P_j = U olan J sayısı}
+#    -> S_k = Σ_U levels[k-1][U] · P(∩ U)
+#    Kombinasyonlar tek tek gezilmez: yollar sırayla eklenir ve
+#    k'lı birleşimler (k-1)'lilerden türetilir; aynı birleşime düşen
+#    kombinasyonlar sayı olarak birleşir. max_unions: tablo boyutu
+#    sınırı, aşılırsa None.
+# =========================================================
+def union_level_counts(path_masks, max_level, max_unions=None, progress=None):
+    levels = [{} for _ in range(max_level)]
+
+    for i, p in enumerate(path_masks):
+        if progress is not None:
+            progress(i, len(path_masks))
+        # büyük k önce: (k-1)'liler bu yol eklenmeden okunur
+        for k in range(min(i, max_level - 1), 0, -1):
+            dst = levels[k]
+            for u, c in levels[k - 1].items():
+                up = u | p
+                dst[up] = dst.get(up, 0) + c
+        levels[0][p] = levels[0].get(p, 0) + 1
+
+        # tablo sınırı aşıldı -> None (çağıran daha düşük seviyede kalır)
+        if max_unions is not None and sum(len(d) for d in levels) > max_unions:
+            return None
+
+    return levels
+
+
+def _mask_rows(mask, n_bits):
+    return [i for i in range(n_bits) if (mask >> i) & 1]
+
+
+# =========================================================
+# 6) Inclusion–Exclusion, seviye seviye (k = 1, 2, 3 ...)
+#    S_k = Σ_{|J|=k} P(∩_{j∈J} P_j),   P(∩) = Π_{c ∈ ∪ P_j} R_c(t)
+#
+#    Bonferroni: tek k'daki kısmi toplam üst sınır, çift k'daki
+#    kısmi toplam alt sınırdır. Bant genişliği (üst - alt) tüm zaman
+#    gridinde tol'un altına indiğinde ya da terim bütçesi (max_terms,
+#    hesaplanan farklı birleşim sayısı) bir sonraki seviyeye
+#    yetmediğinde durulur. k=1 bütçe ne olursa olsun hesaplanır.
+#
+#    tol=None ve max_terms=None -> tam (2^P - 1 terimli) açılım.
+#    term_factor(mask): birleşim terimine çarpan (ör. CCF şok koşulu,
+#    bileşenler bağımsız değilken P(∩) düzeltmesi).
+#    progress(terms, total_terms): uzun açılımda ara bildirim (iptal
+#    için istisna fırlatabilir); build_progress(yol, yol sayısı):
+#    birleşim katsayılarının / seviye sayılarının kurulumu sırasında.
+# =========================================================
+IE_PROGRESS_EVERY = 4096
+IE_MAX_LEVEL_UNIONS = 2 ** 22      # kesik açılımda seviye sayısı tablosu sınırı
+IE_MAX_PRODUCT_ELEMS = 2 ** 25     # saklanan birleşim çarpımları (birleşim × grid)
+
+
+def inclusion_exclusion(component_paths, comp_curves, t_grid, tol=None, max_terms=None, term_factor=None,
+                        progress=None, build_progress=None):
+    t_grid = np.asarray(t_grid, dtype=float)
+    n_paths = len(component_paths)
+
+    names, path_masks = path_bitmasks(component_paths)
+    curve_mat = np.vstack([comp_curves[c] for c in names]) if names else np.ones((0, t_grid.size))
+
+    # Tam açılım: aynı birleşimler toplanır, her biri bir kez çarpılır
+    def full_expansion(unions):
+        system_r = np.zeros_like(t_grid)
+        for i, (mask, coef) in enumerate(unions.items(), 1):
+            prod = np.prod(curve_mat[_mask_rows(mask, len(names))], axis=0)
+            if term_factor is not None:
+                prod = prod * term_factor(mask)
+            system_r += coef * prod
+            if progress is not None and i % IE_PROGRESS_EVERY == 0:
+                progress(i, len(unions))
+
+        system_r = np.clip(system_r, 0.0, 1.0)
+        return {
+            "system_r": np.nan_to_num(system_r, nan=0.0, posinf=0.0, neginf=0.0),
+            "r_lower": system_r,
+            "r_upper": system_r,
+            "levels": n_paths,
+            # Değerlendirilen (birleştirilmiş) birleşim sayısı; 2^P - 1 değil
+            "terms": len(unions),
+            "total_terms": len(unions),
+            "gap": 0.0,
+            "converged": True,
+        }
+
+    if tol is None and max_terms is None:
+        return full_expansion(union_coefficients(path_masks, progress=build_progress))
+
+    # Kesik açılım: seviye sayıları (bkz. 5b) k=1 ile başlar, yetmezse
+    # tavan ikiye katlanarak yeniden kurulur; her birleşim çarpımı bir kez
+    # hesaplanır ve seviyeler arasında paylaşılır
+    n_bits = len(names)
+    log_curves = np.log(np.clip(curve_mat, 1e-300, None))
+    products = {}
+
+    def level_sum(counts):
+        masks = list(counts)
+        s_k = np.zeros_like(t_grid)
+        for lo in range(0, len(masks), IE_PROGRESS_EVERY):
+            chunk = masks[lo:lo + IE_PROGRESS_EVERY]
+            new = [m for m in chunk if m not in products]
+            if new:
+                M = np.zeros((len(new), n_bits))
+                for r, m in enumerate(new):
+                    M[r, _mask_rows(m, n_bits)] = 1.0
+                for m, prod in zip(new, np.exp(M @ log_curves)):
+                    products[m] = prod * term_factor(m) if term_factor is not None else prod
+            weights = np.array([counts[m] for m in chunk], dtype=float)
+            s_k += weights @ np.vstack([products[m] for m in chunk])
+            if progress is not None:
+                progress(len(products), 2 ** n_paths - 1)
+        return s_k
+
+    # Bellek sınırı: saklanan çarpımlar bütçeyi max_terms verilmese de sınırlar
+    budget = IE_MAX_PRODUCT_ELEMS // max(t_grid.size, 1)
+    if max_terms is not None:
+        budget = min(budget, max_terms)
+
+    cap = 1
+    levels = union_level_counts(path_masks, cap)
+
+    partial = np.zeros_like(t_grid)
+    lower = np.zeros_like(t_grid)
+    upper = np.ones_like(t_grid)
+    level = 0
+
+    for k in range(1, n_paths + 1):
+        if k > cap:
+            cap = min(n_paths, 2 * cap)
+            # Son seviyelere kadar gidilecekse ya da son seviye neredeyse hiç
+            # yeni birleşim getirmediyse (birleşimler doymuş) birleştirilmiş
+            # tam açılım hem daha ucuz hem de büyük seviye toplamlarındaki
+            # sayısal sadeleşmeden (Σ ±C(P, k)·Π) etkilenmez
+            if cap == n_paths or 10 * n_new <= len(counts):
+                unions = union_coefficients(path_masks, progress=build_progress)
+                if len(products.keys() | unions.keys()) <= budget:
+                    return full_expansion(unions)
+                if cap == n_paths:
+                    break
+            levels = union_level_counts(
+                path_masks, cap, max_unions=IE_MAX_LEVEL_UNIONS, progress=build_progress
+            )
+            if levels is None:
+                break
+        counts = levels[k - 1]
+
+        # k=1 bütçeden bağımsız: geçerli bir bant için en az S_1 gerekir
+        n_new = sum(1 for m in counts if m not in products)
+        if k > 1 and len(products) + n_new > budget:
+            break
+
+        s_k = level_sum(counts)
+        level = k
+        partial = partial + ((-1) ** (k + 1)) * s_k
+
+        if k == 1:
+            # P(∪) ≥ max_j P(P_j) -> başlangıç için daha sıkı alt sınır
+            lower = np.max(np.vstack([products[m] for m in path_masks]), axis=0)
+
+        if k % 2 == 1:
+            upper = np.minimum(upper, partial)
+        else:
+            lower = np.maximum(lower, partial)
+
+        if k == n_paths:
+            lower = upper = partial
+            break
+
+        gap = float(np.max(np.clip(upper, 0.0, 1.0) - np.clip(lower, 0.0, 1.0))) if t_grid.size else 0.0
+        if tol is not None and gap < tol:
+            break
+
+    lower = np.clip(lower, 0.0, 1.0)
+    upper = np.clip(upper, 0.0, 1.0)
+    upper = np.maximum(upper, lower)
+    gap = float(np.max(upper - lower)) if t_grid.size else 0.0
+
+    if level == n_paths:
+        system_r = np.clip(partial, 0.0, 1.0)
+    else:
+        system_r = 0.5 * (lower + upper)
+
+    return {
+        "system_r": np.nan_to_num(system_r, nan=0.0, posinf=0.0, neginf=0.0),
+        "r_lower": lower,
+        "r_upper": upper,
+        "levels": level,
+        # Değerlendirilen (birleştirilmiş) birleşim sayısı / tam açılımın
+        # (birleştirilmemiş) terim sayısı
+        "terms": len(products),
+        "total_terms": 2 ** n_paths - 1,
+        "gap": gap,
+        "converged": level == n_paths or (tol is not None and gap < tol),
+    }
+
+
+# =========================================================
+# 7) Weibull ailesi: R(t) = exp(-(t/η)^β)  ->  (β, η)
+#    Exponential: β=1, η=1/λ     Rayleigh: β=2, η=σ√2
+# =========================================================
+def weibull_form(data):
+    dist = data["dist"]
+    p = data.get("params", {})
+
+    if dist == "Exponential":
+        return 1.0, 1.0 / float(p["lambda"])
+    if dist == "Weibull":
+        return float(p["beta"]), float(p["eta"])
+    if dist == "Rayleigh":
+        return 2.0, float(p["sigma"]) * np.sqrt(2.0)
+
+    return None
+
+
+# =========================================================
+# 8) Tek birleşim teriminin ∫_0^∞ Π R_c(t) dt kapalı formu
+#    - sadece statik     : Π R > 0 ise ∞
+#    - tek dinamik       : Π R_statik · E[T_c]
+#    - aynı β'lı Weibull : Π R_statik · η_eff Γ(1 + 1/β),
+#                          η_eff = (Σ η_c^{-β})^{-1/β}
+#      (hepsi Exponential ise bu 1/Σλ'ya indirgenir)
+#    Kapalı form yoksa None -> kuadratür.
+# =========================================================
+def union_integral_closed_form(members):
+    static_factor = 1.0
+    dynamic = []
+
+    for data in members:
+        if data["dist"] == "static":
+            static_factor *= float(data["R"])
+        else:
+            dynamic.append(data)
+
+    if static_factor == 0.0:
+        return 0.0
+    # Π R_c(∞) > 0 -> integral ıraksar (statik ya da statik üyeli kapılar)
+    if np.prod([survival_at_infinity(d) for d in dynamic]) > 0:
+        return np.inf
+    if any(is_voting(d) for d in dynamic):
+        return None
+
+    if len(dynamic) == 1:
+        mean_fn = DISTRIBUTIONS[dynamic[0]["dist"]].get("mean")
+        if mean_fn is not None:
+            return static_factor * float(mean_fn(dynamic[0]["params"]))
+
+    forms = [weibull_form(d) for d in dynamic]
+    if all(f is not None for f in forms):
+        beta = forms[0][0]
+        if all(abs(f[0] - beta) <= 1e-12 * max(1.0, beta) for f in forms):
+            rate = sum(f[1] ** (-beta) for f in forms)
+            eta_eff = rate ** (-1.0 / beta)
+            return static_factor * eta_eff * float(gamma_fn(1.0 + 1.0 / beta))
+
+    return None
+
+
+# =========================================================
+# 9) Kalan terimler için vektörel adaptif kuadratür
+#    t = τ·s/(1-s) ile [0, ∞) -> [0, 1), bileşik Gauss–Legendre.
+#    Panel sayısı ikiye katlanır; |Q_2M - Q_M| her terim için hata
+#    tahminidir. Tüm terimler tek bir (U × C) @ log R(C × N) çarpımıyla
+#    aynı düğümlerde birlikte hesaplanır.
+# =========================================================
+_GL_X, _GL_W = np.polynomial.legendre.leggauss(16)
+
+
+def _gauss_nodes(n_panels, tau):
+    edges = np.linspace(0.0, 1.0, n_panels + 1)
+    half = 0.5 * np.diff(edges)
+    mid = 0.5 * (edges[:-1] + edges[1:])
+
+    s = (mid[:, None] + half[:, None] * _GL_X[None, :]).ravel()
+    w = (half[:, None] * _GL_W[None, :]).ravel()
+
+    t = tau * s / (1.0 - s)
+    jac = tau / (1.0 - s) ** 2
+    return t, w * jac
+
+
+def _union_quadrature(mask_mat, curve_fn, tau, tol, min_panels=8, max_panels=2048):
+    n_terms = mask_mat.shape[0]
+    values = np.zeros(n_terms)
+    errors = np.full(n_terms, np.inf)
+    if n_terms == 0:
+        return values, np.zeros(0)
+
+    active = np.arange(n_terms)
+    prev = None
+    n_panels = min_panels
+
+    while n_panels <= max_panels and active.size:
+        t_nodes, w = _gauss_nodes(n_panels, tau)
+        log_curves = np.log(np.clip(curve_fn(t_nodes), 1e-300, None))
+        q = np.exp(mask_mat[active] @ log_curves) @ w
+
+        if prev is not None:
+            err = np.abs(q - prev)
+            values[active] = q
+            errors[active] = err
+            done = err <= np.maximum(tol * np.abs(q), 1e-300)
+            active = active[~done]
+            prev = q[~done]
+        else:
+            values[active] = q
+            prev = q
+
+        n_panels *= 2
+
+    return values, errors
+
+
+# =========================================================
+# 10) Kuadratür ölçeği τ: bileşen ortalama ömürlerinin medyanı
+# =========================================================
+def characteristic_time(components, names, default=1.0):
+    means = [component_mean(components[c]) for c in names]
+    means = [m for m in means if m is not None]
+    return float(np.median(means)) if means else default
+
+
+# =========================================================
+# 10b) Kesik açılımda MTTF sınırları
+#     Kırpılmış Bonferroni zarfları (bkz. 6) Gauss–Legendre
+#     düğümlerinde kurulur ve ayrı ayrı integre edilir:
+#     ∫ alt ≤ MTTF ≤ ∫ üst. Ham kısmi toplamların integrali (kırpılmadan)
+#     sınır değildir. Düğümler bloklar halinde işlenir (bellek).
+# =========================================================
+def _envelope_mttf(components, names, path_masks, max_level, curve_fn, tau, ccf_beta=None, tol=1e-8,
+                   min_panels=16, max_panels=1024, block=2048, progress=None):
+    n_bits = len(names)
+
+    # Bir yol ∞'da çalışıyorsa (statik üyeler) iki sınır da ıraksar
+    s_inf = np.array([survival_at_infinity(components[c]) for c in names])
+    if ccf_beta is not None:
+        s_inf = (1 - ccf_beta) * s_inf
+    if any(np.prod(s_inf[_mask_rows(m, n_bits)]) > 0 for m in path_masks):
+        return np.inf, np.inf, 0.0, 0
+
+    levels = union_level_counts(path_masks, max_level, progress=progress)
+    masks = list({m for counts in levels for m in counts})
+    index = {m: r for r, m in enumerate(masks)}
+
+    M = np.zeros((len(masks), n_bits))
+    for r, m in enumerate(masks):
+        M[r, _mask_rows(m, n_bits)] = 1.0
+    W = np.zeros((len(levels), len(masks)))
+    for k, counts in enumerate(levels):
+        for m, c in counts.items():
+            W[k, index[m]] = (-1) ** k * c
+    path_rows = [index[m] for m in path_masks]
+
+    def envelope(t_nodes):
+        lower = np.empty_like(t_nodes)
+        upper = np.empty_like(t_nodes)
+        for a in range(0, t_nodes.size, block):
+            b = min(a + block, t_nodes.size)
+            prods = np.exp(M @ np.log(np.clip(curve_fn(t_nodes[a:b]), 1e-300, None)))
+            partial = np.cumsum(W @ prods, axis=0)
+            up = np.min(partial[0::2], axis=0)
+            low = np.max(prods[path_rows], axis=0)
+            if len(levels) > 1:
+                low = np.maximum(low, np.max(partial[1::2], axis=0))
+            lower[a:b] = np.clip(low, 0.0, 1.0)
+            upper[a:b] = np.maximum(np.clip(up, 0.0, 1.0), lower[a:b])
+        return lower, upper
+
+    prev, err = None, np.inf
+    n_panels = min_panels
+    while n_panels <= max_panels:
+        t_nodes, w = _gauss_nodes(n_panels, tau)
+        lower, upper = envelope(t_nodes)
+        q = np.array([lower @ w, upper @ w])
+        if prev is not None:
+            err = float(np.max(np.abs(q - prev)))
+            if err <= tol * max(float(np.max(np.abs(q))), 1e-300):
+                break
+        prev = q
+        n_panels *= 2
+
+    return float(q[0]), float(q[1]), err, len(masks)
+
+
+# =========================================================
+# 11) Sistem MTTF = ∫_0^∞ R_sys(t) dt
+#     Her inclusion-exclusion birleşim terimi kapalı formla
+#     (mümkünse) ya da kuadratürle integre edilir; t_max'a bağlı değil.
+#     max_level verilirse (kesik açılım) MTTF, kırpılmış Bonferroni
+#     zarflarının integralleriyle sınırlanır (bkz. 10b); mttf bandın
+#     ortası, error yalnız kuadratür hatası, bounds = (alt, üst).
+# =========================================================
+def system_mttf(components, component_paths, ccf_beta=None, ccf_lambda=None, tol=1e-8, max_level=None,
+                progress=None):
+    names, path_masks = path_bitmasks(component_paths)
+    n_bits = len(names)
+
+    if not path_masks:
+        return {"mttf": 0.0, "error": 0.0, "closed_form_terms": 0, "quad_terms": 0, "converged": True}
+
+    use_ccf = ccf_beta is not None and ccf_beta > 0 and ccf_lambda is not None
+
+    def curve_fn(t_nodes):
+        curves = np.vstack([component_rt(components[c], t_nodes) for c in names])
+        if use_ccf:
+            curves = (1 - ccf_beta) * curves + ccf_beta * np.exp(-ccf_lambda * t_nodes)[None, :]
+        return curves
+
+    tau = characteristic_time(components, names, default=1.0 / ccf_lambda if use_ccf else 1.0)
+
+    integral_cache = {}
+    closed_count = 0
+    quad_count = 0
+
+    def integrate(coefs):
+        nonlocal closed_count, quad_count
+        pending = [m for m in coefs if m not in integral_cache]
+
+        quad_masks = []
+        for i, m in enumerate(pending):
+            if progress is not None and i % IE_PROGRESS_EVERY == 0:
+                progress(i, len(pending))
+            value = None
+            if not use_ccf:
+                value = union_integral_closed_form([components[names[i]] for i in _mask_rows(m, n_bits)])
+            if value is None:
+                quad_masks.append(m)
+            else:
+                integral_cache[m] = (value, 0.0)
+                closed_count += 1
+
+        if quad_masks:
+            mask_mat = np.zeros((len(quad_masks), n_bits))
+            for r, m in enumerate(quad_masks):
+                mask_mat[r, _mask_rows(m, n_bits)] = 1.0
+            vals, errs = _union_quadrature(mask_mat, curve_fn, tau, tol)
+            for m, v, e in zip(quad_masks, vals, errs):
+                integral_cache[m] = (float(v), float(e))
+            quad_count += len(quad_masks)
+
+        total = 0.0
+        error = 0.0
+        for m, c in coefs.items():
+            v, e = integral_cache[m]
+            if np.isinf(v):
+                return np.inf, 0.0
+            total += c * v
+            error += abs(c) * e
+        return total, error
+
+    if max_level is None or max_level >= len(path_masks):
+        mttf, error = integrate(union_coefficients(path_masks, progress=progress))
+        bounds = None
+    else:
+        lo, hi, error, n_unions = _envelope_mttf(
+            components, names, path_masks, max(max_level, 1), curve_fn, tau,
+            ccf_beta=ccf_beta if use_ccf else None, tol=tol, progress=progress
+        )
+        quad_count = n_unions
+        mttf = 0.5 * (lo + hi)
+        bounds = (lo, hi)
+
+    rel_ok = error <= max(1e-6 * abs(mttf), 1e-12) if np.isfinite(mttf) else True
+
+    return {
+        "mttf": float(mttf),
+        "error": float(error),
+        "bounds": bounds,
+        "closed_form_terms": closed_count,
+        "quad_terms": quad_count,
+        "converged": bool(rel_ok),
+    }
@@ -0,0 +1,316 @@
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from engine import Model, analyze_dynamic, analyze_static, simulate
+from time_grid import find_crossing_time
+
+
+ANALYSES = ("dynamic", "static", "montecarlo")
+
+STAGES = ("load_sec", "plan_sec", "grid_sec", "curves_sec", "mttf_sec", "write_sec")
+
+MANIFEST = "manifest.jsonl"
+RESULTS = "results.csv"
+CURVE_DIR = "curves"
+
+
+# =========================================================
+# 1) Girdi dosyaları ve içerik özeti
+#    Dizin -> içindeki *.json, aksi halde glob deseni. Özet
+#    Model.content_hash'ten (konumlar hariç model + analiz ayarları):
+#    arayüz önbelleğiyle aynı anahtar, ikisi de aynıysa sonuç aynıdır.
+# =========================================================
+def model_files(inputs):
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            found = glob.glob(os.path.join(item, "*.json"))
+        else:
+            found = glob.glob(item)
+        files += sorted(os.path.abspath(f) for f in found)
+    return list(dict.fromkeys(files))
+
+
+def curve_name(path, digest):
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return f"{stem}-{digest[:8]}.csv"
+
+
+# =========================================================
+# 2) Kaldığı yerden devam: her biten model manifest'e bir satır
+#    olarak eklenir (flush + fsync). Çökme sonrası yarım kalan son
+#    satır atlanır; dosya başına son kayıt geçerlidir.
+# =========================================================
+def load_manifest(path):
+    entries = {}
+    if not os.path.exists(path):
+        return entries
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            entries[entry["file"]] = entry
+    return entries
+
+
+def append_manifest(path, entry):
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def is_current(entry, digest, out_dir):
+    return (
+        entry is not None
+        and entry.get("hash") == digest
+        and entry.get("status") == "ok"
+        and os.path.exists(os.path.join(out_dir, CURVE_DIR, entry["row"]["curve_file"]))
+    )
+
+
+# =========================================================
+# 3) Tek model (işçi süreç): analiz + eğri dosyası
+#    Motorun konsol çıktısı model başına .log dosyasına yazılır.
+# =========================================================
+def _dynamic(model, settings):
+    result = analyze_dynamic(
+        model, settings["t_max"],
+        grid_tol=settings["grid_tol"],
+        ie_tol=settings["ie_tol"],
+        ie_max_terms=settings["ie_max_terms"],
+        prune=not settings["no_prune"],
+        markov=settings["markov"]
+    )
+    columns = {"t": result["t"], "R": result["R"]}
+    if result["R_lower"] is not None:
+        columns["R_lower"], columns["R_upper"] = result["R_lower"], result["R_upper"]
+    return {
+        "curves": columns,
+        "MTTF": result["MTTF"],
+        "MTTF_error": result["MTTF_error"],
+        "method": result["method"],
+        "timings": result["timings"],
+    }
+
+
+def _static(model, settings):
+    stage = time.perf_counter()
+    points = [analyze_static(model, t=t) for t in settings["times"]]
+    return {
+        "curves": {"t": np.array([p["t"] for p in points]), "R": np.array([p["R"] for p in points])},
+        "MTTF": points[-1]["MTTF"],
+        "MTTF_error": None,
+        "method": points[-1]["method"],
+        "timings": {"curves_sec": time.perf_counter() - stage},
+    }
+
+
+def _montecarlo(model, settings):
+    stage = time.perf_counter()
+    mc = simulate(
+        model, N=settings["n_samples"], t_max=settings["t_max"],
+        seed=settings["seed"], n_t=400, prune=not settings["no_prune"]
+    )
+    return {
+        "curves": {"t": mc["t"], "R": mc["R"], "R_low": mc["R_low"], "R_high": mc["R_high"]},
+        "MTTF": mc["MTTF"],
+        "MTTF_error": (mc["CI_high"] - mc["CI_low"]) / 2.0,
+        "method": "montecarlo",
+        "timings": {"curves_sec": time.perf_counter() - stage},
+    }
+
+
+RUNNERS = {"dynamic": _dynamic, "static": _static, "montecarlo": _montecarlo}
+
+
+def analyze_file(path, data, digest, settings, out_dir):
+    start = time.perf_counter()
+    row = {"file": path, "hash": digest, "analysis": settings["analysis"]}
+    log = io.StringIO()
+
+    try:
+        model = Model.from_dict(data, ccf_beta=settings["ccf_beta"])
+        timings = {"load_sec": time.perf_counter() - start}
+
+        with contextlib.redirect_stdout(log):
+            result = RUNNERS[settings["analysis"]](model, settings)
+        timings.update(result["timings"])
+
+        stage = time.perf_counter()
+        curves = result["curves"]
+        t, R = curves["t"], curves["R"]
+        for tq in settings["times"]:
+            row[f"R@{tq:g}"] = float(np.interp(tq, t, R)) if t.size > 1 else float(R[-1])
+        row["MTTF"] = result["MTTF"]
+        row["MTTF_error"] = result["MTTF_error"]
+        row["t90"] = find_crossing_time(t, R, 0.9)
+        row["t10"] = find_crossing_time(t, R, 0.1)
+        row["method"] = result["method"]
+
+        row["curve_file"] = curve_name(path, digest)
+        np.savetxt(
+            os.path.join(out_dir, CURVE_DIR, row["curve_file"]),
+            np.column_stack(list(curves.values())),
+            delimiter=",", header=",".join(curves), comments=""
+        )
+        timings["write_sec"] = time.perf_counter() - stage
+
+        row.update({k: timings.get(k) for k in STAGES})
+        status, error = "ok", None
+    except Exception as e:
+        status, error = "error", f"{type(e).__name__}: {e}"
+
+    row["total_sec"] = time.perf_counter() - start
+    with open(os.path.join(out_dir, CURVE_DIR, curve_name(path, digest)[:-4] + ".log"), "w", encoding="utf-8") as f:
+        f.write(log.getvalue())
+
+    # JSON'a yazılabilir sayılar (numpy / inf)
+    for k, v in row.items():
+        if isinstance(v, (np.floating, float)):
+            row[k] = float(v) if np.isfinite(v) else str(float(v))
+    return {"file": path, "hash": digest, "status": status, "error": error, "row": row}
+
+
+# =========================================================
+# 4) Toplu çalıştırma
+# =========================================================
+def write_results(path, entries, times):
+    columns = (
+        ["file", "analysis", "status", "error"]
+        + [f"R@{t:g}" for t in times]
+        + ["MTTF", "MTTF_error", "t90", "t10", "method"]
+        + list(STAGES) + ["total_sec", "curve_file", "hash"]
+    )
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        for entry in entries:
+            writer.writerow(dict(entry["row"], status=entry["status"], error=entry["error"] or ""))
+
+
+def run_batch(inputs, out_dir, settings, workers=None, force=False):
+    files = model_files(inputs)
+    if not files:
+        raise ValueError("Analiz edilecek model dosyası bulunamadı.")
+
+    os.makedirs(os.path.join(out_dir, CURVE_DIR), exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST)
+    done = load_manifest(manifest_path)
+
+    entries, todo, skipped = {}, [], 0
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            digest = Model.from_dict(data, ccf_beta=settings["ccf_beta"]).content_hash(settings)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            entries[path] = {
+                "file": path, "hash": None, "status": "error",
+                "error": f"{type(e).__name__}: {e}", "row": {"file": path, "analysis": settings["analysis"]},
+            }
+            continue
+
+        if not force and is_current(done.get(path), digest, out_dir):
+            entries[path] = done[path]
+            skipped += 1
+        else:
+            todo.append((path, data, digest))
+
+    print(f"[INFO] {len(files)} model: {skipped} güncel (atlandı), {len(todo)} analiz edilecek.")
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(analyze_file, path, data, digest, settings, out_dir): path
+                for path, data, digest in todo
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                entry = future.result()
+                append_manifest(manifest_path, entry)
+                entries[entry["file"]] = entry
+                note = f"{entry['row']['total_sec']:.2f} s" if entry["status"] == "ok" else entry["error"]
+                print(f"[{i}/{len(todo)}] {os.path.basename(entry['file'])}: {entry['status']} ({note})")
+    except BrokenProcessPool:
+        print("[WARN] İşçi süreç çöktü; tamamlanan modeller manifest'te, yeniden çalıştırınca kalanlar analiz edilir.")
+
+    ordered = [entries[p] for p in files if p in entries]
+    write_results(os.path.join(out_dir, RESULTS), ordered, settings["times"])
+    return ordered
+
+
+# =========================================================
+# 5) Komut satırı
+#    python batch_cli.py modeller/ --analysis dynamic --t-max 1000 \
+#        --times 100,500,1000 --out sonuclar/
+# =========================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Model JSON dosyalarını paralel analiz eder, tek sonuç tablosu ve eğri dosyaları yazar."
+    )
+    parser.add_argument("inputs", nargs="+", help="Model dizini ya da glob deseni (örn: 'modeller/*.json')")
+    parser.add_argument("--out", default="batch_results", help="Çıktı dizini")
+    parser.add_argument("--analysis", choices=ANALYSES, default="dynamic")
+    parser.add_argument("--t-max", type=float, default=1000.0)
+    parser.add_argument("--times", default=None, help="R(t) raporlanacak anlar, virgülle (varsayılan: t_max)")
+    parser.add_argument("--grid-tol", type=float, default=None, help="Adaptif grid toleransı (yoksa sabit 400 nokta)")
+    parser.add_argument("--ie-tol", type=float, default=None, help="Kesik inclusion-exclusion toleransı")
+    parser.add_argument("--ie-max-terms", type=int, default=None)
+    parser.add_argument("--ccf-beta", type=float, default=None, help="Global β-faktör CCF")
+    parser.add_argument("--markov", action="store_true", help="Markov (CTMC) çözücüyü zorla")
+    parser.add_argument("--no-prune", action="store_true", help="Sadeleştirmeyi kapat")
+    parser.add_argument("-n", "--n-samples", type=int, default=10000, help="Monte Carlo örnek sayısı")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--force", action="store_true", help="Değişmemiş modelleri de yeniden analiz et")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    times = [args.t_max] if args.times is None else [float(t) for t in args.times.split(",") if t.strip()]
+    settings = {
+        "analysis": args.analysis,
+        "t_max": args.t_max,
+        "times": times,
+        "grid_tol": args.grid_tol,
+        "ie_tol": args.ie_tol,
+        "ie_max_terms": args.ie_max_terms,
+        "ccf_beta": args.ccf_beta,
+        "markov": args.markov,
+        "no_prune": args.no_prune,
+        "n_samples": args.n_samples,
+        "seed": args.seed,
+    }
+
+    start = time.perf_counter()
+    try:
+        entries = run_batch(args.inputs, args.out, settings, workers=args.workers, force=args.force)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    failed = sum(1 for e in entries if e["status"] != "ok")
+    print(
+        f"[INFO] {len(entries)} model, {failed} hata, {time.perf_counter() - start:.2f} s -> "
+        f"{os.path.join(args.out, RESULTS)}"
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
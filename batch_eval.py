@@ -0,0 +1,277 @@
+import numpy as np
+
+from distributions import DISTRIBUTIONS
+from analytic import path_bitmasks, union_coefficients, _mask_rows, component_rt
+from voting import VOTING_DIST
+
+_GL_X, _GL_W = np.polynomial.legendre.leggauss(16)
+
+
+# =========================================================
+# 1) Topolojiyi bir kez derle
+#    Inclusion-exclusion birleşim terimleri (U × C) 0/1 matrisi ve
+#    (U,) katsayı vektörüne çevrilir; path enumeration, deepcopy ve
+#    lambdify bir daha yapılmaz. progress(done, total): birleşim kurulumu.
+# =========================================================
+def compile_structure(components, component_paths, progress=None):
+    names, path_masks = path_bitmasks(component_paths)
+    n_comp = len(names)
+
+    coefs = union_coefficients(path_masks, progress=progress)
+    union_masks = np.zeros((len(coefs), n_comp))
+    union_coefs = np.zeros(len(coefs))
+
+    for r, (mask, coef) in enumerate(coefs.items()):
+        union_masks[r, _mask_rows(mask, n_comp)] = 1.0
+        union_coefs[r] = coef
+
+    dists = [components[c]["dist"] for c in names]
+    base_params = []
+    param_columns = []
+    gates = {}
+
+    for c, dist in zip(names, dists):
+        if dist == "static":
+            base_params.append({"R": float(components[c]["R"])})
+            param_columns.append((c, "R"))
+        elif dist == VOTING_DIST:
+            # k-out-of-n kapıları batch'te sabit tutulur (parametre sütunu yok)
+            base_params.append({})
+            gates[c] = components[c]
+        else:
+            p = {k: float(v) for k, v in components[c]["params"].items()}
+            base_params.append(p)
+            for prm in DISTRIBUTIONS[dist]["params"]:
+                param_columns.append((c, prm["key"]))
+
+    return {
+        "names": names,
+        "dists": dists,
+        "base_params": base_params,
+        "param_columns": param_columns,
+        "gates": gates,
+        "union_masks": union_masks,
+        "union_coefs": union_coefs,
+    }
+
+
+# =========================================================
+# 2) Parametre batch'ini bileşen bazlı (S, 1) dizilere aç
+#    param_batch:
+#      - (S × D) dizi, sütunlar structure["param_columns"] sırasında
+#        (tek parametreli dağılımlarda D = C)
+#      - {cname: {key: (S,) dizi}}; verilmeyenler taban değerde kalır
+# =========================================================
+def expand_param_batch(structure, param_batch):
+    names = structure["names"]
+
+    if isinstance(param_batch, dict):
+        # Yazım hatası sessizce taban değerle koşturmasın
+        bases = dict(zip(names, structure["base_params"]))
+        for c, override in param_batch.items():
+            if c not in bases:
+                raise ValueError(f"'{c}' bileşeni yapıda yok (yol üzerindeki bileşenler: {', '.join(names)}).")
+            unknown = [k for k in override if k not in bases[c]]
+            if unknown:
+                raise ValueError(
+                    f"'{c}.{unknown[0]}': '{c}' için geçerli parametreler: {', '.join(bases[c]) or '-'}"
+                )
+
+        sizes = {
+            np.size(v)
+            for comp in param_batch.values()
+            for v in comp.values()
+        }
+        n_samples = max(sizes) if sizes else 1
+
+        per_comp = []
+        for c, base in zip(names, structure["base_params"]):
+            override = param_batch.get(c, {})
+            per_comp.append({
+                k: np.broadcast_to(
+                    np.asarray(override.get(k, v), dtype=float).reshape(-1), (n_samples,)
+                )[:, None]
+                for k, v in base.items()
+            })
+        return n_samples, per_comp
+
+    arr = np.atleast_2d(np.asarray(param_batch, dtype=float))
+    columns = structure["param_columns"]
+    if arr.shape[1] != len(columns):
+        raise ValueError(
+            f"Parametre matrisi {len(columns)} sütun olmalı, {arr.shape[1]} verildi: {columns}"
+        )
+
+    n_samples = arr.shape[0]
+    per_comp = [{} for _ in names]
+    index = {c: i for i, c in enumerate(names)}
+    for j, (c, key) in enumerate(columns):
+        per_comp[index[c]][key] = arr[:, j][:, None]
+
+    return n_samples, per_comp
+
+
+# =========================================================
+# 3) Bileşen survival'ı, parametreler (S, 1) ve t (1, T) ya da (S, T)
+# =========================================================
+def _survival(dist, params, t):
+    if dist == "static":
+        return np.broadcast_to(params["R"], np.broadcast_shapes(params["R"].shape, t.shape))
+
+    with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+        R = DISTRIBUTIONS[dist]["R_num"](t, params)
+    return np.nan_to_num(np.asarray(R, dtype=float), nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def _log_survival_stack(structure, per_comp, t):
+    # (C, S, T) log R;  log(0) -> log(1e-300) ≈ -690 ile sonlu tutulur
+    gates = structure.get("gates", {})
+    curves = [
+        component_rt(gates[c], t) if dist == VOTING_DIST else _survival(dist, params, t)
+        for c, dist, params in zip(structure["names"], structure["dists"], per_comp)
+    ]
+    shape = np.broadcast_shapes(*(np.shape(R) for R in curves))
+    return np.stack([
+        np.log(np.clip(np.broadcast_to(R, shape), 1e-300, None))
+        for R in curves
+    ])
+
+
+def _system_from_logs(structure, log_R):
+    # R_sys[s, t] = Σ_u coef_u · exp(Σ_c M[u, c] · log R_c[s, t])
+    C, S, T = log_R.shape
+    log_union = structure["union_masks"] @ log_R.reshape(C, S * T)
+    np.exp(log_union, out=log_union)
+    return (structure["union_coefs"] @ log_union).reshape(S, T)
+
+
+# =========================================================
+# 4) Batch MTTF
+#    Tüm bileşenler Exponential ise birleşim terimi tam olarak
+#    1/Σλ -> MTTF = Σ_u coef_u / (M λ)_u  (vektörel, kesin).
+#    Aksi halde örnek başına ölçeklenmiş [0, ∞) Gauss–Legendre
+#    kuadratürü; yarım çözünürlüklü kuralla fark hata tahminidir.
+# =========================================================
+def _sample_scale(structure, per_comp, n_samples):
+    means = []
+    for dist, params in zip(structure["dists"], per_comp):
+        mean_fn = DISTRIBUTIONS.get(dist, {}).get("mean")
+        if mean_fn is None:
+            continue
+        with np.errstate(all="ignore"):
+            m = np.broadcast_to(np.asarray(mean_fn(params), dtype=float).reshape(-1), (n_samples,))
+        means.append(m)
+
+    if not means:
+        return np.ones(n_samples)
+
+    means = np.vstack(means)
+    means = np.where(np.isfinite(means) & (means > 0), means, np.nan)
+    tau = np.nanmedian(means, axis=0)
+    return np.where(np.isfinite(tau), tau, 1.0)
+
+
+def _quadrature_mttf(structure, per_comp, n_samples, n_panels):
+    edges = np.linspace(0.0, 1.0, n_panels + 1)
+    half = 0.5 * np.diff(edges)
+    mid = 0.5 * (edges[:-1] + edges[1:])
+    s = (mid[:, None] + half[:, None] * _GL_X[None, :]).ravel()
+    w = (half[:, None] * _GL_W[None, :]).ravel()
+
+    tau = _sample_scale(structure, per_comp, n_samples)[:, None]
+    t_nodes = tau * (s / (1.0 - s))[None, :]
+    weights = tau * (w / (1.0 - s) ** 2)[None, :]
+
+    R_nodes = _system_from_logs(structure, _log_survival_stack(structure, per_comp, t_nodes))
+    return np.sum(R_nodes * weights, axis=1)
+
+
+def batch_mttf(structure, per_comp, n_samples, n_panels=4):
+    if all(d == "Exponential" for d in structure["dists"]):
+        lam = np.hstack([np.broadcast_to(p["lambda"], (n_samples, 1)) for p in per_comp])
+        rates = lam @ structure["union_masks"].T
+        return (1.0 / rates) @ structure["union_coefs"], np.zeros(n_samples)
+
+    if any(d == "static" for d in structure["dists"]):
+        # statik bileşenler zamanla bozulmaz: sadece statik yol varsa MTTF = ∞
+        static_only = np.all(
+            structure["union_masks"][:, [d != "static" for d in structure["dists"]]] == 0, axis=1
+        )
+        if np.any(static_only):
+            return np.full(n_samples, np.inf), np.zeros(n_samples)
+
+    fine = _quadrature_mttf(structure, per_comp, n_samples, n_panels)
+    coarse = _quadrature_mttf(structure, per_comp, n_samples, max(n_panels // 2, 1))
+    return fine, np.abs(fine - coarse)
+
+
+# =========================================================
+# 5) Ana API: (S × D) ya da bileşen bazlı batch -> (S × T) R, (S,) MTTF
+#    Büyük S için bellek sınırlı parçalar (chunk) halinde çalışır.
+# =========================================================
+def evaluate_batch(structure, param_batch, t_grid, with_mttf=True, chunk_size=2048):
+    t_grid = np.asarray(t_grid, dtype=float)
+    n_samples, per_comp = expand_param_batch(structure, param_batch)
+
+    R_sys = np.empty((n_samples, t_grid.size))
+    mttf = np.empty(n_samples) if with_mttf else None
+    mttf_err = np.empty(n_samples) if with_mttf else None
+
+    for start in range(0, n_samples, chunk_size):
+        stop = min(start + chunk_size, n_samples)
+        chunk = [
+            {k: np.broadcast_to(v, (n_samples, 1))[start:stop] for k, v in params.items()}
+            for params in per_comp
+        ]
+
+        log_R = _log_survival_stack(structure, chunk, t_grid[None, :])
+        R_sys[start:stop] = np.clip(_system_from_logs(structure, log_R), 0.0, 1.0)
+
+        if with_mttf:
+            mttf[start:stop], mttf_err[start:stop] = batch_mttf(structure, chunk, stop - start)
+
+    return {
+        "t": t_grid,
+        "R": R_sys,
+        "MTTF": mttf,
+        "MTTF_error": mttf_err,
+    }
+
+
+# =========================================================
+# 6) Yapı fonksiyonu üzerinden koşullu eğriler (tek geçiş)
+#    curves: (C, T) bileşen R(t) matrisi (structure["names"] sırası)
+#    R_sys multilineer olduğundan
+#      R_down_i = R_sys(R_i = 0) = Σ_{u ∌ i} coef_u Π_u
+#      B_i      = ∂R_sys/∂R_i   = Σ_{u ∋ i} coef_u Π_{u \ {i}}
+#      R_up_i   = R_sys(R_i = 1) = R_down_i + B_i
+#    Tüm bileşenler ve tüm zaman noktaları için birlikte hesaplanır.
+# =========================================================
+def conditional_system_curves(structure, curves, chunk_size=64):
+    curves = np.asarray(curves, dtype=float)
+    M = structure["union_masks"]
+    coefs = structure["union_coefs"]
+
+    log_R = np.log(np.clip(curves, 1e-300, None))
+    log_union = M @ log_R
+    terms = coefs[:, None] * np.exp(log_union)
+
+    R_sys = np.sum(terms, axis=0)
+    R_down = R_sys[None, :] - M.T @ terms
+
+    n_comp = curves.shape[0]
+    birnbaum = np.empty_like(curves)
+    weighted = (M.T * coefs[None, :])
+
+    for start in range(0, n_comp, chunk_size):
+        stop = min(start + chunk_size, n_comp)
+        # (c, U, T): Π_{u \ {i}} = exp(log Π_u - log R_i)
+        minus_i = np.exp(log_union[None, :, :] - log_R[start:stop, None, :])
+        birnbaum[start:stop] = np.einsum("cu,cut->ct", weighted[start:stop], minus_i)
+
+    return {
+        "R": R_sys,
+        "R_up": R_down + birnbaum,
+        "R_down": R_down,
+        "birnbaum": birnbaum,
+    }
@@ -0,0 +1,286 @@
+from itertools import combinations, product
+from math import comb
+
+import numpy as np
+
+from distributions import DISTRIBUTIONS
+from analytic import component_rt_curves, component_mean, _gauss_nodes
+from voting import is_voting
+
+
+CCF_MODELS = {
+    "beta": "β-faktör",
+    "alpha": "α-faktör",
+}
+
+MAX_SHOCK_STATES = 4096
+
+
+# =========================================================
+# 1) Adlandırılmış CCF grupları (modelle birlikte kaydedilir)
+#    {"name": "G1", "model": "beta",  "members": [...], "beta": 0.1}
+#    {"name": "G2", "model": "alpha", "members": [...], "alpha": [α1, …, αm]}
+#    α_k: bir arıza olayında tam k üyenin birlikte arızalanma payı.
+# =========================================================
+def make_ccf_group(name, members, model, factors):
+    members = list(dict.fromkeys(members))
+    if not name:
+        raise ValueError("CCF grubu için bir ad gerekli.")
+    if len(members) < 2:
+        raise ValueError("CCF grubu en az iki üye içermeli.")
+    if model not in CCF_MODELS:
+        raise ValueError(f"Bilinmeyen CCF modeli: {model}")
+
+    factors = [float(f) for f in factors]
+
+    if model == "beta":
+        if len(factors) != 1 or not (0.0 <= factors[0] <= 1.0):
+            raise ValueError("β-faktör modeli için 0–1 arasında tek bir β değeri gerekli.")
+        return {"name": name, "model": model, "members": members, "beta": factors[0]}
+
+    if len(factors) != len(members):
+        raise ValueError(f"α-faktör modeli için {len(members)} adet α değeri gerekli (α1 … α{len(members)}).")
+    if min(factors) < 0 or sum(factors) <= 0:
+        raise ValueError("α değerleri negatif olmamalı ve toplamları pozitif olmalı.")
+    total = sum(factors)
+    return {"name": name, "model": model, "members": members, "alpha": [f / total for f in factors]}
+
+
+def validate_groups(groups, components):
+    seen = {}
+    for g in groups:
+        for m in g["members"]:
+            if m not in components:
+                raise ValueError(f"CCF grubu '{g['name']}': bileşen bulunamadı: {m}")
+            data = components[m]
+            if data["dist"] == "static" or is_voting(data):
+                raise ValueError(f"CCF grubu '{g['name']}': {m} statik ya da kapı olamaz.")
+            if m in seen:
+                raise ValueError(f"{m} birden fazla CCF grubunda ({seen[m]}, {g['name']}).")
+            seen[m] = g["name"]
+
+
+# =========================================================
+# 2) Grup parametreleri
+#    λ̄: üyelerin ortalama arıza hızı (Exponential λ, diğerleri 1/ortalama)
+#    β-faktör: bağımsız pay 1 − β, tüm üyeleri düşüren tek şok β·λ̄
+#    α-faktör (tekrarlanmayan test): α_t = Σ k α_k
+#      bağımsız pay α_1/α_t, her k'lı alt küme için şok hızı
+#      λ_k = k / C(m−1, k−1) · α_k / α_t · λ̄        (k ≥ 2)
+#    Bağımsız kısım üyenin kendi kümülatif hazard'ının payı:
+#      R_i,bağımsız(t) = R_i(t) ** pay
+# =========================================================
+def member_rate(data):
+    if data["dist"] == "Exponential":
+        return float(data["params"]["lambda"])
+    mean = component_mean(data)
+    return 1.0 / mean if mean else 0.0
+
+
+def group_parameters(group, components):
+    m = len(group["members"])
+    lam = float(np.mean([member_rate(components[c]) for c in group["members"]]))
+
+    if group["model"] == "beta":
+        return {"fraction": 1.0 - group["beta"], "shock_rates": {m: group["beta"] * lam}}
+
+    alpha = group["alpha"]
+    alpha_t = sum((k + 1) * a for k, a in enumerate(alpha))
+    rates = {
+        k: k / comb(m - 1, k - 1) * alpha[k - 1] / alpha_t * lam
+        for k in range(2, m + 1)
+        if alpha[k - 1] > 0
+    }
+    return {"fraction": alpha[0] / alpha_t, "shock_rates": rates}
+
+
+def independent_curves(components, groups, t_grid):
+    curves = dict(component_rt_curves(components, t_grid))
+    for g in groups:
+        frac = group_parameters(g, components)["fraction"]
+        for c in g["members"]:
+            curves[c] = np.clip(curves[c], 0.0, 1.0) ** frac
+    return curves
+
+
+# =========================================================
+# 3) Şok durumları (t anına kadar şoklarla düşen üye kümesi F)
+#    Her k'lı alt küme bağımsız bir Poisson şokuna sahip ->
+#      g(j) = P(F ⊆ A), |A| = j  = exp(−t Σ_k λ_k [C(m,k) − C(j,k)])
+#      P(F tam olarak belirli bir f'li küme) = Σ_j C(f,j) (−1)^{f−j} g(j)
+#    Olasılığı her yerde 0 olan boyutlar (ör. β'da 0 < f < m) atlanır.
+# =========================================================
+def _no_shock_within(params, m, j, t_grid):
+    rate = sum(lam * (comb(m, k) - comb(j, k)) for k, lam in params["shock_rates"].items())
+    return np.exp(-rate * t_grid)
+
+
+def _group_states(group, components, t_grid):
+    params = group_parameters(group, components)
+    members = group["members"]
+    m = len(members)
+    g = [_no_shock_within(params, m, j, t_grid) for j in range(m + 1)]
+
+    states = []
+    for f in range(m + 1):
+        h = sum(comb(f, j) * (-1) ** (f - j) * g[j] for j in range(f + 1))
+        h = np.clip(h, 0.0, 1.0)
+        if np.max(h) <= 1e-15:
+            continue
+        states += [(frozenset(F), h) for F in combinations(members, f)]
+    return states
+
+
+def shock_states(groups, components, t_grid):
+    per_group = [_group_states(g, components, t_grid) for g in groups]
+    n_states = int(np.prod([len(s) for s in per_group])) if per_group else 1
+    if n_states > MAX_SHOCK_STATES:
+        raise ValueError(f"CCF şok durumu sayısı çok büyük: {n_states} (> {MAX_SHOCK_STATES}).")
+
+    for combo in product(*per_group):
+        failed = frozenset().union(*(F for F, _ in combo))
+        prob = np.ones_like(np.asarray(t_grid, dtype=float))
+        for _, h in combo:
+            prob = prob * h
+        yield failed, prob
+
+
+# =========================================================
+# 4) Analitik: şok durumuna koşullama
+#    R_sys(t) = Σ_F P(F) · R_sys(t | F'deki üyeler arızalı, diğerleri
+#    bağımsız eğrileriyle). evaluate(curves, failed) herhangi bir motor
+#    (modüler ağaçta yalnız şok üyesi içeren modüller yeniden hesaplanır).
+# =========================================================
+def ccf_condition(evaluate, curves, groups, components, t_grid):
+    zero = np.zeros_like(np.asarray(t_grid, dtype=float))
+    total = None
+
+    for failed, prob in shock_states(groups, components, t_grid):
+        local = dict(curves)
+        for c in failed:
+            local[c] = zero
+        value = prob * evaluate(local, failed)
+        total = value if total is None else total + value
+
+    return np.clip(total, 0.0, 1.0)
+
+
+# =========================================================
+# 4b) Koşullu eğriler (önem ölçüleri / duyarlılık) şok durumlarıyla
+#    conditional(eğri matrisi) -> {ad: (C × T) ya da (T,)} sözlüğü
+#    (ör. batch_eval.conditional_system_curves); her alan
+#    Σ_F P(F) · alan(t | F) olarak toplanır. Bileşen i zorlandığında
+#    (R_i = 1 / 0) şok yalnız diğer üyeleri düşürür.
+#    Marjinal bileşen eğrisi: Σ_F P(F) · x_i(t | F).
+# =========================================================
+def ccf_conditional_curves(conditional, curves, names, groups, components, t_grid):
+    index = {c: i for i, c in enumerate(names)}
+    total = None
+    marginal = np.zeros_like(curves)
+
+    for failed, prob in shock_states(groups, components, t_grid):
+        local = curves.copy()
+        for c in failed:
+            if c in index:
+                local[index[c]] = 0.0
+        cond = conditional(local)
+        if total is None:
+            total = {k: prob * v for k, v in cond.items()}
+        else:
+            for k, v in cond.items():
+                total[k] = total[k] + prob * v
+        marginal += prob * local
+
+    return total, marginal
+
+
+# =========================================================
+# 5) Inclusion–exclusion terim çarpanı (tek geçiş)
+#    E[Π_{i∈U} x_i] = Π_{i∈U} R_i,bağımsız · Π_g P(U ∩ M_g'ye şok yok)
+#    ve P(u'lu belirli bir kümeye şok yok) = g(m − u)
+#    -> her birleşim terimi yalnız |U ∩ M_g| ile çarpılır.
+# =========================================================
+def ccf_union_factor(groups, components, t_grid, names):
+    index = {c: i for i, c in enumerate(names)}
+    tables = []
+    for g in groups:
+        params = group_parameters(g, components)
+        m = len(g["members"])
+        bits = 0
+        for c in g["members"]:
+            if c in index:
+                bits |= 1 << index[c]
+        tables.append((bits, [_no_shock_within(params, m, m - u, t_grid) for u in range(m + 1)]))
+
+    def factor(mask):
+        f = 1.0
+        for bits, table in tables:
+            u = bin(mask & bits).count("1")
+            if u:
+                f = f * table[u]
+        return f
+
+    return factor
+
+
+# =========================================================
+# 6) MTTF = ∫_0^∞ R_sys(t) dt  (koşullu eğri, panel ikiye katlanarak)
+# =========================================================
+def ccf_mttf(system_fn, tau, at_infinity=0.0, tol=1e-8, min_panels=16, max_panels=2048):
+    if at_infinity > 1e-12:
+        return {"mttf": np.inf, "error": 0.0, "converged": True}
+
+    prev = None
+    n_panels = min_panels
+    while n_panels <= max_panels:
+        t_nodes, w = _gauss_nodes(n_panels, tau)
+        value = float(system_fn(t_nodes) @ w)
+
+        if prev is not None:
+            err = abs(value - prev)
+            if err <= tol * max(abs(value), 1e-300):
+                return {"mttf": value, "error": err, "converged": True}
+
+        prev = value
+        n_panels *= 2
+
+    return {"mttf": prev, "error": err, "converged": False}
+
+
+# =========================================================
+# 7) Monte Carlo: grup başına paylaşılan şok vektörü (N örnek)
+#    bağımsız ömür: H_inv(E / pay), E ~ Exp(1)   (ölçeklenmiş hazard)
+#    şoklar: her k'lı alt küme için Exp(λ_k) sütunu; üye ömrü
+#    = min(bağımsız ömür, kendisini içeren alt kümelerin şok zamanları)
+# =========================================================
+def sample_ccf_lifetimes(groups, components, rng, N):
+    lifetimes = {}
+
+    for g in groups:
+        params = group_parameters(g, components)
+        members = g["members"]
+        frac = params["fraction"]
+
+        subsets = [
+            (S, lam)
+            for k, lam in params["shock_rates"].items() if lam > 0
+            for S in combinations(range(len(members)), k)
+        ]
+        shocks = (
+            rng.exponential(1.0, size=(N, len(subsets))) / np.array([lam for _, lam in subsets])
+            if subsets else np.empty((N, 0))
+        )
+
+        for i, c in enumerate(members):
+            data = components[c]
+            E = rng.exponential(1.0, size=N)
+            with np.errstate(divide="ignore", over="ignore"):
+                own = (
+                    DISTRIBUTIONS[data["dist"]]["H_inv"](E / frac, data["params"])
+                    if frac > 0 else np.full(N, np.inf)
+                )
+            cols = [j for j, (S, _) in enumerate(subsets) if i in S]
+            shock = np.min(shocks[:, cols], axis=1) if cols else np.full(N, np.inf)
+            lifetimes[c] = np.minimum(own, shock)
+
+    return lifetimes
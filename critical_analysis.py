@@ -3,26 +3,8 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import matplotlib.ticker as ticker
 
-def find_crossing_time(t, R, level):
-    t = np.asarray(t, dtype=float)
-    R = np.asarray(R, dtype=float)
-
-    mask = np.isfinite(t) & np.isfinite(R)
-    t = t[mask]
-    R = R[mask]
-
-    if np.all(R > level):
-        return None
-
-    k = np.argmax(R <= level)
-
-    if k == 0:
-        return t[0]
-
-    t1, t2 = t[k-1], t[k]
-    r1, r2 = R[k-1], R[k]
-
-    return t1 + (level - r1) * (t2 - t1) / (r2 - r1)
+from time_grid import trapezoid_weights, find_crossing_time
+from mc_archive import STREAM_CHUNK, count_finite, stream_extent, survival_counts
 
 
 def plot_critical_intervals(results_dict):
@@ -217,24 +199,28 @@ def plot_path_robustness(results_dict, paths_dict):
     plt.tight_layout()
     plt.show()
 
-def plot_sensitivity_tornado(mttf_base, sensitivity_results):
+def plot_sensitivity_tornado(mttf_base, sensitivity_results, xlabel="ΔMTTF",
+                             title="Sensitivity Analysis (Tornado Chart)"):
     """
     sensitivity_results = {
-      "a1": +120,
-      "a2": -80,
+      "a1 · λ": -0.42,
+      "a2 · η": +0.31,
       ...
     }
+    En büyük |etki| en üstte olacak şekilde sıralanır.
     """
 
-    names = list(sensitivity_results.keys())
-    effects = list(sensitivity_results.values())
+    ordered = sorted(sensitivity_results.items(), key=lambda kv: abs(kv[1]))
+    names = [k for k, _ in ordered]
+    effects = [v for _, v in ordered]
+    colors = ["tab:red" if v < 0 else "tab:blue" for v in effects]
 
-    plt.figure(figsize=(6, 4))
-    plt.barh(names, effects)
+    plt.figure(figsize=(6, max(4, 0.3 * len(names))))
+    plt.barh(names, effects, color=colors)
     plt.axvline(0, color="black")
 
-    plt.xlabel("ΔMTTF")
-    plt.title("Sensitivity Analysis (Tornado Chart)")
+    plt.xlabel(xlabel)
+    plt.title(f"{title}\nMTTF = {mttf_base:.4g}")
     plt.tight_layout()
     plt.show()
 
@@ -335,17 +321,27 @@ def plot_survival_and_cdf(T_sys_samples, title_prefix="System Lifetime"):
     Survival: S(t)=P(T>t)  (bu aslında R(t) ile aynı anlamda kullanılabilir)
     CDF: F(t)=P(T<=t)
     """
-    T = np.asarray(T_sys_samples, dtype=float)
-    T = T[np.isfinite(T)]
-    if T.size < 5:
-        print("[WARN] plot_survival_and_cdf: Yeterli sample yok.")
-        return
-
-    T_sorted = np.sort(T)
-    n = T_sorted.size
-
-    # Empirical CDF: F(t_i)=i/n
-    F = np.arange(1, n + 1) / n
+    if len(T_sys_samples) > STREAM_CHUNK:
+        # büyük / memmap örnek: tam sıralama yerine sabit ızgarada parça sayımı
+        lo, hi = stream_extent(T_sys_samples)
+        if not np.isfinite(lo):
+            print("[WARN] plot_survival_and_cdf: Yeterli sample yok.")
+            return
+        T_sorted = np.linspace(lo, hi, 2000)
+        n_le, _ = survival_counts(T_sys_samples, T_sorted)
+        F = n_le / max(count_finite(T_sys_samples), 1)
+    else:
+        T = np.asarray(T_sys_samples, dtype=float)
+        T = T[np.isfinite(T)]
+        if T.size < 5:
+            print("[WARN] plot_survival_and_cdf: Yeterli sample yok.")
+            return
+
+        T_sorted = np.sort(T)
+        n = T_sorted.size
+
+        # Empirical CDF: F(t_i)=i/n
+        F = np.arange(1, n + 1) / n
     # Survival: S(t)=1-F(t)
     S = 1.0 - F
 
@@ -478,8 +474,9 @@ def plot_hazard_rate(t, R, title="Estimated Hazard Rate"):
 
     R_safe = np.clip(R, 1e-10, 1.0)
 
-    dR_dt = np.gradient(R_safe, t)
-    hazard = -dR_dt / R_safe
+    # h(t) = -d ln R / dt ; np.gradient uniform olmayan (adaptif) gridde
+    # ikinci derece doğru merkezi farkı kullanır
+    hazard = -np.gradient(np.log(R_safe), t)
 
     hazard = np.nan_to_num(hazard, nan=0.0, posinf=0.0, neginf=0.0)
     hazard = np.maximum(hazard, 0.0)
@@ -567,7 +564,13 @@ def build_validation_table(
     R_analytic_interp = np.interp(t_mc, t_analytic, R_analytic)
 
     abs_err = np.abs(R_analytic_interp - R_mc)
-    rmse = np.sqrt(np.mean((R_analytic_interp - R_mc) ** 2))
+
+    # Uniform olmayan gridde RMSE zaman ağırlıklı: sqrt(∫ e² dt / T)
+    w = trapezoid_weights(t_mc)
+    if np.sum(w) > 0:
+        rmse = np.sqrt(np.sum(w * (R_analytic_interp - R_mc) ** 2) / np.sum(w))
+    else:
+        rmse = np.sqrt(np.mean((R_analytic_interp - R_mc) ** 2))
     max_abs_err = np.max(abs_err)
 
     r_end_analytic = float(R_analytic_interp[-1])
@@ -731,7 +734,7 @@ def plot_path_contributions(path_contrib, component_paths, top_k=8, title="Monte
 
 
 
-def plot_mc_component_importance(importance_dict, title="Monte Carlo Component Importance (ΔMTTF)"):
+def plot_mc_component_importance(importance_dict, title="Monte Carlo Component Importance (ΔMTTF)", xlabel="ΔMTTF"):
     import matplotlib.pyplot as plt
 
     if not importance_dict:
@@ -747,16 +750,64 @@ def plot_mc_component_importance(importance_dict, title="Monte Carlo Component I
     bars = plt.barh(range(len(values)), values)
 
     plt.yticks(range(len(names)), names)
-    plt.xlabel("ΔMTTF")
+    plt.xlabel(xlabel)
     plt.title(title)
     plt.gca().invert_yaxis()
     plt.axvline(0, color="black", linewidth=1)
     plt.grid(axis="x", linestyle="--", alpha=0.4)
 
+    offset = 0.01 * max(max(abs(v) for v in values), 1e-12)
     for i, v in enumerate(values):
-        x_text = v + 0.5 if v >= 0 else v - 0.5
+        x_text = v + offset if v >= 0 else v - offset
         ha = "left" if v >= 0 else "right"
         plt.text(x_text, i, f"{v:.2f}", va="center", ha=ha)
 
     plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    plt.show()
+
+
+
+def plot_importance_curves(t, values, names, title="Time-Resolved Importance", ylabel="Importance", top_k=8):
+    """
+    values: (C, T) önem ölçüsü eğrileri (importance.importance_measures)
+    Son noktadaki değere göre en önemli top_k bileşen çizilir.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.size == 0:
+        print("[WARN] plot_importance_curves: veri yok.")
+        return
+
+    last = np.nan_to_num(values[:, -1], nan=-np.inf)
+    order = np.argsort(last)[::-1][:top_k]
+
+    plt.figure(figsize=(8, 5))
+    for i in order:
+        plt.plot(t, values[i], label=names[i])
+
+    plt.xlabel("Time (t)")
+    plt.ylabel(ylabel)
+    plt.title(title)
+    plt.grid(True, linestyle="--", alpha=0.4)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
+
+
+
+def plot_reliability_bounds(t, R_lower, R_upper, R=None, title="Esary–Proschan Bounds"):
+    plt.figure(figsize=(8, 5))
+    plt.fill_between(t, R_lower, R_upper, alpha=0.25, label="EP bracket")
+    plt.plot(t, R_lower, linestyle="--", linewidth=1, label="Lower (min-cut)")
+    plt.plot(t, R_upper, linestyle="--", linewidth=1, label="Upper (min-path)")
+
+    if R is not None:
+        plt.plot(t, R, color="black", linewidth=2, label="Analytic R(t)")
+
+    plt.xlabel("Time (t)")
+    plt.ylabel("R(t)")
+    plt.title(title)
+    plt.ylim(-0.02, 1.02)
+    plt.grid(True, linestyle="--", alpha=0.4)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
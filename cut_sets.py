@@ -0,0 +1,161 @@
+import numpy as np
+
+from analytic import path_bitmasks, _mask_rows
+
+
+# =========================================================
+# 1) Üst küme eleme (bit maskeleri)
+#    Küçükten büyüğe sıralanır; daha önce tutulan bir maskeyi
+#    (m & k == k) içeren her maske atılır -> yalnız minimal kümeler.
+#    progress(done, total): büyük ailelerde ara bildirim / iptal noktası
+# =========================================================
+ELIMINATE_PROGRESS_EVERY = 1024
+
+
+def eliminate_supersets(masks, progress=None):
+    kept = []
+    ordered = sorted(set(masks), key=lambda x: (bin(x).count("1"), x))
+    for i, m in enumerate(ordered):
+        if progress is not None and i % ELIMINATE_PROGRESS_EVERY == 0:
+            progress(i, len(ordered))
+        if not any(m & k == k for k in kept):
+            kept.append(m)
+    return kept
+
+
+# =========================================================
+# 2) Minimal kesim kümeleri = minimal yol kümelerinin dualı
+#    (minimal hitting set / transversal, Berge algoritması)
+#    Yollar tek tek işlenir: yolu zaten kesen kesimler (hit) kalır,
+#    kesmeyenler (miss) yolun her elemanı e ile genişletilir.
+#    Antichain özelliği sayesinde c|e yalnız e'yi içeren bir hit
+#    kesimi tarafından kapsanabilir -> tam üst küme eleme gerekmez.
+#    max_order verilirse daha büyük kesimler atılır; mertebesi
+#    ≤ max_order olan tüm minimal kesimler yine bulunur
+#    (Esary–Proschan alt sınırı için TÜM kesimler gerekir).
+# =========================================================
+def minimal_cut_masks(path_masks, max_order=None, progress=None):
+    paths = eliminate_supersets(path_masks, progress=progress)
+    if not paths:
+        return []
+
+    cuts = [0]
+    for i, p in enumerate(paths):
+        if progress is not None:
+            progress(i, len(paths))
+        hit = [c for c in cuts if c & p]
+        miss = [c for c in cuts if not c & p]
+
+        extended = set()
+        bits = p
+        while bits:
+            e = bits & -bits
+            bits ^= e
+            covers = [h for h in hit if h & e]
+
+            for c in miss:
+                x = c | e
+                if max_order is not None and bin(x).count("1") > max_order:
+                    continue
+                if not any(h & x == h for h in covers):
+                    extended.add(x)
+
+        cuts = hit + sorted(extended)
+
+    return sorted(cuts, key=lambda x: (bin(x).count("1"), x))
+
+
+def masks_to_sets(masks, names):
+    return [
+        frozenset(names[i] for i in _mask_rows(m, len(names)))
+        for m in masks
+    ]
+
+
+def minimal_cut_sets(component_paths, max_order=None):
+    names, path_masks = path_bitmasks(component_paths)
+    cut_masks = minimal_cut_masks(path_masks, max_order=max_order)
+
+    return {
+        "names": names,
+        "path_masks": eliminate_supersets(path_masks),
+        "cut_masks": cut_masks,
+        "cut_sets": masks_to_sets(cut_masks, names),
+        "complete": max_order is None,
+    }
+
+
+def _incidence(masks, n_comp):
+    M = np.zeros((len(masks), n_comp))
+    for r, m in enumerate(masks):
+        M[r, _mask_rows(m, n_comp)] = 1.0
+    return M
+
+
+# =========================================================
+# 3) Esary–Proschan sınırları, zaman gridi üzerinde vektörel
+#    curves: (C, T) bileşen R(t), names sırasıyla
+#
+#      Π_K [1 − Π_{j∈K} Q_j]  ≤  R_sys  ≤  1 − Π_P [1 − Π_{j∈P} R_j]
+#
+#    Basit min–max sınırlarıyla da sıkılaştırılır:
+#      max_P Π_P R_j  ≤  R_sys  ≤  min_K [1 − Π_K Q_j]
+#    Maliyet: iki matris çarpımı, O((P + K) · C · T).
+# =========================================================
+def esary_proschan_bounds(path_masks, cut_masks, curves, complete=True):
+    curves = np.clip(np.asarray(curves, dtype=float), 0.0, 1.0)
+    n_comp = curves.shape[0]
+
+    P = _incidence(path_masks, n_comp)
+    K = _incidence(cut_masks, n_comp)
+
+    log_R = np.log(np.clip(curves, 1e-300, None))
+    log_Q = np.log(np.clip(1.0 - curves, 1e-300, None))
+
+    path_prob = np.exp(P @ log_R)              # (P, T)
+    cut_prob = np.exp(K @ log_Q)               # (K, T)
+
+    upper = 1.0 - np.exp(np.sum(np.log1p(-np.clip(path_prob, 0.0, 1.0 - 1e-16)), axis=0))
+    upper = np.where(np.any(path_prob >= 1.0 - 1e-16, axis=0), 1.0, upper)
+    if cut_prob.size:
+        upper = np.minimum(upper, np.min(1.0 - cut_prob, axis=0))
+
+    if complete and cut_prob.size:
+        lower = np.prod(1.0 - cut_prob, axis=0)
+    else:
+        # kesim listesi eksikse EP alt sınırı geçersiz -> yalnız min–max
+        lower = np.zeros(curves.shape[1])
+    lower = np.maximum(lower, np.max(path_prob, axis=0))
+
+    return {
+        "R_lower": np.clip(lower, 0.0, 1.0),
+        "R_upper": np.clip(upper, 0.0, 1.0),
+        "path_prob": path_prob,
+        "cut_prob": cut_prob,
+    }
+
+
+# =========================================================
+# 4) En küçük / en olası N kesim
+#    by="order": mertebe (bileşen sayısı), eşitlikte olasılık
+#    by="probability": t anındaki Π Q_j (cut_prob[:, t_index])
+# =========================================================
+def top_cut_sets(cut_masks, names, cut_prob=None, n=10, by="order", t_index=-1):
+    if by not in ("order", "probability"):
+        raise ValueError(f"Geçersiz sıralama ölçütü: {by}")
+
+    rows = []
+    for r, m in enumerate(cut_masks):
+        q = float(cut_prob[r, t_index]) if cut_prob is not None else np.nan
+        rows.append({
+            "components": tuple(names[i] for i in _mask_rows(m, len(names))),
+            "order": bin(m).count("1"),
+            "Q": q,
+        })
+
+    if by == "order":
+        rows.sort(key=lambda r: (r["order"], -np.nan_to_num(r["Q"], nan=0.0)))
+    else:
+        rows.sort(key=lambda r: (-np.nan_to_num(r["Q"], nan=0.0), r["order"]))
+
+    return rows[:n]
@@ -0,0 +1,438 @@
+import hashlib
+
+import numpy as np
+
+from analytic import (
+    component_rt_curves,
+    inclusion_exclusion,
+    survival_at_infinity,
+    path_bitmasks,
+    union_coefficients,
+    _mask_rows,
+    characteristic_time,
+    component_descriptor,
+    _gauss_nodes,
+)
+from cut_sets import eliminate_supersets, minimal_cut_masks, masks_to_sets
+from symmetry import symmetric_union
+
+
+# =========================================================
+# 1) Yardımcılar: minimal aile, bileşen grupları (union-find)
+# =========================================================
+def _minimal_family(sets, progress=None):
+    names, masks = path_bitmasks(sets)
+    return masks_to_sets(eliminate_supersets(masks, progress=progress), names)
+
+
+def _disjoint_groups(sets):
+    # Ortak bileşeni olan kümeler aynı gruba düşer
+    parent = {}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for s in sets:
+        items = sorted(s)
+        for c in items:
+            parent.setdefault(c, c)
+        for c in items[1:]:
+            ra, rb = find(items[0]), find(c)
+            if ra != rb:
+                parent[rb] = ra
+
+    groups = {}
+    for c in parent:
+        groups.setdefault(find(c), set()).add(c)
+    return [frozenset(g) for g in groups.values()]
+
+
+def _component(name):
+    return {"type": "component", "name": name, "components": frozenset([name])}
+
+
+def _series(children):
+    flat = []
+    for ch in children:
+        flat.extend(ch["children"] if ch["type"] == "series" else [ch])
+    if len(flat) == 1:
+        return flat[0]
+    return {
+        "type": "series",
+        "children": flat,
+        "components": frozenset().union(*(ch["components"] for ch in flat)),
+    }
+
+
+def _parallel(children):
+    flat = []
+    for ch in children:
+        flat.extend(ch["children"] if ch["type"] == "parallel" else [ch])
+    return {
+        "type": "parallel",
+        "children": flat,
+        "components": frozenset().union(*(ch["components"] for ch in flat)),
+    }
+
+
+# =========================================================
+# 2) Modüler ayrıştırma (minimal yol aileleri üzerinde, özyinelemeli)
+#    - Yol kümeleri bileşen paylaşmayan gruplara ayrılıyorsa: PARALEL
+#    - Tüm yollarda ortak bileşenler: SERİ tekil bileşenler
+#    - Minimal kesimler bileşen paylaşmayan gruplara ayrılıyorsa: SERİ
+#      (seri bağlantının dualı), her grup yolların izdüşümüyle iner
+#    - Hiçbiri değilse iç modüller (ikizler) tek bir atoma indirgenir:
+#        seri ikiz:   tam olarak aynı yollarda bulunan bileşenler
+#        paralel ikiz: aynı yolda hiç birlikte olmayan ve yolun geri
+#                      kalanı (bağlam) aynı olan bileşenler
+#      ve ayrıştırma indirgenmiş aile üzerinde tekrarlanır.
+#    - İndirgenemez modül; yol ya da kesim ailesinden küçük olanı
+#      üzerinde inclusion–exclusion ile çözülür.
+#
+#    atoms: {atom_adı: alt ağaç}; indirgenmiş iç modüller yollarda
+#    tek bir isimle ("#1", "#2", ...) temsil edilir.
+#    progress(done, total): üst küme eleme / kesim üretimi sırasında
+#    ara bildirim (iptal için istisna fırlatabilir).
+# =========================================================
+def decompose(component_paths, progress=None):
+    paths = _minimal_family([p for p in component_paths if p], progress)
+    if not paths:
+        raise ValueError("Ayrıştırma için en az bir boş olmayan yol gerekli.")
+    return _decompose(paths, {}, [0], progress)
+
+
+def _leaf(name, atoms):
+    return atoms[name] if name in atoms else _component(name)
+
+
+def _decompose(paths, atoms, counter, progress=None):
+    if len(paths) == 1:
+        return _series([_leaf(c, atoms) for c in sorted(paths[0])])
+
+    # --- paralel ayrışma ---
+    groups = _disjoint_groups(paths)
+    if len(groups) > 1:
+        return _parallel([
+            _decompose([p for p in paths if p <= g], atoms, counter, progress)
+            for g in sorted(groups, key=lambda g: sorted(g))
+        ])
+
+    # --- tüm yollarda ortak bileşenler (seri) ---
+    common = frozenset.intersection(*paths)
+    if common:
+        rest = _minimal_family([p - common for p in paths], progress)
+        return _series([_leaf(c, atoms) for c in sorted(common)] + [_decompose(rest, atoms, counter, progress)])
+
+    # --- kesim ailesi üzerinden seri ayrışma ---
+    names, masks = path_bitmasks(paths)
+    cuts = masks_to_sets(minimal_cut_masks(masks, progress=progress), names)
+
+    cut_groups = _disjoint_groups(cuts)
+    if len(cut_groups) > 1:
+        return _series([
+            _decompose(_minimal_family([p & g for p in paths], progress), atoms, counter, progress)
+            for g in sorted(cut_groups, key=lambda g: sorted(g))
+        ])
+
+    # --- iç modülleri (seri / paralel ikizler) atomlara indir ---
+    reduced = _reduce_twins(paths, atoms, counter, progress)
+    if reduced is not None:
+        return _decompose(reduced, atoms, counter, progress)
+
+    engine = "paths" if len(paths) <= len(cuts) else "cuts"
+    return {
+        "type": "module",
+        "paths": paths,
+        "cuts": cuts,
+        "engine": engine,
+        "atoms": {a: atoms[a] for a in names if a in atoms},
+        "components": frozenset().union(*(_leaf(a, atoms)["components"] for a in names)),
+    }
+
+
+def _reduce_twins(paths, atoms, counter, progress=None):
+    names = sorted(frozenset().union(*paths))
+    containing = {c: frozenset(i for i, p in enumerate(paths) if c in p) for c in names}
+
+    # seri ikizler: aynı yol indeks kümesi
+    by_paths = {}
+    for c in names:
+        by_paths.setdefault(containing[c], []).append(c)
+    groups = [("series", g) for g in by_paths.values() if len(g) > 1]
+
+    # paralel ikizler: aynı bağlam {p − c}
+    if not groups:
+        by_context = {}
+        for c in names:
+            context = frozenset(paths[i] - {c} for i in containing[c])
+            by_context.setdefault(context, []).append(c)
+        groups = [("parallel", g) for g in by_context.values() if len(g) > 1]
+
+    if not groups:
+        return None
+
+    replace = {}
+    for kind, members in groups:
+        counter[0] += 1
+        atom = f"#{counter[0]}"
+        leaves = [_leaf(c, atoms) for c in members]
+        atoms[atom] = _series(leaves) if kind == "series" else _parallel(leaves)
+        for c in members:
+            replace[c] = atom
+
+    return _minimal_family([frozenset(replace.get(c, c) for c in p) for p in paths], progress)
+
+
+def count_modules(tree):
+    if tree["type"] == "module":
+        return 1
+    if tree["type"] == "component":
+        return 0
+    return sum(count_modules(ch) for ch in tree["children"])
+
+
+def is_trivial(tree):
+    # Tek parça indirgenemez modül: ayrıştırma kazanç sağlamaz
+    # (simetri grupları işaretlenmişse kombinatorik sayım yine kazançlı)
+    return tree["type"] == "module" and not tree.get("symmetry")
+
+
+def describe(tree):
+    if tree["type"] == "component":
+        return tree["name"]
+    if tree["type"] == "module":
+        atoms = tree["atoms"]
+        parts = sorted(describe(atoms[a]) if a in atoms else a for a in frozenset().union(*tree["paths"]))
+        return f"M[{', '.join(parts)}]"
+    sep = " · " if tree["type"] == "series" else " ∥ "
+    return "(" + sep.join(describe(ch) for ch in tree["children"]) + ")"
+
+
+# =========================================================
+# 3) Sembolik yapı ifadesi (açılmamış): seri = çarpım,
+#    paralel = 1 − Π(1 − R), modül = birleşim katsayılarıyla IE
+# =========================================================
+def structure_expression(tree, symbol_map):
+    if tree["type"] == "component":
+        return symbol_map[tree["name"]]
+
+    if tree["type"] == "series":
+        expr = 1
+        for ch in tree["children"]:
+            expr *= structure_expression(ch, symbol_map)
+        return expr
+
+    if tree["type"] == "parallel":
+        q = 1
+        for ch in tree["children"]:
+            q *= 1 - structure_expression(ch, symbol_map)
+        return 1 - q
+
+    local = dict(symbol_map)
+    for a, sub in tree["atoms"].items():
+        local[a] = structure_expression(sub, symbol_map)
+
+    names, masks = path_bitmasks(tree["paths"])
+    expr = 0
+    for mask, coef in union_coefficients(masks).items():
+        term = coef
+        for i in _mask_rows(mask, len(names)):
+            term *= local[names[i]]
+        expr += term
+    return expr
+
+
+# =========================================================
+# 4) Sayısal değerlendirme + modül önbelleği
+#    Önbellek anahtarı: (modül yol ailesi, modüldeki bileşenlerin
+#    imzaları). İmza dağılım, parametreler, zaman gridi ve CCF'yi
+#    içerir; bir modül düzenlenince yalnız o modül yeniden hesaplanır.
+# =========================================================
+def component_signatures(components, t_grid, ccf_key=None):
+    grid_key = hashlib.sha1(np.ascontiguousarray(t_grid, dtype=float).tobytes()).hexdigest()
+
+    return {
+        c: (component_descriptor(data), grid_key, ccf_key)
+        for c, data in components.items()
+    }
+
+
+def _module_curve(node, curves, progress=None, truncation=None):
+    family = node["paths"] if node["engine"] == "paths" else node["cuts"]
+    names, masks = path_bitmasks(family)
+
+    if node["engine"] == "paths":
+        x = np.vstack([curves[c] for c in names])
+    else:
+        x = np.vstack([1.0 - curves[c] for c in names])
+
+    # symmetry.annotate_symmetry ile işaretlenmiş yer değiştirebilir gruplar
+    if node.get("symmetry"):
+        value, n_terms = symmetric_union(family, x, node["symmetry"], progress=progress)
+        R = value if node["engine"] == "paths" else 1.0 - value
+        return np.clip(R, 0.0, 1.0), None, n_terms
+
+    # Kesik açılım: yalnız bu modülün ailesi üzerinde Bonferroni bandı;
+    # kesim motorunda bant P(∪ kesim) için, R = 1 − Q ile ters çevrilir
+    if truncation is not None:
+        tol, max_terms = truncation
+        # (zaman gridi burada yalnız eğri uzunluğu için gerekli)
+        result = inclusion_exclusion(
+            family, dict(zip(names, x)), np.zeros(x.shape[1]), tol=tol, max_terms=max_terms,
+            progress=progress, build_progress=progress
+        )
+        if result["levels"] < len(family):
+            if node["engine"] == "paths":
+                return result["r_lower"], result["r_upper"], result["terms"]
+            return 1.0 - result["r_upper"], 1.0 - result["r_lower"], result["terms"]
+        value, n_terms = result["system_r"], result["terms"]
+    else:
+        log_x = np.log(np.clip(x, 1e-300, None))
+
+        coefs = union_coefficients(masks, progress=progress)
+        M = np.zeros((len(coefs), len(names)))
+        for r, mask in enumerate(coefs):
+            M[r, _mask_rows(mask, len(names))] = 1.0
+
+        value = np.array(list(coefs.values())) @ np.exp(M @ log_x)
+        n_terms = len(coefs)
+
+    R = value if node["engine"] == "paths" else 1.0 - value
+    return np.clip(R, 0.0, 1.0), None, n_terms
+
+
+def evaluate_decomposition(tree, curves, cache=None, signatures=None, max_cache=256, progress=None,
+                           truncation=None):
+    # progress(done, total): değerlendirilen IE modülü; modül içi
+    # döngüler de aynı değerle çağırır (iptal noktası)
+    # truncation=(tol, max_terms): büyük modüller kesik IE ile; her düğüm
+    # (alt, üst) sınır çifti döndürür, üst=None -> kesin. Yapı monoton
+    # olduğundan alt (üst) sınırlar alt (üst) girdilerle birleştirilir.
+    stats = {"modules": 0, "terms": 0, "cache_hits": 0, "truncated_modules": 0}
+    n_modules = count_modules(tree) if progress is not None else 0
+
+    def checkpoint(*_):
+        progress(stats["modules"] - 1, n_modules)
+
+    def combine(kind, parts):
+        if kind == "series":
+            R = 1.0
+            for value, m in parts:
+                R = R * value ** m
+            return R
+        Q = 1.0
+        for value, m in parts:
+            Q = Q * (1.0 - value) ** m
+        return 1.0 - Q
+
+    def walk(node):
+        if node["type"] == "component":
+            return np.clip(np.asarray(curves[node["name"]], dtype=float), 0.0, 1.0), None
+
+        # özdeş dallar ("classes"): temsilci bir kez, m kat kuvvetle
+        if node["type"] in ("series", "parallel"):
+            classes = node.get("classes") or [[i] for i in range(len(node["children"]))]
+            parts = [(walk(node["children"][cls[0]]), len(cls)) for cls in classes]
+            lower = combine(node["type"], [(lo, m) for (lo, _), m in parts])
+            if all(hi is None for (_, hi), _ in parts):
+                return lower, None
+            return lower, combine(node["type"], [(lo if hi is None else hi, m) for (lo, hi), m in parts])
+
+        stats["modules"] += 1
+        if progress is not None:
+            checkpoint()
+        key = None
+        if cache is not None and signatures is not None:
+            key = (
+                frozenset(node["paths"]),
+                tuple(sorted((a, describe(sub)) for a, sub in node["atoms"].items())),
+                tuple(sorted((c, signatures[c]) for c in node["components"])),
+                truncation,
+            )
+            if key in cache:
+                stats["cache_hits"] += 1
+                if cache[key][1] is not None:
+                    stats["truncated_modules"] += 1
+                return cache[key]
+
+        local = dict(curves)
+        local_hi = None
+        for a, sub in node["atoms"].items():
+            local[a], hi = walk(sub)
+            if hi is not None:
+                local_hi = {} if local_hi is None else local_hi
+                local_hi[a] = hi
+
+        module_progress = checkpoint if progress is not None else None
+        lower, upper, n_terms = _module_curve(node, local, progress=module_progress, truncation=truncation)
+        if local_hi is not None:
+            # atom bantları: üst sınır, üst atom eğrileriyle yeniden
+            hi_lower, hi_upper, more = _module_curve(
+                node, dict(local, **local_hi), progress=module_progress, truncation=truncation
+            )
+            upper = hi_lower if hi_upper is None else hi_upper
+            n_terms += more
+        stats["terms"] += n_terms
+        if upper is not None:
+            stats["truncated_modules"] += 1
+
+        if key is not None:
+            cache[key] = (lower, upper)
+            while len(cache) > max_cache:
+                cache.pop(next(iter(cache)))
+        return lower, upper
+
+    lower, upper = walk(tree)
+    stats["r_lower"] = lower
+    stats["r_upper"] = lower if upper is None else upper
+    return (lower if upper is None else 0.5 * (lower + upper)), stats
+
+
+# =========================================================
+# 5) Modüler MTTF = ∫_0^∞ R_sys(t) dt
+#    Ayrıştırma ağacı [0, ∞) Gauss–Legendre düğümlerinde
+#    değerlendirilir; panel sayısı ikiye katlanarak hata tahmini.
+# =========================================================
+def modular_mttf(tree, components, ccf_beta=None, ccf_lambda=None, tol=1e-8,
+                 min_panels=16, max_panels=2048, progress=None, truncation=None):
+    names = sorted(tree["components"])
+    use_ccf = ccf_beta is not None and ccf_beta > 0 and ccf_lambda is not None
+
+    # R_sys(∞) > 0 (statik bileşenlerle çalışan bir yol) -> MTTF = ∞
+    at_infinity = {c: np.array([survival_at_infinity(components[c])]) for c in names}
+    if evaluate_decomposition(tree, at_infinity, truncation=truncation)[1]["r_lower"][0] > 1e-12:
+        return {"mttf": np.inf, "error": 0.0, "bounds": None, "converged": True}
+
+    tau = characteristic_time(components, names, default=1.0 / ccf_lambda if use_ccf else 1.0)
+
+    # Kesik modüllerde alt / üst zarflar ayrı integre edilir: MTTF bandı
+    prev = None
+    n_panels = min_panels
+    while n_panels <= max_panels:
+        t_nodes, w = _gauss_nodes(n_panels, tau)
+        curves = component_rt_curves(
+            {c: components[c] for c in names}, t_nodes,
+            ccf=(ccf_beta, np.exp(-ccf_lambda * t_nodes)) if use_ccf else None
+        )
+
+        _, stats = evaluate_decomposition(tree, curves, progress=progress, truncation=truncation)
+        value = np.array([stats["r_lower"] @ w, stats["r_upper"] @ w])
+
+        if prev is not None:
+            err = float(np.max(np.abs(value - prev)))
+            if err <= tol * max(float(np.max(np.abs(value))), 1e-300):
+                break
+
+        prev = value
+        n_panels *= 2
+
+    lo, hi = float(value[0]), float(value[1])
+    return {
+        "mttf": 0.5 * (lo + hi),
+        "error": err,
+        "bounds": (lo, hi) if hi > lo else None,
+        "converged": n_panels <= max_panels,
+    }
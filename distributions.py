@@ -3,7 +3,12 @@ import sympy
     # LogNormal hatasını çözmek için erf, erfc, sqrt eklendi
 from sympy import erf, erfc, sqrt 
 from sympy import symbols, expand, exp, log, Symbol
-from scipy.stats import lognorm, gamma
+# R_num: scipy.special ile doğrudan survival (stats.cdf'den çok daha hızlı,
+# parametre dizileriyle de yayınlanabilir)
+from scipy.special import gamma as gamma_fn, gammaln, exp1, gammaincc, erfc as erfc_num
+# H_inv: kümülatif hazard tersi, H(t) = −ln R(t) = h  ->  t
+# (CCF'de ölçeklenmiş hazard (1−β)·H ile vektörel örnekleme için)
+from scipy.special import ndtri, gammainccinv
 rng = np.random.default_rng()
 DISTRIBUTIONS = {
     "Exponential": {
@@ -11,7 +16,13 @@ DISTRIBUTIONS = {
             {"key": "lambda", "label": "λ (Failure rate)", "type": float}
         ],
         "R_sym": lambda t, p: exp(-p["lambda"] * t),
-        "sample": lambda p: rng.exponential(1 / p["lambda"])
+        "R_num": lambda t, p: np.exp(-p["lambda"] * t),
+        "sample": lambda p: rng.exponential(1 / p["lambda"]),
+        "mean": lambda p: 1.0 / p["lambda"],
+        "H_inv": lambda h, p: h / p["lambda"],
+        "dR": {
+            "lambda": lambda t, p: -t * np.exp(-p["lambda"] * t)
+        }
     },
 
     "Weibull": {
@@ -20,7 +31,20 @@ DISTRIBUTIONS = {
             {"key": "eta",  "label": "η (Scale)", "type": float}
         ],
         "R_sym": lambda t, p: exp(-(t / p["eta"]) ** p["beta"]),
-        "sample": lambda p: rng.weibull(p["beta"]) * p["eta"]
+        "R_num": lambda t, p: np.exp(-(t / p["eta"]) ** p["beta"]),
+        "sample": lambda p: rng.weibull(p["beta"]) * p["eta"],
+        "mean": lambda p: p["eta"] * gamma_fn(1.0 + 1.0 / p["beta"]),
+        "H_inv": lambda h, p: p["eta"] * h ** (1.0 / p["beta"]),
+        "dR": {
+            "beta": lambda t, p: (
+                -np.exp(-(t / p["eta"]) ** p["beta"])
+                * (t / p["eta"]) ** p["beta"] * np.log(t / p["eta"])
+            ),
+            "eta": lambda t, p: (
+                np.exp(-(t / p["eta"]) ** p["beta"])
+                * (t / p["eta"]) ** p["beta"] * p["beta"] / p["eta"]
+            )
+        }
     },
 
     "Log-Normal": {
@@ -29,8 +53,21 @@ DISTRIBUTIONS = {
             {"key": "sigma", "label": "σ (Std log)",  "type": float}
         ],
         "R_sym": None,  # numerik hesaplanacak
-        "R_num": lambda t, p: 1 - lognorm.cdf(t, s=p["sigma"], scale=np.exp(p["mu"])),
-        "sample": lambda p: rng.lognormal(p["mu"], p["sigma"])
+        "R_num": lambda t, p: 0.5 * erfc_num((np.log(t) - p["mu"]) / (p["sigma"] * np.sqrt(2.0))),
+        "sample": lambda p: rng.lognormal(p["mu"], p["sigma"]),
+        "mean": lambda p: np.exp(p["mu"] + 0.5 * p["sigma"] ** 2),
+        "H_inv": lambda h, p: np.exp(p["mu"] + p["sigma"] * ndtri(-np.expm1(-h))),
+        "dR": {
+            "mu": lambda t, p: (
+                np.exp(-0.5 * ((np.log(t) - p["mu"]) / p["sigma"]) ** 2)
+                / (np.sqrt(2 * np.pi) * p["sigma"])
+            ),
+            "sigma": lambda t, p: (
+                np.exp(-0.5 * ((np.log(t) - p["mu"]) / p["sigma"]) ** 2)
+                / np.sqrt(2 * np.pi)
+                * (np.log(t) - p["mu"]) / p["sigma"] ** 2
+            )
+        }
     },
 
     "Gamma": {
@@ -39,8 +76,17 @@ DISTRIBUTIONS = {
             {"key": "theta", "label": "θ (Scale)", "type": float}
         ],
         "R_sym": None,  # gammaincc ile
-        "R_num": lambda t, p: 1 - gamma.cdf(t, a=p["alpha"], scale=p["theta"]),
-        "sample": lambda p: rng.gamma(p["alpha"], p["theta"])
+        "R_num": lambda t, p: gammaincc(p["alpha"], t / p["theta"]),
+        "sample": lambda p: rng.gamma(p["alpha"], p["theta"]),
+        "mean": lambda p: p["alpha"] * p["theta"],
+        "H_inv": lambda h, p: p["theta"] * gammainccinv(p["alpha"], np.exp(-h)),
+        # ∂/∂α kapalı formda değil (Meijer-G) -> sensitivity'de sayısal türev
+        "dR": {
+            "theta": lambda t, p: (
+                np.exp(p["alpha"] * np.log(t / p["theta"]) - t / p["theta"] - gammaln(p["alpha"]))
+                / p["theta"]
+            )
+        }
     },
 
     "Log-Logistic": {
@@ -49,17 +95,42 @@ DISTRIBUTIONS = {
             {"key": "beta",  "label": "β (Shape)", "type": float}
         ],
         "R_sym": lambda t, p: 1 / (1 + (t / p["alpha"]) ** p["beta"]),
+        "R_num": lambda t, p: 1 / (1 + (t / p["alpha"]) ** p["beta"]),
         "sample": lambda p: (
             p["alpha"] *
             (rng.random() / (1 - rng.random())) ** (1 / p["beta"])
-        )
+        ),
+        "mean": lambda p: np.where(
+            np.asarray(p["beta"]) > 1,
+            p["alpha"] * (np.pi / p["beta"]) / np.sin(np.pi / p["beta"]),
+            np.inf
+        ),
+        "H_inv": lambda h, p: p["alpha"] * np.expm1(h) ** (1.0 / p["beta"]),
+        "dR": {
+            "alpha": lambda t, p: (
+                (t / p["alpha"]) ** p["beta"] * p["beta"] / p["alpha"]
+                / (1 + (t / p["alpha"]) ** p["beta"]) ** 2
+            ),
+            "beta": lambda t, p: (
+                -(t / p["alpha"]) ** p["beta"] * np.log(t / p["alpha"])
+                / (1 + (t / p["alpha"]) ** p["beta"]) ** 2
+            )
+        }
     },
     "Rayleigh": {
         "params": [
             {"key": "sigma", "label": "σ (Scale)", "type": float}
         ],
         "R_sym": lambda t, p: exp(-(t ** 2) / (2 * p["sigma"] ** 2)),
-        "sample": lambda p: p["sigma"] * np.sqrt(-2 * np.log(rng.random()))
+        "R_num": lambda t, p: np.exp(-(t ** 2) / (2 * p["sigma"] ** 2)),
+        "sample": lambda p: p["sigma"] * np.sqrt(-2 * np.log(rng.random())),
+        "mean": lambda p: p["sigma"] * np.sqrt(np.pi / 2),
+        "H_inv": lambda h, p: p["sigma"] * np.sqrt(2.0 * h),
+        "dR": {
+            "sigma": lambda t, p: (
+                np.exp(-(t ** 2) / (2 * p["sigma"] ** 2)) * t ** 2 / p["sigma"] ** 3
+            )
+        }
     },
     "Gompertz": {
         "params": [
@@ -67,8 +138,20 @@ DISTRIBUTIONS = {
             {"key": "eta", "label": "η (Scale)",  "type": float}
         ],
         "R_sym": lambda t, p: exp(-p["b"] * (exp(t / p["eta"]) - 1)),
+        "R_num": lambda t, p: np.exp(-p["b"] * (np.exp(t / p["eta"]) - 1)),
         "sample": lambda p: (
             p["eta"] * np.log(1 - np.log(rng.random()) / p["b"])
-        )
+        ),
+        "mean": lambda p: p["eta"] * np.exp(p["b"]) * exp1(p["b"]),
+        "H_inv": lambda h, p: p["eta"] * np.log1p(h / p["b"]),
+        "dR": {
+            "b": lambda t, p: (
+                -np.exp(-p["b"] * (np.exp(t / p["eta"]) - 1)) * (np.exp(t / p["eta"]) - 1)
+            ),
+            "eta": lambda t, p: (
+                np.exp(-p["b"] * (np.exp(t / p["eta"]) - 1))
+                * p["b"] * np.exp(t / p["eta"]) * t / p["eta"] ** 2
+            )
+        }
     }
 }
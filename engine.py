@@ -0,0 +1,822 @@
+import copy
+import hashlib
+import json
+import time
+
+import numpy as np
+
+from analytic import (
+    component_rt,
+    component_rt_curves,
+    path_rt_curves,
+    inclusion_exclusion,
+    system_mttf,
+    path_bitmasks,
+    survival_at_infinity,
+    characteristic_time,
+)
+from time_grid import adaptive_time_grid
+from importance import importance_measures
+from sensitivity import local_sensitivities
+from voting import is_voting
+from symmetry import annotate_symmetry
+from signature import signature_for, signature_reliability, signature_mttf
+from pruning import prune_model, component_paths_of
+from monte_carlo import run_monte_carlo, monte_carlo_component_importance
+from mc_archive import archive_path, create_archive, checkpoint
+from markov import is_standby, validate_repair_groups, build_chain, chain_reliability, chain_mttf
+from ccf import (
+    validate_groups, independent_curves, ccf_condition, ccf_union_factor,
+    ccf_mttf, shock_states, group_parameters
+)
+from decomposition import (
+    decompose, is_trivial, count_modules, describe,
+    evaluate_decomposition, component_signatures, modular_mttf
+)
+
+
+# =========================================================
+# 0) İlerleme / iptal
+#    progress(mesaj, oran): oran 0–1 ya da None (belirsiz). Geri çağrı
+#    iptal istenmişse Cancelled fırlatır; motor aşama sınırlarında ve
+#    uzun döngülerde (IE terimleri, MC örnekleri) çağırır.
+# =========================================================
+class Cancelled(Exception):
+    pass
+
+
+# analyze_dynamic(cache=...) içinde tutulan topoloji önbellekleri
+ENGINE_CACHE_KEYS = ("path_cache", "signature_cache", "module_cache")
+
+
+def worker_cache(state):
+    # Arka plan işine verilecek kopya: işçi yalnız bu sözlüğü değiştirir,
+    # sonuç GUI iş parçacığında sekme durumuna geri yazılır
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in state.items() if key in ENGINE_CACHE_KEYS
+    }
+
+
+def _report(progress, message, fraction=None):
+    if progress is not None:
+        progress(message, fraction)
+
+
+def _stage(progress, label, lo, hi):
+    # Alt modüllerin progress(done, total) çağrılarını [lo, hi] oranına taşır
+    if progress is None:
+        return None
+
+    def report(done, total):
+        progress(f"{done}/{total} {label}", lo + (hi - lo) * min(done / total, 1.0) if total else lo)
+    return report
+
+
+# =========================================================
+# 1) Model: arayüzden bağımsız (Qt / matplotlib gerektirmez)
+#    components, junctions, connections -> kaydedilen model JSON'u
+#    ccf_beta: global β-faktör (None = kapalı), ccf_groups: adlandırılmış
+#    CCF grupları, repair_groups: ortak onarım grupları (Markov)
+# =========================================================
+class Model:
+    def __init__(self, components=None, junctions=(), connections=(),
+                 ccf_beta=None, ccf_groups=(), repair_groups=()):
+        self.components = dict(components or {})
+        self.junctions = set(junctions)
+        self.connections = [tuple(c) for c in connections]
+        self.ccf_beta = ccf_beta
+        self.ccf_groups = list(ccf_groups)
+        self.repair_groups = list(repair_groups)
+
+        if ccf_beta is not None and not (0.0 <= float(ccf_beta) <= 1.0):
+            raise ValueError("CCF β değeri 0–1 arasında olmalı.")
+
+        self.graph = {}
+        for a, b in self.connections:
+            self.graph.setdefault(a, []).append(b)
+            self.graph.setdefault(b, []).append(a)
+
+    @classmethod
+    def from_dict(cls, data, ccf_beta=None):
+        return cls(
+            components=copy.deepcopy(data.get("components", {})),
+            junctions=data.get("junctions", []),
+            connections=data.get("connections", []),
+            ccf_beta=ccf_beta,
+            ccf_groups=copy.deepcopy(data.get("ccf_groups", [])),
+            repair_groups=copy.deepcopy(data.get("repair_groups", [])),
+        )
+
+    @classmethod
+    def from_json(cls, filename, ccf_beta=None):
+        with open(filename, "r") as f:
+            return cls.from_dict(json.load(f), ccf_beta=ccf_beta)
+
+    def to_dict(self):
+        return {
+            "components": self.components,
+            "junctions": sorted(self.junctions),
+            "connections": [list(c) for c in self.connections],
+            "ccf_groups": self.ccf_groups,
+            "repair_groups": self.repair_groups,
+        }
+
+    def content_hash(self, settings=None):
+        # Sıra bağımsız içerik özeti: aynı model + ayarlar -> aynı anahtar
+        payload = {
+            "model": dict(
+                self.to_dict(),
+                connections=sorted(sorted(c) for c in self.connections),
+                ccf_beta=self.ccf_beta
+            ),
+            "settings": settings,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def component_paths(self):
+        # Start–End basit yolları -> bileşen kümeleri (boş yol hariç)
+        return [p for p in component_paths_of(self.graph, self.components) if p]
+
+    def needs_markov(self):
+        return bool(self.repair_groups) or any(is_standby(d) for d in self.components.values())
+
+    def ccf_config(self):
+        # Global β-faktör: (β, Exponential λ listesi); gruplar varsa yok sayılır
+        if self.ccf_beta is None:
+            return None
+        if self.ccf_groups:
+            print("[WARN] CCF grupları tanımlı; global β seçeneği yok sayıldı.")
+            return None
+        lambdas = [
+            d["params"]["lambda"]
+            for d in self.components.values()
+            if d["dist"] == "Exponential" and "lambda" in d["params"]
+        ]
+        return (float(self.ccf_beta), lambdas) if lambdas else None
+
+
+def active_ccf_groups(groups, components):
+    # Sadeleştirmede düşen üyeler gruptan çıkar; β grubu ≥ 2 üyeyle kalır
+    active = []
+    for g in groups:
+        members = [m for m in g["members"] if m in components]
+        if len(members) == len(g["members"]):
+            active.append(g)
+        elif g["model"] == "beta" and len(members) >= 2:
+            active.append(dict(g, members=members))
+        else:
+            print(f"[WARN] CCF grubu '{g['name']}' sadeleştirilmiş modelde kullanılmadı.")
+    validate_groups(active, components)
+    return active or None
+
+
+def _require_paths(model):
+    if not model.components or not model.graph:
+        raise ValueError("Önce bileşen ve bağlantı tanımlanmalı.")
+    component_paths = model.component_paths()
+    if not component_paths:
+        raise ValueError("Start ile End arasında bileşen içeren geçerli yol yok.")
+    return component_paths
+
+
+def _cached_paths(model, cache):
+    # Yol kümeleri yalnız topolojiye bağlı: parametre taramalarında bir kez
+    key = (
+        tuple(sorted(tuple(sorted(c)) for c in model.connections)),
+        tuple(sorted(model.components))
+    )
+    entry = cache.get("path_cache")
+    if entry is not None and entry[0] == key:
+        return entry[1]
+    component_paths = _require_paths(model)
+    cache["path_cache"] = (key, component_paths)
+    return component_paths
+
+
+def _require_path_model(model):
+    if any(is_standby(d) for d in model.components.values()):
+        raise ValueError("Yedekli (standby) kapı içeren modeller yalnız Markov çözücüsüyle analiz edilebilir.")
+    return _require_paths(model)
+
+
+def _pruned(model, component_paths, t_max, prune=True, window=True):
+    # (components, component_paths, pencere-içi mükemmel bileşenler)
+    if not prune:
+        return model.components, component_paths, []
+
+    pruned = prune_model(
+        model.components, model.graph, t_max,
+        component_paths=component_paths, window=window
+    )
+
+    if pruned["status"] != "ok":
+        state = "çalışıyor" if pruned["status"] == "always_up" else "arızalı"
+        print(f"[WARN] Sadeleştirme: sistem her zaman {state}; sadeleştirme uygulanmadı.")
+        return model.components, component_paths, []
+
+    rep = pruned["report"]
+    if not (pruned["perfect"] or pruned["failed"] or rep["nodes_removed"]):
+        return model.components, component_paths, []
+
+    print(
+        f"  Sadeleştirme: {len(pruned['perfect'])} mükemmel → tel, "
+        f"{len(pruned['failed'])} arızalı silindi, {rep['nodes_removed']} düğüm elendi, "
+        f"yollar {rep['paths_before']} → {rep['paths_after']}, "
+        f"IE terimleri {rep['terms_before']} → {rep['terms_after']}"
+    )
+    return pruned["components"], pruned["component_paths"], pruned["window_only"]
+
+
+# =========================================================
+# 2) Çözüm planı: sadeleştirme, modüler ağaç, survival signature,
+#    CCF ayarı. Topolojiye bağlı her şey bir kez; eğriler her grid için.
+# =========================================================
+def _plan(model, t_max, ie_tol=None, ie_max_terms=None, modular=True, symmetry=True,
+          signature=True, prune=True, cache=None, progress=None):
+    cache = {} if cache is None else cache
+    component_paths = _cached_paths(model, cache)
+    _report(progress, f"{len(component_paths)} yol bulundu", 0.05)
+
+    # R ≡ 1 / R ≡ 0 bileşenler motorlardan önce sadeleştirilir;
+    # pencere içi mükemmel bileşen varsa MTTF tam model üzerinden
+    mttf_paths = component_paths
+    _, component_paths, window_only = _pruned(model, component_paths, t_max, prune=prune)
+    if window_only:
+        print(f"[WARN] {', '.join(window_only)} yalnız [0, t_max] içinde mükemmel; MTTF tam modelden.")
+    else:
+        mttf_paths = component_paths
+
+    print("  Bulunan yollar:", component_paths)
+
+    # Kesik IE ayarları yalnız hâlâ açılım gereken yerlere (modüller ya da
+    # ağaç yoksa tüm yol ailesi) uygulanır; signature zaten kesin ve sınırlı
+    truncated = ie_tol is not None or ie_max_terms is not None
+    ccf_groups = list(model.ccf_groups)
+
+    # Bağımsız alt sistemler: tek 2^P açılım yerine birkaç küçük modül
+    tree = None
+    if modular:
+        tree = decompose(component_paths, progress=_stage(progress, "yol (modüler ayrıştırma)", 0.05, 0.15))
+        # CCF gruplarında üye eğrileri ve şok durumları dalları ayırır
+        if symmetry and not ccf_groups:
+            sym = annotate_symmetry(tree, model.components)
+            if sym["collapsed_branches"] or sym["groups"]:
+                print(
+                    f"  Simetri: {sym['collapsed_branches']} özdeş dal birleştirildi, "
+                    f"{sym['groups']} grupta {sym['grouped_elements']} yer değiştirebilir eleman"
+                )
+        if is_trivial(tree):
+            tree = None
+        else:
+            print(f"  Modüler yapı ({count_modules(tree)} indirgenemez modül): {describe(tree)}")
+
+    # Az tipli modellerde survival signature: topoloji aynı kaldıkça
+    # yeni dağılım / parametreler yalnız ağırlıklı bir toplam
+    sig = None
+    if signature and not ccf_groups:
+        sig, sig_hit = signature_for(
+            model.components, component_paths,
+            cache=cache.setdefault("signature_cache", {}),
+            progress=_stage(progress, "yol (survival signature)", 0.15, 0.25)
+        )
+        if sig is not None:
+            print(
+                f"  Survival signature: {len(sig['counts'])} tip {sig['counts']}, "
+                f"|Φ|={sig['phi'].size} ({'önbellekten' if sig_hit else sig['method']})"
+            )
+
+    # CCF: adlandırılmış gruplar (şok koşullu) ya da global β-faktör
+    beta, lambda_avg = None, None
+    if ccf_groups:
+        validate_groups(ccf_groups, model.components)
+        if model.ccf_beta is not None:
+            print("[WARN] CCF grupları tanımlı; global β seçeneği yok sayıldı.")
+        n_states = sum(1 for _ in shock_states(ccf_groups, model.components, np.array([t_max])))
+        print(f"  CCF: {len(ccf_groups)} grup, {n_states} şok durumu")
+    elif model.ccf_beta is not None:
+        beta = float(model.ccf_beta)
+        lambdas = [d["params"]["lambda"] for d in model.components.values() if d["dist"] == "Exponential"]
+        if lambdas:
+            lambda_avg = np.mean(lambdas)
+
+    return {
+        "components": model.components,
+        "component_paths": component_paths,
+        "mttf_paths": mttf_paths,
+        "window_only": window_only,
+        "truncated": truncated,
+        "truncation": (ie_tol, ie_max_terms) if truncated else None,
+        "ie_tol": ie_tol,
+        "ie_max_terms": ie_max_terms,
+        "tree": tree,
+        "signature": sig,
+        "ccf_groups": ccf_groups,
+        "beta": beta,
+        "lambda_avg": lambda_avg,
+        "cache": cache,
+        "progress": progress,
+    }
+
+
+def _ccf_for(plan, t_grid):
+    if plan["lambda_avg"] is None:
+        return None
+    return plan["beta"], np.exp(-plan["lambda_avg"] * t_grid)
+
+
+def _grouped_result(plan, t_grid, cache=None, signatures=None, progress=None):
+    # Şok durumuna koşullu sistem R(t): modüler ağaçta her durum
+    # için yalnız şok üyesi içeren modüller yeniden hesaplanır,
+    # IE'de tek geçiş (terim başına şok çarpanı)
+    components, ccf_groups, tree = plan["components"], plan["ccf_groups"], plan["tree"]
+    curves = independent_curves(components, ccf_groups, t_grid)
+    if tree is not None:
+        stats = {"terms": 0, "truncated_modules": 0}
+
+        # Kesik modüllerde her şok durumu (alt, üst) çifti verir; ağırlıklı
+        # toplam iki satır üzerinde tek geçişte alınır
+        def evaluate(local, failed):
+            sig = signatures
+            if sig is not None:
+                sig = dict(sig, **{c: ("failed",) + tuple(sig[c]) for c in failed})
+            _, s = evaluate_decomposition(
+                tree, local, cache=cache, signatures=sig, progress=progress, truncation=plan["truncation"]
+            )
+            stats["terms"] += s["terms"]
+            stats["truncated_modules"] += s["truncated_modules"]
+            return np.vstack([s["r_lower"], s["r_upper"]])
+
+        lower, upper = ccf_condition(evaluate, curves, ccf_groups, components, t_grid)
+        return _tree_result(plan, lower, upper, stats)
+
+    names, _ = path_bitmasks(plan["component_paths"])
+    return inclusion_exclusion(
+        plan["component_paths"], curves, t_grid,
+        tol=plan["ie_tol"], max_terms=plan["ie_max_terms"],
+        term_factor=ccf_union_factor(ccf_groups, components, t_grid, names),
+        progress=progress, build_progress=progress
+    )
+
+
+def _tree_result(plan, lower, upper, stats):
+    # Ağaç sonucu IE sonucuyla aynı biçimde; kesik modül yoksa alt = üst
+    n_paths = len(plan["component_paths"])
+    if not stats["truncated_modules"]:
+        return {"system_r": lower, "levels": n_paths, "terms": stats["terms"]}
+
+    upper = np.maximum(upper, lower)
+    gap = float(np.max(upper - lower)) if lower.size else 0.0
+    tol = plan["ie_tol"]
+    return {
+        "system_r": 0.5 * (lower + upper),
+        "r_lower": lower,
+        "r_upper": upper,
+        "levels": n_paths,
+        "terms": stats["terms"],
+        "gap": gap,
+        "converged": tol is not None and gap < tol,
+    }
+
+
+def _system_curve(plan, t_grid):
+    # Önbelleksiz tek eğri (adaptif grid yoklamaları için)
+    progress = _stage(plan["progress"], "IE adımı (grid yoklaması)", 0.25, 0.3)
+    if plan["ccf_groups"]:
+        return _grouped_result(plan, t_grid, progress=progress)["system_r"]
+    curves = component_rt_curves(plan["components"], t_grid, ccf=_ccf_for(plan, t_grid))
+    if plan["signature"] is not None:
+        return signature_reliability(
+            plan["signature"], np.vstack([curves[g[0]] for g in plan["signature"]["types"]])
+        )
+    if plan["tree"] is not None:
+        return evaluate_decomposition(plan["tree"], curves, progress=progress, truncation=plan["truncation"])[0]
+    return inclusion_exclusion(
+        plan["component_paths"], curves, t_grid,
+        tol=plan["ie_tol"], max_terms=plan["ie_max_terms"],
+        progress=progress, build_progress=progress
+    )["system_r"]
+
+
+def _system_result(plan, t_grid, comp_curves):
+    # Inclusion–Exclusion (numeric, tam ya da Bonferroni ile kesik)
+    # Modüler yapıda her modül kendi küçük IE'si ile, önbellekli
+    components, component_paths = plan["components"], plan["component_paths"]
+    tree, signature, ccf_groups = plan["tree"], plan["signature"], plan["ccf_groups"]
+    cache, progress = plan["cache"], plan["progress"]
+
+    if ccf_groups:
+        return _grouped_result(
+            plan, t_grid,
+            cache=cache.setdefault("module_cache", {}),
+            signatures=component_signatures(
+                components, t_grid,
+                ccf_key=json.dumps(
+                    [ccf_groups, [group_parameters(g, components) for g in ccf_groups]],
+                    sort_keys=True
+                )
+            ),
+            progress=_stage(progress, "IE modülü (şok durumları)", 0.3, 0.8)
+        )
+
+    if signature is not None:
+        return {
+            "system_r": signature_reliability(
+                signature, np.vstack([comp_curves[g[0]] for g in signature["types"]])
+            ),
+            "levels": len(component_paths),
+            "terms": signature["phi"].size,
+        }
+
+    if tree is not None:
+        _, module_stats = evaluate_decomposition(
+            tree, comp_curves,
+            cache=cache.setdefault("module_cache", {}),
+            signatures=component_signatures(
+                components, t_grid,
+                ccf_key=(plan["beta"], plan["lambda_avg"]) if plan["lambda_avg"] is not None else None
+            ),
+            progress=_stage(progress, "IE modülü", 0.3, 0.8),
+            truncation=plan["truncation"]
+        )
+        print(
+            f"  Modüller: {module_stats['modules']} IE modülü ({module_stats['truncated_modules']} kesik), "
+            f"{module_stats['terms']} terim (tek parça: {2 ** len(component_paths) - 1}), "
+            f"önbellekten {module_stats['cache_hits']}"
+        )
+        return _tree_result(plan, module_stats["r_lower"], module_stats["r_upper"], module_stats)
+
+    return inclusion_exclusion(
+        component_paths, comp_curves, t_grid,
+        tol=plan["ie_tol"], max_terms=plan["ie_max_terms"],
+        progress=_stage(progress, "IE terimi", 0.45, 0.8),
+        build_progress=_stage(progress, "yol (IE birleşimleri)", 0.3, 0.45)
+    )
+
+
+# =========================================================
+# 3) MTTF (kapalı form + kuadratür, t_max'tan bağımsız)
+# =========================================================
+def _plan_mttf(plan, ie_result):
+    components = plan["components"]
+    component_paths, mttf_paths = plan["component_paths"], plan["mttf_paths"]
+    ccf_groups, tree, signature = plan["ccf_groups"], plan["tree"], plan["signature"]
+    ccf_beta = plan["beta"] if plan["lambda_avg"] is not None else None
+    ccf_lambda = plan["lambda_avg"]
+    progress = _stage(plan["progress"], "MTTF adımı", 0.8, 0.9)
+
+    if ccf_groups:
+        names = sorted(set().union(*mttf_paths))
+        result = ccf_mttf(
+            lambda t_nodes: _grouped_result(plan, t_nodes, progress=progress)["system_r"]
+            if mttf_paths is component_paths
+            else ccf_condition(
+                lambda local, failed: inclusion_exclusion(
+                    mttf_paths, local, t_nodes, progress=progress, build_progress=progress
+                )["system_r"],
+                independent_curves(components, ccf_groups, t_nodes),
+                ccf_groups, components, t_nodes
+            ),
+            characteristic_time(components, names),
+            at_infinity=float(any(
+                all(survival_at_infinity(components[c]) > 0 for c in p)
+                for p in mttf_paths
+            ))
+        )
+        print(f"  MTTF: CCF şok koşullu kuadratür, hata ≈ {result['error']:.2e}")
+    elif mttf_paths is not component_paths:
+        result = system_mttf(components, mttf_paths, ccf_beta=ccf_beta, ccf_lambda=ccf_lambda, progress=progress)
+        print(f"  MTTF: sadeleştirilmemiş model, hata ≈ {result['error']:.2e}")
+    elif signature is not None:
+        result = signature_mttf(signature, components, ccf_beta=ccf_beta, ccf_lambda=ccf_lambda)
+        print(f"  MTTF: survival signature kuadratürü, hata ≈ {result['error']:.2e}")
+    elif tree is not None:
+        result = modular_mttf(
+            tree, components, ccf_beta=ccf_beta, ccf_lambda=ccf_lambda, progress=progress,
+            truncation=plan["truncation"]
+        )
+        print(f"  MTTF: modüler kuadratür, hata ≈ {result['error']:.2e}")
+    else:
+        truncated = ie_result["levels"] < len(component_paths)
+        result = system_mttf(
+            components, component_paths,
+            ccf_beta=ccf_beta, ccf_lambda=ccf_lambda,
+            max_level=ie_result["levels"] if truncated else None,
+            progress=progress
+        )
+        print(
+            f"  MTTF: {result['closed_form_terms']} kapalı form, "
+            f"{result['quad_terms']} kuadratür terimi, hata ≈ {result['error']:.2e}"
+        )
+    if result.get("bounds") is not None:
+        print(f"  MTTF Bonferroni bandı: [{result['bounds'][0]:.6g}, {result['bounds'][1]:.6g}]")
+    return result
+
+
+def _time_grid(system_curve, t_max, grid_tol):
+    if grid_tol is None:
+        return np.linspace(1e-6, t_max, 400)
+    t_safe, _ = adaptive_time_grid(system_curve, t_max, tol=grid_tol)
+    print(f"  Adaptif grid: {t_safe.size} nokta (tol={grid_tol:.1e})")
+    return t_safe
+
+
+# =========================================================
+# 4) Markov (CTMC): yedekli kapı / ortak onarım içeren modeller
+# =========================================================
+def _analyze_markov(model, component_paths, t_max, grid_tol, progress=None):
+    stage = time.perf_counter()
+    validate_repair_groups(model.repair_groups, model.components)
+    if model.ccf_groups:
+        print("[WARN] Markov çözücü CCF gruplarını desteklemiyor; gruplar yok sayıldı.")
+    chain = build_chain(model.components, component_paths, model.repair_groups)
+    timings = {"plan_sec": time.perf_counter() - stage}
+    _report(progress, f"Markov zinciri: {chain['n_states']} durum", 0.2)
+
+    stage = time.perf_counter()
+    t_safe = _time_grid(lambda t_grid: chain_reliability(chain, t_grid)[0], t_max, grid_tol)
+    timings["grid_sec"] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    system_r, method = chain_reliability(chain, t_safe)
+    timings["curves_sec"] = time.perf_counter() - stage
+    _report(progress, "R(t) hesaplandı, MTTF çözülüyor", 0.7)
+
+    stage = time.perf_counter()
+    mttf = chain_mttf(chain)
+    timings["mttf_sec"] = time.perf_counter() - stage
+
+    print(
+        f"  Markov: {chain['n_states']} durum ({chain['n_transient']} çalışır), "
+        f"{len(chain['classes'])} sınıf, {chain['n_units']} birim, R(t): {method}"
+    )
+
+    plain = {
+        c: d for c, d in model.components.items()
+        if c in set().union(*component_paths) and not is_voting(d) and not is_standby(d)
+    }
+    return {
+        "t": t_safe,
+        "R": system_r,
+        "R_lower": None,
+        "R_upper": None,
+        "ie_levels": len(component_paths),
+        "ie_terms": 0,
+        "MTTF": mttf["mttf"],
+        "MTTF_error": mttf["error"],
+        "MTTF_bounds": None,
+        "component_paths": component_paths,
+        "component_curves": component_rt_curves(plain, t_safe),
+        "path_curves": [],
+        "decomposition": None,
+        "signature": None,
+        "truncated": False,
+        "method": "markov",
+        "markov_states": chain["n_states"],
+        "markov_method": method,
+        "timings": timings,
+    }
+
+
+# =========================================================
+# 5) Genel API
+#    analyze_dynamic: R(t) + MTTF (+ Bonferroni bandı, yol eğrileri)
+#    analyze_static : tek t anında (statik bileşenler için t önemsiz)
+#    simulate       : Monte Carlo ömür örneklemesi
+#    importance     : Birnbaum / criticality / FV / RAW / RRW
+#    sensitivity    : parametre duyarlılıkları, MTTF elastikiyeti
+#    mc_importance  : MC ile bileşen iyileştirme etkisi (ΔMTTF)
+#    cache: çağrılar arası paylaşılan sözlük (yol / signature / modül önbelleği)
+#    progress: bkz. bölüm 0
+# =========================================================
+def analyze_dynamic(model, t_max, grid_tol=None, ie_tol=None, ie_max_terms=None,
+                    modular=True, symmetry=True, signature=True, prune=True,
+                    markov=False, cache=None, progress=None):
+    run_start = time.perf_counter()
+
+    if markov or model.needs_markov():
+        result = _analyze_markov(model, _require_paths(model), t_max, grid_tol, progress=progress)
+        result["runtime_sec"] = time.perf_counter() - run_start
+        return result
+
+    plan = _plan(
+        model, t_max, ie_tol=ie_tol, ie_max_terms=ie_max_terms, modular=modular,
+        symmetry=symmetry, signature=signature, prune=prune, cache=cache, progress=progress
+    )
+    component_paths = plan["component_paths"]
+    timings = {"plan_sec": time.perf_counter() - run_start}
+
+    stage = time.perf_counter()
+    t_safe = _time_grid(lambda t_grid: _system_curve(plan, t_grid), t_max, grid_tol)
+    timings["grid_sec"] = time.perf_counter() - stage
+    _report(progress, f"Zaman gridi: {t_safe.size} nokta", 0.3)
+
+    stage = time.perf_counter()
+
+    # Bileşen ve minimal yol R(t) eğrileri
+    comp_curves = component_rt_curves(plan["components"], t_safe, ccf=_ccf_for(plan, t_safe))
+    if plan["ccf_groups"]:
+        # yol eğrileri de şok koşullu: Π R_bağımsız · P(yola şok yok)
+        names, masks = path_bitmasks(component_paths)
+        factor = ccf_union_factor(plan["ccf_groups"], plan["components"], t_safe, names)
+        path_rts = [
+            r * factor(m) for r, m in zip(
+                path_rt_curves(
+                    component_paths,
+                    independent_curves(plan["components"], plan["ccf_groups"], t_safe),
+                    t_safe
+                ),
+                masks
+            )
+        ]
+    else:
+        path_rts = path_rt_curves(component_paths, comp_curves, t_safe)
+
+    ie_result = _system_result(plan, t_safe, comp_curves)
+
+    # Kesik açılımın bandı (tek parça IE ya da kesik modüller)
+    R_lower, R_upper = None, None
+    if ie_result.get("gap", 0.0) > 0.0:
+        R_lower, R_upper = ie_result["r_lower"], ie_result["r_upper"]
+        scope = (
+            f"k={ie_result['levels']}, {ie_result['terms']}/{ie_result['total_terms']} terim"
+            if "total_terms" in ie_result else f"{ie_result['terms']} modül terimi"
+        )
+        print(f"  Bonferroni: {scope}, bant genişliği={ie_result['gap']:.2e}")
+        if not ie_result["converged"]:
+            print(
+                f"[WARN] Bonferroni bandı toleransa inmeden durdu (terim bütçesi / bellek sınırı); "
+                f"R(t) bandın ortası, hata ≤ {0.5 * ie_result['gap']:.2e}"
+            )
+
+    system_r = np.clip(np.asarray(ie_result["system_r"], dtype=float), 0.0, 1.0)
+    system_r = np.nan_to_num(system_r, nan=0.0, posinf=0.0, neginf=0.0)
+    timings["curves_sec"] = time.perf_counter() - stage
+    _report(progress, f"{ie_result['terms']} terim değerlendirildi, MTTF hesaplanıyor", 0.8)
+
+    stage = time.perf_counter()
+    try:
+        mttf = _plan_mttf(plan, ie_result)
+        mttf, mttf_error, mttf_bounds = mttf["mttf"], mttf["error"], mttf.get("bounds")
+    except Exception as e:
+        print("MTTF hesaplama hatası:", e)
+        mttf, mttf_error, mttf_bounds = None, None, None
+    timings["mttf_sec"] = time.perf_counter() - stage
+
+    return {
+        "t": t_safe,
+        "R": system_r,
+        "R_lower": R_lower,
+        "R_upper": R_upper,
+        "ie_levels": ie_result["levels"],
+        "ie_terms": ie_result["terms"],
+        "MTTF": mttf,
+        "MTTF_error": mttf_error,
+        "MTTF_bounds": mttf_bounds,
+        "component_paths": component_paths,
+        "component_curves": {c: component_rt(d, t_safe) for c, d in model.components.items()},
+        "path_curves": path_rts,
+        "decomposition": plan["tree"],
+        "signature": plan["signature"],
+        "truncated": plan["truncated"],
+        "method": "ccf" if plan["ccf_groups"] else (
+            "signature" if plan["signature"] is not None else
+            "modular" if plan["tree"] is not None else "ie"
+        ),
+        "timings": timings,
+        "runtime_sec": time.perf_counter() - run_start,
+    }
+
+
+def analyze_static(model, t=1e-6, **options):
+    # Statik bileşenler t'den bağımsız; dinamik bileşenler R(t) ile girer
+    t = max(float(t), 1e-6)
+    result = analyze_dynamic(model, t_max=t, **options)
+    return {
+        "t": t,
+        "R": float(result["R"][-1]),
+        "component_R": {
+            c: float(component_rt(d, np.array([t]))[0])
+            for c, d in model.components.items()
+        },
+        "component_paths": result["component_paths"],
+        "MTTF": result["MTTF"],
+        "ie_terms": result["ie_terms"],
+        "method": result["method"],
+    }
+
+
+def simulate(model, N, t_max, seed=42, t_grid=None, n_t=100, prune=True, progress=None, archive=None):
+    # archive: .npy yolu -> sistem ömürleri simülasyon sırasında memmap
+    # arşive yazılır (bkz. mc_archive); ~%1 adımlarla kontrol noktası
+    component_paths = _require_path_model(model)
+    _report(progress, f"{len(component_paths)} yol bulundu", 0.0)
+
+    # MC ömürleri t_max ötesine uzandığından yalnız tam sadeleştirme
+    components, component_paths, _ = _pruned(model, component_paths, t_max, prune=prune, window=False)
+
+    out = None
+    if archive is not None:
+        archive = archive_path(archive)
+        out, header = create_archive(
+            archive, N, model_hash=model.content_hash(), seed=seed, t_max=t_max, prune=prune
+        )
+
+    def on_samples(i, n):
+        if out is not None:
+            checkpoint(out, archive, header, i)
+        _report(progress, f"{i}/{n} örnek", i / n)
+
+    mc_start = time.perf_counter()
+    T_sys, t_vals, R_mc, R_low, R_high, MTTF, CI_low, CI_high, path_contrib = run_monte_carlo(
+        components=components,
+        component_paths=component_paths,
+        N=N,
+        t_max=t_max,
+        ccf=model.ccf_config(),
+        n_t=n_t,
+        seed=seed,
+        t_grid=t_grid,
+        ccf_groups=active_ccf_groups(model.ccf_groups, components),
+        progress=on_samples if (progress is not None or out is not None) else None,
+        out=out
+    )
+    if out is not None:
+        checkpoint(out, archive, header, N)
+
+    return {
+        "archive": archive,
+        "T_sys": T_sys,
+        "t": t_vals,
+        "R": R_mc,
+        "R_low": R_low,
+        "R_high": R_high,
+        "MTTF": MTTF,
+        "CI_low": CI_low,
+        "CI_high": CI_high,
+        "path_contrib": path_contrib,
+        "component_paths": component_paths,
+        "runtime_sec": time.perf_counter() - mc_start,
+    }
+
+
+def importance(model, t_grid, progress=None):
+    component_paths = _require_path_model(model)
+    _report(progress, f"{len(component_paths)} yol bulundu", 0.1)
+    # CCF: adlandırılmış gruplar (şok koşullu) ya da global β-faktör
+    ccf = model.ccf_config()
+    ccf_beta, ccf_lambda = (ccf[0], float(np.mean(ccf[1]))) if ccf else (None, None)
+    ccf_groups = active_ccf_groups(model.ccf_groups, model.components) if model.ccf_groups else None
+
+    start_time = time.perf_counter()
+    result = importance_measures(
+        model.components, component_paths, t_grid,
+        ccf_beta=ccf_beta, ccf_lambda=ccf_lambda, ccf_groups=ccf_groups,
+        progress=_stage(progress, "yol (IE birleşimleri)", 0.1, 0.6)
+    )
+    result["runtime_sec"] = time.perf_counter() - start_time
+    return result
+
+
+def sensitivity(model, t_grid, progress=None):
+    # Duyarlılık tam (sadeleştirilmemiş) yol ailesi üzerinden
+    component_paths = _require_path_model(model)
+    _report(progress, f"{len(component_paths)} yol bulundu", 0.1)
+
+    ccf = model.ccf_config()
+    start_time = time.perf_counter()
+    result = local_sensitivities(
+        model.components, component_paths, t_grid,
+        ccf_beta=ccf[0] if ccf else None,
+        ccf_lambda=float(np.mean(ccf[1])) if ccf else None,
+        ccf_groups=active_ccf_groups(model.ccf_groups, model.components) if model.ccf_groups else None,
+        progress=_stage(progress, "yol (IE birleşimleri)", 0.1, 0.6)
+    )
+    result["runtime_sec"] = time.perf_counter() - start_time
+    return result
+
+
+def mc_importance(model, N, t_max, delta=0.10, seed=42, progress=None):
+    component_paths = _require_path_model(model)
+
+    start_time = time.perf_counter()
+    base_mttf, scores = monte_carlo_component_importance(
+        components=model.components,
+        component_paths=component_paths,
+        N=N,
+        t_max=t_max,
+        ccf=model.ccf_config(),
+        delta=delta,
+        seed=seed,
+        ccf_groups=active_ccf_groups(model.ccf_groups, model.components),
+        progress=None if progress is None else (
+            lambda k, n: progress(f"{k}/{n} MC koşusu", k / n)
+        )
+    )
+    return {
+        "base_mttf": base_mttf,
+        "scores": scores,
+        "runtime_sec": time.perf_counter() - start_time,
+    }
@@ -0,0 +1,334 @@
+import argparse
+import copy
+import csv
+import json
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import breadth_first_order, shortest_path
+
+from distributions import DISTRIBUTIONS
+
+
+# =========================================================
+# Büyük modeller için toplu içe aktarma
+#   Kenar listesi CSV : source,target (from,to da olur)
+#   Bileşen CSV       : name,dist,<parametre sütunları> (static: R)
+#   GraphML           : düğüm verisi dist + parametre adları, kenarlar
+# Model durumu tek geçişte kurulur (arayüz işi yok) ve kaydedilen model
+# JSON'u biçiminde döner; ayrıca vektörel katmanlı yerleşim.
+# k-out-of-n / standby kapıları ve onarım düz tablolarla aktarılmaz.
+# =========================================================
+TERMINALS = ("Start", "End")
+
+NAME_COLUMNS = ("name", "id", "node", "component")
+DIST_COLUMNS = ("dist", "distribution", "type")
+SOURCE_COLUMNS = ("source", "from", "u")
+TARGET_COLUMNS = ("target", "to", "v")
+
+# dist sütunu boş ya da bu değerlerden biriyse düğüm kavşaktır
+JUNCTION_TYPES = ("", "junction", "kavşak")
+
+GRAPHML_NS = "{http://graphml.graphdrawing.org/xmlns}"
+
+# Bu kadar düğümden büyük modeller arayüzde açılmadan önce sorulur
+LARGE_MODEL_NODES = 500
+
+
+def _column(fieldnames, candidates, what):
+    lowered = {name.strip().lower(): name for name in fieldnames or ()}
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered[candidate]
+    raise ValueError(f"{what} sütunu bulunamadı (beklenen: {', '.join(candidates)}).")
+
+
+def parse_default(spec):
+    # "Exponential:lambda=1e-3" -> bileşen sözlüğü (yalnız kenarda geçen düğümler için)
+    dist, _, rest = spec.partition(":")
+    row = {"dist": dist.strip()}
+    for item in filter(None, (s.strip() for s in rest.split(","))):
+        key, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"Varsayılan parametre 'ad=değer' olmalı: {item}")
+        row[key.strip()] = value
+    return component_from_row("(varsayılan)", row)
+
+
+# =========================================================
+# 1) Bileşen satırı -> bileşen sözlüğü (None = kavşak)
+# =========================================================
+def component_from_row(name, row):
+    dist = str(row.get("dist") or "").strip()
+    if dist.lower() in JUNCTION_TYPES:
+        return None
+
+    if dist.lower() == "static":
+        try:
+            R = float(row["R"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{name}: static bileşen için R değeri gerekli.")
+        if not (0.0 <= R <= 1.0):
+            raise ValueError(f"{name}: R 0–1 arasında olmalı.")
+        return {"dist": "static", "R": R}
+
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"{name}: bilinmeyen dağılım '{dist}'.")
+
+    params = {}
+    for p in DISTRIBUTIONS[dist]["params"]:
+        value = row.get(p["key"])
+        if value is None or str(value).strip() == "":
+            raise ValueError(f"{name}: {dist} için '{p['key']}' parametresi eksik.")
+        try:
+            params[p["key"]] = p["type"](value)
+        except ValueError:
+            raise ValueError(f"{name}: '{p['key']}' sayısal olmalı ({value!r}).")
+    return {"dist": dist, "params": params}
+
+
+# =========================================================
+# 2) Okuyucular
+# =========================================================
+def read_components_csv(path):
+    """
+    Bileşen tablosu: {ad: satır}; parametre sütunları adıyla (lambda,
+    beta, eta, ..., static için R), dağılım sütunu "dist" anahtarında.
+    """
+    rows = {}
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        name_col = _column(reader.fieldnames, NAME_COLUMNS, "Bileşen adı")
+        dist_col = _column(reader.fieldnames, DIST_COLUMNS, "Dağılım")
+        for raw in reader:
+            name = (raw.get(name_col) or "").strip()
+            if not name:
+                continue
+            row = {k.strip(): v for k, v in raw.items() if k is not None and v is not None}
+            row["dist"] = raw.get(dist_col)
+            if name in rows:
+                print(f"[WARN] {path}: '{name}' birden fazla satırda; sonuncusu kullanıldı.")
+            rows[name] = row
+    return rows
+
+
+def read_edges_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        source = _column(reader.fieldnames, SOURCE_COLUMNS, "Kaynak")
+        target = _column(reader.fieldnames, TARGET_COLUMNS, "Hedef")
+        return [
+            (row[source].strip(), row[target].strip())
+            for row in reader
+            if row.get(source) and row.get(target)
+        ]
+
+
+def read_graphml(path):
+    """
+    GraphML -> (düğüm satırları, kenarlar). Düğüm <data> alanları
+    attr.name ile (dist, lambda, beta, ...) satıra yazılır; dosya akış
+    halinde okunur (iterparse), işlenen öğeler bırakılır.
+    """
+    keys, defaults, rows, edges = {}, {}, {}, []
+    for _, elem in ET.iterparse(path, events=("end",)):
+        tag = elem.tag.replace(GRAPHML_NS, "")
+        if tag == "key":
+            name = elem.get("attr.name") or elem.get("id")
+            keys[elem.get("id")] = name
+            default = elem.find(f"{GRAPHML_NS}default")
+            if elem.get("for") in ("node", "all") and default is not None:
+                defaults[name] = default.text
+        elif tag == "node":
+            row = dict(defaults)
+            for data in elem.findall(f"{GRAPHML_NS}data"):
+                row[keys.get(data.get("key"), data.get("key"))] = data.text
+            rows[elem.get("id")] = row
+            elem.clear()
+        elif tag == "edge":
+            edges.append((elem.get("source"), elem.get("target")))
+            elem.clear()
+    return rows, edges
+
+
+# =========================================================
+# 3) Model kurulumu (tek geçiş)
+# =========================================================
+def unique_edges(edges):
+    """
+    Kendine bağlı ve yinelenen (yönsüz) kenarları atar; ilk görülen
+    sıra/yön korunur. (düğüm adları, kenar dizisi (m, 2)) döner.
+    """
+    if not edges:
+        return [], np.zeros((0, 2), dtype=np.int64)
+    nodes, codes = np.unique(np.array(edges, dtype=str).ravel(), return_inverse=True)
+    codes = codes.reshape(-1, 2)
+
+    loops = codes[:, 0] == codes[:, 1]
+    if loops.any():
+        print(f"[WARN] {int(loops.sum())} kendine bağlı kenar atlandı.")
+    lo, hi = np.minimum(codes[:, 0], codes[:, 1]), np.maximum(codes[:, 0], codes[:, 1])
+    _, first = np.unique(lo * len(nodes) + hi, return_index=True)
+    keep = np.sort(first)
+    keep = keep[~loops[keep]]
+    if len(keep) < len(codes) - int(loops.sum()):
+        print(f"[INFO] {len(codes) - int(loops.sum()) - len(keep)} yinelenen kenar atlandı.")
+    return [str(n) for n in nodes], codes[keep]
+
+
+def build_model(edges, rows=None, default=None):
+    """
+    Kenarlar + bileşen satırları -> model sözlüğü (kaydedilen JSON
+    biçimi, konumlar hariç). Satırı olmayan ya da satırında dist değeri
+    boş olan düğümler default verilirse o bileşen, aksi halde kavşak
+    olur; açıkça "junction"/"kavşak" yazılan düğümler kavşak kalır.
+    """
+    rows = rows or {}
+    nodes, codes = unique_edges(edges)
+    missing = [t for t in TERMINALS if t not in nodes]
+    if missing:
+        raise ValueError(f"Kenar listesinde {' / '.join(missing)} düğümü yok.")
+
+    components, junctions = {}, []
+    for name in nodes:
+        if name in TERMINALS:
+            continue
+        row = rows.get(name)
+        # GraphML her düğüm için satır üretir; dist yoksa varsayılana düş
+        if row is None or not str(row.get("dist") or "").strip():
+            # derin kopya: bileşenler params sözlüğünü paylaşmasın
+            comp = copy.deepcopy(default) if default is not None else None
+        else:
+            comp = component_from_row(name, row)
+        if comp is None:
+            junctions.append(name)
+        else:
+            components[name] = comp
+
+    unused = len(set(rows) - set(nodes))
+    if unused:
+        print(f"[WARN] {unused} bileşen satırı hiçbir kenarda geçmiyor; atlandı.")
+
+    dynamic = any(c["dist"] != "static" for c in components.values())
+    return {
+        "analysis_mode": "dynamic" if dynamic else "static",
+        "components": components,
+        "junctions": sorted(junctions),
+        "node_positions": {},
+        "connections": [[nodes[a], nodes[b]] for a, b in codes],
+        "ccf_groups": [],
+        "repair_groups": [],
+    }
+
+
+# =========================================================
+# 4) Otomatik yerleşim: Start'tan BFS derinliği = sütun, katman içi
+#    sıra = BFS sırası. Tamamen vektörel (seyrek matris + numpy).
+# =========================================================
+def layered_layout(data, dx=140.0, dy=70.0, origin=(300.0, 300.0)):
+    names = list(TERMINALS) + list(data["components"]) + list(data["junctions"])
+    index = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    conn = np.array([(index[a], index[b]) for a, b in data["connections"]], dtype=np.int64).reshape(-1, 2)
+    adj = coo_matrix(
+        (np.ones(2 * len(conn)), (np.r_[conn[:, 0], conn[:, 1]], np.r_[conn[:, 1], conn[:, 0]])),
+        shape=(n, n)
+    ).tocsr()
+
+    depth = shortest_path(adj, directed=False, unweighted=True, indices=0)
+    reachable = np.isfinite(depth)
+    layer = np.where(reachable, depth, 0).astype(np.int64)
+    layer[~reachable] = layer.max() + 1    # Start'a bağlı olmayanlar en sağda
+
+    order = np.full(n, n, dtype=np.int64)
+    bfs = breadth_first_order(adj, 0, directed=False, return_predecessors=False)
+    order[bfs] = np.arange(len(bfs))
+
+    # Start / End sahnede sabit: yalnız bileşen ve kavşaklar yerleşir
+    movable = np.arange(2, n)
+    ranked = movable[np.lexsort((order[movable], layer[movable]))]
+    sorted_layer = layer[ranked]
+    first = np.searchsorted(sorted_layer, sorted_layer, side="left")
+    rank = np.arange(len(ranked)) - first
+    count = np.bincount(sorted_layer)[sorted_layer]
+
+    x = origin[0] + (sorted_layer - 1) * dx
+    y = origin[1] + (rank - (count - 1) / 2.0) * dy
+    return {names[i]: [float(xi), float(yi)] for i, xi, yi in zip(ranked, x, y)}
+
+
+# =========================================================
+# 5) Tek çağrıda içe aktarma
+# =========================================================
+def import_graph(path, components_csv=None, default=None, layout=True):
+    """
+    path: kenar listesi .csv ya da .graphml; components_csv: bileşen
+    tablosu (CSV için; GraphML'de düğüm verisine eklenir).
+    Kaydedilen model JSON'u biçiminde sözlük döner.
+    """
+    start = time.perf_counter()
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".graphml", ".xml"):
+        rows, edges = read_graphml(path)
+    elif ext in (".csv", ".txt"):
+        rows, edges = {}, read_edges_csv(path)
+    else:
+        raise ValueError(f"Desteklenmeyen dosya türü: {ext} (.csv / .graphml)")
+    if components_csv:
+        rows.update(read_components_csv(components_csv))
+    if isinstance(default, str):
+        default = parse_default(default)
+
+    data = build_model(edges, rows, default=default)
+    if layout:
+        data["node_positions"] = layered_layout(data)
+
+    print(
+        f"[INFO] İçe aktarıldı: {len(data['components'])} bileşen, {len(data['junctions'])} kavşak, "
+        f"{len(data['connections'])} bağlantı ({time.perf_counter() - start:.2f} s)"
+    )
+    return data
+
+
+def save_model(data, path):
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+
+# =========================================================
+# 6) Komut satırı
+# =========================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Kenar listesi (CSV) ya da GraphML'den toplu model içe aktarma -> model JSON."
+    )
+    parser.add_argument("graph", help="Kenar listesi .csv ya da .graphml")
+    parser.add_argument("-c", "--components", default=None,
+                        help="Bileşen tablosu CSV (name,dist,<parametreler>)")
+    parser.add_argument("--default", default=None,
+                        help="Tabloda olmayan düğümler için dağılım, ör. Exponential:lambda=1e-3 "
+                             "(verilmezse kavşak)")
+    parser.add_argument("--no-layout", action="store_true", help="Otomatik yerleşim hesaplama")
+    parser.add_argument("-o", "--out", default=None, help="Model JSON (varsayılan: <girdi>.json)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    out = args.out or os.path.splitext(args.graph)[0] + ".json"
+    try:
+        data = import_graph(args.graph, args.components, default=args.default, layout=not args.no_layout)
+    except (OSError, ValueError, ET.ParseError) as e:
+        print(f"[ERROR] {e}")
+        return 2
+    save_model(data, out)
+    print(f"[INFO] Model kaydedildi: {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
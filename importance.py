@@ -0,0 +1,96 @@
+import numpy as np
+
+from analytic import component_rt
+from batch_eval import compile_structure, conditional_system_curves
+from ccf import independent_curves, ccf_conditional_curves
+
+
+IMPORTANCE_MEASURES = {
+    "birnbaum": "Birnbaum  (∂R_sys/∂R_i)",
+    "criticality": "Criticality  (B_i · Q_i / Q_sys)",
+    "fussell_vesely": "Fussell–Vesely  (1 − Q_sys(i↑)/Q_sys)",
+    "raw": "RAW  (Q_sys(i↓)/Q_sys)",
+    "rrw": "RRW  (Q_sys/Q_sys(i↑))",
+}
+
+
+# =========================================================
+# 1) Tüm önem ölçüleri, tek koşullu geçişte
+#    R_up_i  = R_sys(R_i = 1),  R_down_i = R_sys(R_i = 0)
+#    (batch_eval.conditional_system_curves; bileşen × zaman vektörel)
+#
+#    Q = 1 − R olmak üzere (arıza odaklı tanımlar):
+#      Birnbaum        B_i    = R_up_i − R_down_i
+#      Criticality     IC_i   = B_i · Q_i / Q_sys
+#      Fussell–Vesely  FV_i   = (Q_sys − Q_up_i) / Q_sys
+#      RAW             RAW_i  = Q_down_i / Q_sys
+#      RRW             RRW_i  = Q_sys / Q_up_i
+#    Q_sys ≈ 0 (t ≈ 0) noktalarında oranlar tanımsızdır -> NaN.
+#    ccf_groups: adlandırılmış CCF grupları; koşullu eğriler şok
+#    durumları üzerinden toplanır (ccf.ccf_conditional_curves), Q_i
+#    üyenin marjinal (şok dahil) arıza olasılığıdır.
+# =========================================================
+def importance_measures(components, component_paths, t_grid,
+                        ccf_beta=None, ccf_lambda=None, ccf_groups=None, eps=1e-12, progress=None):
+    t_grid = np.asarray(t_grid, dtype=float)
+    structure = compile_structure(components, component_paths, progress=progress)
+    names = structure["names"]
+
+    if ccf_groups:
+        independent = independent_curves(components, ccf_groups, t_grid)
+        cond, curves = ccf_conditional_curves(
+            lambda local: conditional_system_curves(structure, local),
+            np.vstack([independent[c] for c in names]), names, ccf_groups, components, t_grid
+        )
+    else:
+        curves = np.vstack([component_rt(components[c], t_grid) for c in names])
+        if ccf_beta is not None and ccf_beta > 0 and ccf_lambda is not None:
+            curves = (1.0 - ccf_beta) * curves + ccf_beta * np.exp(-ccf_lambda * t_grid)[None, :]
+
+        cond = conditional_system_curves(structure, curves)
+
+    R_sys = np.clip(cond["R"], 0.0, 1.0)
+    Q_sys = 1.0 - R_sys
+    Q_up = 1.0 - np.clip(cond["R_up"], 0.0, 1.0)
+    Q_down = 1.0 - np.clip(cond["R_down"], 0.0, 1.0)
+    Q_comp = 1.0 - curves
+
+    defined = Q_sys[None, :] > eps
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        criticality = np.where(defined, cond["birnbaum"] * Q_comp / Q_sys[None, :], np.nan)
+        fussell_vesely = np.where(defined, (Q_sys[None, :] - Q_up) / Q_sys[None, :], np.nan)
+        raw = np.where(defined, Q_down / Q_sys[None, :], np.nan)
+        rrw = np.where(defined, Q_sys[None, :] / np.where(Q_up > eps, Q_up, np.nan), np.nan)
+
+    return {
+        "t": t_grid,
+        "names": names,
+        "R": R_sys,
+        "R_up": cond["R_up"],
+        "R_down": cond["R_down"],
+        "birnbaum": cond["birnbaum"],
+        "criticality": criticality,
+        "fussell_vesely": fussell_vesely,
+        "raw": raw,
+        "rrw": rrw,
+    }
+
+
+# =========================================================
+# 2) Belirli bir t anında {bileşen: değer} (bar chart girdisi)
+#    t verilmezse grid'in son noktası (t_max) kullanılır.
+# =========================================================
+def importance_at(result, measure, t=None):
+    if measure not in IMPORTANCE_MEASURES:
+        raise ValueError(f"Bilinmeyen önem ölçüsü: {measure}")
+
+    t_grid = result["t"]
+    idx = t_grid.size - 1 if t is None else int(np.argmin(np.abs(t_grid - t)))
+    values = result[measure][:, idx]
+
+    return {
+        c: float(v)
+        for c, v in zip(result["names"], values)
+        if np.isfinite(v)
+    }
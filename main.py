@@ -14,10 +14,11 @@ import json
 import time
 import re
 import copy
+import threading
+import contextlib
+import xml.etree.ElementTree as ET
 from monte_carlo import (
-    run_monte_carlo,
-    monte_carlo_convergence,
-    monte_carlo_component_importance
+    monte_carlo_convergence
 )
 from critical_analysis import (
     plot_critical_intervals,
@@ -38,7 +39,9 @@ from critical_analysis import (
     plot_critical_summary_table,
     plot_path_contributions,
     plot_hazard_rate,
-    plot_mc_component_importance
+    plot_mc_component_importance,
+    plot_importance_curves,
+    plot_reliability_bounds
 )
 # --- GEREKLİ KÜTÜPHANELER ---
 try:
@@ -52,26 +55,20 @@ except ImportError:
     sys.exit()
 try:
     from scipy.stats import norm
-    # LogNormal hatasını çözmek için 'scipy_erfc' eklendi
-    from scipy.special import erfc as scipy_erfc 
 except ImportError:
     print("UYARI: 'scipy' kütüphanesi bulunamadı. 'pip install scipy'")
     class norm:
         @staticmethod
         def cdf(*args, **kwargs): return 0.5
-    # scipy yoksa, 'scipy_erfc'yi math kütüphanesinden almayı dene (alternatif)
-    try:
-        from math import erfc as scipy_erfc
-    except ImportError:
-        def scipy_erfc(*args, **kwargs): return 0.0 # Hiçbiri yoksa
 # --- GEREKLİ KÜTÜPHANELER SONU ---
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
     QPushButton, QLabel, QListWidget, QComboBox, QLineEdit,
-    QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsTextItem,
+    QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsSimpleTextItem,
     QGraphicsLineItem, QMessageBox, QFrame, QGraphicsItem, QGridLayout,
-    QTextEdit, QMenu, QScrollArea , QDialog ,QDialogButtonBox ,QInputDialog, QTabWidget,QCheckBox,QGroupBox,QDoubleSpinBox,QSpinBox
+    QTextEdit, QMenu, QScrollArea , QDialog ,QDialogButtonBox ,QInputDialog, QTabWidget,QCheckBox,QGroupBox,QDoubleSpinBox,QSpinBox,QProgressBar,
+    QCompleter, QStyleOptionGraphicsItem
     # QTabWidget buradan kaldırıldı
 )
 from PyQt6.QtWidgets import QFileDialog
@@ -82,17 +79,73 @@ from matplotlib.figure import Figure
 from PyQt6.QtGui import (
     QColor, QBrush, QPen, QFont, QPainter, QPainterPath, QPolygonF
 )
-from PyQt6.QtCore import Qt, QPointF, QObject
+from PyQt6.QtCore import Qt, QPointF, QObject, QRunnable, QThreadPool, QStringListModel, pyqtSignal
 from PyQt6.QtWidgets import QInputDialog ,QInputDialog
-from critical_analysis import plot_critical_intervals
+from critical_analysis import plot_critical_intervals, find_crossing_time
 
 from distributions import DISTRIBUTIONS
 
-from monte_carlo import run_monte_carlo, monte_carlo_convergence
-
+from analytic import component_rt_curves
+from importance import importance_at, IMPORTANCE_MEASURES
+from scenario_store import open_store, component_key
+from mc_archive import open_archive, stream_extent, stream_histogram
+from result_cache import ResultCache, result_key, cached
+from graph_import import LARGE_MODEL_NODES, import_graph, save_model as save_imported_model
+from sweep import (
+    SWEEP_METHODS, parse_factor, validate_factors, run_sweep, save_dataset,
+    plot_sweep_heatmap, plot_sweep_contour, plot_sweep_curve
+)
+from cut_sets import minimal_cut_sets, esary_proschan_bounds, top_cut_sets
+from voting import is_voting, make_voting_gate
+from pruning import component_paths_of
+from engine import (
+    Model, Cancelled, analyze_dynamic, simulate, importance, sensitivity, mc_importance,
+    active_ccf_groups, worker_cache
+)
+from repairable import make_repair, simulate_availability, plot_availability
+from markov import STANDBY_MODES, is_standby, make_standby_gate, make_repair_group, validate_repair_groups
+from ccf import CCF_MODELS, make_ccf_group, validate_groups
+from decomposition import count_modules, structure_expression
 
 
 # --- GÖRSEL SINIFLAR (Düğümler ve Düz Çizgiler) ---
+# Ayrıntı düzeyi (LOD): bu ölçeğin altında etiketler çizilmez, düğüm ve
+# teller kenar yumuşatmasız çizilir (uzaklaştırılmış büyük modeller)
+LABEL_MIN_LOD = 0.45
+SIMPLE_DRAW_LOD = 0.3
+
+
+def _level_of_detail(painter):
+    return QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+
+
+class GraphView(QGraphicsView):
+    """ Model sahnesi: arka plan önbellekli, kısmi güncelleme, Ctrl+tekerlek yakınlaştırma """
+    def __init__(self, scene, parent=None):
+        super().__init__(scene, parent)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            factor = 1.15 if event.angleDelta().y() > 0 else 1 / 1.15
+            self.scale(factor, factor)
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+
+class NodeLabelItem(QGraphicsSimpleTextItem):
+    """ Düğüm adı (metin belgesiz hafif öğe): uzaklaştırınca çizilmez """
+    def paint(self, painter, option, widget=None):
+        if _level_of_detail(painter) < LABEL_MIN_LOD:
+            return
+        super().paint(painter, option, widget)
+
+
 class DraggableNode(QGraphicsEllipseItem):
     """ Sürüklenen 'Bileşen' (Node) """
     def __init__(self, *args, node_name=None, main_window=None, **kwargs):
@@ -101,6 +154,11 @@ class DraggableNode(QGraphicsEllipseItem):
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
         self.setAcceptHoverEvents(True)
+
+    def paint(self, painter, option, widget=None):
+        if _level_of_detail(painter) < SIMPLE_DRAW_LOD:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(painter, option, widget)
         
     def mousePressEvent(self, event):
         self.setZValue(10); super().mousePressEvent(event)
@@ -130,21 +188,33 @@ class ClickableLineItem(QGraphicsLineItem):
     Sağ tıklanabilen ve "Kavşak Ekle" menüsü çıkaran
     düz çizgi (tel).
     """
+    PEN = None
+    HOVER_PEN = None
+
     def __init__(self, node1, node2, main_window, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.node1 = node1 # Başlangıç düğümü adı
         self.node2 = node2 # Bitiş düğümü adı
         self.main_window = main_window
-        self.setPen(QPen(QColor("gray"), 2, Qt.PenStyle.SolidLine))
+        if ClickableLineItem.PEN is None:
+            # Kalemler tüm tellerde ortak (binlerce tel için tek nesne)
+            ClickableLineItem.PEN = QPen(QColor("gray"), 2, Qt.PenStyle.SolidLine)
+            ClickableLineItem.HOVER_PEN = QPen(QColor("darkcyan"), 4, Qt.PenStyle.SolidLine)
+        self.setPen(ClickableLineItem.PEN)
         self.setZValue(-1) # Düğümlerin arkasında kalması için
         self.setAcceptHoverEvents(True)
 
+    def paint(self, painter, option, widget=None):
+        if _level_of_detail(painter) < SIMPLE_DRAW_LOD:
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        super().paint(painter, option, widget)
+
     def hoverEnterEvent(self, event):
-        self.setPen(QPen(QColor("darkcyan"), 4, Qt.PenStyle.SolidLine))
+        self.setPen(ClickableLineItem.HOVER_PEN)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
-        self.setPen(QPen(QColor("gray"), 2, Qt.PenStyle.SolidLine))
+        self.setPen(ClickableLineItem.PEN)
         super().hoverLeaveEvent(event)
 
     def contextMenuEvent(self, event):
@@ -159,7 +229,7 @@ class ClickableLineItem(QGraphicsLineItem):
 
 # --- GRAFİK PENCERESİ ---
 class PlotWindow(QMainWindow):
-    def __init__(self, t_values, plot_data, mttf=None, parent=None):
+    def __init__(self, t_values, plot_data, mttf=None, bounds=None, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Zamana Bağlı Güvenilirlik Grafiği R(t)")
         self.setGeometry(200, 200, 900, 600)
@@ -206,6 +276,15 @@ class PlotWindow(QMainWindow):
                 )
 
 
+        # --- Bonferroni alt/üst sınır bandı (kesik inclusion-exclusion) ---
+        if bounds is not None:
+            r_lower, r_upper = bounds
+            ax.fill_between(
+                t_values, r_lower, r_upper,
+                color="navy", alpha=0.2, zorder=9,
+                label=f"Bonferroni bandı [max genişlik = {np.max(r_upper - r_lower):.2e}]"
+            )
+
         ax.set_xlabel("Zaman (t)")
         ax.set_ylabel("Güvenilirlik R(t)")
         ax.set_title("Sistem ve Bileşenlerin Güvenilirlik Analizi R(t)")
@@ -224,14 +303,9 @@ class PlotWindow(QMainWindow):
         # ============================================
         #  t_90 VE t_10 NOKTALARINI BUL
         # ============================================
-        t_90, t_10 = None, None
-
-        for i in range(len(t_values)):
-            if t_90 is None and system_r[i] <= 0.9:
-                t_90 = t_values[i]
-            if t_10 is None and system_r[i] <= 0.1:
-                t_10 = t_values[i]
-                break
+        # (uniform olmayan gridde de doğru: komşu noktalar arası interpolasyon)
+        t_90 = find_crossing_time(t_values, system_r, 0.9)
+        t_10 = find_crossing_time(t_values, system_r, 0.1)
 
         # ============================================
         #  KRITIK BÖLGE (0.1 – 0.9)
@@ -268,7 +342,7 @@ class PlotWindow(QMainWindow):
         # ============================================
         #  MTTF DİKEY ÇİZGİ
         # ============================================
-        if mttf is not None:
+        if mttf is not None and np.isfinite(mttf):
             ax.axvline(mttf, color='purple', linestyle='-.', linewidth=2)
             ax.text(mttf, 0.50,
                     f"MTTF = {mttf:.1f}",
@@ -282,7 +356,7 @@ class PlotWindow(QMainWindow):
         info = []
         if t_90: info.append(f"t₉₀ (R=0.9): {t_90:.1f}")
         if t_10: info.append(f"t₁₀ (R=0.1): {t_10:.1f}")
-        if mttf is not None: info.append(f"MTTF: {mttf:.1f}")
+        if mttf is not None: info.append(f"MTTF: {mttf:.1f}" if np.isfinite(mttf) else "MTTF: ∞")
 
         ax.text(0.98, 0.02,
                 "\n".join(info),
@@ -314,19 +388,21 @@ class HistogramWindow(QMainWindow):
         # === Kitap Formatında Histogram (Şekil 5.15 gibi) ===
 
 # 1) Sistemin maksimum arıza zamanı t_max (ör. 90000)
-        max_val = max(data)
+        #    (parça parça: memmap arşivler belleğe alınmaz)
+        max_val = stream_extent(data)[1]
 
         # 2) Kitaptaki aralığa ölçekle: 0–50 arası olsun
         #    Bu şekilde kitap histogramına birebir benzer.
         scale_factor = max_val / 50      # istediğin eksen uzunluğu kadar bölebilirsin
-        data_scaled = data / scale_factor
 
         # 3) Kitaptaki gibi bin genişliği = 5
         bin_edges = np.arange(0, 55, 5)   # 0,5,10,...,50
+        counts = stream_histogram(data, bin_edges, scale=scale_factor)
 
         ax.hist(
-            data_scaled,
+            bin_edges[:-1],
             bins=bin_edges,
+            weights=counts,
             color="gray",
             edgecolor="black",
             linewidth=0.8
@@ -435,6 +511,47 @@ class FormulaWindow(QMainWindow):
 # --- TEK SAYFA FORMÜL PENCERESİ SONU ---
 
 
+# --- ARKA PLAN İŞLERİ (QThreadPool) ---
+class WorkerSignals(QObject):
+    progress = pyqtSignal(str, float)   # mesaj, oran (0–1; <0 belirsiz)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class AnalysisWorker(QRunnable):
+    """
+    fn(progress) iş parçacığında çalışır; progress(mesaj, oran) her
+    çağrıda iptal bayrağını kontrol eder (engine.Cancelled). Sonuç
+    sinyallerle GUI iş parçacığına iletilir; widget'lara dokunulmaz.
+    """
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = WorkerSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def report(self, message, fraction=None):
+        if self._cancel.is_set():
+            raise Cancelled(message)
+        self.signals.progress.emit(message, -1.0 if fraction is None else float(fraction))
+
+    def run(self):
+        try:
+            result = self.fn(self.report)
+        except Cancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            print("HATA:", e)
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+# --- ARKA PLAN İŞLERİ SONU ---
+
+
 # --- ANA PENCERE (Hibrit Model: Bileşen + Otomatik Kavşak) ---
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -449,6 +566,8 @@ class MainWindow(QMainWindow):
         # --- Veri Modeli ---
         self.components = {}      # Bozulabilenler (a1, a5...)
         self.junctions = set()    # Bozulmaz kavşaklar (j1, j2...)
+        self.ccf_groups = []      # Adlandırılmış CCF grupları
+        self.repair_groups = []   # Ortak onarım grupları (Markov)
         self.junction_count = 1   # j1, j2... diye isim vermek için
         self.graph = {}           # Çift yönlü mantık için
         self.connections = []
@@ -456,10 +575,16 @@ class MainWindow(QMainWindow):
         self.node_positions = {}
         self.node_items = {}
         self.edge_items = {}
+        self.node_edges = {}       # düğüm -> çizili tellerin anahtarları (edge_items indeksi)
 
         self.plot_window = None
         self.formula_window = None
         self.formula_latex = None  # Formüller LaTeX metin blokları
+        self._job = None           # Çalışan arka plan işi (AnalysisWorker)
+        self._queue = None         # Çoklu sekme analiz kuyruğu
+        self._queue_pool = QThreadPool(self)
+        self._queue_pool.setMaxThreadCount(max(1, min(4, (os.cpu_count() or 2) - 1)))
+        self._result_cache = None  # Disk sonuç önbelleği (ilk kullanımda açılır)
 
         # === HESAPLAMA WIDGET'LARI (sağ panelde kullanılacak) ===
         
@@ -501,7 +626,8 @@ class MainWindow(QMainWindow):
         self.mode_selector.addItems([
             "Statik Analiz (R)",
             "Dinamik Analiz R(t)",
-            "Monte Carlo Simülasyonu"
+            "Monte Carlo Simülasyonu",
+            "Onarılabilir Sistem A(t)"
         ])
         self.mode_selector.setMinimumHeight(32)
         self.mode_selector.currentTextChanged.connect(self.on_mode_changed)
@@ -565,9 +691,24 @@ class MainWindow(QMainWindow):
 
         model_layout.addWidget(self.dynamic_inputs_widget)
 
+        # --- ONARIM GİRİŞLERİ (onarılabilir mod; boş bırakılırsa onarılamaz) ---
+        self.repair_inputs_widget = QGroupBox("Onarım Süresi Dağılımı")
+        repair_layout = QVBoxLayout(self.repair_inputs_widget)
+        self.repair_dist_selector = QComboBox()
+        self.repair_dist_selector.addItems(list(DISTRIBUTIONS.keys()))
+        self.repair_dist_selector.setMinimumHeight(32)
+        self.repair_dist_selector.currentTextChanged.connect(self.on_repair_dist_changed)
+        repair_layout.addWidget(self.repair_dist_selector)
+        self.repair_param_inputs = []
+        self.repair_param_layout = QVBoxLayout()
+        repair_layout.addLayout(self.repair_param_layout)
+        model_layout.addWidget(self.repair_inputs_widget)
+
         # Dinamik başlangıç durumu
         self.dynamic_inputs_widget.hide()
+        self.repair_inputs_widget.hide()
         self.on_dist_changed()
+        self.on_repair_dist_changed()
         
 
         # Bileşen ekleme butonları / liste
@@ -576,6 +717,7 @@ class MainWindow(QMainWindow):
         model_layout.addWidget(self.add_comp_button)
 
         self.comp_list_widget = QListWidget()
+        self.comp_list_widget.setUniformItemSizes(True)
         model_layout.addWidget(self.comp_list_widget)
 
         
@@ -587,14 +729,71 @@ class MainWindow(QMainWindow):
     )
         self.update_comp_button.clicked.connect(self.update_selected_component)
 
+        # k-out-of-n kapısı: listedeki (bağlantısız) bileşenleri tek düğümde topla
+        voting_box = QGroupBox("k-out-of-n Kapısı")
+        voting_layout = QGridLayout(voting_box)
+
+        self.voting_members_input = QLineEdit()
+        self.voting_members_input.setPlaceholderText("Üyeler (örn: a1, a2, a3)")
+        self.voting_members_input.setMinimumHeight(32)
+        voting_layout.addWidget(self.voting_members_input, 0, 0, 1, 2)
+
+        voting_layout.addWidget(QLabel("k (en az çalışan):"), 1, 0)
+        self.voting_k_spinbox = QSpinBox()
+        self.voting_k_spinbox.setRange(1, 64)
+        self.voting_k_spinbox.setValue(2)
+        voting_layout.addWidget(self.voting_k_spinbox, 1, 1)
+
+        self.voting_button = QPushButton("k-out-of-n Kapısı Oluştur")
+        self.voting_button.clicked.connect(self.add_voting_gate)
+        voting_layout.addWidget(self.voting_button, 2, 0, 1, 2)
+
+        model_layout.addWidget(voting_box)
+
+        # Yedekli (standby) kapı: soğuk / ılık / sıcak yedek, kapı içi onarım
+        # (yalnız Markov çözücüsünde; üyeler Exponential)
+        standby_box = QGroupBox("Yedekli (Standby) Kapı")
+        standby_layout = QGridLayout(standby_box)
+
+        self.standby_members_input = QLineEdit()
+        self.standby_members_input.setPlaceholderText("Üyeler, öncelik sırasıyla (örn: a1, a2)")
+        self.standby_members_input.setMinimumHeight(32)
+        standby_layout.addWidget(self.standby_members_input, 0, 0, 1, 2)
+
+        standby_layout.addWidget(QLabel("k (aktif gereken):"), 1, 0)
+        self.standby_k_spinbox = QSpinBox()
+        self.standby_k_spinbox.setRange(1, 64)
+        self.standby_k_spinbox.setValue(1)
+        standby_layout.addWidget(self.standby_k_spinbox, 1, 1)
+
+        self.standby_mode_combo = QComboBox()
+        for key, label in STANDBY_MODES.items():
+            self.standby_mode_combo.addItem(label, key)
+        standby_layout.addWidget(self.standby_mode_combo, 2, 0)
+
+        self.standby_dormancy_input = QLineEdit()
+        self.standby_dormancy_input.setPlaceholderText("Ilık yedek α (0–1)")
+        standby_layout.addWidget(self.standby_dormancy_input, 2, 1)
+
+        standby_layout.addWidget(QLabel("Onarım ekibi (0 = sınırsız):"), 3, 0)
+        self.standby_crews_spinbox = QSpinBox()
+        self.standby_crews_spinbox.setRange(0, 64)
+        standby_layout.addWidget(self.standby_crews_spinbox, 3, 1)
+
+        self.standby_button = QPushButton("Yedekli Kapı Oluştur")
+        self.standby_button.clicked.connect(self.add_standby_gate)
+        standby_layout.addWidget(self.standby_button, 4, 0, 1, 2)
+
+        model_layout.addWidget(standby_box)
+
         # 3. Adım: Bağlantı Ekleme (Teller)
         model_layout.addWidget(self.create_separator("3. Adım: Bağlantıları (Telleri) Ekle"))
         model_layout.addWidget(QLabel("NOT: Bir 'tele' bağlanmak için, sahnedeki tele sağ tıklayın."))
 
-        self.from_node_selector = QComboBox()
-        self.to_node_selector = QComboBox()
-        self.from_node_selector.setMinimumHeight(32)
-        self.to_node_selector.setMinimumHeight(32)
+        # İki seçici tek düğüm listesi modelini paylaşır; yazarak aranabilir
+        self.node_model = QStringListModel(self)
+        self.from_node_selector = self._node_selector()
+        self.to_node_selector = self._node_selector()
 
         self.add_connection_button = QPushButton("Bağlantı Ekle (Düğüm 1 <-> Düğüm 2)")
         self.add_connection_button.clicked.connect(self.add_connection)
@@ -606,6 +805,7 @@ class MainWindow(QMainWindow):
         model_layout.addWidget(self.add_connection_button)
 
         self.conn_list_widget = QListWidget()
+        self.conn_list_widget.setUniformItemSizes(True)
         model_layout.addWidget(self.conn_list_widget)
 
         # 5. Adım: Formül Göstergesi (başlık sadece)
@@ -622,6 +822,10 @@ class MainWindow(QMainWindow):
 
         model_layout.addWidget(self.load_model_button)
 
+        self.import_graph_button = QPushButton("Toplu İçe Aktar (CSV / GraphML)")
+        self.import_graph_button.clicked.connect(self.import_graph_dialog)
+        model_layout.addWidget(self.import_graph_button)
+
         model_layout.addStretch()
 
         # === ORTA PANEL: SEKME BAZLI GRAFİK SAHNELER ===
@@ -644,16 +848,36 @@ class MainWindow(QMainWindow):
         mc_layout = QVBoxLayout()
 
         self.mc_spinbox = QSpinBox()
-        self.mc_spinbox.setRange(100, 1_000_000)
+        self.mc_spinbox.setRange(100, 100_000_000)
         self.mc_spinbox.setSingleStep(1000)
         self.mc_spinbox.setValue(20000)
 
         mc_layout.addWidget(QLabel("Simülasyon Sayısı (N):"))
         mc_layout.addWidget(self.mc_spinbox)
 
+        # Büyük N için örnekler diske (.npy memmap) yazılır, RAM'de tutulmaz
+        self.mc_archive_cb = QCheckBox("Örnekleri arşivle (.npy, memmap)")
+        self.mc_archive_cb.setChecked(False)
+        mc_layout.addWidget(self.mc_archive_cb)
+
+        self.open_mc_archive_button = QPushButton("MC Arşivi Aç")
+        self.open_mc_archive_button.clicked.connect(self.open_mc_archive)
+        mc_layout.addWidget(self.open_mc_archive_button)
+
         self.mc_box.setLayout(mc_layout)
         right_layout.addWidget(self.mc_box)
 
+        # === ONARIM AYARLARI (onarılabilir mod) ===
+        self.repair_box = QGroupBox("Onarım Ayarları")
+        repair_box_layout = QVBoxLayout(self.repair_box)
+        repair_box_layout.addWidget(QLabel("Onarım ekibi sayısı (0 = sınırsız):"))
+        self.crews_spinbox = QSpinBox()
+        self.crews_spinbox.setRange(0, 1000)
+        self.crews_spinbox.setValue(0)
+        repair_box_layout.addWidget(self.crews_spinbox)
+        right_layout.addWidget(self.repair_box)
+        self.repair_box.setVisible(False)
+
         # === ÇIKTI TERCİHLERİ ===
         self.output_box = QGroupBox("Çıktı Tercihleri")
         output_layout = QVBoxLayout()
@@ -694,6 +918,72 @@ class MainWindow(QMainWindow):
         right_layout.addWidget(self.ccf_checkbox)
         right_layout.addWidget(self.ccf_beta_input)
 
+        # Adlandırılmış CCF grupları (tanımlıysa global β yerine kullanılır)
+        ccf_group_box = QGroupBox("CCF Grupları")
+        ccf_group_layout = QGridLayout(ccf_group_box)
+
+        self.ccf_group_name_input = QLineEdit()
+        self.ccf_group_name_input.setPlaceholderText("Grup adı (örn: G1)")
+        ccf_group_layout.addWidget(self.ccf_group_name_input, 0, 0)
+
+        self.ccf_group_model_combo = QComboBox()
+        for key, label in CCF_MODELS.items():
+            self.ccf_group_model_combo.addItem(label, key)
+        ccf_group_layout.addWidget(self.ccf_group_model_combo, 0, 1)
+
+        self.ccf_group_members_input = QLineEdit()
+        self.ccf_group_members_input.setPlaceholderText("Üyeler (örn: a1, a2, a3)")
+        ccf_group_layout.addWidget(self.ccf_group_members_input, 1, 0, 1, 2)
+
+        self.ccf_group_factors_input = QLineEdit()
+        self.ccf_group_factors_input.setPlaceholderText("β  ya da  α1, α2, …, αm")
+        ccf_group_layout.addWidget(self.ccf_group_factors_input, 2, 0, 1, 2)
+
+        self.ccf_group_add_button = QPushButton("Grup Ekle")
+        self.ccf_group_add_button.clicked.connect(self.add_ccf_group)
+        ccf_group_layout.addWidget(self.ccf_group_add_button, 3, 0)
+
+        self.ccf_group_remove_button = QPushButton("Seçili Grubu Sil")
+        self.ccf_group_remove_button.clicked.connect(self.remove_ccf_group)
+        ccf_group_layout.addWidget(self.ccf_group_remove_button, 3, 1)
+
+        self.ccf_group_list = QListWidget()
+        self.ccf_group_list.setMaximumHeight(90)
+        ccf_group_layout.addWidget(self.ccf_group_list, 4, 0, 1, 2)
+
+        right_layout.addWidget(ccf_group_box)
+
+        # Ortak onarım grupları: üyeler aynı ekipleri paylaşır (Markov çözücü)
+        repair_group_box = QGroupBox("Ortak Onarım Grupları")
+        repair_group_layout = QGridLayout(repair_group_box)
+
+        self.repair_group_name_input = QLineEdit()
+        self.repair_group_name_input.setPlaceholderText("Grup adı (örn: R1)")
+        repair_group_layout.addWidget(self.repair_group_name_input, 0, 0)
+
+        self.repair_group_crews_spinbox = QSpinBox()
+        self.repair_group_crews_spinbox.setRange(1, 64)
+        self.repair_group_crews_spinbox.setPrefix("Ekip: ")
+        repair_group_layout.addWidget(self.repair_group_crews_spinbox, 0, 1)
+
+        self.repair_group_members_input = QLineEdit()
+        self.repair_group_members_input.setPlaceholderText("Üyeler, öncelik sırasıyla (örn: a1, a2)")
+        repair_group_layout.addWidget(self.repair_group_members_input, 1, 0, 1, 2)
+
+        self.repair_group_add_button = QPushButton("Grup Ekle")
+        self.repair_group_add_button.clicked.connect(self.add_repair_group)
+        repair_group_layout.addWidget(self.repair_group_add_button, 2, 0)
+
+        self.repair_group_remove_button = QPushButton("Seçili Grubu Sil")
+        self.repair_group_remove_button.clicked.connect(self.remove_repair_group)
+        repair_group_layout.addWidget(self.repair_group_remove_button, 2, 1)
+
+        self.repair_group_list = QListWidget()
+        self.repair_group_list.setMaximumHeight(70)
+        repair_group_layout.addWidget(self.repair_group_list, 3, 0, 1, 2)
+
+        right_layout.addWidget(repair_group_box)
+
         # === ZAMAN AYARLARI ===
         time_box = QGroupBox("Zaman Ayarları")
         time_layout = QVBoxLayout()
@@ -707,14 +997,92 @@ class MainWindow(QMainWindow):
         time_layout.addWidget(QLabel("Maksimum Zaman (t_max):"))
         time_layout.addWidget(self.t_max_input)
 
+        self.adaptive_grid_cb = QCheckBox("Adaptif zaman gridi")
+        self.adaptive_grid_cb.setChecked(True)
+
+        self.grid_tol_input = QLineEdit("1e-5")
+        self.grid_tol_input.setPlaceholderText("İnterpolasyon toleransı (örn: 1e-5)")
+
+        self.adaptive_grid_cb.toggled.connect(self.grid_tol_input.setEnabled)
+
+        time_layout.addWidget(self.adaptive_grid_cb)
+        time_layout.addWidget(self.grid_tol_input)
+
         time_box.setLayout(time_layout)
         right_layout.addWidget(time_box)
 
+        # === ANALİTİK AYARLAR (Kesik Inclusion–Exclusion) ===
+        self.analytic_box = QGroupBox("Analitik Ayarlar")
+        analytic_layout = QVBoxLayout()
+
+        self.ie_truncate_cb = QCheckBox("Kesik Inclusion–Exclusion (Bonferroni)")
+        self.ie_truncate_cb.setChecked(False)
+
+        self.ie_tol_input = QLineEdit("1e-6")
+        self.ie_tol_input.setPlaceholderText("Tolerans (örn: 1e-6)")
+        self.ie_tol_input.setEnabled(False)
+
+        self.ie_budget_spinbox = QSpinBox()
+        self.ie_budget_spinbox.setRange(0, 100_000_000)
+        self.ie_budget_spinbox.setSingleStep(1000)
+        self.ie_budget_spinbox.setValue(0)
+        self.ie_budget_spinbox.setSpecialValueText("Sınırsız")
+        self.ie_budget_spinbox.setEnabled(False)
+
+        self.ie_truncate_cb.toggled.connect(self.ie_tol_input.setEnabled)
+        self.ie_truncate_cb.toggled.connect(self.ie_budget_spinbox.setEnabled)
+
+        analytic_layout.addWidget(self.ie_truncate_cb)
+        analytic_layout.addWidget(QLabel("Bant toleransı (üst − alt):"))
+        analytic_layout.addWidget(self.ie_tol_input)
+        analytic_layout.addWidget(QLabel("Terim bütçesi:"))
+        analytic_layout.addWidget(self.ie_budget_spinbox)
+
+        self.modular_cb = QCheckBox("Modüler ayrıştırma (bağımsız alt sistemler)")
+        self.modular_cb.setChecked(True)
+        analytic_layout.addWidget(self.modular_cb)
+
+        self.symmetry_cb = QCheckBox("Simetri indirgeme (özdeş dallar / bileşenler)")
+        self.symmetry_cb.setChecked(True)
+        self.modular_cb.toggled.connect(self.symmetry_cb.setEnabled)
+        analytic_layout.addWidget(self.symmetry_cb)
+
+        self.prune_cb = QCheckBox("Mükemmel / arızalı bileşenleri sadeleştir")
+        self.prune_cb.setChecked(True)
+        analytic_layout.addWidget(self.prune_cb)
+
+        self.signature_cb = QCheckBox("Survival signature (tip bazlı, önbellekli)")
+        self.signature_cb.setChecked(True)
+        analytic_layout.addWidget(self.signature_cb)
+
+        # Yedekli kapı / ortak onarım varsa Markov çözücü kendiliğinden seçilir
+        self.markov_cb = QCheckBox("Markov (CTMC) çözücü (Exponential, onarımlı)")
+        self.markov_cb.setChecked(False)
+        analytic_layout.addWidget(self.markov_cb)
+
+        self.analytic_box.setLayout(analytic_layout)
+        right_layout.addWidget(self.analytic_box)
+
         # === ANA İŞLEM ===
         right_layout.addWidget(self.run_button)
         right_layout.addWidget(self.result_label)
         self.runtime_label = QLabel("Son çalışma süresi: -")
         right_layout.addWidget(self.runtime_label)
+
+        # Arka plan işi ilerlemesi + iptal (yalnız iş sürerken görünür)
+        job_row = QHBoxLayout()
+        self.job_progress = QProgressBar()
+        self.job_progress.setRange(0, 1000)
+        self.job_progress.setFormat("%p%")
+        self.cancel_job_button = QPushButton("İptal")
+        self.cancel_job_button.clicked.connect(self.cancel_job)
+        job_row.addWidget(self.job_progress)
+        job_row.addWidget(self.cancel_job_button)
+        right_layout.addLayout(job_row)
+        self.job_status_label = QLabel("")
+        right_layout.addWidget(self.job_status_label)
+        self._set_job_widgets_visible(False)
+
         right_layout.addWidget(self.show_formula_button)
 
         right_layout.addStretch()
@@ -728,10 +1096,30 @@ class MainWindow(QMainWindow):
 
         self.mc_importance_button = QPushButton("MC Component Importance")
         self.mc_importance_button.setMinimumHeight(36)
-        self.mc_importance_button.clicked.connect(self.run_mc_component_importance_current)
+        self.mc_importance_button.clicked.connect(lambda: self.run_mc_component_importance_current(background=True))
+
+        self.importance_measure_combo = QComboBox()
+        for key, label in IMPORTANCE_MEASURES.items():
+            self.importance_measure_combo.addItem(label, key)
+
+        self.importance_button = QPushButton("Importance Measures (Analitik)")
+        self.importance_button.setMinimumHeight(36)
+        self.importance_button.clicked.connect(lambda: self.run_importance_current(background=True))
 
         advanced_layout.addWidget(self.hazard_button)
         advanced_layout.addWidget(self.mc_importance_button)
+        advanced_layout.addWidget(self.importance_measure_combo)
+        advanced_layout.addWidget(self.importance_button)
+
+        self.cut_sets_button = QPushButton("Minimal Cut Sets & EP Bounds")
+        self.cut_sets_button.setMinimumHeight(36)
+        self.cut_sets_button.clicked.connect(self.run_cut_sets_current)
+        advanced_layout.addWidget(self.cut_sets_button)
+
+        self.sweep_button = QPushButton("Parametre Taraması (Sweep / DOE)")
+        self.sweep_button.setMinimumHeight(36)
+        self.sweep_button.clicked.connect(self.run_sweep_dialog)
+        advanced_layout.addWidget(self.sweep_button)
         self.current_critical_button = QPushButton("Critical Analysis (Current Tab)")
         self.current_critical_button.setMinimumHeight(36)
         self.current_critical_button.clicked.connect(self.run_current_tab_critical_analysis)
@@ -740,8 +1128,31 @@ class MainWindow(QMainWindow):
         self.compare_models_button.setMinimumHeight(36)
         self.compare_models_button.clicked.connect(self.run_critical_analysis)
 
+        self.analyze_all_tabs_button = QPushButton("Tüm Sekmeleri Analiz Et")
+        self.analyze_all_tabs_button.setMinimumHeight(36)
+        self.analyze_all_tabs_button.clicked.connect(self.analyze_all_tabs)
+
+        self.cancel_queue_button = QPushButton("Kuyruğu İptal Et")
+        self.cancel_queue_button.clicked.connect(self.cancel_queue)
+        self.cancel_queue_button.setEnabled(False)
+
+        # Sekme başına kuyruk durumu
+        self.queue_status_list = QListWidget()
+        self.queue_status_list.setMaximumHeight(110)
+
         advanced_layout.addWidget(self.current_critical_button)
         advanced_layout.addWidget(self.compare_models_button)
+        advanced_layout.addWidget(self.analyze_all_tabs_button)
+        advanced_layout.addWidget(self.cancel_queue_button)
+        advanced_layout.addWidget(self.queue_status_list)
+
+        # Aynı model + ayarlar için sonuçlar diskten (içerik adresli, LRU)
+        self.result_cache_cb = QCheckBox("Sonuç önbelleği (disk)")
+        self.result_cache_cb.setChecked(True)
+        self.clear_cache_button = QPushButton("Önbelleği Temizle")
+        self.clear_cache_button.clicked.connect(self.clear_result_cache)
+        advanced_layout.addWidget(self.result_cache_cb)
+        advanced_layout.addWidget(self.clear_cache_button)
 
         self.advanced_box.setLayout(advanced_layout)
         right_layout.addWidget(self.advanced_box)
@@ -786,6 +1197,10 @@ class MainWindow(QMainWindow):
         self.node_positions  = state["node_positions"]
         self.node_items      = state["node_items"]
         self.edge_items      = state["edge_items"]
+        self.node_edges      = state.setdefault("node_edges", {})
+        self.ccf_groups      = state.setdefault("ccf_groups", [])
+        self.repair_groups   = state.setdefault("repair_groups", [])
+        self.formula_latex   = state.get("formula_latex")
 
         # 🎨 SCENE / VIEW
         view = tab.findChild(QGraphicsView)
@@ -795,6 +1210,8 @@ class MainWindow(QMainWindow):
 
         # 🔄 SOL PANEL
         self.refresh_left_panel()
+        self.refresh_ccf_group_list()
+        self.refresh_repair_group_list()
 
 
     def run_critical_analysis(self):
@@ -810,19 +1227,20 @@ class MainWindow(QMainWindow):
         checkboxes = []
 
         # === TABLARDAN MODEL LİSTESİ ===
+        # Analizi olmayan / eskimiş sekmeler de listelenir; seçilirse kuyruğa alınır
         for i in range(self.tab_widget.count()):
             name = self.tab_widget.tabText(i)
             tab = self.tab_widget.widget(i)
 
-            # sadece analiz yapılmış modeller
             if not hasattr(tab, "model_state"):
                 continue
-            if "analysis_results" not in tab.model_state:
+            if not tab.model_state["components"] or not tab.model_state["graph"]:
                 continue
 
-            cb = QCheckBox(name)
+            fresh = self._has_fresh_results(tab)
+            cb = QCheckBox(name if fresh else f"{name}  (analiz edilecek)")
             layout.addWidget(cb)
-            checkboxes.append((cb, tab))
+            checkboxes.append((cb, name, tab))
 
         # === BUTONLAR ===
         btn_layout = QHBoxLayout()
@@ -837,8 +1255,8 @@ class MainWindow(QMainWindow):
 
         def on_ok():
             selected = [
-                (cb.text(), tab)
-                for cb, tab in checkboxes
+                (name, tab)
+                for cb, name, tab in checkboxes
                 if cb.isChecked()
             ]
 
@@ -850,19 +1268,33 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            if len(selected) == 1:
-                dialog.accept()
-                self._run_single_model_analysis_from_dialog(selected[0])
-                return
-
             dialog.accept()
-            self._run_critical_analysis_on_selected(selected)
-
-            
+            if all(self._has_fresh_results(tab) for _, tab in selected):
+                self._compare_selected(selected)
+            else:
+                # Eksik sonuçlar kuyrukta üretilir, karşılaştırma hepsi gelince başlar
+                self.queue_tab_analyses(selected, on_done=self._compare_when_ready)
 
         ok_btn.clicked.connect(on_ok)
 
         dialog.exec()
+
+    def _compare_selected(self, selected):
+        if len(selected) == 1:
+            self._run_single_model_analysis_from_dialog(selected[0])
+        else:
+            self._run_critical_analysis_on_selected(selected)
+
+    def _compare_when_ready(self, done, failed):
+        if failed:
+            QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Analiz edilemeyen modeller karşılaştırmadan çıkarıldı:\n"
+                + "\n".join(f"{name}: {reason}" for name, reason in failed)
+            )
+        if done:
+            self._compare_selected(done)
     def _run_single_model_analysis_from_dialog(self, selected_item):
         name, tab = selected_item
 
@@ -1019,6 +1451,262 @@ class MainWindow(QMainWindow):
                     title=f"Top-5 Critical Paths – {model_name}"
                 )
 
+    # ==========================================================
+    # PARAMETRE TARAMASI (SWEEP / DOE)
+    # ==========================================================
+    def run_sweep_dialog(self):
+        if self._markov_only_warning():
+            return
+        if not self.components or not self.graph:
+            QMessageBox.warning(self, "Uyarı", "Önce bileşenleri ve bağlantıları tanımlamalısınız.")
+            return
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle("Parametre Taraması")
+        layout = QVBoxLayout(dialog)
+        layout.addWidget(QLabel(
+            "Faktörler (satır başına bir): bileşen.parametre=alt:üst[:log][:düzey]\n"
+            "örn.  a3.lambda=1e-4:1e-2:log     a5.eta=500:2000     t_max=500:2000"
+        ))
+
+        example = next(
+            (f"{name}.{DISTRIBUTIONS[d['dist']]['params'][0]['key']}="
+             for name, d in self.components.items() if d.get("dist") in DISTRIBUTIONS),
+            "t_max="
+        )
+        factors_edit = QTextEdit()
+        factors_edit.setPlainText(example)
+        layout.addWidget(factors_edit)
+
+        form = QGridLayout()
+        method_combo = QComboBox()
+        for key, label in SWEEP_METHODS.items():
+            method_combo.addItem(label, key)
+        levels_spin = QSpinBox()
+        levels_spin.setRange(2, 200)
+        levels_spin.setValue(9)
+        points_spin = QSpinBox()
+        points_spin.setRange(2, 100000)
+        points_spin.setValue(100)
+        t_star_edit = QLineEdit()
+        t_star_edit.setPlaceholderText("boş: t_max")
+        metric_combo = QComboBox()
+        metric_combo.addItem("MTTF", "MTTF")
+        metric_combo.addItem("R(t*)", "R_t_star")
+        for row, (label, widget) in enumerate([
+            ("Tasarım:", method_combo), ("Izgara düzeyi:", levels_spin),
+            ("LHS / rastgele nokta:", points_spin), ("t*:", t_star_edit), ("Görünüm:", metric_combo)
+        ]):
+            form.addWidget(QLabel(label), row, 0)
+            form.addWidget(widget, row, 1)
+        layout.addLayout(form)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        buttons.accepted.connect(dialog.accept)
+        buttons.rejected.connect(dialog.reject)
+        layout.addWidget(buttons)
+
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+
+        try:
+            factors = [
+                parse_factor(line.strip(), levels=levels_spin.value())
+                for line in factors_edit.toPlainText().splitlines() if line.strip()
+            ]
+            validate_factors(factors, self.components)
+            t_star = float(t_star_edit.text()) if t_star_edit.text().strip() else None
+        except ValueError as e:
+            QMessageBox.warning(self, "Tarama Hatası", str(e) or "t* sayı olmalı.")
+            return
+
+        self.run_parameter_sweep(
+            factors, method=method_combo.currentData(), n=points_spin.value(),
+            t_star=t_star, metric=metric_combo.currentData()
+        )
+
+    def run_parameter_sweep(self, factors, method="grid", n=None, t_star=None, metric="MTTF", background=True):
+        model = self._engine_model()
+        if model is None:
+            return
+
+        tab = self.tab_widget.currentWidget()
+        t_max = self.t_max_input.value()
+        options = self._analysis_options()
+        options.pop("markov")
+
+        def compute(progress):
+            return run_sweep(
+                model, factors, method=method, n=n, t_max=t_max, t_star=t_star,
+                options=options, mp_context="spawn", progress=progress
+            )
+
+        def finish(dataset):
+            tab.model_state["sweep"] = dataset
+            self.runtime_label.setText(f"Son çalışma süresi: {dataset['runtime_sec']:.3f} s")
+            print(f"[INFO] Tarama: {len(dataset['columns']['MTTF'])} nokta, {dataset['runtime_sec']:.2f} s")
+
+            names = dataset["factors"]
+            if len(names) == 1:
+                plot_sweep_curve(dataset, names[0], metric)
+            else:
+                plot_sweep_heatmap(dataset, names[0], names[1], metric)
+                plot_sweep_contour(dataset, names[0], names[1], metric)
+
+            filename, _ = QFileDialog.getSaveFileName(
+                self, "Tarama Sonucunu Kaydet", "sweep.npz", "NumPy Sütunlu (*.npz)"
+            )
+            if filename:
+                save_dataset(dataset, filename)
+
+        self._run_job("Parametre Taraması", compute, finish, background=background)
+
+    # ==========================================================
+    # ÇOKLU SEKME İŞ KUYRUĞU
+    # ==========================================================
+    def _has_fresh_results(self, tab):
+        # Sekmenin analiz sonucu mevcut model + ayarlarla üretilmiş mi
+        results = tab.model_state.get("analysis_results")
+        if not results or results.get("model_key") is None:
+            return False
+        model = self._engine_model(tab)
+        return model is not None and results["model_key"] == self._analysis_key(model)
+
+    def analyze_all_tabs(self):
+        tabs = [
+            (self.tab_widget.tabText(i), self.tab_widget.widget(i))
+            for i in range(self.tab_widget.count())
+            if hasattr(self.tab_widget.widget(i), "model_state")
+        ]
+        self.queue_tab_analyses(tabs, force=True)
+
+    def queue_tab_analyses(self, tabs, on_done=None, force=False):
+        """
+        Sekmeleri [(ad, sekme)] sınırlı iş havuzunda eşzamanlı analiz eder.
+        Aynı içerik özetli (model + ayarlar) sekmeler tek işte çözülür;
+        force=False iken sonucu güncel olan sekmeler yeniden çözülmez.
+        Tüm işler bitince on_done(başarılı, başarısız) çağrılır.
+        """
+        if self._queue is not None:
+            QMessageBox.information(
+                self, "Bilgi", "Kuyruktaki analizler sürüyor; bitmesini bekleyin veya iptal edin."
+            )
+            return
+
+        self.queue_status_list.clear()
+        queue = {"rows": {}, "groups": [], "done": [], "failed": [], "tabs": tabs, "on_done": on_done}
+        groups = {}
+
+        for name, tab in tabs:
+            self.queue_status_list.addItem(name)
+            queue["rows"][id(tab)] = self.queue_status_list.count() - 1
+
+            state = tab.model_state
+            if not state["components"] or not state["graph"]:
+                queue["failed"].append((name, "boş model"))
+                self._set_queue_status(queue, tab, name, "boş model (atlandı)")
+                continue
+
+            model = self._engine_model(tab)
+            if model is None:
+                self.queue_status_list.clear()
+                return
+            key = self._analysis_key(model)
+
+            if not force and self._has_fresh_results(tab):
+                queue["done"].append((name, tab))
+                self._set_queue_status(queue, tab, name, "güncel")
+            elif key in groups:
+                # Aynı içerik: sonuç paylaşılır, ayrı iş açılmaz
+                groups[key]["tabs"].append((name, tab))
+                self._set_queue_status(queue, tab, name, f"kuyrukta (= {groups[key]['tabs'][0][0]})")
+            else:
+                groups[key] = {"key": key, "model": model, "tabs": [(name, tab)]}
+                self._set_queue_status(queue, tab, name, "kuyrukta")
+
+        queue["pending"] = len(groups)
+        if not groups:
+            self._finish_queue(queue)
+            return
+
+        self._queue = queue
+        self.cancel_queue_button.setEnabled(True)
+        self.analyze_all_tabs_button.setEnabled(False)
+        t_max = self.t_max_input.value()
+
+        for group in groups.values():
+            _, lead_tab = group["tabs"][0]
+            compute, _ = self._analysis_job(
+                show_plot=False, show_sensitivity=False, tab=lead_tab, model=group["model"]
+            )
+            group["t_max"] = t_max
+            group["start"] = time.perf_counter()
+            group["worker"] = worker = AnalysisWorker(compute)
+            worker.signals.progress.connect(lambda message, fraction, g=group: self._on_queue_progress(g, message, fraction))
+            worker.signals.finished.connect(lambda result, g=group: self._on_queue_finished(g, result))
+            worker.signals.failed.connect(lambda message, g=group: self._on_queue_failed(g, message))
+            worker.signals.cancelled.connect(lambda g=group: self._on_queue_failed(g, "iptal edildi"))
+            queue["groups"].append(group)
+            self._queue_pool.start(worker)
+
+        print(f"[INFO] {len(groups)} analiz işi kuyruğa alındı ({len(tabs)} sekme, "
+              f"{self._queue_pool.maxThreadCount()} iş parçacığı).")
+
+    def _set_queue_status(self, queue, tab, name, text):
+        item = self.queue_status_list.item(queue["rows"][id(tab)])
+        if item is not None:
+            item.setText(f"{name}: {text}")
+
+    def _on_queue_progress(self, group, message, fraction):
+        if self._queue is None:
+            return
+        text = f"çalışıyor – {message}" + (f" ({fraction:.0%})" if fraction >= 0 else "")
+        for name, tab in group["tabs"]:
+            self._set_queue_status(self._queue, tab, name, text)
+
+    def _on_queue_finished(self, group, result):
+        queue = self._queue
+        for name, tab in group["tabs"]:
+            try:
+                self._finish_analysis(tab, result, group["t_max"], False, group["start"], group["key"])
+            except Exception as e:
+                queue["failed"].append((name, str(e)))
+                self._set_queue_status(queue, tab, name, f"hata: {e}")
+                continue
+            queue["done"].append((name, tab))
+            self._set_queue_status(queue, tab, name, f"tamamlandı ({time.perf_counter() - group['start']:.2f} s)")
+        self._queue_step(queue)
+
+    def _on_queue_failed(self, group, message):
+        queue = self._queue
+        for name, tab in group["tabs"]:
+            queue["failed"].append((name, message))
+            self._set_queue_status(queue, tab, name, f"hata: {message}" if message != "iptal edildi" else message)
+        self._queue_step(queue)
+
+    def _queue_step(self, queue):
+        queue["pending"] -= 1
+        if queue["pending"] == 0:
+            self._queue = None
+            self.cancel_queue_button.setEnabled(False)
+            self.analyze_all_tabs_button.setEnabled(True)
+            self._finish_queue(queue)
+
+    def _finish_queue(self, queue):
+        # Sonuçlar seçim sırasıyla teslim edilir
+        order = {id(tab): i for i, (_, tab) in enumerate(queue["tabs"])}
+        done = sorted(queue["done"], key=lambda item: order[id(item[1])])
+        print(f"[INFO] Kuyruk bitti: {len(done)} başarılı, {len(queue['failed'])} başarısız.")
+        if queue["on_done"] is not None:
+            queue["on_done"](done, queue["failed"])
+
+    def cancel_queue(self):
+        if self._queue is None:
+            return
+        for group in self._queue["groups"]:
+            group["worker"].cancel()
+        self.cancel_queue_button.setEnabled(False)
+
     def create_empty_model_tab(self, tab_name):
         tab = QWidget()
         tab_layout = QVBoxLayout(tab)
@@ -1027,9 +1715,7 @@ class MainWindow(QMainWindow):
         scene = QGraphicsScene()
         scene.setBackgroundBrush(QBrush(QColor(230, 230, 230)))
 
-        view = QGraphicsView(scene)
-        view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
-        view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        view = GraphView(scene)
 
         tab_layout.addWidget(view)
         tab.setLayout(tab_layout)
@@ -1042,7 +1728,10 @@ class MainWindow(QMainWindow):
     "graph": {},
     "node_positions": {},
     "node_items": {},
-    "edge_items": {}
+    "edge_items": {},
+    "node_edges": {},
+    "ccf_groups": [],
+    "repair_groups": []
 }
         # 👉 BU SEKMEYİ AKTİF YAP
         self.tab_widget.setCurrentWidget(tab)
@@ -1055,8 +1744,35 @@ class MainWindow(QMainWindow):
 
 
     # --- SİMÜLASYON MOTORU (Tüm düzeltmeler dahil) ---
-    def run_analysis(self, show_plot=True, show_sensitivity=None):
-        mttf = None
+    def run_analysis(self, show_plot=True, show_sensitivity=None, background=False):
+        job = self._analysis_job(show_plot, show_sensitivity)
+        if job is not None:
+            self._run_job("Analiz", *job, background=background)
+
+    def _analysis_options(self):
+        # Sağ paneldeki analiz ayarları (analyze_dynamic anahtar argümanları)
+        ie_tol, ie_max_terms = self._get_truncation_config()
+        return dict(
+            grid_tol=self._get_adaptive_grid_tol(),
+            ie_tol=ie_tol,
+            ie_max_terms=ie_max_terms,
+            modular=self.modular_cb.isChecked(),
+            symmetry=self.symmetry_cb.isChecked(),
+            signature=self.signature_cb.isChecked(),
+            prune=self.prune_cb.isChecked(),
+            markov=self.markov_cb.isChecked()
+        )
+
+    def _analysis_key(self, model):
+        # Model + analiz ayarları içerik özeti (kuyrukta tekilleştirme, tazelik)
+        return model.content_hash(dict(self._analysis_options(), t_max=self.t_max_input.value()))
+
+    def _analysis_job(self, show_plot=True, show_sensitivity=None, tab=None, model=None):
+        """
+        Analitik analizi (compute, finish) çiftine böler: compute arayüze
+        dokunmaz (arka planda çalışabilir), finish sonucu başlatıldığı
+        sekmeye yazar ve grafikleri çizer. Girdi geçersizse None.
+        """
         t_max = self.t_max_input.value()
         if show_sensitivity is None:
             show_sensitivity = (
@@ -1065,45 +1781,337 @@ class MainWindow(QMainWindow):
                 and self.show_sensitivity_cb.isChecked()
             )
 
-        if not self.components or not self.graph:
-            QMessageBox.warning(self, "Hata", "Önce bileşen ve bağlantı tanımlanmalı.")
-            return
+        if tab is None:
+            tab = self.tab_widget.currentWidget()
+        if model is None:
+            if not tab.model_state["components"] or not tab.model_state["graph"]:
+                QMessageBox.warning(self, "Hata", "Önce bileşen ve bağlantı tanımlanmalı.")
+                return None
+            model = self._engine_model(tab)
+            if model is None:
+                return None
+
+        options = self._analysis_options()
+        model_key = self._analysis_key(model)
+        cache = self._cache()
+        cache_key = result_key(model, "analysis", t_max=t_max, sensitivity=bool(show_sensitivity), **options)
         run_start = time.perf_counter()
+        # Sekme durumu işçi iş parçacığında değiştirilmez (GUI düzenleyebilir)
+        engine_cache = worker_cache(tab.model_state)
+
+        def solve(progress):
+            # === 1. PATH SETS + SAYISAL ÇÖZÜM (engine) ===
+            print("1. Tüm minimal yollar (path sets) bulunuyor...")
+            result = analyze_dynamic(model, t_max, cache=engine_cache, progress=progress, **options)
+
+            # === 2. SEMBOLİK FORMÜLLER ===
+            print("2. Sembolik formüller üretiliyor...")
+            if progress is not None:
+                progress("Sembolik formüller", 0.9)
+            result["formula_latex"] = self._build_formulas(result, model.components)
+
+            # === 3. SENSITIVITY ===
+            if show_sensitivity and result["method"] != "markov":
+                try:
+                    result["sensitivity"] = sensitivity(model, result["t"], progress=progress)
+                except Cancelled:
+                    raise
+                except Exception as e:
+                    print("Sensitivity analysis hatası:", e)
+            return result
+
+        def compute(progress):
+            result = cached(cache, cache_key, solve, progress, kind="analysis")
+            # önbelleğe yazıldıktan sonra eklenir (diske gitmez)
+            result["engine_cache"] = engine_cache
+            return result
+
+        def finish(result):
+            self._finish_analysis(tab, result, t_max, show_plot, run_start, model_key)
+
+        return compute, finish
+
+    def _finish_analysis(self, tab, result, t_max, show_plot, run_start, model_key=None):
+        # Sonuç başlatıldığı sekmeye yazılır; etiketler/formüller yalnız
+        # o sekme hâlâ aktifse güncellenir
+        is_current = tab is self.tab_widget.currentWidget()
+        # İşçinin topoloji önbellekleri (yol, signature, modül) GUI iş parçacığında
+        # birleştirilir; anahtarlar içerik özetli olduğundan eski sekme durumuyla çakışmaz
+        tab.model_state.update(result.get("engine_cache", {}))
+        component_paths = result["component_paths"]
+        tab.model_state["component_paths"] = component_paths
+        tab.model_state["decomposition"] = result["decomposition"]
+        tab.model_state["signature"] = result["signature"]
+        tab.model_state["formula_latex"] = result["formula_latex"]
+        if is_current:
+            self.formula_latex = result["formula_latex"]
+
+        t_safe = result["t"]
+        system_r = result["R"]
+        mttf, mttf_error = result["MTTF"], result["MTTF_error"]
+        bounds = (result["R_lower"], result["R_upper"]) if result["R_lower"] is not None else None
+
+        plot_data_final = {"Sistem": system_r}
+        plot_data_final.update(result["component_curves"])
+
+        # === YOLLARIN R(t) EĞRİLERİ ===
+        path_names = [
+            f"Yol_{i+1} ({' → '.join(sorted(list(pset)))})"
+            for i, pset in enumerate(component_paths)
+        ]
+        for path_name, rt in zip(path_names, result["path_curves"]):
+            plot_data_final[path_name] = rt
+
+        # 🔴 PATH R(t) LİSTESİNİ SAKLA (Critical Analysis için)
+        tab.model_state["path_rt"] = list(result["path_curves"])
+
+        if result["method"] == "markov":
+            print(f"  Markov MTTF: kalıntı ≈ {mttf_error:.2e}")
+
+        # === GRAFİK ===
+        if show_plot:
+            self.plot_window = PlotWindow(t_safe, plot_data_final, mttf=mttf, bounds=bounds)
+            self.plot_window.show()
+        # === ANALİZ SONUÇLARINI SAKLA (KRİTİK ANALİZ İÇİN) ===
+        if is_current:
+            self.last_results = {
+                "CurrentSystem": {
+                    "t": t_safe,
+                    "R": system_r
+                }
+            }
+
+        if mttf is None:
+            mttf_text = "N/A"
+        elif not np.isfinite(mttf):
+            mttf_text = "∞"
+        elif result.get("MTTF_bounds") is not None:
+            # Kesik açılım: Bonferroni bandı (kuadratür hatası değil)
+            mttf_lo, mttf_hi = result["MTTF_bounds"]
+            mttf_text = f"{mttf:.2f} ∈ [{mttf_lo:.2f}, {mttf_hi:.2f}]"
+        elif mttf_error:
+            mttf_text = f"{mttf:.2f} ± {mttf_error:.2g}"
+        else:
+            mttf_text = f"{mttf:.2f}"
+        runtime_sec = time.perf_counter() - run_start
+        if is_current:
+            self.runtime_label.setText(self._runtime_text(result, runtime_sec))
+            self.result_label.setText(
+                f"Sistem Güvenirliği: R(t={t_max:.0f}) = {float(system_r[-1]):.6f},  MTTF ≈ {mttf_text}"
+            )
+
+        # === SENSITIVITY / TORNADO ANALYSIS ===
+        sens = result.get("sensitivity")
+        if sens is not None:
+            tab.model_state["sensitivity"] = sens
+            sensitivity_results = {
+                sens["labels"][key]: value
+                for key, value in sens["elasticity_mttf"].items()
+                if np.isfinite(value)
+            }
+            if sensitivity_results:
+                plot_sensitivity_tornado(
+                    sens["MTTF"], sensitivity_results,
+                    xlabel="MTTF elastikiyeti  (θ/MTTF · ∂MTTF/∂θ)"
+                )
+            else:
+                print("[WARN] MTTF sonsuz (yalnız statik yol) -> elastikiyet tanımsız.")
+
+        # === ANALİZ SONUCUNU BAŞLATILDIĞI SEKMEYE KAYDET (ÇOK ÖNEMLİ) ===
+        tab.model_state["analysis_results"] = {
+            "t": t_safe,
+            "R": system_r,
+            "runtime_sec": runtime_sec,
+            "model_key": model_key
+        }
+
+        tab.model_state["analytic_results"] = {
+            "t": t_safe.copy(),
+            "R": system_r.copy(),
+            "R_lower": bounds[0].copy() if bounds is not None else None,
+            "R_upper": bounds[1].copy() if bounds is not None else None,
+            "ie_levels": result["ie_levels"],
+            "ie_terms": result["ie_terms"],
+            "MTTF": float(mttf) if mttf is not None else None,
+            "MTTF_error": mttf_error,
+            "runtime_sec": runtime_sec
+        }
+        if result["method"] == "markov":
+            tab.model_state["analytic_results"].update(
+                markov_states=result["markov_states"], markov_method=result["markov_method"]
+            )
+
+    # ==========================================================
+    # ARKA PLAN İŞLERİ
+    # ==========================================================
+    def _run_job(self, title, compute, finish, background=False):
+        """
+        compute(progress) -> sonuç, finish(sonuç) GUI iş parçacığında.
+        background=False iken eski senkron davranış (iç çağrılar için).
+        """
+        if background:
+            self._start_job(title, compute, finish)
+            return
+
+        button_text = self.run_button.text()
         self.run_button.setText("Hesaplanıyor...")
         QApplication.processEvents()
+        try:
+            result = compute(None)
+        except Exception as e:
+            QMessageBox.critical(self, f"{title} Hatası", f"Hata: {e}")
+            print("HATA:", e)
+            return
+        finally:
+            self.run_button.setText(button_text)
+        finish(result)
+
+    def _start_job(self, title, compute, finish):
+        if self._job is not None:
+            QMessageBox.information(self, "Bilgi", "Önce çalışan işin bitmesini bekleyin veya iptal edin.")
+            return
 
+        worker = AnalysisWorker(compute)
+        self._job = {"worker": worker, "title": title, "finish": finish,
+                     "button_text": self.run_button.text()}
+        worker.signals.progress.connect(self._on_job_progress)
+        worker.signals.finished.connect(self._on_job_finished)
+        worker.signals.failed.connect(self._on_job_failed)
+        worker.signals.cancelled.connect(self._on_job_cancelled)
+
+        self.run_button.setText("Hesaplanıyor...")
+        self._set_job_buttons_enabled(False)
+        self.job_progress.setRange(0, 0)
+        self.job_status_label.setText(f"{title}: başlatılıyor...")
+        self._set_job_widgets_visible(True)
+        QThreadPool.globalInstance().start(worker)
+
+    def _set_job_widgets_visible(self, visible):
+        self.job_progress.setVisible(visible)
+        self.cancel_job_button.setVisible(visible)
+        self.cancel_job_button.setEnabled(visible)
+        self.job_status_label.setVisible(visible)
+
+    def _set_job_buttons_enabled(self, enabled):
+        for button in (self.run_button, self.importance_button, self.mc_importance_button, self.sweep_button):
+            button.setEnabled(enabled)
+
+    def _end_job(self):
+        job, self._job = self._job, None
+        self.run_button.setText(job["button_text"])
+        self._set_job_buttons_enabled(True)
+        self._set_job_widgets_visible(False)
+        return job
+
+    def cancel_job(self):
+        if self._job is None:
+            return
+        self._job["worker"].cancel()
+        self.cancel_job_button.setEnabled(False)
+        self.job_status_label.setText(f"{self._job['title']}: iptal ediliyor...")
+
+    def _on_job_progress(self, message, fraction):
+        if self._job is None:
+            return
+        if fraction < 0:
+            self.job_progress.setRange(0, 0)
+        else:
+            self.job_progress.setRange(0, 1000)
+            self.job_progress.setValue(int(1000 * min(fraction, 1.0)))
+        if self.cancel_job_button.isEnabled():
+            self.job_status_label.setText(f"{self._job['title']}: {message}")
+
+    def _on_job_finished(self, result):
+        job = self._end_job()
         try:
-            # === 1. PATH SETS ===
-            print("1. Tüm minimal yollar (path sets) bulunuyor...")
-            component_paths = self._get_component_paths()
+            job["finish"](result)
+        except Exception as e:
+            QMessageBox.critical(self, f"{job['title']} Hatası", f"Hata: {e}")
+            print("HATA:", e)
 
-            if not component_paths:
-                QMessageBox.critical(self, "Hata", "Start ile End arasında bileşen içeren geçerli yol yok.")
-                self.run_button.setText("FORMÜL ÜRET & HESAPLA")
-                return
+    def _on_job_failed(self, message):
+        job = self._end_job()
+        QMessageBox.critical(self, f"{job['title']} Hatası", f"Hata: {message}")
+
+    def _on_job_cancelled(self):
+        job = self._end_job()
+        print(f"[INFO] {job['title']} iptal edildi.")
+        self.runtime_label.setText(f"{job['title']} iptal edildi.")
+
+    # ==========================================================
+    # SONUÇ ÖNBELLEĞİ
+    # ==========================================================
+    def _cache(self):
+        # Kapalıysa / açılamazsa None: her zaman yeniden hesaplanır
+        if not self.result_cache_cb.isChecked():
+            return None
+        if self._result_cache is None:
+            try:
+                self._result_cache = ResultCache()
+            except Exception as e:
+                print(f"[WARN] Sonuç önbelleği açılamadı, devre dışı: {e}")
+                self.result_cache_cb.setChecked(False)
+                return None
+        return self._result_cache
+
+    @staticmethod
+    def _runtime_text(result, runtime_sec):
+        if result.get("cache_hit"):
+            return (
+                f"Son çalışma süresi: {result['cache_load_sec']:.3f} s  ⚡ önbellekten "
+                f"(ilk hesap {result.get('compute_sec', runtime_sec):.3f} s)"
+            )
+        return f"Son çalışma süresi: {runtime_sec:.3f} s"
 
-            tab = self.tab_widget.currentWidget()
-            tab.model_state["component_paths"] = component_paths
+    def clear_result_cache(self):
+        if self._result_cache is None:
+            try:
+                self._result_cache = ResultCache()
+            except Exception as e:
+                QMessageBox.warning(self, "Önbellek", f"Önbellek açılamadı: {e}")
+                return
+        stats = self._result_cache.stats()
+        self._result_cache.clear()
+        QMessageBox.information(
+            self, "Önbellek",
+            f"{stats['entries']} kayıt silindi ({stats['bytes'] / 2**20:.1f} MB)."
+        )
 
-            print("  Bulunan yollar:", component_paths)
+    def _build_formulas(self, result, components):
+        """
+        Yol kümeleri, kapalı form sistem formülü ve R(t) formülü (LaTeX).
+        Kesik IE ve Markov çözümünde tam açılım üretilmez. Arayüze
+        dokunmaz; arka plan işinden çağrılabilir.
+        """
+        component_paths = result["component_paths"]
+        tree = result["decomposition"]
+        truncated = result["truncated"]
+        trunc_note = r"\text{Kesik inclusion-exclusion: tam sembolik açılım üretilmedi}"
 
-            # === 2. SEMBOLİK FORMÜLLER ===
-            print("2. Sembolik formüller üretiliyor...")
+        if result["method"] == "markov":
+            return ["Markov (CTMC) çözümü: kapalı form formül üretilmedi.", "", ""]
 
-            self.formula_latex = ["", "", ""]
-            genis_formula_str_list = [
+        formula_latex = ["", "", ""]
+        genis_formula_str_list = [
     r"\text{Sistemde " + str(len(component_paths)) + r" başarılı yol vardır:}"
 ]
 
-            path_symbols = [symbols(f"P_{i+1}") for i in range(len(component_paths))]
+        path_symbols = [symbols(f"P_{i+1}") for i in range(len(component_paths))]
 
-            for i, pset in enumerate(component_paths):
-                term = r" \cdot ".join([f"R_{{{c}}}" for c in sorted(list(pset))])
-                genis_formula_str_list.append(f"  $P_{i+1}$ = {term}")
+        for i, pset in enumerate(component_paths):
+            term = r" \cdot ".join([f"R_{{{c}}}" for c in sorted(list(pset))])
+            genis_formula_str_list.append(f"  $P_{i+1}$ = {term}")
 
-            p_union = r" \cup ".join([f"P_{i+1}" for i in range(len(component_paths))])
-            genis_formula_str_list.append(f"$R_{{Sistem}} = P({p_union})$")
+        p_union = r" \cup ".join([f"P_{i+1}" for i in range(len(component_paths))])
+        genis_formula_str_list.append(f"$R_{{Sistem}} = P({p_union})$")
 
+        if truncated:
+            genis_formula_str_list.append(trunc_note)
+        elif tree is not None:
+            genis_formula_str_list.append(
+                r"\text{Modüler ayrıştırma: " + str(count_modules(tree)) + r" indirgenemez modül}"
+            )
+        else:
             wide_formula = 0
             for k in range(1, len(path_symbols) + 1):
                 for comb in combinations(path_symbols, k):
@@ -1113,12 +2121,18 @@ class MainWindow(QMainWindow):
                     wide_formula += ((-1)**(k+1)) * term
 
             genis_formula_str_list.append(sympy.latex(wide_formula))
-            self.formula_latex[0] = self.clean_latex("\n".join(genis_formula_str_list))
+        formula_latex[0] = self.clean_latex("\n".join(genis_formula_str_list))
 
-            # === 3. BİLEŞEN FORMÜLÜ ===
-            comp_symbols = {c: symbols(f"R_{c}") for c in self.components}
-            final_formula = 0
+        # === 3. BİLEŞEN FORMÜLÜ ===
+        comp_symbols = {c: symbols(f"R_{c}") for c in components}
+        final_formula = 0
 
+        if truncated:
+            formula_latex[1] = self.clean_latex(trunc_note)
+        elif tree is not None:
+            final_formula = structure_expression(tree, comp_symbols)
+            formula_latex[1] = self.clean_latex(sympy.latex(final_formula))
+        else:
             for k in range(1, len(component_paths) + 1):
                 for comb in combinations(range(len(component_paths)), k):
                     union_c = frozenset.union(*[component_paths[i] for i in comb])
@@ -1128,244 +2142,42 @@ class MainWindow(QMainWindow):
                     final_formula += ((-1)**(k+1)) * term
 
             final_formula = expand(final_formula)
-            self.formula_latex[1] = self.clean_latex(sympy.latex(final_formula))
+            formula_latex[1] = self.clean_latex(sympy.latex(final_formula))
 
-            
-            # === 4. DİNAMİK R(t) FORMÜLÜ ===
-            t = symbols("t", positive=True)
-            subs_dict_calc = {}
-            comp_plot_data = {}
-
-            for comp_name, data in self.components.items():
-                if data["dist"] == "static":
-                    rt = data["R"]
-                else:
-                    conf = DISTRIBUTIONS[data["dist"]]
-                    if conf.get("R_sym") is not None:
-                        rt = conf["R_sym"](t, data["params"])
-                    elif "R_num" in conf:
-                        # NUMERİK dağılımlar sembolik formüle girmez
-                        rt = symbols(f"R_{comp_name}")
+        # === 4. DİNAMİK R(t) FORMÜLÜ ===
+        t = symbols("t", positive=True)
+        subs_dict_calc = {}
 
-                    else:
-                        rt = 1
+        for comp_name, data in components.items():
+            if data["dist"] == "static":
+                rt = data["R"]
+            elif is_voting(data):
+                # k-out-of-n kapısı: DP ile sayısal, sembolik formülde R_kapı
+                rt = symbols(f"R_{comp_name}")
+            else:
+                conf = DISTRIBUTIONS[data["dist"]]
+                if conf.get("R_sym") is not None:
+                    rt = conf["R_sym"](t, data["params"])
+                elif "R_num" in conf:
+                    # NUMERİK dağılımlar sembolik formüle girmez
+                    rt = symbols(f"R_{comp_name}")
+                else:
+                    rt = 1
 
+            subs_dict_calc[symbols(f"R_{comp_name}")] = rt
 
+        if truncated:
+            formula_latex[2] = self.clean_latex(trunc_note)
+        else:
+            final_rt_formula = final_formula.subs(subs_dict_calc)
 
+            rt_latex = sympy.latex(final_rt_formula)
+            formula_latex[2] = self.clean_latex(
+                r"R_{\text{Sistem}}(t) = " + rt_latex
+            )
 
-                subs_dict_calc[symbols(f"R_{comp_name}")] = rt
-                comp_plot_data[comp_name] = data
+        return formula_latex
 
-            # === 5. SAYISAL R(t) HESABI ===
-            # === ZAMAN VEKÖRÜ (LOG-GÜVENLİ) ===
-            
-            t_safe = np.linspace(1e-6, t_max, 400)   # 0 YOK
-            t_values = t_safe.copy()
-
-
-            modules = ["numpy", {"exp": np.exp, "log": np.log, "sqrt": np.sqrt, "erfc": scipy_erfc}]
-            final_rt_formula = final_formula.subs(subs_dict_calc)
-            
-            rt_latex = sympy.latex(final_rt_formula)
-            self.formula_latex[2] = self.clean_latex(
-                r"R_{\text{Sistem}}(t) = " + rt_latex
-            )
-
-            # 1) Önce sistem R(t)'yi 1 kabul et
-            system_r = np.ones_like(t_safe, dtype=float)
-            R_ccf_numeric = None
-
-            if self.ccf_checkbox.isChecked():
-                try:
-                    beta = float(self.ccf_beta_input.text())
-                    if not (0 <= beta <= 1):
-                        raise ValueError
-                except:
-                    QMessageBox.warning(self, "Hata", "CCF β değeri 0–1 arasında olmalı.")
-                    return
-
-                lambdas = [
-                    d["params"]["lambda"]
-                    for d in self.components.values()
-                    if d["dist"] == "Exponential"
-                ]
-
-                if lambdas:
-                    lambda_avg = np.mean(lambdas)
-                    R_ccf_numeric = np.exp(-lambda_avg * t_safe)
-
-
-            # 2) Her minimal yol için numerik R(t) hesapla
-            path_rts = []
-
-            for pset in component_paths:
-                rt_path = np.ones_like(t_safe, dtype=float)
-
-                for cname in pset:
-                    data = self.components[cname]
-
-                    # --- 1) Bağımsız bileşen R(t) ---
-                    if data["dist"] == "static":
-                        rt_ind = np.ones_like(t_safe) * data["R"]
-                    else:
-                        conf = DISTRIBUTIONS[data["dist"]]
-                        if conf.get("R_sym") is not None:
-                            f = sympy.lambdify(t, conf["R_sym"](t, data["params"]), modules)
-                            rt_ind = f(t_safe)
-                        else:
-                            rt_ind = conf["R_num"](t_safe, data["params"])
-
-                    rt_ind = np.asarray(rt_ind, dtype=float)
-                    rt_ind = np.nan_to_num(rt_ind, 0.0, 0.0, 0.0)
-
-                    # --- 2) CCF uygula (ASLİ YERİ BURASI) ---
-                    if R_ccf_numeric is not None:
-                        rt_c = (1 - beta) * rt_ind + beta * R_ccf_numeric
-                    else:
-                        rt_c = rt_ind
-
-                    rt_path *= rt_c
-
-                path_rts.append(rt_path)
-
-            # 3) Inclusion–Exclusion (numeric)
-            system_r = np.zeros_like(t_safe)
-
-            for k in range(1, len(path_rts) + 1):
-                for comb in combinations(range(len(path_rts)), k):
-                    prod = np.ones_like(t_safe)
-                    for i in comb:
-                        prod *= path_rts[i]
-                    system_r += ((-1) ** (k + 1)) * prod
-
-            system_r = np.clip(system_r, 0.0, 1.0)
-
-            system_r = np.asarray(system_r, dtype=float)
-            system_r = np.nan_to_num(system_r, nan=0.0, posinf=0.0, neginf=0.0)
-
-
-            plot_data_final = {"Sistem": system_r}
-
-            for cname, data in comp_plot_data.items():
-                if data["dist"] == "static":
-                    plot_data_final[cname] = np.ones_like(t_safe) * data["R"]
-                else:
-                    conf = DISTRIBUTIONS[data["dist"]]
-
-                    if conf.get("R_sym") is not None:
-                        f = sympy.lambdify(t, conf["R_sym"](t, data["params"]), modules)
-                        plot_data_final[cname] = f(t_safe)
-                        plot_data_final[cname] = np.asarray(plot_data_final[cname], dtype=float)
-                        plot_data_final[cname] = np.nan_to_num(plot_data_final[cname], 0.0, 0.0, 0.0)
-
-                    elif "R_num" in conf:
-                        plot_data_final[cname] = conf["R_num"](t_safe, data["params"])
-                        plot_data_final[cname] = np.asarray(plot_data_final[cname], dtype=float)
-                        plot_data_final[cname] = np.nan_to_num(plot_data_final[cname], 0.0, 0.0, 0.0)
-
-                    else:
-                        plot_data_final[cname] = np.ones_like(t_safe)
-
-                # === YOLLARIN R(t) EĞRİLERİ ===
-            for i, pset in enumerate(component_paths):
-                components_in_path = " → ".join(sorted(list(pset)))
-                path_name = f"Yol_{i+1} ({components_in_path})"
-
-                rt = np.ones_like(t_safe)
-                for cname in pset:
-                    data = self.components[cname]
-
-                    if data["dist"] == "static":
-                        rt_ind = np.ones_like(t_safe) * data["R"]
-                    else:
-                        conf = DISTRIBUTIONS[data["dist"]]
-                        if conf.get("R_sym") is not None:
-                            f = sympy.lambdify(t, conf["R_sym"](t, data["params"]), modules)
-                            rt_ind = f(t_safe)
-                        else:
-                            rt_ind = conf["R_num"](t_safe, data["params"])
-
-                    rt_ind = np.nan_to_num(rt_ind, 0.0, 0.0, 0.0)
-
-                    if R_ccf_numeric is not None:
-                        rt_c = (1 - beta) * rt_ind + beta * R_ccf_numeric
-                    else:
-                        rt_c = rt_ind
-
-                    rt *= rt_c
-
-                plot_data_final[path_name] = rt
-
-
-            # 🔴 PATH R(t) LİSTESİNİ SAKLA (Critical Analysis için)
-            tab = self.tab_widget.currentWidget()
-            tab.model_state["component_paths"] = component_paths
-            tab.model_state["path_rt"] = [
-                plot_data_final[f"Yol_{i+1} ({' → '.join(sorted(list(pset)))})"]
-                for i, pset in enumerate(component_paths)
-            ]
-
-            # === MTTF HESABI ===
-            try:
-                mttf = np.trapz(system_r, t_safe)
-                if not np.isfinite(mttf):
-                    mttf = 0.0
-
-            except:
-                mttf = None
-
-            # === GRAFİK ===
-            if show_plot:
-                self.plot_window = PlotWindow(t_safe, plot_data_final, mttf=mttf)
-                self.plot_window.show()
-            # === ANALİZ SONUÇLARINI SAKLA (KRİTİK ANALİZ İÇİN) ===
-            self.last_results = {
-                "CurrentSystem": {
-                    "t": t_safe,
-                    "R": system_r
-                }
-            }
-
-
-        except Exception as e:
-            QMessageBox.critical(self, "Analiz Hatası", f"Hata: {e}")
-            print("HATA:", e)
-            self.run_button.setText("FORMÜL ÜRET & HESAPLA")
-            return
-
-        self.run_button.setText("FORMÜL ÜRET & HESAPLA")
-
-        mttf_text = f"{mttf:.2f}" if mttf is not None else "N/A"
-        runtime_sec = time.perf_counter() - run_start
-        self.runtime_label.setText(f"Son çalışma süresi: {runtime_sec:.3f} s")
-        self.result_label.setText(
-            f"Sistem Güvenirliği: R(t={t_max:.0f}) = {float(system_r[-1]):.6f},  MTTF ≈ {mttf_text}"
-        )
-
-                
-        # === SENSITIVITY / TORNADO ANALYSIS ===
-        if show_sensitivity:
-            try:
-                mttf_base, sensitivity = self.run_sensitivity_analysis()
-                if sensitivity:
-                    plot_sensitivity_tornado(mttf_base, sensitivity)
-            except Exception as e:
-                print("Sensitivity analysis hatası:", e)
-
-        # === ANALİZ SONUCUNU AKTİF SEKMEYE KAYDET (ÇOK ÖNEMLİ) ===
-        tab = self.tab_widget.currentWidget()
-        tab.model_state["analysis_results"] = {
-            "t": t_safe,
-            "R": system_r,
-            "runtime_sec": runtime_sec
-        }
-
-        tab.model_state["analytic_results"] = {
-    "t": t_safe.copy(),
-    "R": system_r.copy(),
-    "MTTF": float(mttf) if mttf is not None else None,
-    "runtime_sec": runtime_sec
-}
     def on_dist_changed(self):
         # Eski parametre widgetlarını temizle
         for label, edit in getattr(self, "param_inputs", []):
@@ -1386,6 +2198,32 @@ class MainWindow(QMainWindow):
 
             self.param_inputs.append((label, edit))
 
+    def on_repair_dist_changed(self):
+        for label, edit in getattr(self, "repair_param_inputs", []):
+            label.deleteLater()
+            edit.deleteLater()
+        self.repair_param_inputs = []
+
+        config = DISTRIBUTIONS[self.repair_dist_selector.currentText()]
+        for prm in config["params"]:
+            label = QLabel(prm["label"])
+            edit = QLineEdit()
+            edit.setMinimumHeight(28)
+
+            self.repair_param_layout.addWidget(label)
+            self.repair_param_layout.addWidget(edit)
+
+            self.repair_param_inputs.append((label, edit))
+
+    def _read_repair(self):
+        # Tüm alanlar boşsa bileşen onarılamaz (None)
+        texts = [edit.text().strip() for _, edit in self.repair_param_inputs]
+        if not any(texts):
+            return None
+        dist = self.repair_dist_selector.currentText()
+        keys = [prm["key"] for prm in DISTRIBUTIONS[dist]["params"]]
+        return make_repair(dist, dict(zip(keys, texts)))
+
 
 
     def setup_connection_context_menu(self):
@@ -1405,42 +2243,44 @@ class MainWindow(QMainWindow):
             node1, node2 = [x.strip() for x in text.split("<->")]
             self.remove_connection_logic(node1, node2)
 
-    def _find_all_paths(self, start, end, path=None):
-            if path is None: path = []
-            path = path + [start]
-            if start == end:
-                return [path]
-            if start not in self.graph:
-                return []
-            paths = []
-            for node in self.graph[start]:
-                if node not in path:
-                    new_paths = self._find_all_paths(node, end, path)
-                    for p in new_paths:
-                        if p not in paths:
-                            paths.append(p)
-            return paths
-
-        # --- ARAYÜZ YÖNETİM FONKSİYONLARI ---
     def _get_component_paths(self):
-    
-        paths_nodes = self._find_all_paths("Start", "End")
-
-        if not paths_nodes:
-            return []
-
-        component_paths = [
-            frozenset([n for n in p if n in self.components])
-            for p in paths_nodes
-        ]
+        # Start–End basit yolları -> bileşen kümeleri (engine ile aynı)
+        return [p for p in component_paths_of(self.graph, self.components) if p]
 
-        # tekrar edenleri kaldır
-        component_paths = list(dict.fromkeys(component_paths))
+    def _engine_model(self, tab=None):
+        """
+        Sekmenin (varsayılan: aktif sekme) modelini arayüzden bağımsız
+        engine.Model olarak (kopya) döndürür. Global CCF β geçersizse
+        uyarı verir, None döner.
+        """
+        ccf_beta = None
+        if self.ccf_checkbox.isChecked():
+            try:
+                ccf_beta = float(self.ccf_beta_input.text())
+                if not (0.0 <= ccf_beta <= 1.0):
+                    raise ValueError
+            except ValueError:
+                QMessageBox.warning(self, "Hata", "CCF β değeri 0–1 arasında olmalı.")
+                return None
 
-        # boş path'leri çıkar
-        component_paths = [p for p in component_paths if p]
+        if tab is None:
+            state = {
+                "components": self.components, "junctions": self.junctions, "graph": self.graph,
+                "ccf_groups": self.ccf_groups, "repair_groups": self.repair_groups
+            }
+        else:
+            state = tab.model_state
+
+        # Kopya: arka plan işi sürerken modelde yapılan düzenlemeler işi etkilemez
+        return Model(
+            components=copy.deepcopy(state["components"]),
+            junctions=set(state["junctions"]),
+            connections=[(a, b) for a, vs in state["graph"].items() for b in vs if a < b],
+            ccf_beta=ccf_beta,
+            ccf_groups=copy.deepcopy(state.get("ccf_groups", [])),
+            repair_groups=copy.deepcopy(state.get("repair_groups", []))
+        )
 
-        return component_paths    
     def show_formula_window(self):
             if self.formula_latex:
                 if self.formula_window and self.formula_window.isVisible():
@@ -1467,6 +2307,8 @@ class MainWindow(QMainWindow):
             self.run_button.setText("FORMÜL ÜRET & HESAPLA")
 
             self.mc_box.setVisible(False)
+            self.repair_box.setVisible(False)
+            self.repair_inputs_widget.setVisible(False)
             self.output_box.setVisible(False)
             self.show_formula_button.setVisible(True)
 
@@ -1479,6 +2321,8 @@ class MainWindow(QMainWindow):
             self.on_dist_changed()
 
             self.mc_box.setVisible(False)
+            self.repair_box.setVisible(False)
+            self.repair_inputs_widget.setVisible(False)
             self.output_box.setVisible(True)
 
             self.show_mc_hist_cb.setVisible(False)
@@ -1488,7 +2332,7 @@ class MainWindow(QMainWindow):
 
             self.show_formula_button.setVisible(True)
 
-        else:  # Monte Carlo
+        elif mode_text == "Monte Carlo Simülasyonu":
             self.analysis_mode = "montecarlo"
             self.static_inputs_widget.setVisible(False)
             self.dynamic_inputs_widget.setVisible(True)
@@ -1497,6 +2341,8 @@ class MainWindow(QMainWindow):
             self.on_dist_changed()
 
             self.mc_box.setVisible(True)
+            self.repair_box.setVisible(False)
+            self.repair_inputs_widget.setVisible(False)
             self.output_box.setVisible(True)
 
             self.show_mc_hist_cb.setVisible(True)
@@ -1508,33 +2354,53 @@ class MainWindow(QMainWindow):
             self.show_sensitivity_cb.setVisible(False)
 
             self.show_formula_button.setVisible(True)
+
+        else:  # Onarılabilir sistem (erişilebilirlik, ayrık olay simülasyonu)
+            self.analysis_mode = "repairable"
+            self.static_inputs_widget.setVisible(False)
+            self.dynamic_inputs_widget.setVisible(True)
+            self.repair_inputs_widget.setVisible(True)
+
+            self.run_button.setText("ERİŞİLEBİLİRLİK SİMÜLASYONU")
+            self.on_dist_changed()
+
+            self.mc_box.setVisible(True)
+            self.repair_box.setVisible(True)
+            self.output_box.setVisible(False)
+            self.show_formula_button.setVisible(False)
     # --- EKSİK FONKSİYONLARIN SONU ---    
         
     def refresh_left_panel(self):
         # 🔴 HER ŞEYİ TEMİZLE
         self.comp_list_widget.clear()
         self.conn_list_widget.clear()
-        self.from_node_selector.clear()
-        self.to_node_selector.clear()
 
         # 🧩 BİLEŞEN LİSTESİ
+        comp_texts = []
         for cname, cdata in self.components.items():
             if cdata["dist"] == "static":
                 text = f"{cname} (R={cdata['R']:.4f})"
+            elif is_voting(cdata):
+                text = f"{cname} (k-out-of-n: {cdata['k']}/{len(cdata['members'])})"
+            elif is_standby(cdata):
+                text = (
+                    f"{cname} ({STANDBY_MODES[cdata['mode']]} yedek: "
+                    f"{cdata['k']}/{len(cdata['members'])})"
+                )
             else:
                 params = ", ".join(f"{k}={v}" for k, v in cdata["params"].items())
                 text = f"{cname} ({cdata['dist']}: {params})"
+                if cdata.get("repair"):
+                    text += f" [onarım: {cdata['repair']['dist']}]"
 
-            self.comp_list_widget.addItem(text)
+            comp_texts.append(text)
+        self.comp_list_widget.addItems(comp_texts)
 
         # 🔗 NODE SELECTOR
-        all_nodes = ["Start", "End"] + list(self.components.keys()) + sorted(self.junctions)
-        self.from_node_selector.addItems(all_nodes)
-        self.to_node_selector.addItems(all_nodes)
+        self.update_connection_selectors()
 
         # 🔗 BAĞLANTILAR
-        for a, b in self.connections:
-            self.conn_list_widget.addItem(f"{a} <-> {b}")
+        self.conn_list_widget.addItems([f"{a} <-> {b}" for a, b in self.connections])
 
 
     def add_component(self):
@@ -1586,6 +2452,12 @@ class MainWindow(QMainWindow):
                 param_str = ", ".join(f"{k}={v}" for k, v in params.items())
                 display_text = f"{comp_name} ({dist}: {param_str})"
 
+                if self.analysis_mode == "repairable":
+                    repair = self._read_repair()
+                    if repair is not None:
+                        self.components[comp_name]["repair"] = repair
+                        display_text += f" [onarım: {repair['dist']}]"
+
 
         except Exception:
             QMessageBox.warning(self, "Hata", "Parametreleri doğru giriniz.")
@@ -1605,6 +2477,206 @@ class MainWindow(QMainWindow):
         self.comp_reli_input.clear()
 
     
+    def add_voting_gate(self):
+        inputs = self._gate_inputs(self.voting_members_input)
+        if inputs is None:
+            return
+        gate_name, members = inputs
+        k = self.voting_k_spinbox.value()
+
+        try:
+            gate = make_voting_gate(k, {m: copy.deepcopy(self.components[m]) for m in members})
+        except ValueError as e:
+            QMessageBox.warning(self, "Hata", str(e))
+            return
+
+        self._place_gate(gate_name, gate, members)
+        self.voting_members_input.clear()
+
+        print(f"[INFO] k-out-of-n kapısı '{gate_name}' oluşturuldu: {k}/{len(members)}")
+
+    def _gate_inputs(self, members_input):
+        if not hasattr(self, "scene") or self.scene is None:
+            QMessageBox.warning(
+                self,
+                "Aktif Model Yok",
+                "Lütfen önce bir model yükleyin veya aktif bir sekme seçin."
+            )
+            return None
+
+        gate_name = self.comp_name_input.text().strip()
+        members = [m.strip() for m in members_input.text().split(",") if m.strip()]
+
+        if not gate_name or gate_name in self.components or gate_name in ["Start", "End"]:
+            QMessageBox.warning(self, "Hata", "Kapı için geçersiz veya mevcut bir ad girildi.")
+            return None
+
+        missing = [m for m in members if m not in self.components]
+        if missing:
+            QMessageBox.warning(self, "Hata", f"Bulunamayan üyeler: {', '.join(missing)}")
+            return None
+
+        connected = [m for m in members if self.graph.get(m)]
+        if connected:
+            QMessageBox.warning(
+                self, "Hata",
+                f"Kapı üyeleri bağlantısız olmalı: {', '.join(connected)}"
+            )
+            return None
+
+        return gate_name, members
+
+    def _place_gate(self, gate_name, gate, members):
+        # Üyeler ayrı düğüm olarak kalmaz, kapının içine taşınır
+        positions = [self.node_positions[m] for m in members if m in self.node_positions]
+        for m in members:
+            self.remove_component(m)
+
+        self.components[gate_name] = gate
+
+        if positions:
+            x, y = positions[0].x(), positions[0].y()
+        else:
+            x = 300 + (len(self.components) % 4) * 120
+            y = 100 + (len(self.components) // 4) * 80
+        self.draw_node(gate_name, x, y, QColor("darkmagenta"), is_component=True)
+
+        self.refresh_left_panel()
+        self.comp_name_input.clear()
+
+    def add_standby_gate(self):
+        inputs = self._gate_inputs(self.standby_members_input)
+        if inputs is None:
+            return
+        gate_name, members = inputs
+
+        mode = self.standby_mode_combo.currentData()
+        k = self.standby_k_spinbox.value()
+        dormancy = None
+        if mode == "warm":
+            try:
+                dormancy = float(self.standby_dormancy_input.text())
+            except ValueError:
+                QMessageBox.warning(self, "Hata", "Ilık yedek için α değerini sayı olarak giriniz.")
+                return
+
+        try:
+            gate = make_standby_gate(
+                k, {m: copy.deepcopy(self.components[m]) for m in members},
+                mode=mode,
+                dormancy=dormancy,
+                crews=self.standby_crews_spinbox.value() or None
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Hata", str(e))
+            return
+
+        self._place_gate(gate_name, gate, members)
+        self.standby_members_input.clear()
+
+        print(f"[INFO] {STANDBY_MODES[mode]} yedekli kapı '{gate_name}' oluşturuldu: {k}/{len(members)}")
+
+    def add_repair_group(self):
+        name = self.repair_group_name_input.text().strip()
+        members = [m.strip() for m in self.repair_group_members_input.text().split(",") if m.strip()]
+
+        try:
+            if any(g["name"] == name for g in self.repair_groups):
+                raise ValueError(f"'{name}' adlı onarım grubu zaten var.")
+            group = make_repair_group(name, members, self.repair_group_crews_spinbox.value())
+            validate_repair_groups(self.repair_groups + [group], self.components)
+        except ValueError as e:
+            QMessageBox.warning(self, "Onarım Grubu Hatası", str(e))
+            return
+
+        self.repair_groups.append(group)
+        self.refresh_repair_group_list()
+        self.repair_group_name_input.clear()
+        self.repair_group_members_input.clear()
+        print(f"[INFO] Onarım grubu '{name}' eklendi: {', '.join(group['members'])} ({group['crews']} ekip)")
+
+    def remove_repair_group(self):
+        row = self.repair_group_list.currentRow()
+        if row < 0 or row >= len(self.repair_groups):
+            return
+        group = self.repair_groups.pop(row)
+        self.refresh_repair_group_list()
+        print(f"[INFO] Onarım grubu '{group['name']}' silindi.")
+
+    def refresh_repair_group_list(self):
+        if not hasattr(self, "repair_group_list"):
+            return
+        self.repair_group_list.clear()
+        for g in self.repair_groups:
+            self.repair_group_list.addItem(f"{g['name']}: {', '.join(g['members'])}  ({g['crews']} ekip)")
+
+    def _markov_only_warning(self):
+        # Yedekli kapı yol kümesi motorlarında / örneklemede tanımlı değil
+        if any(is_standby(d) for d in self.components.values()):
+            QMessageBox.warning(
+                self, "Uyarı",
+                "Yedekli (standby) kapı içeren modeller yalnız Markov çözücüsüyle analiz edilebilir."
+            )
+            return True
+        return False
+
+    def add_ccf_group(self):
+        name = self.ccf_group_name_input.text().strip()
+        members = [m.strip() for m in self.ccf_group_members_input.text().split(",") if m.strip()]
+        model = self.ccf_group_model_combo.currentData()
+
+        try:
+            if any(g["name"] == name for g in self.ccf_groups):
+                raise ValueError(f"'{name}' adlı CCF grubu zaten var.")
+            factors = [f for f in self.ccf_group_factors_input.text().replace(";", ",").split(",") if f.strip()]
+            group = make_ccf_group(name, members, model, factors)
+            validate_groups(self.ccf_groups + [group], self.components)
+        except ValueError as e:
+            QMessageBox.warning(self, "CCF Hatası", str(e))
+            return
+
+        self.ccf_groups.append(group)
+        self.refresh_ccf_group_list()
+        self.ccf_group_name_input.clear()
+        self.ccf_group_members_input.clear()
+        self.ccf_group_factors_input.clear()
+        print(f"[INFO] CCF grubu '{name}' eklendi: {', '.join(group['members'])}")
+
+    def remove_ccf_group(self):
+        row = self.ccf_group_list.currentRow()
+        if row < 0 or row >= len(self.ccf_groups):
+            return
+        group = self.ccf_groups.pop(row)
+        self.refresh_ccf_group_list()
+        print(f"[INFO] CCF grubu '{group['name']}' silindi.")
+
+    def refresh_ccf_group_list(self):
+        if not hasattr(self, "ccf_group_list"):
+            return
+        self.ccf_group_list.clear()
+        for g in self.ccf_groups:
+            if g["model"] == "beta":
+                factors = f"β={g['beta']:g}"
+            else:
+                factors = "α=" + "/".join(f"{a:.3g}" for a in g["alpha"])
+            self.ccf_group_list.addItem(f"{g['name']}: {', '.join(g['members'])}  ({factors})")
+
+    def _drop_from_ccf_groups(self, comp_name):
+        for g in list(self.ccf_groups):
+            if comp_name not in g["members"]:
+                continue
+            g["members"].remove(comp_name)
+            if g["model"] == "alpha":
+                # α vektörü grup boyutuna bağlı -> yeniden girilmeli
+                print(f"[WARN] CCF grubu '{g['name']}' α-faktör grubu olduğu için silindi.")
+                self.ccf_groups.remove(g)
+            elif len(g["members"]) < 2:
+                self.ccf_groups.remove(g)
+        self.refresh_ccf_group_list()
+
+    def _validated_ccf_groups(self, components):
+        return active_ccf_groups(self.ccf_groups, components)
+
     # --- BAĞLANTI VE KAVŞAK MANTIĞI ---
 
     def add_connection(self):
@@ -1616,8 +2688,14 @@ class MainWindow(QMainWindow):
             )
             return
 
-        node1 = self.from_node_selector.currentText()
-        node2 = self.to_node_selector.currentText()
+        node1 = self.from_node_selector.currentText().strip()
+        node2 = self.to_node_selector.currentText().strip()
+        # Seçiciler yazılabilir: yalnız modeldeki düğümler kabul edilir
+        known = {"Start", "End"} | set(self.components) | set(self.junctions)
+        unknown = [n for n in (node1, node2) if n and n not in known]
+        if unknown:
+            QMessageBox.warning(self, "Hata", f"Bilinmeyen düğüm: {', '.join(unknown)}")
+            return
         self.add_connection_logic(node1, node2)
 
     def add_connection_logic(self, node1, node2):
@@ -1642,16 +2720,43 @@ class MainWindow(QMainWindow):
 
         line_item = self.draw_edge(node1, node2)
         if line_item:
-            self.edge_items[edge_key] = line_item
+            self._index_edge(edge_key, line_item)
         
         return True
 
+    def _index_edge(self, edge_key, line_item):
+        # edge_items + düğüm -> tel indeksi (sürüklemede yalnız komşu teller)
+        self.edge_items[edge_key] = line_item
+        for node in edge_key:
+            self.node_edges.setdefault(node, set()).add(edge_key)
+
+    def _add_connections_bulk(self, connections):
+        """
+        Model yüklemede add_connection_logic'in toplu karşılığı: yinelenen
+        ve kendine bağlı kenarlar sessizce atlanır, uyarı kutusu çıkmaz.
+        Bağlantı listesi sonradan refresh_left_panel ile tek seferde dolar.
+        """
+        seen = set(self.edge_items)
+        for node1, node2 in connections:
+            edge_key = tuple(sorted((node1, node2)))
+            if node1 == node2 or edge_key in seen:
+                continue
+            seen.add(edge_key)
+            self.graph.setdefault(node1, []).append(node2)
+            self.graph.setdefault(node2, []).append(node1)
+            self.connections.append((node1, node2))
+            line_item = self.draw_edge(node1, node2)
+            if line_item:
+                self._index_edge(edge_key, line_item)
+
     def remove_connection_logic(self, node1, node2):
         """ İki düğüm arasındaki bağlantıyı (mantık ve görsel) siler """
         edge_key = tuple(sorted((node1, node2)))
         
         if edge_key in self.edge_items:
             line_item = self.edge_items.pop(edge_key)
+            for node in edge_key:
+                self.node_edges.get(node, set()).discard(edge_key)
             self.scene.removeItem(line_item)
         
         if node1 in self.graph and node2 in self.graph[node1]:
@@ -1700,13 +2805,21 @@ class MainWindow(QMainWindow):
             self.remove_connection_logic(a, b)
 
         # 3) Sahnedeki node'u sil
+        self.node_edges.pop(comp_name, None)
         if comp_name in self.node_items:
             self.scene.removeItem(self.node_items[comp_name])
             del self.node_items[comp_name]
 
-        # 4) Modelden sil
+        # 4) Modelden sil (CCF gruplarından da; < 2 üyeli grup kalmaz)
         self.components.pop(comp_name, None)
         self.node_positions.pop(comp_name, None)
+        self._drop_from_ccf_groups(comp_name)
+        for g in list(self.repair_groups):
+            if comp_name in g["members"]:
+                g["members"].remove(comp_name)
+                if len(g["members"]) < 2:
+                    self.repair_groups.remove(g)
+        self.refresh_repair_group_list()
 
         # 5) Sol paneli yenile
         self.refresh_left_panel()
@@ -1720,32 +2833,32 @@ class MainWindow(QMainWindow):
         center_pos = QPointF(new_pos.x() + width / 2, new_pos.y() + height / 2)
         self.node_positions[node_name] = center_pos
 
-        for edge_key, line_item in self.edge_items.items():
-            if node_name in edge_key:
-                node1, node2 = edge_key
-                try:
-                    p1_center = self.node_positions[node1]
-                    p2_center = self.node_positions[node2]
-                    
-                    V = p2_center - p1_center; L = math.sqrt(V.x()**2 + V.y()**2)
-                    if L == 0: line_item.setLine(0,0,0,0); continue
-                    
-                    U = V / L
-                    clip1 = 42 if (node1 in self.components or node1 in ['Start', 'End']) else 17
-                    clip2 = 42 if (node2 in self.components or node2 in ['Start', 'End']) else 17
+        for edge_key in self.node_edges.get(node_name, ()):
+            line_item = self.edge_items[edge_key]
+            node1, node2 = edge_key
+            try:
+                p1_center = self.node_positions[node1]
+                p2_center = self.node_positions[node2]
+                
+                V = p2_center - p1_center; L = math.sqrt(V.x()**2 + V.y()**2)
+                if L == 0: line_item.setLine(0,0,0,0); continue
+                
+                U = V / L
+                clip1 = 42 if (node1 in self.components or node1 in ['Start', 'End']) else 17
+                clip2 = 42 if (node2 in self.components or node2 in ['Start', 'End']) else 17
+                
+                if L <= clip1 + clip2: 
+                    line_item.setLine(0,0,0,0); continue
                     
-                    if L <= clip1 + clip2: 
-                        line_item.setLine(0,0,0,0); continue
-                        
-                    p1_clipped = p1_center + U * clip1
-                    p2_clipped = p2_center - U * clip2
-                    line_item.setLine(p1_clipped.x(), p1_clipped.y(), p2_clipped.x(), p2_clipped.y())
-                except Exception as e:
-                    pass 
+                p1_clipped = p1_center + U * clip1
+                p2_clipped = p2_center - U * clip2
+                line_item.setLine(p1_clipped.x(), p1_clipped.y(), p2_clipped.x(), p2_clipped.y())
+            except Exception as e:
+                pass 
 
     def reset_model(self):
         self.components = {}; self.graph = {}; self.node_positions = {}
-        self.node_items = {}; self.edge_items = {} 
+        self.node_items = {}; self.edge_items = {}; self.node_edges = {}
         self.junctions = set(); self.junction_count = 1
         self.scene.clear(); self.comp_list_widget.clear(); self.conn_list_widget.clear()
         self.result_label.setText("Sistem Güvenirliği: - (Model değişti)")
@@ -1785,8 +2898,13 @@ class MainWindow(QMainWindow):
              node_item = DraggableNode(0, 0, 30, 30, node_name=name, main_window=self)
              width, height = 30, 30
              
-        node_item.setBrush(QBrush(color)); node_item.setPen(QPen(Qt.GlobalColor.black))
-        text_item = QGraphicsTextItem(name, node_item); text_item.setDefaultTextColor(QColor("white")); text_item.setFont(QFont("Arial", 9, QFont.Weight.Bold))
+        if not hasattr(self, "_node_style"):
+            # Kalem / yazı tipi / yazı rengi tüm düğümlerde ortak
+            self._node_style = (QPen(Qt.GlobalColor.black), QFont("Arial", 9, QFont.Weight.Bold), QBrush(QColor("white")))
+        pen, font, text_brush = self._node_style
+
+        node_item.setBrush(QBrush(color)); node_item.setPen(pen)
+        text_item = NodeLabelItem(name, node_item); text_item.setBrush(text_brush); text_item.setFont(font)
         text_rect = text_item.boundingRect(); text_item.setPos((width - text_rect.width()) / 2, (height - text_rect.height()) / 2); self.scene.addItem(node_item)
         
         node_item.setPos(x - width/2, y - height/2) 
@@ -1827,94 +2945,71 @@ class MainWindow(QMainWindow):
             print(f"Hata: {from_node} veya {to_node} için pozisyon bulunamadı.")
             return None
             
+    def _node_selector(self):
+        combo = QComboBox()
+        combo.setModel(self.node_model)
+        combo.setEditable(True)
+        combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        combo.setMinimumHeight(32)
+        combo.setMaxVisibleItems(20)
+        combo.view().setUniformItemSizes(True)
+
+        completer = QCompleter(self.node_model, combo)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        combo.setCompleter(completer)
+        return combo
+
     def update_connection_selectors(self):
-        self.from_node_selector.clear(); self.to_node_selector.clear()
+        # Tek model güncellemesi: her iki seçici de aynı listeyi gösterir
         all_nodes = ['Start', 'End'] + list(self.components.keys()) + sorted(list(self.junctions))
-        self.from_node_selector.addItems(all_nodes)
-        self.to_node_selector.addItems(all_nodes)
+        self.node_model.setStringList(all_nodes)
     
 
-    def save_scenario_to_json(self, scenario_name, params, t_values, system_rt, comp_rt, T_sys_samples=None):
-
+    def save_scenario(self, scenario_name, params, t_values, system_rt, comp_rt, T_sys_samples=None):
         """
-        Tek bir analizi JSON dosyasına ekler.
+        Tek bir analizi senaryo deposuna ekler (scenario_store, O(1)).
         scenario_name : kullanıcının verdiği isim (örn: 'test1')
         params        : bileşen parametreleri (self.components)
         t_values      : numpy array (zaman noktaları)
         system_rt     : numpy array (Sistem R(t))
         comp_rt       : dict {comp_name: numpy array}
+        Aynı isimde senaryo varsa yenisi geçerli olur.
         """
-
-        filename = "scenarios.json"
-
-        # JSON kayıt formatı
-        entry = {
-    "name": scenario_name,
-    "analysis_mode": self.analysis_mode,
-    "params": params,
-    "t_values": list(map(float, t_values)),
-    "system_rt": list(map(float, system_rt)),
-    "components_rt": {k: list(map(float, v)) for k, v in comp_rt.items()}
-}
-
+        arrays = {"t": t_values, "R": system_rt}
+        arrays.update({component_key(k): v for k, v in comp_rt.items()})
         if T_sys_samples is not None:
-            entry["T_sys_samples"] = T_sys_samples
+            arrays["T_sys"] = T_sys_samples
 
-        # Eski dosyayı oku
-        if os.path.exists(filename):
-            with open(filename, "r") as f:
-                try:
-                    existing = json.load(f)
-                except json.JSONDecodeError:
-                    existing = {"scenarios": []}
-        else:
-            existing = {"scenarios": []}
+        with open_store() as store:
+            store.save(scenario_name, arrays, params=params, analysis_mode=self.analysis_mode)
 
-        # Aynı isimde senaryo varsa → üzerine yaz
-        existing["scenarios"] = [
-            sc for sc in existing.get("scenarios", [])
-            if sc.get("name") != scenario_name
-        ]
-
-        existing["scenarios"].append(entry)
-
-        # Yaz
-        with open(filename, "w") as f:
-            json.dump(existing, f, indent=4)
+        print(f"[INFO] Senaryo kaydedildi: {scenario_name}")
 
-        print(f"[JSON] Senaryo kaydedildi: {scenario_name}")
-
-
-    def plot_from_json(self, scenario_names):
-        filename = "scenarios.json"
-
-        if not os.path.exists(filename):
-            QMessageBox.warning(self, "Hata", "Önce senaryo kaydedilmesi gerekiyor!")
-            return
-
-        with open(filename, "r") as f:
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                QMessageBox.warning(self, "Hata", "scenarios.json okunamadı.")
-                return
+    def plot_scenarios(self, scenario_names):
+        # Yalnız seçilen senaryoların t ve sistem R(t) dizileri okunur
+        with open_store() as store:
+            scenarios = store.load_many(scenario_names, keys=("t", "R"))
 
         t_values = None
         plot_data = {}
 
-        for sc in data.get("scenarios", []):
-            name = sc.get("name")
-            if name in scenario_names:
-
-                # Eksik veri varsa atla
-                if "system_rt" not in sc or "t_values" not in sc:
-                    print(f"[UYARI] Senaryo bozuk atlanıyor: {name}")
-                    continue
+        for name, sc in scenarios.items():
+            arrays = sc["arrays"]
+            # Eksik veri varsa atla
+            if "R" not in arrays or "t" not in arrays:
+                print(f"[WARN] Senaryo eksik, atlanıyor: {name}")
+                continue
 
-                if t_values is None:
-                    t_values = np.array(sc["t_values"], dtype=float)
+            if t_values is None:
+                t_values = np.array(arrays["t"])
+            elif arrays["t"].shape != t_values.shape or not np.allclose(arrays["t"], t_values):
+                # farklı gridler ilk senaryonun gridine taşınır
+                plot_data[name] = np.interp(t_values, arrays["t"], arrays["R"])
+                continue
 
-                plot_data[name] = np.array(sc["system_rt"], dtype=float)
+            plot_data[name] = np.array(arrays["R"])
 
         if not plot_data:
             QMessageBox.warning(self, "Hata", "Seçilen senaryolar bulunamadı veya eksik.")
@@ -1923,18 +3018,20 @@ class MainWindow(QMainWindow):
         # Grafik çiz
         self.plot_window = PlotWindow(t_values, plot_data)
         self.plot_window.show()
-    
 
-    
     def run_main_button(self):
+        # Uzun işler arka planda (QThreadPool); pencere yanıt vermeye devam eder
         if self.analysis_mode == "static":
-            self.run_analysis()  # mevcut analitik statik fonksiyonun
+            self.run_analysis(background=True)  # mevcut analitik statik fonksiyonun
 
         elif self.analysis_mode == "dynamic":
-            self.run_analysis()  # mevcut analitik dinamik fonksiyonun
+            self.run_analysis(background=True)  # mevcut analitik dinamik fonksiyonun
 
         elif self.analysis_mode == "montecarlo":
-            self.run_monte_carlo_gui()
+            self.run_monte_carlo_gui(background=True)
+
+        elif self.analysis_mode == "repairable":
+            self.run_availability_gui()
 
     
     def clean_latex(self, text):
@@ -1958,7 +3055,10 @@ class MainWindow(QMainWindow):
                 for name in self.node_positions
                 if name not in ["Start", "End"]        # <<< ÖNEMLİ
             },
-            "connections": [list(edge) for edge in self.edge_items.keys()]
+            # çizilemeyen (çok kısa) teller edge_items'ta yok: mantıksal liste esas
+            "connections": [list(edge) for edge in self.connections],
+            "ccf_groups": self.ccf_groups,
+            "repair_groups": self.repair_groups
         }
 
         with open(filename, "w") as f:
@@ -1983,12 +3083,42 @@ class MainWindow(QMainWindow):
         state["node_positions"].clear()
         state["node_items"].clear()
         state["edge_items"].clear()
+        state.setdefault("node_edges", {}).clear()
 
         # 4️⃣ STATE’E JSON VERİSİNİ YAZ
         state["components"].update(copy.deepcopy(data.get("components", {})))
+        state.setdefault("ccf_groups", [])[:] = copy.deepcopy(data.get("ccf_groups", []))
+        state.setdefault("repair_groups", [])[:] = copy.deepcopy(data.get("repair_groups", []))
         state["junctions"].update(set(data.get("junctions", [])))
         state["node_positions"].update(data.get("node_positions", {}))
 
+        # 5️⃣–8️⃣ toplu sahne kurulumu: çizim ve uzamsal indeks sonda bir kez
+        with self._bulk_scene_update():
+            self._build_loaded_scene(state, data)
+
+        # 9️⃣ SOL PANEL + STATE SENKRON
+        self.on_tab_changed(self.tab_widget.currentIndex())
+
+        # 10️⃣ UI DURUM
+        self.result_label.setText("Sistem Güvenirliği: - (Model yüklendi)")
+        print("[MODEL] Yüklendi:", filename)
+
+    @contextlib.contextmanager
+    def _bulk_scene_update(self):
+        """
+        Çok sayıda öğe eklerken görünüm güncellemesi ve sahnenin BSP
+        indeksi askıya alınır; çıkışta indeks bir kez kurulur.
+        """
+        self.view.setUpdatesEnabled(False)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            yield
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
+
+    def _build_loaded_scene(self, state, data):
         # 5️⃣ SCENE TEMİZLE + START / END
         self.scene.clear()
         self.initialize_scene()
@@ -2003,7 +3133,8 @@ class MainWindow(QMainWindow):
             else:
                 x, y = 300, 200
 
-            self.draw_node(cname, x, y, QColor("darkblue"), is_component=True)
+            color = QColor("darkmagenta") if is_voting(cdata) or is_standby(cdata) else QColor("darkblue")
+            self.draw_node(cname, x, y, color, is_component=True)
 
         # 7️⃣ KAVŞAKLARI ÇİZ
         for jname in state["junctions"]:
@@ -2011,16 +3142,8 @@ class MainWindow(QMainWindow):
                 x, y = state["node_positions"][jname]
                 self.draw_node(jname, x, y, QColor("darkgrey"), is_component=False)
 
-        # 8️⃣ BAĞLANTILARI KUR
-        for n1, n2 in data.get("connections", []):
-            self.add_connection_logic(n1, n2)
-
-        # 9️⃣ SOL PANEL + STATE SENKRON
-        self.on_tab_changed(self.tab_widget.currentIndex())
-
-        # 10️⃣ UI DURUM
-        self.result_label.setText("Sistem Güvenirliği: - (Model yüklendi)")
-        print("[MODEL] Yüklendi:", filename)
+        # 8️⃣ BAĞLANTILARI KUR (toplu: graf tek geçişte, liste tek çağrıda)
+        self._add_connections_bulk(data.get("connections", []))
 
     def save_model_dialog(self):
         # Kaydetme penceresi aç
@@ -2044,6 +3167,54 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Kaydetme Hatası", f"Model kaydedilemedi:\n{e}")
 
+    def import_graph_dialog(self):
+        """
+        Kenar listesi CSV / GraphML -> model JSON (graph_import). Büyük
+        modeller önce diske yazılır; sekmede açmak isteğe bağlıdır.
+        """
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Kenar Listesi / GraphML Seç", "",
+            "Graf Dosyaları (*.csv *.graphml *.xml);;Tüm Dosyalar (*)"
+        )
+        if not path:
+            return
+
+        components_csv = None
+        if path.lower().endswith(".csv"):
+            components_csv, _ = QFileDialog.getOpenFileName(
+                self, "Bileşen Tablosu (name, dist, parametreler) — isteğe bağlı", os.path.dirname(path),
+                "CSV (*.csv)"
+            )
+
+        try:
+            data = import_graph(path, components_csv or None)
+        except (OSError, ValueError, ET.ParseError) as e:
+            QMessageBox.warning(self, "İçe Aktarma Hatası", str(e))
+            return
+
+        out, _ = QFileDialog.getSaveFileName(
+            self, "Modeli Kaydet", os.path.splitext(path)[0] + ".json", "JSON Files (*.json)"
+        )
+        if not out:
+            return
+        if not out.lower().endswith(".json"):
+            out += ".json"
+        save_imported_model(data, out)
+
+        n_nodes = len(data["components"]) + len(data["junctions"])
+        if n_nodes > LARGE_MODEL_NODES:
+            reply = QMessageBox.question(
+                self, "Büyük Model",
+                f"Model {n_nodes} düğüm, {len(data['connections'])} bağlantı içeriyor ve kaydedildi:\n{out}\n\n"
+                "Sekmede açılsın mı? (Açmadan batch_cli / sweep ile analiz edilebilir.)",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                return
+
+        self.create_empty_model_tab(os.path.basename(out))
+        self.load_model(out)
+
     def load_model_dialog(self):
         
         filenames, _ = QFileDialog.getOpenFileNames(
@@ -2070,9 +3241,7 @@ class MainWindow(QMainWindow):
             scene = QGraphicsScene()
             scene.setBackgroundBrush(QBrush(QColor(230, 230, 230)))
 
-            view = QGraphicsView(scene)
-            view.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
-            view.setRenderHint(QPainter.RenderHint.Antialiasing)
+            view = GraphView(scene)
 
             tab_layout.addWidget(view)
             tab.setLayout(tab_layout)
@@ -2085,7 +3254,10 @@ class MainWindow(QMainWindow):
     "graph": {},
     "node_positions": {},
     "node_items": {},
-    "edge_items": {}
+    "edge_items": {},
+    "node_edges": {},
+    "ccf_groups": [],
+    "repair_groups": []
 }
             self.tab_widget.setCurrentWidget(tab)
             self.on_tab_changed(self.tab_widget.currentIndex())
@@ -2129,32 +3301,72 @@ class MainWindow(QMainWindow):
         if not self.ccf_checkbox.isChecked():
             return None
 
+        model = self._engine_model()
+        return model.ccf_config() if model is not None else None
+
+    def _get_truncation_config(self):
+        """
+        Kesik inclusion-exclusion ayarlarını (tol, max_terms) döndürür.
+        Aktif değilse (None, None) -> tam açılım.
+        """
+        if not self.ie_truncate_cb.isChecked():
+            return None, None
+
         try:
-            beta = float(self.ccf_beta_input.text())
-            if not (0.0 <= beta <= 1.0):
+            tol = float(self.ie_tol_input.text())
+            if tol <= 0:
                 raise ValueError
+        except Exception:
+            QMessageBox.warning(
+                self,
+                "Tolerans Hatası",
+                "Bonferroni toleransı pozitif bir sayı olmalı. Tam açılım kullanılacak."
+            )
+            return None, None
 
-            # Sadece Exponential bileşenlerden lambda al
-            lambdas = [
-                d["params"]["lambda"]
-                for d in self.components.values()
-                if d["dist"] == "Exponential" and "lambda" in d["params"]
-            ]
-
-            if not lambdas:
-                return None
+        max_terms = self.ie_budget_spinbox.value() or None
+        return tol, max_terms
 
-            return (beta, lambdas)
+    def _get_adaptive_grid_tol(self):
+        """
+        Adaptif zaman gridi toleransını döndürür.
+        Aktif değilse None -> sabit 400 noktalı lineer grid.
+        """
+        if not self.adaptive_grid_cb.isChecked():
+            return None
 
+        try:
+            tol = float(self.grid_tol_input.text())
+            if tol <= 0:
+                raise ValueError
+            return tol
         except Exception:
             QMessageBox.warning(
                 self,
-                "CCF Hatası",
-                "CCF β değeri 0–1 arasında olmalı ve en az bir Exponential bileşen olmalı."
+                "Grid Toleransı Hatası",
+                "Grid toleransı pozitif bir sayı olmalı. Sabit grid kullanılacak."
             )
             return None
 
-    def run_monte_carlo_gui(self):
+    @staticmethod
+    def _mc_time_grid(analytic, t_max, adaptive=True):
+        """
+        Monte Carlo R(t) için zaman gridi: analitik sonuç aynı t_max ile
+        (adaptif gridde) hesaplanmışsa aynı noktalar kullanılır, böylece
+        validation interpolasyonsuz yapılır. Aksi halde None (100 nokta).
+        """
+        if analytic is None or not adaptive:
+            return None
+
+        t_analytic = np.asarray(analytic["t"], dtype=float)
+        if t_analytic.size == 0 or not np.isclose(t_analytic[-1], t_max):
+            return None
+
+        return np.concatenate([[0.0], t_analytic])
+
+    def run_monte_carlo_gui(self, background=False):
+        if self._markov_only_warning():
+            return
         if not self.components or not self.graph:
             QMessageBox.warning(
                 self,
@@ -2173,6 +3385,7 @@ class MainWindow(QMainWindow):
             return
 
         analytic = tab.model_state.get("analytic_results", None)
+        pre_analysis = None
 
         if analytic is None:
             reply = QMessageBox.question(
@@ -2185,41 +3398,103 @@ class MainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.StandardButton.Yes:
-                old_mode = self.analysis_mode
-                try:
-                    self.analysis_mode = "dynamic"
-                    self.run_analysis(show_plot=False, show_sensitivity=False)
-                finally:
-                    self.analysis_mode = old_mode
-                analytic = tab.model_state.get("analytic_results", None)
+                # Analitik ön koşu MC ile aynı işte çalışır (arka planda da)
+                pre_analysis = self._analysis_job(show_plot=False, show_sensitivity=False)
+                if pre_analysis is None:
+                    return
             else:
                 print("[INFO] User skipped automatic analytical run before Monte Carlo.")
 
-        component_paths = self._get_component_paths()
+        model = self._engine_model()
+        if model is None:
+            return
 
-        if not component_paths:
-            QMessageBox.warning(
-                self,
-                "Monte Carlo Uyarısı",
-                "Start ile End arasında geçerli bir bileşen yolu bulunamadı."
+        N = self.mc_spinbox.value()
+        t_max = self.t_max_input.value()
+        adaptive = self.adaptive_grid_cb.isChecked()
+
+        archive = None
+        if self.mc_archive_cb.isChecked():
+            archive, _ = QFileDialog.getSaveFileName(
+                self, "MC Örnek Arşivi", "mc_samples.npy", "NumPy Arşivi (*.npy)"
+            )
+            if not archive:
+                return
+
+        # Arşiv istendiğinde örnekler diske yazılmalı: önbellek atlanır
+        cache = None if archive else self._cache()
+
+        def compute(progress):
+            analytic_result = pre_analysis[0](progress) if pre_analysis else None
+            reference = analytic_result if pre_analysis else analytic
+            t_grid = self._mc_time_grid(reference, t_max, adaptive)
+            mc = cached(
+                cache, result_key(model, "montecarlo", N=N, seed=42, t_max=t_max, t_grid=t_grid),
+                lambda p: simulate(
+                    model, N=N, t_max=t_max, seed=42, t_grid=t_grid, progress=p, archive=archive
+                ),
+                progress, kind="montecarlo"
             )
+            return analytic_result, mc
+
+        def finish(outcome):
+            analytic_result, mc = outcome
+            if pre_analysis:
+                pre_analysis[1](analytic_result)
+            self._finish_monte_carlo(tab, mc, tab.model_state.get("analytic_results", None), t_max)
+
+        if not background:
+            try:
+                outcome = compute(None)
+            except ValueError as e:
+                QMessageBox.warning(self, "Monte Carlo Uyarısı", str(e))
+                return
+            except Exception as e:
+                QMessageBox.critical(self, "Monte Carlo Hatası", f"Hata: {e}")
+                print("HATA:", e)
+                return
+            finish(outcome)
+        else:
+            self._start_job("Monte Carlo", compute, finish)
+
+    def open_mc_archive(self):
+        # Arşivlenmiş MC koşusu: örnekler memmap ile, parça parça çizilir
+        path, _ = QFileDialog.getOpenFileName(self, "MC Arşivi Aç", "", "NumPy Arşivi (*.npy)")
+        if not path:
+            return
+        try:
+            T_sys, header = open_archive(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "MC Arşivi", f"Arşiv açılamadı: {e}")
             return
 
-        tab.model_state["component_paths"] = component_paths
+        print(f"[INFO] MC arşivi: {path}")
+        for key, value in header.items():
+            print(f"   {key}: {value}")
+        if len(T_sys) < 2:
+            QMessageBox.warning(self, "MC Arşivi", "Arşivde yeterli tamamlanmış örnek yok.")
+            return
 
-        mc_start = time.perf_counter()
+        self.mc_hist_window = HistogramWindow(T_sys)
+        self.mc_hist_window.setWindowTitle(f"MC Arşivi Histogramı ({os.path.basename(path)})")
+        self.mc_hist_window.show()
+        plot_survival_and_cdf(T_sys, title_prefix="MC Arşivi")
+        monte_carlo_convergence(T_sys, title=f"Monte Carlo Convergence ({os.path.basename(path)})")
 
-        T_sys, t_vals, R_mc, R_low, R_high, MTTF, CI_low, CI_high, path_contrib = run_monte_carlo(
-            components=self.components,
-            component_paths=component_paths,
-            N=self.mc_spinbox.value(),
-            t_max=self.t_max_input.value(),
-            ccf=self._get_ccf_config(),
-            seed=42
+        self.result_label.setText(
+            f"MC Arşivi: {header.get('completed', len(T_sys))}/{header.get('N', len(T_sys))} örnek, "
+            f"seed = {header.get('seed')}"
         )
 
-        mc_runtime = time.perf_counter() - mc_start
-        self.runtime_label.setText(f"Son çalışma süresi: {mc_runtime:.3f} s")
+    def _finish_monte_carlo(self, tab, mc, analytic, t_max):
+        component_paths = mc["component_paths"]
+        tab.model_state["component_paths"] = component_paths
+
+        T_sys, t_vals, R_mc, R_low, R_high = mc["T_sys"], mc["t"], mc["R"], mc["R_low"], mc["R_high"]
+        MTTF, CI_low, CI_high, path_contrib = mc["MTTF"], mc["CI_low"], mc["CI_high"], mc["path_contrib"]
+
+        mc_runtime = mc["runtime_sec"]
+        self.runtime_label.setText(self._runtime_text(mc, mc_runtime))
         
         if self.show_mc_hist_cb.isChecked():
             self.mc_hist_window = HistogramWindow(T_sys)
@@ -2265,11 +3540,15 @@ class MainWindow(QMainWindow):
             "CI_high": CI_high,
             "runtime_sec": mc_runtime,
             "validation_table": validation_df.to_dict(orient="records") if validation_df is not None else None,
-            "path_contrib": path_contrib  
+            "path_contrib": path_contrib,
+            "archive": mc.get("archive")
         }
 
+        if mc.get("archive"):
+            print(f"[INFO] MC örnekleri arşivlendi: {mc['archive']}")
+
         self.result_label.setText(
-            f"Monte Carlo: R(t={self.t_max_input.value():.0f}) = {float(R_mc[-1]):.6f}, "
+            f"Monte Carlo: R(t={t_max:.0f}) = {float(R_mc[-1]):.6f}, "
             f"MTTF ≈ {MTTF:.2f}, Runtime ≈ {mc_runtime:.3f}s"
         )
 
@@ -2290,6 +3569,73 @@ class MainWindow(QMainWindow):
             )
         if self.show_mc_conv_cb.isChecked():
             monte_carlo_convergence(T_sys, analytic_mttf=analytic_mttf)
+    def run_availability_gui(self):
+        if self._markov_only_warning():
+            return
+        tab = self.tab_widget.currentWidget()
+        if tab is None or not hasattr(tab, "model_state"):
+            QMessageBox.warning(self, "Uyarı", "Aktif model bulunamadı.")
+            return
+
+        component_paths = self._get_component_paths()
+        if not component_paths:
+            QMessageBox.warning(
+                self,
+                "Erişilebilirlik Uyarısı",
+                "Start ile End arasında geçerli bir bileşen yolu bulunamadı."
+            )
+            return
+
+        used = set().union(*component_paths)
+        no_repair = sorted(
+            c for c in used
+            if self.components[c]["dist"] != "static"
+            and not is_voting(self.components[c])
+            and not self.components[c].get("repair")
+        )
+        if no_repair:
+            print(f"[WARN] Onarım tanımı olmayan bileşenler onarılamaz kabul edildi: {', '.join(no_repair)}")
+        if self.ccf_groups or self.ccf_checkbox.isChecked():
+            print("[WARN] Onarılabilir simülasyonda CCF dikkate alınmaz.")
+
+        t_max = self.t_max_input.value()
+        crews = self.crews_spinbox.value() or None
+
+        start_time = time.perf_counter()
+        try:
+            result = simulate_availability(
+                self.components, component_paths, t_max,
+                n_reps=self.mc_spinbox.value(), crews=crews, seed=42
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Erişilebilirlik Hatası", str(e))
+            return
+        runtime_sec = time.perf_counter() - start_time
+
+        result["runtime_sec"] = runtime_sec
+        tab.model_state["availability_results"] = result
+        self.runtime_label.setText(f"Son çalışma süresi: {runtime_sec:.3f} s")
+
+        self.result_label.setText(
+            f"Erişilebilirlik: A(t={t_max:.0f}) = {float(result['A'][-1]):.6f}, "
+            f"Ā = {result['interval_availability']:.6f}, "
+            f"MTBF ≈ {result['mtbf']:.2f}, MTTR ≈ {result['mttr']:.2f}"
+        )
+
+        print("===== Onarılabilir Sistem (Ayrık Olay Simülasyonu) =====")
+        print(f"Replikasyon: {self.mc_spinbox.value()}, ekip: {crews if crews else 'sınırsız'}, "
+              f"olay: {result['events']} ({result['steps']} adım)")
+        print("Aralık erişilebilirliği:", result["interval_availability"],
+              "95% CI:", result["interval_ci"][0], "-", result["interval_ci"][1])
+        if result["steady_state"] is not None:
+            print("Kararlı durum erişilebilirliği (analitik):", result["steady_state"])
+        print("Replikasyon başına sistem arızası:", result["failures_per_rep"])
+        print("MTBF:", result["mtbf"], " MTTR:", result["mttr"],
+              f"(Kaplan–Meier, t_max'ta süren {result['censored_episodes'].size} kesinti sansürlü)")
+        print("Runtime (s):", runtime_sec)
+
+        plot_availability(result)
+
     def show_hazard_rate_current(self):
         tab = self.tab_widget.currentWidget()
 
@@ -2319,7 +3665,9 @@ class MainWindow(QMainWindow):
         )
 
 
-    def run_mc_component_importance_current(self):
+    def run_mc_component_importance_current(self, background=False):
+        if self._markov_only_warning():
+            return
         if not self.components or not self.graph:
             QMessageBox.warning(
                 self,
@@ -2346,42 +3694,208 @@ class MainWindow(QMainWindow):
             )
             return
 
+        model = self._engine_model()
+        if model is None:
+            return
+
+        tab = self.tab_widget.currentWidget()
+        N = self.mc_spinbox.value()
+        t_max = self.t_max_input.value()
+
+        cache = self._cache()
+        cache_key = result_key(model, "mc_importance", N=N, t_max=t_max, delta=0.10, seed=42)
+
+        def compute(progress):
+            return cached(
+                cache, cache_key,
+                lambda p: mc_importance(model, N=N, t_max=t_max, delta=0.10, seed=42, progress=p),
+                progress, kind="mc_importance"
+            )
+
+        def finish(result):
+            base_mttf, runtime_sec = result["base_mttf"], result["runtime_sec"]
+            plot_mc_component_importance(
+                result["scores"],
+                title=f"Monte Carlo Component Importance (Base MTTF = {base_mttf:.2f})"
+            )
+
+            if tab is not None and hasattr(tab, "model_state"):
+                tab.model_state["mc_component_importance"] = result
+
+            self.runtime_label.setText(self._runtime_text(result, runtime_sec))
+
+            QMessageBox.information(
+                self,
+                "Tamamlandı",
+                f"Monte Carlo component importance tamamlandı.\n\n"
+                f"Base MTTF: {base_mttf:.2f}\n"
+                f"Runtime: {runtime_sec:.3f} s"
+            )
+
+        self._run_job("MC Importance", compute, finish, background=background)
+
+    def run_importance_current(self, background=False):
+        """
+        Birnbaum, criticality, Fussell–Vesely, RAW, RRW:
+        tek koşullu geçişte, tüm bileşenler ve tüm zaman noktaları için.
+        """
+        if self._markov_only_warning():
+            return
+        if not self.components or not self.graph:
+            QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Önce bileşenleri ve bağlantıları tanımlamalısınız."
+            )
+            return
+
+        component_paths = self._get_component_paths()
+        if not component_paths:
+            QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Start ile End arasında geçerli bir bileşen yolu bulunamadı."
+            )
+            return
+
+        tab = self.tab_widget.currentWidget()
+        t_max = self.t_max_input.value()
+
+        # mevcut analitik grid aynı t_max için varsa onu kullan
+        analytic = tab.model_state.get("analytic_results") if tab is not None else None
+        if analytic is not None and np.isclose(analytic["t"][-1], t_max):
+            t_grid = analytic["t"]
+        else:
+            t_grid = np.linspace(1e-6, t_max, 400)
+
+        model = self._engine_model()
+        if model is None:
+            return
+
+        def finish(result):
+            runtime_sec = result["runtime_sec"]
+
+            if tab is not None and hasattr(tab, "model_state"):
+                tab.model_state["importance"] = result
+
+            self.runtime_label.setText(self._runtime_text(result, runtime_sec))
+
+            measure = self.importance_measure_combo.currentData()
+            label = IMPORTANCE_MEASURES[measure]
+
+            scores = importance_at(result, measure)
+            if not scores:
+                QMessageBox.information(
+                    self,
+                    "Bilgi",
+                    "Seçilen ölçü t_max anında tanımsız (Q_sys ≈ 0)."
+                )
+                return
+
+            plot_mc_component_importance(
+                scores,
+                title=f"{label} @ t = {t_grid[-1]:.0f}",
+                xlabel=label.split("  ")[0]
+            )
+            plot_importance_curves(
+                t_grid, result[measure], result["names"],
+                title=f"Time-Resolved {label.split('  ')[0]}",
+                ylabel=label.split("  ")[0]
+            )
+
+        cache = self._cache()
+        cache_key = result_key(model, "importance", t_grid=t_grid)
+
+        def compute(progress):
+            return cached(
+                cache, cache_key, lambda p: importance(model, t_grid, progress=p),
+                progress, kind="importance"
+            )
+
+        self._run_job("Importance", compute, finish, background=background)
+
+    def run_cut_sets_current(self, top_n=10):
+        """
+        Minimal kesim kümeleri (yol kümelerinin dualı) + Esary–Proschan
+        R(t) aralığı. Tam analiz gerektirmez: büyük modellerde anlık sınır.
+        """
+        if self._markov_only_warning():
+            return
+        if not self.components or not self.graph:
+            QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Önce bileşenleri ve bağlantıları tanımlamalısınız."
+            )
+            return
+
+        component_paths = self._get_component_paths()
+        if not component_paths:
+            QMessageBox.warning(
+                self,
+                "Uyarı",
+                "Start ile End arasında geçerli bir bileşen yolu bulunamadı."
+            )
+            return
+
+        tab = self.tab_widget.currentWidget()
+        t_max = self.t_max_input.value()
+
+        analytic = tab.model_state.get("analytic_results") if tab is not None else None
+        if analytic is not None and np.isclose(analytic["t"][-1], t_max):
+            t_grid = analytic["t"]
+            R_exact = analytic["R"]
+        else:
+            t_grid = np.linspace(1e-6, t_max, 400)
+            R_exact = None
+
+        ccf = self._get_ccf_config()
+        ccf_pair = None
+        if ccf:
+            ccf_pair = (ccf[0], np.exp(-float(np.mean(ccf[1])) * t_grid))
+
         start_time = time.perf_counter()
 
-        base_mttf, importance = monte_carlo_component_importance(
-            components=self.components,
-            component_paths=component_paths,
-            N=self.mc_spinbox.value(),
-            t_max=self.t_max_input.value(),
-            ccf=self._get_ccf_config(),
-            delta=0.10,
-            seed=42
-        )
+        cuts = minimal_cut_sets(component_paths)
+        comp_curves = component_rt_curves(self.components, t_grid, ccf=ccf_pair)
+        curves = np.vstack([comp_curves[c] for c in cuts["names"]])
+        bounds = esary_proschan_bounds(cuts["path_masks"], cuts["cut_masks"], curves)
 
         runtime_sec = time.perf_counter() - start_time
 
-        plot_mc_component_importance(
-            importance,
-            title=f"Monte Carlo Component Importance (Base MTTF = {base_mttf:.2f})"
-        )
+        by_order = top_cut_sets(cuts["cut_masks"], cuts["names"], bounds["cut_prob"], n=top_n, by="order")
+        by_prob = top_cut_sets(cuts["cut_masks"], cuts["names"], bounds["cut_prob"], n=top_n, by="probability")
 
-        tab = self.tab_widget.currentWidget()
         if tab is not None and hasattr(tab, "model_state"):
-            tab.model_state["mc_component_importance"] = {
-                "base_mttf": base_mttf,
-                "scores": importance,
+            tab.model_state["cut_sets"] = {
+                "t": t_grid,
+                "cut_sets": cuts["cut_sets"],
+                "R_lower": bounds["R_lower"],
+                "R_upper": bounds["R_upper"],
+                "top_by_order": by_order,
+                "top_by_probability": by_prob,
                 "runtime_sec": runtime_sec
             }
 
         self.runtime_label.setText(f"Son çalışma süresi: {runtime_sec:.3f} s")
 
+        plot_reliability_bounds(
+            t_grid, bounds["R_lower"], bounds["R_upper"], R=R_exact,
+            title=f"Esary–Proschan Bounds ({len(cuts['path_masks'])} paths, {len(cuts['cut_masks'])} cuts)"
+        )
+
+        lines = [
+            f"{', '.join(row['components'])}   (mertebe {row['order']}, Q = {row['Q']:.3e})"
+            for row in by_prob
+        ]
         QMessageBox.information(
             self,
-            "Tamamlandı",
-            f"Monte Carlo component importance tamamlandı.\n\n"
-            f"Base MTTF: {base_mttf:.2f}\n"
-            f"Runtime: {runtime_sec:.3f} s"
+            "Minimal Cut Sets",
+            f"Toplam minimal kesim: {len(cuts['cut_masks'])}\n"
+            f"R(t_max) ∈ [{bounds['R_lower'][-1]:.6f}, {bounds['R_upper'][-1]:.6f}]\n\n"
+            f"En olası {len(lines)} kesim (t = {t_grid[-1]:.0f}):\n" + "\n".join(lines)
         )
+
     def resizeEvent(self, event):
         super().resizeEvent(event)
 
@@ -2415,7 +3929,7 @@ class MainWindow(QMainWindow):
             self.comp_name_input.setText(comp_name)
 
             data = self.components.get(comp_name)
-            if not data:
+            if not data or is_voting(data) or is_standby(data):
                 return
 
             if data["dist"] == "static":
@@ -2427,6 +3941,12 @@ class MainWindow(QMainWindow):
                     self.param_inputs, data["params"].items()
                 ):
                     edit.setText(str(val))
+
+                if data.get("repair"):
+                    self.repair_dist_selector.setCurrentText(data["repair"]["dist"])
+                    self.on_repair_dist_changed()
+                    for (_, edit), val in zip(self.repair_param_inputs, data["repair"]["params"].values()):
+                        edit.setText(str(val))
         else:
             self.update_comp_button.setEnabled(False)
     def update_selected_component(self):
@@ -2437,6 +3957,13 @@ class MainWindow(QMainWindow):
         item = self.comp_list_widget.item(row)
         comp_name = item.text().split()[0]
 
+        if is_voting(self.components.get(comp_name, {})) or is_standby(self.components.get(comp_name, {})):
+            QMessageBox.warning(
+                self, "Uyarı",
+                "Kapılar doğrudan güncellenemez; kapıyı silip yeniden oluşturun."
+            )
+            return
+
         try:
             if self.analysis_mode == "static":
                 R = float(self.comp_reli_input.text())
@@ -2457,120 +3984,29 @@ class MainWindow(QMainWindow):
                 for (prm, (_, edit)) in zip(config["params"], self.param_inputs):
                     params[prm["key"]] = float(edit.text())
 
+                # onarım tanımı yalnız onarılabilir modda değişir
+                repair = self.components.get(comp_name, {}).get("repair")
+                if self.analysis_mode == "repairable":
+                    repair = self._read_repair()
+
                 self.components[comp_name] = {
                     "dist": dist,
                     "params": params
                 }
 
                 param_str = ", ".join(f"{k}={v}" for k, v in params.items())
-                item.setText(f"{comp_name} ({dist}: {param_str})")
+                text = f"{comp_name} ({dist}: {param_str})"
+                if repair is not None:
+                    self.components[comp_name]["repair"] = repair
+                    text += f" [onarım: {repair['dist']}]"
+                item.setText(text)
 
             QMessageBox.information(self, "Başarılı", f"{comp_name} güncellendi.")
 
         except Exception:
             QMessageBox.warning(self, "Hata", "Parametreleri doğru giriniz.")
-    def _compute_mttf_for_components(self, components_backup):
-        """
-        Verilen bileşen konfigürasyonu için
-        sadece MTTF hesaplar (grafik çizmez).
-        """
-
-        component_paths = self._get_component_paths()
-        if not component_paths:
-            return 0.0
-
-        t_max = self.t_max_input.value()
-        t_safe = np.linspace(1e-6, t_max, 400)
-
-        t = sympy.symbols("t", positive=True)
-        modules = ["numpy", {"exp": np.exp, "log": np.log, "sqrt": np.sqrt, "erfc": scipy_erfc}]
-
-        path_rts = []
 
-        for pset in component_paths:
-            rt_path = np.ones_like(t_safe, dtype=float)
 
-            for cname in pset:
-                data = components_backup[cname]
-
-                if data["dist"] == "static":
-                    rt_c = np.ones_like(t_safe, dtype=float) * data["R"]
-
-                else:
-                    conf = DISTRIBUTIONS[data["dist"]]
-
-                    if conf.get("R_sym") is not None:
-                        f = sympy.lambdify(t, conf["R_sym"](t, data["params"]), modules)
-                        rt_c = f(t_safe)
-                    else:
-                        rt_c = conf["R_num"](t_safe, data["params"])
-
-                    rt_c = np.asarray(rt_c, dtype=float)
-                    rt_c = np.nan_to_num(rt_c, nan=0.0, posinf=0.0, neginf=0.0)
-
-                rt_path *= rt_c
-
-            path_rts.append(rt_path)
-
-        system_r = np.zeros_like(t_safe, dtype=float)
-
-        for k in range(1, len(path_rts) + 1):
-            for comb in combinations(range(len(path_rts)), k):
-                prod = np.ones_like(t_safe, dtype=float)
-                for i in comb:
-                    prod *= path_rts[i]
-                system_r += ((-1) ** (k + 1)) * prod
-
-        system_r = np.clip(system_r, 0.0, 1.0)
-
-        mttf = np.trapz(system_r, t_safe)
-        return float(mttf)
-
-    def run_sensitivity_analysis(self):
-        """
-        Her bileşenin parametresini %±10 değiştirir,
-        MTTF farkını hesaplar (ΔMTTF)
-        """
-        base_components = copy.deepcopy(self.components)
-        mttf_base = self._compute_mttf_for_components(base_components)
-
-        sensitivity_results = {}
-
-        for cname, cdata in base_components.items():
-            if cdata["dist"] == "static":
-                continue  # statik için anlamlı değil
-
-            params = cdata["params"]
-
-            # sadece ilk parametreyi oynatıyoruz (literatürde yaygın)
-            key = list(params.keys())[0]
-            original = params[key]
-
-            if original <= 0:
-                continue
-
-            # +10%
-            params[key] = original * 1.10
-            mttf_plus = self._compute_mttf_for_components(base_components)
-
-            # -10%
-            params[key] = original * 0.90
-            mttf_minus = self._compute_mttf_for_components(base_components)
-
-            # geri al
-            params[key] = original
-
-            # en büyük etkiyi al
-            delta = max(
-                abs(mttf_plus - mttf_base),
-                abs(mttf_minus - mttf_base)
-            )
-
-            sensitivity_results[cname] = delta
-
-        return mttf_base, sensitivity_results
-
-    
 if __name__ == '__main__':
     app = QApplication(sys.argv)
     window = MainWindow()
@@ -0,0 +1,441 @@
+import numpy as np
+from scipy import sparse
+from scipy.sparse.linalg import expm_multiply, splu
+from scipy.stats import binom, poisson
+
+from voting import is_voting
+from symmetry import interchangeable_groups
+
+
+STANDBY_DIST = "standby"
+STANDBY_MODES = {"cold": "Soğuk", "warm": "Ilık", "hot": "Sıcak"}
+
+MARKOV_MAX_STATES = 200_000           # Π(m_c + 1) durum sınırı
+UNIFORMIZATION_MAX_STEPS = 50_000     # aşılırsa expm_multiply ile adım adım
+
+
+# =========================================================
+# 1) Yedekli (standby) kapı
+#    components[name] = {
+#        "dist": "standby", "k": 1, "mode": "cold" | "warm" | "hot",
+#        "dormancy": α,      # bekleyen üyenin arıza hızı α·λ (soğuk 0, sıcak 1)
+#        "crews": None,      # kapı içi onarım ekibi (None = sınırsız)
+#        "members": {"p1": {...}, ...}   # sıra = devreye girme önceliği
+#    }
+#    Kapı çalışıyor <=> en az k üye çalışıyor; aktif üyeler öncelik
+#    sırasındaki ilk k çalışan üyedir. Yalnız Markov çözücüsünde.
+# =========================================================
+def is_standby(data):
+    return data.get("dist") == STANDBY_DIST
+
+
+def make_standby_gate(k, members, mode="cold", dormancy=None, crews=None):
+    members = dict(members)
+    n = len(members)
+
+    if n == 0:
+        raise ValueError("Yedekli kapı için en az bir üye gerekli.")
+    if not (1 <= int(k) <= n):
+        raise ValueError(f"k değeri 1 ile {n} arasında olmalı, {k} verildi.")
+    if mode not in STANDBY_MODES:
+        raise ValueError(f"Bilinmeyen yedeklilik tipi: {mode}")
+
+    if mode == "cold":
+        dormancy = 0.0
+    elif mode == "hot":
+        dormancy = 1.0
+    elif dormancy is None or not (0.0 < float(dormancy) < 1.0):
+        raise ValueError("Ilık yedek için 0 ile 1 arasında bir bekleme katsayısı (α) gerekli.")
+
+    if crews is not None and int(crews) < 1:
+        raise ValueError("Onarım ekibi sayısı en az 1 olmalı (sınırsız için boş bırakın).")
+
+    for m, data in members.items():
+        _unit_key(m, data)
+
+    return {
+        "dist": STANDBY_DIST,
+        "k": int(k),
+        "mode": mode,
+        "dormancy": float(dormancy),
+        "crews": int(crews) if crews is not None else None,
+        "members": members,
+    }
+
+
+# =========================================================
+# 2) Ortak onarım grupları (modelle birlikte kaydedilir)
+#    {"name": "R1", "members": ["a1", "a2"], "crews": 1}
+#    Gruptaki bileşenler aynı ekipleri paylaşır; ekipler öncelik
+#    sırasına göre (önleyici) atanır.
+# =========================================================
+def make_repair_group(name, members, crews):
+    members = list(dict.fromkeys(members))
+    if not name:
+        raise ValueError("Onarım grubu için bir ad gerekli.")
+    if len(members) < 2:
+        raise ValueError("Onarım grubu en az iki üye içermeli.")
+    if int(crews) < 1:
+        raise ValueError("Onarım ekibi sayısı en az 1 olmalı.")
+    return {"name": name, "members": members, "crews": int(crews)}
+
+
+def validate_repair_groups(groups, components):
+    seen = {}
+    for g in groups:
+        for m in g["members"]:
+            if m not in components:
+                raise ValueError(f"Onarım grubu '{g['name']}': bileşen bulunamadı: {m}")
+            data = components[m]
+            if is_voting(data) or is_standby(data) or data["dist"] == "static":
+                raise ValueError(f"Onarım grubu '{g['name']}': {m} statik ya da kapı olamaz.")
+            if not data.get("repair"):
+                raise ValueError(f"Onarım grubu '{g['name']}': {m} için onarım dağılımı tanımlı değil.")
+            if m in seen:
+                raise ValueError(f"{m} birden fazla onarım grubunda ({seen[m]}, {g['name']}).")
+            seen[m] = g["name"]
+
+
+# =========================================================
+# 3) Birim anahtarı: (statik R) ya da (λ, μ)
+#    CTMC yalnız üstel ömür / onarım süreleriyle kurulabilir.
+# =========================================================
+def _unit_key(name, data):
+    if data["dist"] == "static":
+        return ("static", float(data["R"]))
+
+    if data["dist"] != "Exponential":
+        raise ValueError(f"Markov çözücü yalnız Exponential ömür destekler: {name} ({data['dist']})")
+
+    repair = data.get("repair")
+    if repair and repair["dist"] != "Exponential":
+        raise ValueError(f"Markov çözücü yalnız Exponential onarım destekler: {name} ({repair['dist']})")
+
+    mu = float(repair["params"]["lambda"]) if repair else 0.0
+    return ("Exponential", float(data["params"]["lambda"]), mu)
+
+
+def _priority_runs(members, rank):
+    # Onarım grubu üyeleri grup sırasında ardışık parçalara bölünür
+    if members[0] not in rank:
+        return [members]
+    members = sorted(members, key=rank.get)
+    runs = [[members[0]]]
+    for prev, m in zip(members, members[1:]):
+        if rank[m] == rank[prev] + 1:
+            runs[-1].append(m)
+        else:
+            runs.append([m])
+    return runs
+
+
+# =========================================================
+# 4) Durum uzayı (özdeş bileşenler birleştirilmiş)
+#    Sınıf = özdeş ve yer değiştirebilir birimler; durum = sınıf
+#    başına arızalı sayısı f_c. Boyut Π(m_c + 1), 2^n yerine.
+#      - kapı dışı bileşenler: aynı (λ, μ, onarım grubu) ve yol
+#        ailesinde yer değiştirebilir (symmetry.interchangeable_groups)
+#      - kapı üyeleri: öncelik sırasında ardışık ve aynı (λ, μ)
+#      - onarım grubundakiler ayrıca grup sırasında ardışık olmalı
+#    Sınıf içinde arızalı sayısı yeterlidir: hangi üyenin arızalı
+#    olduğu sistem durumunu değiştirmez, üstel süreler hafızasız.
+#    Ardışıklık şartı devreye girme / ekip önceliğini korur (araya
+#    başka bir üye giriyorsa sayaç hangi üyenin önce geldiğini bilemez).
+# =========================================================
+def build_chain(components, component_paths, repair_groups=()):
+    component_paths = [p for p in component_paths if p]
+    if not component_paths:
+        raise ValueError("Start ile End arasında bileşen içeren yol yok.")
+
+    repair_groups = list(repair_groups)
+    validate_repair_groups(repair_groups, components)
+
+    names = sorted(set().union(*component_paths))
+    pool_of = {m: i for i, g in enumerate(repair_groups) for m in g["members"]}
+    pools = [g["crews"] for g in repair_groups]
+
+    # onarım grubunda ekip önceliği: grup üye sırası
+    rank = {m: i for g in repair_groups for i, m in enumerate(g["members"])}
+
+    labels = {}
+    for c in names:
+        data = components[c]
+        if is_voting(data) or is_standby(data):
+            labels[c] = "G:" + c
+        else:
+            labels[c] = repr((_unit_key(c, data), pool_of.get(c)))
+
+    classes = []
+    element_of = {}        # eleman -> ("plain", sınıf, sıra) | ("gate", kapı indeksi)
+    gates = []
+
+    def add_class(members, key, pool, gate=None):
+        classes.append({
+            "members": members,
+            "m": len(members),
+            "lam": key[1] if key[0] != "static" else 0.0,
+            "mu": key[2] if key[0] != "static" else 0.0,
+            "p_up": key[1] if key[0] == "static" else 1.0,
+            "pool": pool,
+            "gate": gate,
+            # ekip önceliği: kapıda sınıf sırası, onarım grubunda üye sırası
+            "rank": len(classes) if gate is not None else min(rank.get(m, 0) for m in members),
+        })
+        return len(classes) - 1
+
+    # --- kapı dışı bileşenler: yer değiştirebilir gruplar tek sınıf
+    grouped = interchangeable_groups(component_paths, labels)
+    in_group = {c for g in grouped for c in g}
+    plain = [
+        g for g in grouped
+        if not labels[g[0]].startswith("G:")
+    ] + [[c] for c in names if c not in in_group and not labels[c].startswith("G:")]
+
+    for g in [run for g in plain for run in _priority_runs(g, rank)]:
+        idx = add_class(g, _unit_key(g[0], components[g[0]]), pool_of.get(g[0]))
+        for r, c in enumerate(g):
+            element_of[c] = ("plain", idx, r)
+
+    # --- kapılar (k-out-of-n = sıcak yedek, ekip sınırsız)
+    for c in names:
+        data = components[c]
+        if not (is_voting(data) or is_standby(data)):
+            continue
+
+        pools.append(data.get("crews"))
+        pool = len(pools) - 1
+        gate = {
+            "name": c,
+            "k": int(data["k"]),
+            "dormancy": float(data.get("dormancy", 1.0)),
+            "classes": [],
+        }
+
+        # yalnız öncelik sırasında yan yana duran özdeş üyeler birleşir
+        runs = []
+        for m, mdata in data["members"].items():
+            if is_voting(mdata) or is_standby(mdata):
+                raise ValueError(f"{c}: iç içe kapılar Markov çözücüde desteklenmiyor.")
+            key = _unit_key(m, mdata)
+            if runs and runs[-1][0] == key:
+                runs[-1][1].append(m)
+            else:
+                runs.append((key, [m]))
+
+        for key, members in runs:
+            gate["classes"].append(add_class(members, key, pool, gate=len(gates)))
+
+        element_of[c] = ("gate", len(gates))
+        gates.append(gate)
+
+    shape = tuple(cl["m"] + 1 for cl in classes)
+    n_states = int(np.prod(shape))
+    if n_states > MARKOV_MAX_STATES:
+        raise ValueError(f"Markov durum uzayı çok büyük: {n_states} (> {MARKOV_MAX_STATES}).")
+
+    failed = np.indices(shape).reshape(len(classes), -1).T          # (S, C)
+    strides = np.array([int(np.prod(shape[c + 1:])) for c in range(len(classes))])
+
+    # --- eleman ve sistem durumu (sıra r'deki üye, f > r ise arızalı)
+    def element_up(c):
+        kind = element_of[c]
+        if kind[0] == "plain":
+            return failed[:, kind[1]] <= kind[2]
+        gate = gates[kind[1]]
+        working = sum(classes[i]["m"] - failed[:, i] for i in gate["classes"])
+        return working >= gate["k"]
+
+    up = {c: element_up(c) for c in names}
+    sys_up = np.zeros(n_states, dtype=bool)
+    for p in component_paths:
+        sys_up |= np.logical_and.reduce([up[c] for c in p])
+
+    # --- arıza hızları (kapıda ilk k çalışan aktif, diğerleri α·λ)
+    fail_rate = np.zeros((n_states, len(classes)))
+    for i, cl in enumerate(classes):
+        if cl["gate"] is None:
+            fail_rate[:, i] = cl["lam"] * (cl["m"] - failed[:, i])
+
+    for gate in gates:
+        remaining = np.full(n_states, gate["k"])
+        for i in gate["classes"]:
+            working = classes[i]["m"] - failed[:, i]
+            active = np.minimum(working, remaining)
+            remaining = remaining - active
+            fail_rate[:, i] = classes[i]["lam"] * (active + gate["dormancy"] * (working - active))
+
+    # --- onarım hızları (havuz: sınırsız ya da öncelik sırasında ekip)
+    repair_rate = np.zeros((n_states, len(classes)))
+    crews_left = {p: np.full(n_states, pools[p]) for p in range(len(pools)) if pools[p] is not None}
+    for i in sorted(range(len(classes)), key=lambda i: classes[i]["rank"]):
+        cl = classes[i]
+        if cl["mu"] <= 0:
+            continue
+        busy = failed[:, i]
+        if cl["pool"] is not None and cl["pool"] in crews_left:
+            busy = np.minimum(busy, crews_left[cl["pool"]])
+            crews_left[cl["pool"]] = crews_left[cl["pool"]] - busy
+        repair_rate[:, i] = cl["mu"] * busy
+
+    # --- geçişler: yalnız sistem çalışır durumlar (geçici), arızalı durumlar yutucu
+    transient = np.flatnonzero(sys_up)
+    local = np.full(n_states, -1)
+    local[transient] = np.arange(transient.size)
+
+    rows, cols, vals = [], [], []
+    outflow = np.zeros(transient.size)
+    for i, cl in enumerate(classes):
+        for rate, step, ok in (
+            (fail_rate[:, i], strides[i], failed[:, i] < cl["m"]),
+            (repair_rate[:, i], -strides[i], failed[:, i] > 0),
+        ):
+            src = transient[ok[transient] & (rate[transient] > 0)]
+            if not src.size:
+                continue
+            r = rate[src]
+            outflow[local[src]] += r
+            dst = local[src + step]
+            keep = dst >= 0
+            rows.append(local[src[keep]])
+            cols.append(dst[keep])
+            vals.append(r[keep])
+
+    n_t = transient.size
+    rows = np.concatenate(rows + [np.arange(n_t)])
+    cols = np.concatenate(cols + [np.arange(n_t)])
+    vals = np.concatenate(vals + [-outflow])
+    Q = sparse.csr_matrix((vals, (rows, cols)), shape=(n_t, n_t))
+
+    # --- başlangıç: dinamik birimler yeni, statik sınıfta arızalı sayısı Binom(m, 1 − R)
+    p0 = np.ones(n_states)
+    for i, cl in enumerate(classes):
+        p0 *= binom.pmf(failed[:, i], cl["m"], 1.0 - cl["p_up"])
+
+    # satır toplamı = −(yutucu kümeye çıkış hızı)
+    exit_rate = -np.asarray(Q.sum(axis=1)).ravel()
+
+    return {
+        "Q": Q,
+        "p0": p0[transient],
+        "exit": np.clip(exit_rate, 0.0, None),
+        "n_states": n_states,
+        "n_transient": n_t,
+        "n_units": int(sum(cl["m"] for cl in classes)),
+        "classes": classes,
+    }
+
+
+# =========================================================
+# 5) R(t) = P(t anında henüz yutulmadı) tüm grid üzerinde
+#    Tekdüzleştirme: q = max çıkış hızı, P = I + Q/q,
+#      R(t) = Σ_n Poisson(n; q t) · ‖p0 Pⁿ‖₁
+#    ‖p0 Pⁿ‖₁ dizisi bir kez hesaplanır, tüm t'ler için yalnız ağırlık
+#    değişir (seyrek matris-vektör çarpımı). q·t_max çok büyükse
+#    (sert zincir) expm_multiply ile grid noktaları arasında adım adım.
+# =========================================================
+def chain_reliability(chain, t_grid, method="auto"):
+    t_grid = np.asarray(t_grid, dtype=float)
+    Q, p0 = chain["Q"], chain["p0"]
+    if Q.shape[0] == 0:
+        return np.zeros_like(t_grid), "empty"
+
+    q = float(np.max(-Q.diagonal()))
+    if q <= 0:
+        return np.full_like(t_grid, p0.sum()), "constant"
+
+    qt_max = q * float(np.max(t_grid))
+    n_max = int(np.ceil(qt_max + 8.0 * np.sqrt(qt_max) + 20))
+
+    if method == "uniformization" or (method == "auto" and n_max <= UNIFORMIZATION_MAX_STEPS):
+        PT = (sparse.identity(Q.shape[0], format="csr") + Q / q).T.tocsr()
+        v = p0.copy()
+        sums = []
+        for _ in range(n_max + 1):
+            sums.append(v.sum())
+            if sums[-1] <= 1e-18:
+                break
+            v = PT @ v
+
+        sums = np.array(sums)
+        R = np.zeros(t_grid.size)
+        qt = q * t_grid
+        for start in range(0, sums.size, 2048):
+            n = np.arange(start, min(start + 2048, sums.size))
+            R += poisson.pmf(n[None, :], qt[:, None]) @ sums[n]
+        return np.clip(R, 0.0, 1.0), "uniformization"
+
+    order = np.argsort(t_grid)
+    AT = Q.T.tocsr()
+    v = p0.copy()
+    t_prev = 0.0
+    R = np.zeros(t_grid.size)
+    for j in order:
+        dt = t_grid[j] - t_prev
+        if dt > 0:
+            v = expm_multiply(AT * dt, v)
+        R[j] = v.sum()
+        t_prev = t_grid[j]
+    return np.clip(R, 0.0, 1.0), "expm_multiply"
+
+
+# =========================================================
+# 6) MTTF = p0 · (−Q_TT)⁻¹ · 1   (tek seyrek doğrusal çözüm)
+#    Başlangıçtan erişilen bir durumdan yutucu kümeye ulaşılamıyorsa
+#    (ör. statik bileşenlerle hep çalışan alt sistem) MTTF = ∞.
+# =========================================================
+def _reachable(adj, seeds):
+    reach = seeds.copy()
+    frontier = seeds.copy()
+    while frontier.any():
+        nxt = (adj @ frontier.astype(float)) > 0
+        frontier = nxt & ~reach
+        reach |= frontier
+    return reach
+
+
+def chain_mttf(chain):
+    Q, p0 = chain["Q"], chain["p0"]
+    if Q.shape[0] == 0 or p0.sum() <= 0:
+        return {"mttf": 0.0, "error": 0.0, "converged": True}
+
+    off = Q - sparse.diags(Q.diagonal())
+    adj = (off != 0).astype(float)
+
+    forward = _reachable(adj.T.tocsr(), p0 > 0)
+    absorbing = _reachable(adj.tocsr(), chain["exit"] > 0)
+    if np.any(forward & ~absorbing):
+        return {"mttf": np.inf, "error": 0.0, "converged": True}
+
+    # −Q_TT satırca köşegen baskın (M-matris): devriği sütunca baskın,
+    # pivotsuz LU kararlı -> minimum derece sıralaması korunur (az dolgu)
+    idx = np.flatnonzero(forward)
+    A = (-Q[idx][:, idx]).tocsr()
+    lu = splu(
+        A.T.tocsc(), permc_spec="MMD_AT_PLUS_A",
+        diag_pivot_thresh=0.0, options=dict(SymmetricMode=True)
+    )
+    tau = lu.solve(np.ones(idx.size), trans="T")
+    residual = float(np.max(np.abs(A @ tau - 1.0)))
+    return {"mttf": float(p0[idx] @ tau), "error": residual, "converged": True}
+
+
+# =========================================================
+# 7) Tek çağrı: analytic_results ile aynı anahtarlar
+# =========================================================
+def markov_analysis(components, component_paths, t_grid, repair_groups=(), method="auto"):
+    chain = build_chain(components, component_paths, repair_groups)
+    R, used = chain_reliability(chain, t_grid, method=method)
+    mttf = chain_mttf(chain)
+
+    return {
+        "t": np.asarray(t_grid, dtype=float),
+        "R": R,
+        "MTTF": mttf["mttf"],
+        "MTTF_error": mttf["error"],
+        "method": used,
+        "states": chain["n_states"],
+        "transient_states": chain["n_transient"],
+        "units": chain["n_units"],
+        "classes": len(chain["classes"]),
+        "chain": chain,
+    }
@@ -0,0 +1,167 @@
+import json
+import os
+import time
+
+import numpy as np
+
+
+# =========================================================
+# Monte Carlo örnek arşivi
+#   <ad>.npy      : float64 sistem ömürleri (standart .npy, memmap ile
+#                   simülasyon sırasında doğrudan yazılır)
+#   <ad>.npy.json : küçük başlık (model özeti, seed, N, tamamlanan örnek)
+# Başlık her kontrol noktasında atomik yenilenir: yarıda kalan koşuda
+# yalnız "completed" kadar örnek geçerlidir.
+# =========================================================
+ARCHIVE_VERSION = 1
+
+# Akış (streaming) hesaplarında parça boyu: 4M örnek ≈ 32 MB
+STREAM_CHUNK = 1 << 22
+
+
+def header_path(path):
+    return path + ".json"
+
+
+def archive_path(path):
+    # Uzantısız verilen yollar .npy ile tamamlanır
+    return path if path.endswith(".npy") else path + ".npy"
+
+
+def write_header(path, header):
+    tmp = header_path(path) + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(header, f, indent=2, default=str)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, header_path(path))
+
+
+def create_archive(path, N, model_hash=None, seed=None, **meta):
+    """
+    N örneklik boş arşiv açar; (yazılabilir memmap, başlık) döner.
+    meta: başlığa eklenecek ek alanlar (t_max, prune, ...).
+    """
+    path = archive_path(path)
+    samples = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(int(N),))
+    header = {
+        "version": ARCHIVE_VERSION,
+        "path": os.path.basename(path),
+        "N": int(N),
+        "completed": 0,
+        "model_hash": model_hash,
+        "seed": seed,
+        "dtype": "float64",
+        "created": time.time(),
+    }
+    header.update(meta)
+    write_header(path, header)
+    return samples, header
+
+
+def checkpoint(samples, path, header, completed):
+    # Önce veri diske, sonra başlık: başlık hiçbir zaman veriden önde olmaz
+    samples.flush()
+    header["completed"] = int(completed)
+    header["updated"] = time.time()
+    write_header(archive_path(path), header)
+
+
+def open_archive(path, complete_only=True):
+    """
+    Arşivi salt okunur memmap olarak açar; (örnekler, başlık) döner.
+    complete_only: yalnız tamamlanmış (kontrol noktasına yazılmış) örnekler.
+    """
+    path = archive_path(path)
+    samples = np.load(path, mmap_mode="r")
+    try:
+        with open(header_path(path), "r", encoding="utf-8") as f:
+            header = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        print(f"[WARN] {header_path(path)} okunamadı; tüm örnekler geçerli sayıldı.")
+        header = {"N": int(samples.size), "completed": int(samples.size)}
+
+    if complete_only and header.get("completed", samples.size) < samples.size:
+        print(f"[WARN] Arşiv yarım: {header['completed']}/{samples.size} örnek tamamlanmış.")
+        samples = samples[:header["completed"]]
+    return samples, header
+
+
+# =========================================================
+# Akış hesapları: örnekler STREAM_CHUNK'lık parçalarla okunur, bellek
+# parça boyuyla sınırlı. Tek parçaya sığan dizilerde sonuçlar tam
+# dizi üzerindeki hesapla aynıdır.
+# =========================================================
+def iter_chunks(T, chunk=STREAM_CHUNK, finite_only=False):
+    for start in range(0, len(T), chunk):
+        part = np.asarray(T[start:start + chunk], dtype=float)
+        yield part[np.isfinite(part)] if finite_only else part
+
+
+def count_finite(T):
+    return sum(int(np.count_nonzero(np.isfinite(part))) for part in iter_chunks(T))
+
+
+def stream_extent(T):
+    # Sonlu örneklerin (min, max); sonlu örnek yoksa (nan, nan)
+    lo, hi = np.inf, -np.inf
+    for part in iter_chunks(T, finite_only=True):
+        if part.size:
+            lo, hi = min(lo, part.min()), max(hi, part.max())
+    return (lo, hi) if lo <= hi else (np.nan, np.nan)
+
+
+def stream_moments(T):
+    # (n, ortalama, M2) — parça istatistikleri Chan formülüyle birleştirilir
+    n, mean, m2 = 0, 0.0, 0.0
+    for part in iter_chunks(T):
+        k = part.size
+        if k == 0:
+            continue
+        part_mean = float(np.mean(part))
+        part_m2 = float(np.sum((part - part_mean) ** 2))
+        delta = part_mean - mean
+        total = n + k
+        mean += delta * k / total
+        m2 += part_m2 + delta ** 2 * n * k / total
+        n = total
+    return n, mean, m2
+
+
+def survival_counts(T, t_vals):
+    # #T ≤ t her t için (parça sıralanır + searchsorted); (sayılar, n)
+    t_vals = np.asarray(t_vals, dtype=float)
+    n_le = np.zeros(t_vals.shape, dtype=np.int64)
+    n = 0
+    for part in iter_chunks(T):
+        n_le += np.searchsorted(np.sort(part), t_vals, side="right")
+        n += part.size
+    return n_le, n
+
+
+def stream_histogram(T, bin_edges, scale=1.0):
+    counts = np.zeros(len(bin_edges) - 1, dtype=np.int64)
+    for part in iter_chunks(T, finite_only=True):
+        counts += np.histogram(part / scale, bins=bin_edges)[0]
+    return counts
+
+
+def running_sums(T, checkpoints):
+    """
+    Sonlu örnekler sırasıyla: her kontrol noktası n için ilk n örneğin
+    toplamı ve kareler toplamı (kümülatif MTTF yakınsaması için).
+    """
+    checkpoints = np.asarray(checkpoints, dtype=np.int64)
+    sums = np.zeros(checkpoints.size)
+    sums_sq = np.zeros(checkpoints.size)
+    seen, total, total_sq = 0, 0.0, 0.0
+    for part in iter_chunks(T, finite_only=True):
+        inside = (checkpoints > seen) & (checkpoints <= seen + part.size)
+        if inside.any():
+            local = checkpoints[inside] - seen - 1
+            sums[inside] = total + np.cumsum(part)[local]
+            sums_sq[inside] = total_sq + np.cumsum(part ** 2)[local]
+        total += float(np.sum(part))
+        total_sq += float(np.sum(part ** 2))
+        seen += part.size
+    return sums, sums_sq
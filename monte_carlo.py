@@ -1,107 +1,116 @@
-import numpy as np
-import matplotlib.pyplot as plt
 import copy
 import numpy as np
-import matplotlib.pyplot as plt
+
+from voting import is_voting, kth_largest
+from ccf import sample_ccf_lifetimes
+from mc_archive import STREAM_CHUNK, count_finite, stream_moments, survival_counts, running_sums
 
 # =========================================================
 # 1) Tek bileşen için lifetime örnekleme
 #    Burada local rng kullanıyoruz -> seed gerçekten çalışsın
+#    size verilirse aynı dağılımdan vektörel örnek (size,) döner
 # =========================================================
-def sample_one_lifetime(dist_name, params, rng):
+def sample_one_lifetime(dist_name, params, rng, size=None):
     if dist_name == "static":
-        return 1e20
+        return 1e20 if size is None else np.full(size, 1e20)
 
     if dist_name == "Exponential":
         lam = float(params["lambda"])
-        return rng.exponential(1.0 / lam)
+        return rng.exponential(1.0 / lam, size=size)
 
     if dist_name == "Weibull":
         beta = float(params["beta"])
         eta = float(params["eta"])
-        return rng.weibull(beta) * eta
+        return rng.weibull(beta, size=size) * eta
 
     if dist_name == "Log-Normal":
         mu = float(params["mu"])
         sigma = float(params["sigma"])
-        return rng.lognormal(mean=mu, sigma=sigma)
+        return rng.lognormal(mean=mu, sigma=sigma, size=size)
 
     if dist_name == "Gamma":
         alpha = float(params["alpha"])
         theta = float(params["theta"])
-        return rng.gamma(shape=alpha, scale=theta)
+        return rng.gamma(shape=alpha, scale=theta, size=size)
 
     if dist_name == "Log-Logistic":
         alpha = float(params["alpha"])
         beta = float(params["beta"])
-        u = np.clip(rng.random(), 1e-12, 1 - 1e-12)
+        u = np.clip(rng.random(size), 1e-12, 1 - 1e-12)
         return alpha * (u / (1.0 - u)) ** (1.0 / beta)
 
     if dist_name == "Rayleigh":
         sigma = float(params["sigma"])
-        return rng.rayleigh(scale=sigma)
+        return rng.rayleigh(scale=sigma, size=size)
 
     if dist_name == "Gompertz":
         b = float(params["b"])
         eta = float(params["eta"])
-        u = np.clip(rng.random(), 1e-12, 1 - 1e-12)
+        u = np.clip(rng.random(size), 1e-12, 1 - 1e-12)
         return eta * np.log(1.0 - np.log(1.0 - u) / b)
 
     raise ValueError(f"Bilinmeyen dağılım tipi: {dist_name}")
 
 
 # =========================================================
-# 2) Tüm bileşenler için lifetime üret
+# 1b) k-out-of-n kapısı: üye ömürleri (size, n) tek seferde çekilir,
+#     kapı ömrü = k'ıncı en büyük ömür (np.partition, vektörel)
 # =========================================================
-def sample_component_lifetimes(components, rng, ccf=None):
-    lifetimes = {}
-    T_ccf = None
+def sample_voting_lifetime(data, rng, size=None):
+    draws = [
+        sample_voting_lifetime(m, rng, size) if is_voting(m)
+        else sample_one_lifetime(m["dist"], m.get("params", {}), rng, size)
+        for m in data["members"].values()
+    ]
+    return kth_largest(np.stack(draws, axis=-1), data["k"])
+
+
+# =========================================================
+# 2) Tüm bileşenler için lifetime üret: n örnek tek seferde
+#    (n,) ömür dizileri; bileşen sırası components ile aynı.
+#    ccf_groups üyeleri sample_ccf_lifetimes'tan, global β-faktör
+#    şoku (ccf) tüm bileşen ömürlerini kırpar.
+# =========================================================
+def sample_component_lifetimes(components, rng, n, ccf=None, ccf_groups=None):
+    presampled = sample_ccf_lifetimes(ccf_groups, components, rng, n) if ccf_groups else {}
 
+    T_ccf = None
     if ccf:
         beta, lambdas = ccf
         if beta > 0 and lambdas:
-            lambda_avg = np.mean(lambdas)
-            T_ccf = rng.exponential(1.0 / (beta * lambda_avg))
+            T_ccf = rng.exponential(1.0 / (beta * np.mean(lambdas)), size=n)
 
+    lifetimes = {}
     for cname, d in components.items():
-        lt_ind = sample_one_lifetime(d["dist"], d.get("params", {}), rng)
-
-        if T_ccf is not None:
-            lifetimes[cname] = min(lt_ind, T_ccf)
+        if cname in presampled:
+            lt = presampled[cname]
+        elif is_voting(d):
+            lt = sample_voting_lifetime(d, rng, size=n)
         else:
-            lifetimes[cname] = lt_ind
-
+            lt = sample_one_lifetime(d["dist"], d.get("params", {}), rng, size=n)
+        lifetimes[cname] = lt if T_ccf is None else np.minimum(lt, T_ccf)
     return lifetimes
 
 
 # =========================================================
-# 3) Path fail times
-# =========================================================
-def compute_path_fail_times(lifetimes, component_paths):
-    return [
-        min(lifetimes[c] for c in path)
-        for path in component_paths if path
-    ]
-
-
-# =========================================================
-# 4) System failure time
+# 3) R(t) eğrisi
 # =========================================================
-def compute_system_failure_time(path_fail_times):
-    return max(path_fail_times) if path_fail_times else 1e20
-
-
-# =========================================================
-# 5) R(t) eğrisi
-# =========================================================
-def estimate_reliability_curve(T_sys, t_max, n_t):
-    t_vals = np.linspace(0, t_max, n_t)
-    R_mc = np.array([np.mean(T_sys > t) for t in t_vals], dtype=float)
+def estimate_reliability_curve(T_sys, t_max, n_t, t_grid=None):
+    # t_grid verilirse (ör. analitik adaptif grid) aynı noktalar kullanılır
+    if t_grid is not None:
+        t_vals = np.asarray(t_grid, dtype=float)
+    else:
+        t_vals = np.linspace(0, t_max, n_t)
+
+    # P(T > t) = 1 - (#T ≤ t)/N, sıralı örnek üzerinde searchsorted
+    # (parça parça: memmap arşivler belleğe alınmaz)
+    n_le, n = survival_counts(T_sys, t_vals)
+    R_mc = 1.0 - n_le / max(n, 1)
     return t_vals, R_mc
 
 
 # =========================================================
-# 6) Güven aralığı
+# 4) Güven aralığı
 # =========================================================
 def compute_reliability_ci(R_mc, N):
     se = np.sqrt(np.maximum(R_mc * (1.0 - R_mc), 0.0) / N)
@@ -111,21 +120,26 @@ def compute_reliability_ci(R_mc, N):
 
 
 # =========================================================
-# 7) MTTF + CI
+# 5) MTTF + CI
 # =========================================================
 def compute_mttf_stats(T_sys):
-    T_sys = np.asarray(T_sys, dtype=float)
     n = len(T_sys)
 
     if n == 0:
         return np.nan, np.nan, np.nan
 
-    mttf = np.mean(T_sys)
+    if n > STREAM_CHUNK:
+        # büyük / memmap örnek: parça momentleri
+        _, mttf, m2 = stream_moments(T_sys)
+        std = np.sqrt(m2 / (n - 1))
+    else:
+        T_sys = np.asarray(T_sys, dtype=float)
+        mttf = np.mean(T_sys)
 
-    if n == 1:
-        return float(mttf), float(mttf), float(mttf)
+        if n == 1:
+            return float(mttf), float(mttf), float(mttf)
 
-    std = np.std(T_sys, ddof=1)
+        std = np.std(T_sys, ddof=1)
     half_width = 1.96 * std / np.sqrt(n)
 
     ci_low = mttf - half_width
@@ -134,34 +148,54 @@ def compute_mttf_stats(T_sys):
 
 
 # =========================================================
-# 8) Ana Monte Carlo
+# 6) Ana Monte Carlo (blok blok, vektörel)
+#    Her blokta tüm bileşen ömürleri (n, C) matrisine çekilir;
+#    yol arıza zamanı = satırda yol sütunlarının minimumu, sistem =
+#    yolların maksimumu. Blok boyu bellek sınırından (MC_BLOCK_ELEMS
+#    eleman) ve ~%1 ilerleme adımından küçük olanı; N ne olursa olsun
+#    bellekte yalnız bir blok tutulur, örnekler out'a (memmap) yazılır.
 # =========================================================
-def run_monte_carlo(components, component_paths, N, t_max, ccf=None, n_t=100, seed=None):
+MC_BLOCK_ELEMS = 1 << 22
+
+
+def run_monte_carlo(components, component_paths, N, t_max, ccf=None, n_t=100, seed=None, t_grid=None,
+                    ccf_groups=None, progress=None, out=None):
+    # progress(i, N): blok başında çekilen örnek sayısı (iptal için istisna fırlatabilir)
+    # out: (N,) yazılabilir dizi (ör. mc_archive memmap'i); örnekler doğrudan oraya
     rng = np.random.default_rng(seed)
-    T_sys = np.zeros(N, dtype=float)
+    T_sys = np.zeros(N, dtype=float) if out is None else out
+
+    paths = [sorted(p) for p in component_paths if p]
+    names = sorted({c for p in paths for c in p})
+    col = {c: i for i, c in enumerate(names)}
+    path_cols = [np.array([col[c] for c in p]) for p in paths]
 
     # her path'in sisteme katkı sayacı
     path_contrib_counts = np.zeros(len(component_paths), dtype=float)
 
-    for i in range(N):
-        lifetimes = sample_component_lifetimes(components, rng, ccf=ccf)
-        path_fail_times = compute_path_fail_times(lifetimes, component_paths)
-        T_sys[i] = compute_system_failure_time(path_fail_times)
-
-        # sistemi belirleyen yol(lar): en geç fail olan path
-        if path_fail_times:
-            max_ft = max(path_fail_times)
-            winners = [
-                j for j, ft in enumerate(path_fail_times)
-                if np.isclose(ft, max_ft, rtol=1e-9, atol=1e-12)
-            ]
-
-            if winners:
-                share = 1.0 / len(winners)
-                for j in winners:
-                    path_contrib_counts[j] += share
-
-    t_vals, R_mc = estimate_reliability_curve(T_sys, t_max, n_t)
+    width = max(len(names), len(paths), 1)
+    block = max(1, min(STREAM_CHUNK, MC_BLOCK_ELEMS // width, max(N // 100, 1024)))
+
+    for start in range(0, N, block):
+        n = min(block, N - start)
+        if progress is not None:
+            progress(start, N)
+
+        lifetimes = sample_component_lifetimes(components, rng, n, ccf=ccf, ccf_groups=ccf_groups)
+        if not paths:
+            T_sys[start:start + n] = 1e20
+            continue
+
+        L = np.column_stack([lifetimes[c] for c in names])
+        path_ft = np.column_stack([L[:, cols].min(axis=1) for cols in path_cols])
+        max_ft = path_ft.max(axis=1)
+        T_sys[start:start + n] = max_ft
+
+        # sistemi belirleyen yol(lar): en geç fail olan path (eşitlikte pay bölünür)
+        winners = np.abs(path_ft - max_ft[:, None]) <= 1e-12 + 1e-9 * np.abs(max_ft)[:, None]
+        path_contrib_counts[:len(paths)] += (winners / winners.sum(axis=1, keepdims=True)).sum(axis=0)
+
+    t_vals, R_mc = estimate_reliability_curve(T_sys, t_max, n_t, t_grid=t_grid)
     R_low, R_high = compute_reliability_ci(R_mc, N)
     MTTF, CI_low, CI_high = compute_mttf_stats(T_sys)
 
@@ -175,7 +209,7 @@ def run_monte_carlo(components, component_paths, N, t_max, ccf=None, n_t=100, se
 
 
 # =========================================================
-# 9) Convergence analizi için checkpoint seç
+# 7) Convergence analizi için checkpoint seç
 # =========================================================
 def build_convergence_checkpoints(N, min_points=10, max_points=25):
     if N <= 1:
@@ -194,33 +228,33 @@ def build_convergence_checkpoints(N, min_points=10, max_points=25):
 
 
 # =========================================================
-# 10) Cumulative MTTF convergence
+# 8) Cumulative MTTF convergence
 # =========================================================
 def monte_carlo_convergence(T_sys, analytic_mttf=None, title="Monte Carlo Convergence (MTTF)"):
-    T_sys = np.asarray(T_sys, dtype=float)
-    T_sys = T_sys[np.isfinite(T_sys)]
+    # matplotlib yalnız çizimde: modül arayüzsüz (headless) içe aktarılabilir
+    import matplotlib.pyplot as plt
 
-    if T_sys.size < 2:
+    # sonlu örnekler üzerinde, parça parça (memmap arşivler için)
+    n_total = count_finite(T_sys)
+
+    if n_total < 2:
         print("[WARN] monte_carlo_convergence: yeterli sample yok.")
         return None
 
-    n_total = len(T_sys)
     checkpoints = build_convergence_checkpoints(n_total)
-
-    csum = np.cumsum(T_sys)
-    csum_sq = np.cumsum(T_sys ** 2)
+    sums, sums_sq = running_sums(T_sys, checkpoints)
 
     means = []
     ci_lows = []
     ci_highs = []
 
-    for n in checkpoints:
-        mean_n = csum[n - 1] / n
+    for n, csum_n, csum_sq_n in zip(checkpoints, sums, sums_sq):
+        mean_n = csum_n / n
 
         if n == 1:
             var_n = 0.0
         else:
-            ex2 = csum_sq[n - 1] / n
+            ex2 = csum_sq_n / n
             var_n = max(ex2 - mean_n ** 2, 0.0) * n / max(n - 1, 1)
 
         std_n = np.sqrt(var_n)
@@ -278,6 +312,13 @@ def monte_carlo_convergence(T_sys, analytic_mttf=None, title="Monte Carlo Conver
 def _improve_component_for_importance(comp_data, delta=0.10):
     d = copy.deepcopy(comp_data)
 
+    if is_voting(d):
+        d["members"] = {
+            m: _improve_component_for_importance(md, delta=delta)
+            for m, md in d["members"].items()
+        }
+        return d
+
     if d["dist"] == "static":
         if "R" in d:
             d["R"] = min(0.999999, d["R"] + (1.0 - d["R"]) * delta)
@@ -320,20 +361,26 @@ def monte_carlo_component_importance(
     t_max,
     ccf=None,
     delta=0.10,
-    seed=42
+    seed=42,
+    ccf_groups=None,
+    progress=None
 ):
+    # progress(k, n): tamamlanan MC koşusu (taban + bileşen başına bir)
     _, _, _, _, _, base_mttf, _, _, _ = run_monte_carlo(
         components=components,
         component_paths=component_paths,
         N=N,
         t_max=t_max,
         ccf=ccf,
-        seed=seed
+        seed=seed,
+        ccf_groups=ccf_groups
     )
 
     importance = {}
+    if progress is not None:
+        progress(1, len(components) + 1)
 
-    for cname in components:
+    for i, cname in enumerate(components, 2):
         modified = copy.deepcopy(components)
         modified[cname] = _improve_component_for_importance(modified[cname], delta=delta)
 
@@ -343,9 +390,12 @@ def monte_carlo_component_importance(
             N=N,
             t_max=t_max,
             ccf=ccf,
-            seed=seed
+            seed=seed,
+            ccf_groups=ccf_groups
         )
 
         importance[cname] = float(new_mttf - base_mttf)
+        if progress is not None:
+            progress(i, len(components) + 1)
 
     return float(base_mttf), importance
\ No newline at end of file
@@ -0,0 +1,202 @@
+import numpy as np
+
+from analytic import component_rt
+
+
+# =========================================================
+# 1) Sınıflandırma: her zaman çalışan / her zaman arızalı
+#    statik: R == 1 / R == 0 (tam)
+#    dinamik: R(t_min) ≤ tol -> arızalı (R azalan, t ≥ t_min için tam)
+#             R(t)  ≥ 1 − tol tüm [t_min, t_max] boyunca -> pencere içi
+#             mükemmel ("window"): R(t) için geçerli, t_max ötesi
+#             (MTTF, Monte Carlo ömürleri) için değil.
+# =========================================================
+def classify_components(components, t_max, tol=1e-9, t_min=1e-6, n_points=64, window=True):
+    t_grid = np.linspace(t_min, t_max, n_points)
+    perfect, failed, window_only = [], [], []
+
+    for cname, data in components.items():
+        if data["dist"] == "static":
+            if float(data["R"]) == 1.0:
+                perfect.append(cname)
+            elif float(data["R"]) == 0.0:
+                failed.append(cname)
+            continue
+
+        rt = component_rt(data, t_grid)
+        if rt[0] <= tol:
+            failed.append(cname)
+        elif window and np.min(rt) >= 1.0 - tol:
+            perfect.append(cname)
+            window_only.append(cname)
+
+    return {"perfect": perfect, "failed": failed, "window_only": window_only}
+
+
+# =========================================================
+# 2) Start–End arasındaki basit yollarda bulunan düğümler
+#    Sanal (Start, End) kenarı eklenir; bir düğüm basit bir s–t
+#    yolundadır <=> bu kenarla aynı iki-bağlantılı blokta (Tarjan,
+#    kenar yığını, özyinelemesiz). Blok yoksa s ile t bağlantısız.
+# =========================================================
+def _st_block(adj, s, t):
+    adj = {u: set(vs) for u, vs in adj.items()}
+    adj.setdefault(s, set()).add(t)
+    adj.setdefault(t, set()).add(s)
+
+    disc = {s: 0}
+    low = {s: 0}
+    edges = []
+    stack = [(s, None, iter(adj[s]))]
+
+    while stack:
+        u, parent, it = stack[-1]
+        advanced = False
+        for v in it:
+            if v not in disc:
+                disc[v] = low[v] = len(disc)
+                edges.append((u, v))
+                stack.append((v, u, iter(adj[v])))
+                advanced = True
+                break
+            if v != parent and disc[v] < disc[u]:
+                edges.append((u, v))
+                low[u] = min(low[u], disc[v])
+        if advanced:
+            continue
+
+        stack.pop()
+        if not stack:
+            break
+        p = stack[-1][0]
+        low[p] = min(low[p], low[u])
+        if low[u] >= disc[p]:
+            block = set()
+            while True:
+                e = edges.pop()
+                block.update(e)
+                if e == (p, u):
+                    break
+            if s in block and t in block:
+                return block
+
+    return set()
+
+
+# =========================================================
+# 3) Sadeleştirme geçişi (grafik üzerinde, motorlardan önce)
+#    - arızalı bileşenler: düğüm + kenarları silinir
+#    - mükemmel bileşenler: tel (kavşak) olur; komşu tel düğümleri
+#      ve Start / End ile birleştirilir (union-find)
+#    - çıkmaz alt grafikler: hiçbir basit Start–End yolunda olmayan
+#      düğümler atılır
+#    Dönüş: sade grafik, kalan bileşenler ve durum:
+#      "ok" | "always_up" (Start = End teli) | "always_down" (yol yok)
+# =========================================================
+def prune_graph(graph, components, perfect=(), failed=(), start="Start", end="End"):
+    perfect, failed = set(perfect), set(failed)
+    nodes = set(graph) | {v for vs in graph.values() for v in vs} | {start, end}
+    wires = (nodes - set(components) - {start, end}) | perfect
+
+    parent = {n: n for n in nodes}
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(a, b):
+        ra, rb = find(a), find(b)
+        if ra == rb:
+            return
+        # Start / End temsilci olarak kalır
+        if rb in (start, end):
+            ra, rb = rb, ra
+        parent[rb] = ra
+
+    for u, vs in graph.items():
+        for v in vs:
+            if u in failed or v in failed:
+                continue
+            if (u in wires or u in (start, end)) and (v in wires or v in (start, end)):
+                union(u, v)
+
+    if find(start) == find(end):
+        return {"status": "always_up", "graph": {}, "components": {}}
+
+    adj = {}
+    for u, vs in graph.items():
+        if u in failed:
+            continue
+        for v in vs:
+            if v in failed:
+                continue
+            a, b = find(u), find(v)
+            if a != b:
+                adj.setdefault(a, set()).add(b)
+                adj.setdefault(b, set()).add(a)
+
+    keep = _st_block(adj, start, end) if start in adj and end in adj else set()
+    if not keep:
+        return {"status": "always_down", "graph": {}, "components": {}}
+
+    pruned = {
+        u: sorted(v for v in vs if v in keep)
+        for u, vs in adj.items() if u in keep
+    }
+    return {
+        "status": "ok",
+        "graph": pruned,
+        "components": {c: components[c] for c in keep if c in components and c not in perfect},
+    }
+
+
+def component_paths_of(graph, components, start="Start", end="End"):
+    # Basit Start–End yolları (DFS, özyinelemesiz) -> bileşen kümeleri
+    paths = {}
+    stack = [(start, [start])]
+    while stack:
+        node, path = stack.pop()
+        if node == end:
+            paths.setdefault(frozenset(n for n in path if n in components), None)
+            continue
+        for nxt in graph.get(node, []):
+            if nxt not in path:
+                stack.append((nxt, path + [nxt]))
+    return list(paths)
+
+
+# =========================================================
+# 4) Tek çağrı + rapor (düğüm, yol, IE terimi kazancı)
+# =========================================================
+def prune_model(components, graph, t_max, component_paths=None, tol=1e-9, window=True):
+    cls = classify_components(components, t_max, tol=tol, window=window)
+    result = prune_graph(graph, components, cls["perfect"], cls["failed"])
+
+    nodes_before = len(set(graph) | {v for vs in graph.values() for v in vs})
+    if component_paths is None:
+        component_paths = [p for p in component_paths_of(graph, components) if p]
+
+    paths = []
+    if result["status"] == "ok":
+        # teller birleştiği için bileşensiz bir yol kalmaz
+        paths = component_paths_of(result["graph"], result["components"])
+
+    nodes_after = len(result["graph"])
+    return {
+        "status": result["status"],
+        "graph": result["graph"],
+        "components": result["components"],
+        "component_paths": paths,
+        "perfect": cls["perfect"],
+        "failed": cls["failed"],
+        "window_only": [c for c in cls["window_only"] if c in cls["perfect"]],
+        "report": {
+            "nodes_removed": nodes_before - nodes_after if result["status"] == "ok" else nodes_before,
+            "paths_before": len(component_paths),
+            "paths_after": len(paths),
+            "terms_before": 2 ** len(component_paths) - 1,
+            "terms_after": 2 ** len(paths) - 1,
+        },
+    }
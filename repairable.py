@@ -0,0 +1,356 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from distributions import DISTRIBUTIONS
+from analytic import component_mean, inclusion_exclusion
+from monte_carlo import sample_one_lifetime
+from voting import is_voting, at_least_k_survival
+
+
+# =========================================================
+# 1) Onarım süresi tanımı (bileşen verisinde "repair" anahtarı)
+#    components[name]["repair"] = {"dist": "Log-Normal", "params": {...}}
+#    Dağılımlar ömürlerle aynı DISTRIBUTIONS kaydından; "repair"
+#    olmayan dinamik bileşen onarılamaz (arızalanınca kapalı kalır).
+# =========================================================
+def make_repair(dist, params):
+    if dist not in DISTRIBUTIONS:
+        raise ValueError(f"Bilinmeyen onarım dağılımı: {dist}")
+
+    keys = [p["key"] for p in DISTRIBUTIONS[dist]["params"]]
+    missing = [k for k in keys if k not in params]
+    if missing:
+        raise ValueError(f"Onarım dağılımı için eksik parametre: {', '.join(missing)}")
+
+    params = {k: float(params[k]) for k in keys}
+    if any(v <= 0 for v in params.values()) and dist != "Log-Normal":
+        raise ValueError("Onarım dağılımı parametreleri pozitif olmalı.")
+    return {"dist": dist, "params": params}
+
+
+def repair_mean(repair):
+    if repair is None:
+        return None
+    mean_fn = DISTRIBUTIONS[repair["dist"]].get("mean")
+    return float(mean_fn(repair["params"])) if mean_fn is not None else None
+
+
+# =========================================================
+# 2) Simülasyon birimleri
+#    Eleman = yollarda geçen üst düzey bileşen; birim = arızalanıp
+#    onarılan en küçük parça (normal bileşen ya da kapı üyesi).
+#    Eleman çalışıyor <=> çalışan birim sayısı ≥ k  (normal: k = 1)
+# =========================================================
+def _units(components, names):
+    units = []
+    k = []
+    for e, c in enumerate(names):
+        data = components[c]
+        if is_voting(data):
+            for m, mdata in data["members"].items():
+                if is_voting(mdata):
+                    raise ValueError(f"{c}: iç içe kapılar onarılabilir simülasyonda desteklenmiyor.")
+                units.append((e, mdata, mdata.get("repair")))
+            k.append(int(data["k"]))
+        else:
+            units.append((e, data, data.get("repair")))
+            k.append(1)
+    return units, np.array(k)
+
+
+# =========================================================
+# 3) Kararlı durum erişilebilirliği (sınırsız ekip, analitik)
+#    Alternatif yenileme süreci: A_i = E[ömür] / (E[ömür] + E[onarım])
+#    Bileşenler bağımsız onarıldığından A_sys yapı fonksiyonunun A_i
+#    değerlerindeki değeridir (IE ile). Onarılamayan dinamik birim: 0.
+# =========================================================
+def steady_state_availability(components, component_paths):
+    names = sorted(set().union(*component_paths))
+    units, k = _units(components, names)
+
+    unit_a = []
+    for _, data, repair in units:
+        if data["dist"] == "static":
+            unit_a.append(float(data["R"]))
+            continue
+        if repair is None:
+            unit_a.append(0.0)
+            continue
+        up, down = component_mean(data), repair_mean(repair)
+        if up is None or down is None:
+            return None
+        unit_a.append(up / (up + down))
+
+    curves = {}
+    for e, c in enumerate(names):
+        members = [a for (ue, _, _), a in zip(units, unit_a) if ue == e]
+        curves[c] = np.array([at_least_k_survival(np.array(members)[:, None], k[e])[0]])
+
+    return float(inclusion_exclusion(component_paths, curves, np.zeros(1))["system_r"][0])
+
+
+# =========================================================
+# Sağdan sansürlü süreler için Kaplan–Meier ortalaması
+# (t_max'ta hâlâ açık kesintiler; en uzun gözlem sansürlüyse
+# sınırlandırılmış ortalama, yani alt sınır)
+# =========================================================
+def km_mean(durations, observed):
+    if durations.size == 0:
+        return np.nan
+    # eşit sürelerde tamamlanan olay sansürden önce
+    order = np.lexsort((~observed, durations))
+    d, obs = durations[order], observed[order]
+    at_risk = d.size - np.arange(d.size)
+    S = np.cumprod(1.0 - obs / at_risk)
+    S_before = np.concatenate(([1.0], S[:-1]))
+    return float(np.sum(S_before * np.diff(np.concatenate(([0.0], d)))))
+
+
+# =========================================================
+# 4) Ayrık olay simülasyonu (replikasyonlar üzerinde vektörel)
+#    Olay kuyruğu: replikasyon başına sonraki olay zamanları (R, birim);
+#    tüm replikasyonlar adım adım birlikte ilerler, her adımda her
+#    replikasyonun en erken olayı (argmin) işlenir.
+#    Yol durumu artımlı: yol başına arızalı eleman sayacı, yalnız
+#    değişen elemanın yolları güncellenir; sistem çalışıyor <=>
+#    sayacı 0 olan yol sayısı > 0 (tüm yollar yeniden taranmaz).
+#    crews: eşzamanlı onarım ekibi sayısı (None = sınırsız), kuyruk FIFO.
+# =========================================================
+def simulate_availability(components, component_paths, t_max, n_reps=1000, crews=None,
+                          t_grid=None, seed=None, max_steps=1_000_000):
+    rng = np.random.default_rng(seed)
+    component_paths = [p for p in component_paths if p]
+    if not component_paths:
+        raise ValueError("Start ile End arasında bileşen içeren yol yok.")
+
+    names = sorted(set().union(*component_paths))
+    units, k = _units(components, names)
+    n_units, n_paths = len(units), len(component_paths)
+    R = int(n_reps)
+
+    elem_of = np.array([u[0] for u in units])
+    paths_of = [
+        np.array([j for j, p in enumerate(component_paths) if c in p])
+        for c in names
+    ]
+    incidence = np.zeros((len(names), n_paths), dtype=int)
+    for e, cols in enumerate(paths_of):
+        incidence[e, cols] = 1
+
+    t_grid = np.linspace(0.0, t_max, 200) if t_grid is None else np.asarray(t_grid, dtype=float)
+    rows_all = np.arange(R)
+
+    # --- başlangıç: dinamik birimler yeni, statikler R olasılığıyla çalışır
+    up = np.ones((R, n_units), dtype=bool)
+    next_time = np.full((R, n_units), np.inf)
+    for u, (_, data, _) in enumerate(units):
+        if data["dist"] == "static":
+            up[:, u] = rng.random(R) < float(data["R"])
+        else:
+            next_time[:, u] = sample_one_lifetime(data["dist"], data["params"], rng, size=R)
+
+    up_count = np.zeros((R, len(names)), dtype=int)
+    for u, e in enumerate(elem_of):
+        up_count[:, e] += up[:, u]
+    elem_up = up_count >= k
+
+    down_count = (~elem_up).astype(int) @ incidence
+    up_paths = np.sum(down_count == 0, axis=1)
+    sys_up = up_paths > 0
+
+    busy = np.zeros(R, dtype=int)
+    waiting = np.full((R, n_units), np.inf)      # kuyruğa giriş zamanı
+
+    # --- kayıtlar
+    diff = np.zeros(t_grid.size + 1)             # A(t) fark dizisi
+    grid_pos = np.zeros(R, dtype=int)
+    t_prev = np.zeros(R)
+    uptime = np.zeros(R)
+    failures = np.zeros(R, dtype=int)
+    down_start = np.zeros(R)
+    episodes = []
+    n_events = 0
+    steps = 0
+
+    def start_repair(rows, u, tau):
+        repair = units[u][2]
+        next_time[rows, u] = tau + sample_one_lifetime(repair["dist"], repair["params"], rng, size=rows.size)
+
+    active = rows_all
+    while active.size:
+        nt = next_time[active]
+        u = np.argmin(nt, axis=1)
+        tau = nt[np.arange(active.size), u]
+        end = (tau >= t_max) | (steps >= max_steps)
+
+        # [t_prev, τ) aralığı eski sistem durumunda
+        s = sys_up[active].astype(float)
+        tau_c = np.minimum(tau, t_max)
+        hi = np.where(end, t_grid.size, np.searchsorted(t_grid, tau, side="left"))
+        np.add.at(diff, grid_pos[active], s)
+        np.add.at(diff, hi, -s)
+        grid_pos[active] = hi
+        uptime[active] += s * (tau_c - t_prev[active])
+        t_prev[active] = tau_c
+
+        keep = ~end
+        active, u, tau = active[keep], u[keep], tau[keep]
+        if not active.size:
+            break
+        steps += 1
+        n_events += active.size
+
+        failing = up[active, u]
+        up[active, u] = ~failing
+
+        # --- birim olayları: arıza -> onarım / kuyruk, onarım -> yeni ömür
+        for uid in np.unique(u):
+            sel = u == uid
+            data, repair = units[uid][1], units[uid][2]
+
+            f_rows = active[sel & failing]
+            f_tau = tau[sel & failing]
+            if f_rows.size:
+                if repair is None:
+                    next_time[f_rows, uid] = np.inf
+                elif crews is None:
+                    start_repair(f_rows, uid, f_tau)
+                else:
+                    free = busy[f_rows] < crews
+                    busy[f_rows[free]] += 1
+                    start_repair(f_rows[free], uid, f_tau[free])
+                    waiting[f_rows[~free], uid] = f_tau[~free]
+                    next_time[f_rows[~free], uid] = np.inf
+
+            r_rows = active[sel & ~failing]
+            if r_rows.size:
+                next_time[r_rows, uid] = tau[sel & ~failing] + sample_one_lifetime(
+                    data["dist"], data["params"], rng, size=r_rows.size
+                )
+                if crews is not None:
+                    busy[r_rows] -= 1
+
+        # --- boşalan ekip kuyruktaki en eski arızaya geçer
+        if crews is not None:
+            freed = ~failing
+            rows = active[freed]
+            if rows.size:
+                w = np.argmin(waiting[rows], axis=1)
+                has = np.isfinite(waiting[rows, w])
+                rows, w, w_tau = rows[has], w[has], tau[freed][has]
+                waiting[rows, w] = np.inf
+                busy[rows] += 1
+                for uid in np.unique(w):
+                    sel = w == uid
+                    start_repair(rows[sel], uid, w_tau[sel])
+
+        # --- eleman ve yol sayaçları (yalnız değişen elemanın yolları)
+        e = elem_of[u]
+        up_count[active, e] += np.where(failing, -1, 1)
+        new_up = up_count[active, e] >= k[e]
+        changed = new_up != elem_up[active, e]
+        elem_up[active, e] = new_up
+
+        for ee in np.unique(e[changed]):
+            sel = changed & (e == ee)
+            rows = active[sel]
+            cols = paths_of[ee]
+            block = down_count[np.ix_(rows, cols)]
+            before = np.sum(block == 0, axis=1)
+            block += np.where(new_up[sel], -1, 1)[:, None]
+            down_count[np.ix_(rows, cols)] = block
+            up_paths[rows] += np.sum(block == 0, axis=1) - before
+
+        # --- sistem geçişleri
+        new_sys = up_paths[active] > 0
+        old_sys = sys_up[active]
+        went_down = old_sys & ~new_sys
+        came_up = ~old_sys & new_sys
+        failures[active[went_down]] += 1
+        down_start[active[went_down]] = tau[went_down]
+        if np.any(came_up):
+            episodes.append(tau[came_up] - down_start[active[came_up]])
+        sys_up[active] = new_sys
+
+    if steps >= max_steps:
+        print(f"[WARN] Onarılabilir simülasyon {max_steps} adımda kesildi; sonuçlar yaklaşık.")
+
+    A = np.cumsum(diff)[:t_grid.size] / R
+    se = np.sqrt(np.maximum(A * (1.0 - A), 0.0) / R)
+
+    interval = uptime / t_max
+    interval_mean = float(np.mean(interval))
+    interval_half = 1.96 * float(np.std(interval, ddof=1)) / np.sqrt(R) if R > 1 else 0.0
+
+    episodes = np.concatenate(episodes) if episodes else np.zeros(0)
+    total_failures = int(np.sum(failures))
+
+    # t_max'ta (ya da adım sınırında) sürmekte olan kesintiler sağdan sansürlü
+    open_rows = ~sys_up
+    censored = t_prev[open_rows] - down_start[open_rows]
+    all_episodes = np.concatenate([episodes, censored])
+    observed = np.concatenate([np.ones(episodes.size, dtype=bool), np.zeros(censored.size, dtype=bool)])
+
+    return {
+        "t": t_grid,
+        "A": A,
+        "A_low": np.clip(A - 1.96 * se, 0.0, 1.0),
+        "A_high": np.clip(A + 1.96 * se, 0.0, 1.0),
+        "interval_availability": interval_mean,
+        "interval_ci": (interval_mean - interval_half, interval_mean + interval_half),
+        "availability_samples": interval,
+        "downtime": t_max - uptime,
+        "down_episodes": episodes,
+        "censored_episodes": censored,
+        "failures_per_rep": total_failures / R,
+        "mtbf": float(np.sum(uptime) / total_failures) if total_failures else np.inf,
+        "mttr": km_mean(all_episodes, observed),
+        "down_at_end": int(np.sum(open_rows)),
+        "steady_state": steady_state_availability(components, component_paths) if crews is None else None,
+        "events": n_events,
+        "steps": steps,
+    }
+
+
+# =========================================================
+# 5) Grafik: A(t) + güven bandı, kesinti süresi dağılımları
+# =========================================================
+def plot_availability(result, title="Onarılabilir Sistem – Erişilebilirlik A(t)"):
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4.5))
+
+    ax = axes[0]
+    ax.fill_between(result["t"], result["A_low"], result["A_high"], color="orange", alpha=0.5, label="95% CI")
+    ax.plot(result["t"], result["A"], color="blue", linewidth=2.2, label="A(t) (simülasyon)")
+    ax.axhline(result["interval_availability"], color="green", linestyle="--",
+               label=f"Aralık erişilebilirliği = {result['interval_availability']:.4f}")
+    if result["steady_state"] is not None:
+        ax.axhline(result["steady_state"], color="purple", linestyle=":",
+                   label=f"Kararlı durum (analitik) = {result['steady_state']:.4f}")
+    ax.set_xlabel("Zaman (t)")
+    ax.set_ylabel("A(t)")
+    ax.set_ylim(0, 1.05)
+    ax.grid(True, linestyle="--", linewidth=0.5)
+    ax.legend(fontsize=8)
+    ax.set_title(title)
+
+    ax = axes[1]
+    censored = result["censored_episodes"]
+    if result["down_episodes"].size or censored.size:
+        ax.hist(
+            [result["down_episodes"], censored], bins=40, stacked=True,
+            color=["gray", "salmon"], edgecolor="black", linewidth=0.6,
+            label=["tamamlanan", f"t_max'ta süren (sansürlü, {censored.size})"]
+        )
+        ax.legend(fontsize=8)
+    ax.set_xlabel("Kesinti süresi (olay başına)")
+    ax.set_ylabel("Frekans")
+    ax.set_title(f"Kesinti olayları (MTTR ≈ {result['mttr']:.2f}, Kaplan–Meier)")
+
+    ax = axes[2]
+    ax.hist(result["downtime"], bins=40, color="steelblue", edgecolor="black", linewidth=0.6)
+    ax.set_xlabel("Toplam kesinti süresi [0, t_max]")
+    ax.set_ylabel("Frekans")
+    ax.set_title("Replikasyon başına toplam kesinti")
+
+    plt.tight_layout()
+    plt.show()
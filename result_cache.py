@@ -0,0 +1,155 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+
+# =========================================================
+# İçerik adresli sonuç önbelleği
+#   <dizin>/index.sqlite : anahtar, tür, boyut, son erişim
+#   <dizin>/objects/ab/<anahtar>.pkl : sonuç sözlüğü (pickle)
+# Anahtar = model içerik özeti (bileşenler, parametreler, topoloji, CCF)
+# + analiz türü ve ayarları (t_max, motor seçenekleri, N, seed, ...).
+# Toplam boyut max_bytes'ı aşınca en uzun süredir okunmayanlar silinir.
+# =========================================================
+CACHE_DIR = "result_cache"
+CACHE_VERSION = 4
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_access ON entries (last_access);
+"""
+
+
+def result_key(model, kind, **settings):
+    # Diziler (ör. zaman gridi) içerikleriyle özetlenir
+    settings = {
+        k: hashlib.sha256(np.ascontiguousarray(v, dtype=float).tobytes()).hexdigest()
+        if isinstance(v, np.ndarray) else v
+        for k, v in settings.items()
+    }
+    return model.content_hash(dict(settings, kind=kind, cache_version=CACHE_VERSION))
+
+
+class ResultCache:
+    def __init__(self, path=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        self.path = path
+        self.max_bytes = int(max_bytes)
+        # Arka plan işçileri aynı bağlantıyı kilitle paylaşır
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(
+            os.path.join(path, "index.sqlite"), isolation_level=None, check_same_thread=False
+        )
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def _object_path(self, key):
+        return os.path.join(self.path, "objects", key[:2], key + ".pkl")
+
+    def get(self, key):
+        # Sonuç sözlüğü ya da None; okunamayan kayıt silinir
+        with self._lock:
+            row = self.db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            try:
+                with open(self._object_path(key), "rb") as f:
+                    value = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+                print(f"[WARN] Önbellek kaydı okunamadı, silindi ({key[:12]}): {e}")
+                self._remove(key)
+                return None
+            self.db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+        return value
+
+    def put(self, key, value, kind=None):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) > self.max_bytes // 4:
+            print(f"[INFO] Sonuç önbelleğe alınmadı: {len(data) / 2**20:.1f} MB (sınır {self.max_bytes / 2**22:.0f} MB)")
+            return False
+
+        path = self._object_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._lock:
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            now = time.time()
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries (key, kind, size, created, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, kind, len(data), now, now)
+            )
+            self._evict()
+        return True
+
+    def _remove(self, key):
+        self.db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        try:
+            os.remove(self._object_path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        # LRU: toplam boyut sınırın altına inene dek en eski erişilenler
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.db.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for (key,) in self.db.execute("SELECT key FROM entries").fetchall():
+                self._remove(key)
+
+    def stats(self):
+        with self._lock:
+            count, total = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+
+def cached(cache, key, compute, progress=None, kind=None):
+    """
+    compute(progress) -> sonuç sözlüğü; aynı anahtarlı kayıt varsa diskten.
+    Dönen sözlükte cache_hit, compute_sec (ilk hesap süresi) ve isabette
+    cache_load_sec bulunur.
+    cache None ise her zaman hesaplanır.
+    """
+    if cache is None:
+        return compute(progress)
+
+    start = time.perf_counter()
+    result = cache.get(key)
+    if result is not None:
+        result["cache_hit"] = True
+        result["cache_load_sec"] = time.perf_counter() - start
+        return result
+
+    result = compute(progress)
+    result["compute_sec"] = time.perf_counter() - start
+    try:
+        cache.put(key, result, kind=kind)
+    except (OSError, sqlite3.Error, pickle.PicklingError, TypeError) as e:
+        print(f"[WARN] Sonuç önbelleğe yazılamadı: {e}")
+    result["cache_hit"] = False
+    return result
@@ -0,0 +1,246 @@
+import json
+import os
+import sqlite3
+import time
+
+import numpy as np
+
+
+# =========================================================
+# Senaryo deposu
+#   <dizin>/index.sqlite : senaryo meta verisi + dizi konumları
+#   <dizin>/arrays.bin   : yalnız sona eklenen ham diziler (64 bayt hizalı)
+# Kayıt geçmişten bağımsız O(1): blob sona yazılır, tek satır eklenir.
+# Aynı ada yeni kayıt eskisini gizler (latest=0); alan compact() ile
+# geri kazanılır. Okuma np.memmap ile kopyasız, yalnız istenen diziler.
+# =========================================================
+SCENARIO_DIR = "scenarios"
+LEGACY_JSON = "scenarios.json"
+
+ALIGN = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    created REAL NOT NULL,
+    analysis_mode TEXT,
+    params TEXT,
+    latest INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS scenarios_name ON scenarios (name, latest);
+CREATE TABLE IF NOT EXISTS arrays (
+    scenario_id INTEGER NOT NULL REFERENCES scenarios (id),
+    key TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    dtype TEXT NOT NULL,
+    length INTEGER NOT NULL,
+    PRIMARY KEY (scenario_id, key)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def component_key(name):
+    # Bileşen R(t) dizileri "comp:<ad>" anahtarıyla saklanır
+    return f"comp:{name}"
+
+
+class ScenarioStore:
+    def __init__(self, path=SCENARIO_DIR):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.blob_path = os.path.join(path, "arrays.bin")
+        self.db = sqlite3.connect(os.path.join(path, "index.sqlite"), isolation_level=None)
+        self.db.executescript(SCHEMA)
+        if not os.path.exists(self.blob_path):
+            open(self.blob_path, "wb").close()
+
+    def close(self):
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -----------------------------------------------------
+    # Yazma
+    # -----------------------------------------------------
+    def save(self, name, arrays, params=None, analysis_mode=None):
+        """
+        arrays: {anahtar: 1-B dizi} (örn. "t", "R", "comp:a1", "T_sys").
+        Aynı adlı önceki kayıt gizlenir; yeni kaydın id'si döner.
+        """
+        if not name:
+            raise ValueError("Senaryo adı boş olamaz.")
+        arrays = {k: np.ascontiguousarray(v, dtype=float).ravel() for k, v in arrays.items()}
+
+        # Yazma kilidi (BEGIN IMMEDIATE) blob'u da korur: ofsetler çakışmaz
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            placed = []
+            with open(self.blob_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                for key, values in arrays.items():
+                    pad = -offset % ALIGN
+                    f.write(b"\0" * pad)
+                    offset += pad
+                    f.write(values.tobytes())
+                    placed.append((key, offset, values.dtype.str, values.size))
+                    offset += values.nbytes
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.db.execute("UPDATE scenarios SET latest = 0 WHERE name = ? AND latest = 1", (name,))
+            cursor = self.db.execute(
+                "INSERT INTO scenarios (name, created, analysis_mode, params) VALUES (?, ?, ?, ?)",
+                (name, time.time(), analysis_mode, json.dumps(params, default=str))
+            )
+            scenario_id = cursor.lastrowid
+            self.db.executemany(
+                "INSERT INTO arrays (scenario_id, key, offset, dtype, length) VALUES (?, ?, ?, ?, ?)",
+                [(scenario_id, *p) for p in placed]
+            )
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        return scenario_id
+
+    def delete(self, name):
+        self.db.execute("UPDATE scenarios SET latest = 0 WHERE name = ?", (name,))
+
+    # -----------------------------------------------------
+    # Okuma
+    # -----------------------------------------------------
+    def names(self):
+        rows = self.db.execute("SELECT name FROM scenarios WHERE latest = 1 ORDER BY id")
+        return [r[0] for r in rows]
+
+    def info(self, name):
+        row = self.db.execute(
+            "SELECT id, created, analysis_mode, params FROM scenarios WHERE name = ? AND latest = 1",
+            (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        keys = [r[0] for r in self.db.execute("SELECT key FROM arrays WHERE scenario_id = ?", (row[0],))]
+        return {
+            "id": row[0], "name": name, "created": row[1], "analysis_mode": row[2],
+            "params": json.loads(row[3]) if row[3] else None, "keys": keys,
+        }
+
+    def load(self, name, keys=None):
+        """
+        Senaryonun meta verisi + dizileri (salt okunur memmap, kopyasız).
+        keys verilirse yalnız o diziler; senaryo yoksa None.
+        """
+        info = self.info(name)
+        if info is None:
+            return None
+
+        query = "SELECT key, offset, dtype, length FROM arrays WHERE scenario_id = ?"
+        rows = self.db.execute(query, (info["id"],)).fetchall()
+        arrays = {}
+        for key, offset, dtype, length in rows:
+            if keys is not None and key not in keys:
+                continue
+            if length == 0:
+                arrays[key] = np.empty(0, dtype=dtype)
+            else:
+                arrays[key] = np.memmap(self.blob_path, dtype=dtype, mode="r", offset=offset, shape=(length,))
+        info["arrays"] = arrays
+        return info
+
+    def load_many(self, names, keys=None):
+        # Yalnız seçilen senaryolar, verilen sırayla (bulunmayanlar atlanır)
+        loaded = {}
+        for name in names:
+            scenario = self.load(name, keys=keys)
+            if scenario is not None:
+                loaded[name] = scenario
+        return loaded
+
+    # -----------------------------------------------------
+    # Bakım
+    # -----------------------------------------------------
+    def compact(self):
+        """
+        Gizlenmiş kayıtları siler ve blob'u yalnız güncel dizilerle
+        yeniden yazar. Geri kazanılan bayt sayısını döner.
+        """
+        self.db.execute("BEGIN IMMEDIATE")
+        try:
+            before = os.path.getsize(self.blob_path)
+            tmp_path = self.blob_path + ".tmp"
+            rows = self.db.execute(
+                "SELECT a.scenario_id, a.key, a.offset, a.dtype, a.length FROM arrays a "
+                "JOIN scenarios s ON s.id = a.scenario_id WHERE s.latest = 1 ORDER BY a.offset"
+            ).fetchall()
+
+            moved = []
+            with open(self.blob_path, "rb") as src, open(tmp_path, "wb") as dst:
+                offset = 0
+                for scenario_id, key, old, dtype, length in rows:
+                    pad = -offset % ALIGN
+                    dst.write(b"\0" * pad)
+                    offset += pad
+                    src.seek(old)
+                    nbytes = length * np.dtype(dtype).itemsize
+                    dst.write(src.read(nbytes))
+                    moved.append((offset, scenario_id, key))
+                    offset += nbytes
+                dst.flush()
+                os.fsync(dst.fileno())
+
+            self.db.execute("DELETE FROM arrays WHERE scenario_id IN (SELECT id FROM scenarios WHERE latest = 0)")
+            self.db.execute("DELETE FROM scenarios WHERE latest = 0")
+            self.db.executemany("UPDATE arrays SET offset = ? WHERE scenario_id = ? AND key = ?", moved)
+            os.replace(tmp_path, self.blob_path)
+            self.db.execute("COMMIT")
+        except BaseException:
+            self.db.execute("ROLLBACK")
+            raise
+        self.db.execute("VACUUM")
+        return before - os.path.getsize(self.blob_path)
+
+    def import_json(self, filename=LEGACY_JSON):
+        """
+        Eski scenarios.json içeriğini depoya aktarır (tek seferlik).
+        Aktarılan senaryo sayısını döner.
+        """
+        with open(filename, "r") as f:
+            data = json.load(f)
+
+        count = 0
+        for sc in data.get("scenarios", []):
+            if "system_rt" not in sc or "t_values" not in sc:
+                print(f"[WARN] Senaryo bozuk, aktarılmadı: {sc.get('name')}")
+                continue
+            arrays = {"t": sc["t_values"], "R": sc["system_rt"]}
+            arrays.update({component_key(k): v for k, v in sc.get("components_rt", {}).items()})
+            if sc.get("T_sys_samples") is not None:
+                arrays["T_sys"] = sc["T_sys_samples"]
+            self.save(sc["name"], arrays, params=sc.get("params"), analysis_mode=sc.get("analysis_mode"))
+            count += 1
+        return count
+
+
+def open_store(path=SCENARIO_DIR, legacy=LEGACY_JSON):
+    # Eski JSON dosyası varsa bir kez içe aktarılır (meta tablosunda işaretli)
+    store = ScenarioStore(path)
+    done = store.db.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone()
+    if legacy and os.path.exists(legacy) and done is None:
+        try:
+            count = store.import_json(legacy)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[WARN] {legacy} okunamadı, aktarılmadı: {e}")
+        else:
+            print(f"[INFO] {legacy} -> {path}: {count} senaryo aktarıldı.")
+        store.db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_imported', ?)", (legacy,))
+    return store
@@ -0,0 +1,218 @@
+import copy
+
+import numpy as np
+
+from distributions import DISTRIBUTIONS
+from analytic import component_rt, characteristic_time, system_mttf, survival_at_infinity, _gauss_nodes
+from batch_eval import compile_structure, conditional_system_curves, _system_from_logs
+from ccf import independent_curves, ccf_condition, ccf_conditional_curves, ccf_mttf
+from voting import is_voting, member_birnbaum
+
+
+# =========================================================
+# 1) ∂R_i/∂θ  (bileşen seviyesinde)
+#    DISTRIBUTIONS[dist]["dR"] kapalı formları kullanılır; tanımlı
+#    olmayan parametreler (ör. Gamma α) için merkezi fark.
+#    k-out-of-n kapısı: üye m'nin parametresi için
+#    ∂R_kapı/∂θ = P(diğerlerinden tam k−1'i çalışıyor) · ∂R_m/∂θ,
+#    anahtar "üye.parametre".
+# =========================================================
+def component_param_derivatives(data, t, fd_rel_step=1e-6):
+    t = np.asarray(t, dtype=float)
+
+    if data["dist"] == "static":
+        return {"R": np.ones_like(t)}
+
+    if is_voting(data):
+        members = data["members"]
+        curves = np.stack([component_rt(m, t) for m in members.values()])
+        weights = member_birnbaum(curves, data["k"])
+
+        derivs = {}
+        for w, (mname, mdata) in zip(weights, members.items()):
+            for key, d in component_param_derivatives(mdata, t, fd_rel_step).items():
+                derivs[f"{mname}.{key}"] = w * d
+        return derivs
+
+    conf = DISTRIBUTIONS[data["dist"]]
+    params = {k: float(v) for k, v in data["params"].items()}
+    closed = conf.get("dR", {})
+    derivs = {}
+
+    with np.errstate(over="ignore", under="ignore", invalid="ignore", divide="ignore"):
+        for prm in conf["params"]:
+            key = prm["key"]
+
+            if key in closed:
+                d = closed[key](t, params)
+            else:
+                h = fd_rel_step * max(abs(params[key]), 1e-12)
+                p_plus = dict(params, **{key: params[key] + h})
+                p_minus = dict(params, **{key: params[key] - h})
+                d = (conf["R_num"](t, p_plus) - conf["R_num"](t, p_minus)) / (2 * h)
+
+            derivs[key] = np.nan_to_num(np.asarray(d, dtype=float) * np.ones_like(t),
+                                        nan=0.0, posinf=0.0, neginf=0.0)
+
+    return derivs
+
+
+def parameter_values(data):
+    if data["dist"] == "static":
+        return {"R": float(data["R"])}
+    if is_voting(data):
+        return {
+            f"{mname}.{key}": value
+            for mname, mdata in data["members"].items()
+            for key, value in parameter_values(mdata).items()
+        }
+    return {k: float(v) for k, v in data["params"].items()}
+
+
+def param_label(cname, data, key):
+    if data["dist"] == "static":
+        return f"{cname} · R"
+
+    if is_voting(data):
+        mname, sub = key.split(".", 1)
+        inner = param_label(mname, data["members"][mname], sub).split(" · ", 1)[1]
+        return f"{cname} · {mname}.{inner}"
+
+    for prm in DISTRIBUTIONS[data["dist"]]["params"]:
+        if prm["key"] == key:
+            return f"{cname} · {prm['label'].split()[0]}"
+
+    return f"{cname} · {key}"
+
+
+def with_parameter(data, key, value):
+    # parameter_values anahtarıyla (kapı üyeleri "üye.parametre") tek
+    # parametresi değiştirilmiş kopya
+    data = copy.deepcopy(data)
+    if data["dist"] == "static":
+        data["R"] = value
+    elif is_voting(data):
+        mname, sub = key.split(".", 1)
+        data["members"][mname] = with_parameter(data["members"][mname], sub, value)
+    else:
+        data["params"][key] = value
+    return data
+
+
+def _grouped_system_curve(structure, components, groups, t):
+    # Adlandırılmış CCF grupları: R_sys(t) = Σ_F P(F) · R_sys(t | F)
+    names = structure["names"]
+    return ccf_condition(
+        lambda local, failed: _system_from_logs(
+            structure, np.log(np.clip(np.vstack([local[c] for c in names]), 1e-300, None))[:, None, :]
+        )[0],
+        independent_curves(components, groups, t), groups, components, t
+    )
+
+
+# =========================================================
+# 2) Tek geçişte yerel duyarlılıklar
+#    ∂R_sys/∂θ_ij (t) = B_i(t) · ∂R_i/∂θ_j (t)     (zincir kuralı)
+#    ∂MTTF/∂θ_ij      = ∫_0^∞ B_i(t) ∂R_i/∂θ_j (t) dt
+#
+#    B_i (Birnbaum) grid noktaları ve [0, ∞) kuadratür düğümleri
+#    üzerinde tek bir conditional_system_curves çağrısıyla bulunur;
+#    2C+1 ayrı analiz yerine ~1 analiz maliyeti.
+#
+#    Elastikiyet: θ/MTTF · ∂MTTF/∂θ  (boyutsuz, parametreler arası
+#    karşılaştırılabilir)
+#
+#    ccf_groups: adlandırılmış CCF gruplarında şok hızları üyelerin
+#    parametrelerine (λ̄) de bağlıdır; ∂R_sys/∂θ şok koşullu sistem
+#    eğrisinin merkezi farkıyla, B_i şok durumları üzerinden toplanır.
+# =========================================================
+def local_sensitivities(components, component_paths, t_grid,
+                        ccf_beta=None, ccf_lambda=None, ccf_groups=None, n_panels=32, fd_rel_step=1e-6,
+                        progress=None):
+    t_grid = np.asarray(t_grid, dtype=float)
+    structure = compile_structure(components, component_paths, progress=progress)
+    names = structure["names"]
+    n_t = t_grid.size
+
+    use_ccf = not ccf_groups and ccf_beta is not None and ccf_beta > 0 and ccf_lambda is not None
+    mix = (1.0 - ccf_beta) if use_ccf else 1.0
+
+    tau = characteristic_time(components, names, default=1.0 / ccf_lambda if use_ccf else 1.0)
+    t_q, w_q = _gauss_nodes(n_panels, tau)
+    t_all = np.concatenate([t_grid, t_q])
+
+    if ccf_groups:
+        independent = independent_curves(components, ccf_groups, t_all)
+        cond, _ = ccf_conditional_curves(
+            lambda local: conditional_system_curves(structure, local),
+            np.vstack([independent[c] for c in names]), names, ccf_groups, components, t_all
+        )
+        mttf = ccf_mttf(
+            lambda t_nodes: _grouped_system_curve(structure, components, ccf_groups, t_nodes), tau,
+            at_infinity=float(any(
+                all(survival_at_infinity(components[c]) > 0 for c in p) for p in component_paths
+            ))
+        )["mttf"]
+    else:
+        curves = np.vstack([component_rt(components[c], t_all) for c in names])
+        if use_ccf:
+            curves = mix * curves + ccf_beta * np.exp(-ccf_lambda * t_all)[None, :]
+
+        cond = conditional_system_curves(structure, curves)
+        mttf = system_mttf(components, component_paths, ccf_beta=ccf_beta, ccf_lambda=ccf_lambda)["mttf"]
+
+    birnbaum = cond["birnbaum"]
+    R_sys = np.clip(cond["R"][:n_t], 0.0, 1.0)
+
+    dR = {}
+    dMTTF = {}
+    elasticity_mttf = {}
+    elasticity_R = {}
+    labels = {}
+
+    for i, c in enumerate(names):
+        data = components[c]
+        base = parameter_values(data)
+
+        for key, d_comp in component_param_derivatives(data, t_all).items():
+            theta = float(base[key])
+            if ccf_groups:
+                # statik R ≤ 1: üst noktada tek yönlü fark
+                h = fd_rel_step * max(abs(theta), 1e-12)
+                lo, hi = theta - h, theta + h
+                if key == "R" or key.endswith(".R"):
+                    hi = min(hi, 1.0)
+                d_sys = (
+                    _grouped_system_curve(structure, dict(components, **{c: with_parameter(data, key, hi)}),
+                                          ccf_groups, t_all)
+                    - _grouped_system_curve(structure, dict(components, **{c: with_parameter(data, key, lo)}),
+                                            ccf_groups, t_all)
+                ) / (hi - lo)
+            else:
+                d_sys = birnbaum[i] * mix * d_comp
+
+            dR[(c, key)] = d_sys[:n_t]
+            labels[(c, key)] = param_label(c, data, key)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                elasticity_R[(c, key)] = np.where(R_sys > 1e-12, theta * d_sys[:n_t] / R_sys, 0.0)
+
+            if np.isfinite(mttf) and mttf > 0:
+                dM = float(np.sum(d_sys[n_t:] * w_q))
+                dMTTF[(c, key)] = dM
+                elasticity_mttf[(c, key)] = theta * dM / mttf
+            else:
+                dMTTF[(c, key)] = np.nan
+                elasticity_mttf[(c, key)] = np.nan
+
+    return {
+        "t": t_grid,
+        "R": R_sys,
+        "MTTF": mttf,
+        "birnbaum": {c: birnbaum[i, :n_t] for i, c in enumerate(names)},
+        "dR": dR,
+        "dMTTF": dMTTF,
+        "elasticity_R": elasticity_R,
+        "elasticity_mttf": elasticity_mttf,
+        "labels": labels,
+    }
@@ -0,0 +1,201 @@
+from math import comb
+
+import numpy as np
+
+from analytic import (
+    component_descriptor,
+    component_rt_curves,
+    survival_at_infinity,
+    path_bitmasks,
+    union_coefficients,
+    characteristic_time,
+    _gauss_nodes,
+)
+from cut_sets import eliminate_supersets
+
+
+SIGNATURE_MAX_STATES_BITS = 20     # 2^n durum sayımı için üst sınır
+SIGNATURE_MAX_SIZE = 4096          # Π(m_k + 1) tablo boyutu sınırı
+SIGNATURE_MAX_WORK = 2 ** 24       # durum sayımında 2^n · |minimal yol| sınırı
+SIGNATURE_MAX_IE_PATHS = 14        # IE ile kurulumda minimal yol sınırı (2^P birleşim)
+
+
+# =========================================================
+# 1) Bileşen tipleri: aynı dağılım + parametre -> aynı tip
+#    (yalnız yollarda geçen bileşenler; sıra ilk ada göre)
+# =========================================================
+def component_types(components, component_paths):
+    names = sorted({c for p in component_paths for c in p})
+    by_desc = {}
+    for c in names:
+        by_desc.setdefault(component_descriptor(components[c]), []).append(c)
+    return sorted(by_desc.values(), key=lambda g: g[0])
+
+
+def signature_key(component_paths, types):
+    return (frozenset(frozenset(p) for p in component_paths), tuple(tuple(g) for g in types))
+
+
+# =========================================================
+# 2) Survival signature  Φ(l_1, …, l_K)
+#    = P(sistem çalışıyor | k tipinden tam l_k bileşen çalışıyor)
+#    Yalnız topolojiye (ve tip bölüntüsüne) bağlıdır.
+#
+#    n ≤ 20: 2^n durum vektörel sayılır, φ(S) = ∃P: P ⊆ S
+#    aksi halde IE birleşim katsayılarından:
+#      Φ(l) = Σ_U c_U Π_k C(l_k, u_k) / C(m_k, u_k)
+#    (belirli u_k eleman, rastgele l_k çalışan içinde olasılığı)
+#    progress(done, total): işlenen yol (iptal için istisna fırlatabilir)
+# =========================================================
+def survival_signature(component_paths, types, progress=None):
+    names, masks = path_bitmasks(component_paths)
+    masks = eliminate_supersets(masks, progress=progress)
+    index = {c: i for i, c in enumerate(names)}
+
+    counts = [len(g) for g in types]
+    shape = tuple(m + 1 for m in counts)
+    type_of = np.zeros(len(names), dtype=int)
+    for k, g in enumerate(types):
+        type_of[[index[c] for c in g]] = k
+
+    if len(names) <= SIGNATURE_MAX_STATES_BITS:
+        states = np.arange(2 ** len(names), dtype=np.int64)
+        works = np.zeros(states.size, dtype=bool)
+        for i, m in enumerate(masks):
+            if progress is not None:
+                progress(i, len(masks))
+            works |= (states & m) == m
+
+        working = np.zeros((len(types), states.size), dtype=np.int64)
+        for i in range(len(names)):
+            working[type_of[i]] += (states >> i) & 1
+
+        flat = np.ravel_multi_index(tuple(working[:, works]), shape)
+        totals = np.bincount(flat, minlength=int(np.prod(shape))).reshape(shape)
+
+        norm = np.ones(shape)
+        for k, m in enumerate(counts):
+            c = np.array([comb(m, l) for l in range(m + 1)], dtype=float)
+            norm = norm * c.reshape([-1 if j == k else 1 for j in range(len(counts))])
+        phi = totals / norm
+        method = "states"
+    else:
+        A = np.zeros(shape)
+        for mask, coef in union_coefficients(masks, progress=progress).items():
+            u = np.zeros(len(types), dtype=int)
+            for i in range(len(names)):
+                if (mask >> i) & 1:
+                    u[type_of[i]] += 1
+            A[tuple(u)] += coef
+
+        phi = A
+        for k, m in enumerate(counts):
+            C = np.array([[comb(l, u) / comb(m, u) for u in range(m + 1)] for l in range(m + 1)])
+            phi = np.moveaxis(np.tensordot(C, phi, axes=([1], [k])), 0, k)
+        method = "ie"
+
+    return {
+        "types": [list(g) for g in types],
+        "counts": counts,
+        "phi": np.clip(phi, 0.0, 1.0),
+        "method": method,
+    }
+
+
+# =========================================================
+# 3) R_sys(t) = Σ_l Φ(l) Π_k C(m_k, l_k) R_k^{l_k} (1 − R_k)^{m_k − l_k}
+#    type_curves: (K, ...) tip başına R eğrisi. Maliyet Π(m_k+1) · T,
+#    topoloji değişmedikçe yeni dağılım / parametreler için yalnız bu.
+# =========================================================
+def signature_reliability(signature, type_curves):
+    type_curves = np.clip(np.asarray(type_curves, dtype=float), 0.0, 1.0)
+    out_shape = type_curves.shape[1:]
+    P = type_curves.reshape(len(signature["counts"]), -1)
+
+    X = None
+    for k, m in enumerate(signature["counts"]):
+        l = np.arange(m + 1)[:, None]
+        c = np.array([comb(m, j) for j in range(m + 1)], dtype=float)[:, None]
+        B = c * P[k][None, :] ** l * (1.0 - P[k][None, :]) ** (m - l)     # (m+1, T)
+
+        if X is None:
+            X = np.moveaxis(np.tensordot(signature["phi"], B, axes=([0], [0])), -1, 0)
+        else:
+            X = np.einsum("tj...,jt->t...", X, B)
+
+    return np.clip(X, 0.0, 1.0).reshape(out_shape)
+
+
+def signature_type_curves(signature, components, t_grid, ccf=None):
+    reps = {g[0]: components[g[0]] for g in signature["types"]}
+    curves = component_rt_curves(reps, t_grid, ccf=ccf)
+    return np.vstack([curves[g[0]] for g in signature["types"]])
+
+
+# =========================================================
+# 4) MTTF = ∫_0^∞ R_sys(t) dt, [0, ∞) Gauss–Legendre, panel ikiye
+#    katlanarak hata tahmini (modular_mttf ile aynı şema)
+# =========================================================
+def signature_mttf(signature, components, ccf_beta=None, ccf_lambda=None, tol=1e-8,
+                   min_panels=16, max_panels=2048):
+    use_ccf = ccf_beta is not None and ccf_beta > 0 and ccf_lambda is not None
+    reps = [g[0] for g in signature["types"]]
+
+    at_infinity = np.array([[survival_at_infinity(components[c])] for c in reps])
+    if signature_reliability(signature, at_infinity)[0] > 1e-12:
+        return {"mttf": np.inf, "error": 0.0, "converged": True}
+
+    tau = characteristic_time(components, reps, default=1.0 / ccf_lambda if use_ccf else 1.0)
+
+    prev = None
+    n_panels = min_panels
+    while n_panels <= max_panels:
+        t_nodes, w = _gauss_nodes(n_panels, tau)
+        ccf = (ccf_beta, np.exp(-ccf_lambda * t_nodes)) if use_ccf else None
+        value = float(signature_reliability(
+            signature, signature_type_curves(signature, components, t_nodes, ccf=ccf)
+        ) @ w)
+
+        if prev is not None:
+            err = abs(value - prev)
+            if err <= tol * max(abs(value), 1e-300):
+                return {"mttf": value, "error": err, "converged": True}
+
+        prev = value
+        n_panels *= 2
+
+    return {"mttf": prev, "error": err, "converged": False}
+
+
+# =========================================================
+# 5) Önbellekli erişim: anahtar (yol ailesi, tip bölüntüsü)
+#    Tablo çok büyükse (Π(m_k+1) > SIGNATURE_MAX_SIZE) ya da kurulumu
+#    pahalıysa (2^n durum × yol ya da 2^P birleşimli IE) None döner,
+#    çağıran modüler ağaca / klasik motora düşer.
+# =========================================================
+def build_affordable(component_paths):
+    # Üst küme eleme O(P²); yol sayısı (tekrarsız) üst sınır olarak yeter
+    n_comp = len({c for p in component_paths for c in p})
+    n_paths = len({frozenset(p) for p in component_paths})
+    if n_comp <= SIGNATURE_MAX_STATES_BITS:
+        return 2 ** n_comp * n_paths <= SIGNATURE_MAX_WORK
+    return n_paths <= SIGNATURE_MAX_IE_PATHS
+
+
+def signature_for(components, component_paths, cache=None, progress=None):
+    types = component_types(components, component_paths)
+    if int(np.prod([len(g) + 1 for g in types])) > SIGNATURE_MAX_SIZE:
+        return None, False
+
+    key = signature_key(component_paths, types)
+    if cache is not None and key in cache:
+        return cache[key], True
+    if not build_affordable(component_paths):
+        print("[INFO] Survival signature kurulumu pahalı; modüler / IE motoru kullanılıyor.")
+        return None, False
+
+    signature = survival_signature(component_paths, types, progress=progress)
+    if cache is not None:
+        cache.clear()
+        cache[key] = signature
+    return signature, False
@@ -0,0 +1,460 @@
+import argparse
+import contextlib
+import copy
+import io
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from distributions import DISTRIBUTIONS
+from engine import Model, Cancelled, analyze_dynamic
+
+
+SWEEP_METHODS = {
+    "grid": "Izgara (tam faktöriyel)",
+    "lhs": "Latin hypercube",
+    "random": "Rastgele",
+}
+
+# Nokta başına hesaplanan metrikler (veri kümesi sütunları)
+METRICS = ("R_t_star", "MTTF", "MTTF_error", "runtime_sec")
+
+
+# =========================================================
+# 1) Faktörler
+#    hedef: "bileşen.parametre" (örn. "a3.lambda", statik için "s1.R")
+#    ya da "t_max". Ölçek "log" ise düzeyler / örnekler log10 uzayında.
+# =========================================================
+def make_factor(target, low, high, levels=5, scale="linear"):
+    low, high = float(low), float(high)
+    if scale not in ("linear", "log"):
+        raise ValueError(f"'{target}': ölçek 'linear' ya da 'log' olmalı.")
+    if not low < high:
+        raise ValueError(f"'{target}': alt sınır üst sınırdan küçük olmalı.")
+    if scale == "log" and low <= 0:
+        raise ValueError(f"'{target}': log ölçekte sınırlar pozitif olmalı.")
+    if int(levels) < 2:
+        raise ValueError(f"'{target}': en az 2 düzey gerekir.")
+    return {"target": target, "low": low, "high": high, "levels": int(levels), "scale": scale}
+
+
+def parse_factor(spec, levels=5):
+    """
+    Komut satırı / arayüz biçimi: "a3.lambda=1e-4:1e-2[:log][:düzey]".
+    """
+    try:
+        target, rng = spec.split("=", 1)
+        parts = rng.split(":")
+        low, high = float(parts[0]), float(parts[1])
+    except (ValueError, IndexError):
+        raise ValueError(f"Faktör biçimi hatalı: '{spec}' (örn: a3.lambda=1e-4:1e-2:log)")
+
+    scale = "linear"
+    for extra in parts[2:]:
+        if extra in ("log", "linear"):
+            scale = extra
+        elif extra.isdigit():
+            levels = int(extra)
+        else:
+            raise ValueError(f"Faktör biçimi hatalı: '{spec}'")
+    return make_factor(target.strip(), low, high, levels=levels, scale=scale)
+
+
+def validate_factors(factors, components):
+    seen = set()
+    for f in factors:
+        target = f["target"]
+        if target in seen:
+            raise ValueError(f"'{target}' iki kez tanımlanmış.")
+        seen.add(target)
+        if target == "t_max":
+            if f["low"] <= 0:
+                raise ValueError("t_max pozitif olmalı.")
+            continue
+
+        comp, _, param = target.partition(".")
+        if comp not in components:
+            raise ValueError(f"'{target}': '{comp}' bileşeni modelde yok.")
+        data = components[comp]
+        if data.get("dist") == "static":
+            if param != "R":
+                raise ValueError(f"'{target}': statik bileşende yalnız 'R' taranabilir.")
+            if f["low"] < 0 or f["high"] > 1:
+                raise ValueError(f"'{target}': R 0–1 arasında olmalı.")
+            continue
+
+        conf = DISTRIBUTIONS.get(data.get("dist"))
+        keys = [p["key"] for p in conf["params"]] if conf else []
+        if param not in keys:
+            raise ValueError(
+                f"'{target}': '{data.get('dist')}' için geçerli parametreler: {', '.join(keys) or '-'}"
+            )
+
+
+def _to_scale(f, u):
+    # u ∈ [0, 1] -> faktör değeri
+    if f["scale"] == "log":
+        lo, hi = np.log10(f["low"]), np.log10(f["high"])
+        return 10.0 ** (lo + u * (hi - lo))
+    return f["low"] + u * (f["high"] - f["low"])
+
+
+# =========================================================
+# 2) Deney tasarımı: (n_nokta, n_faktör) değer matrisi
+#    grid  : her faktörde 'levels' düzey, tam faktöriyel
+#    lhs   : her faktör n eşit tabakaya bölünür, tabaka başına bir örnek
+#    random: bağımsız düzgün (log ölçekte log-düzgün)
+# =========================================================
+def design_points(factors, method="grid", n=None, seed=42):
+    if not factors:
+        raise ValueError("En az bir faktör tanımlanmalı.")
+    if method not in SWEEP_METHODS:
+        raise ValueError(f"Bilinmeyen tasarım: {method} ({', '.join(SWEEP_METHODS)})")
+
+    if method == "grid":
+        axes = [_to_scale(f, np.linspace(0.0, 1.0, f["levels"])) for f in factors]
+        mesh = np.meshgrid(*axes, indexing="ij")
+        return np.column_stack([m.ravel() for m in mesh])
+
+    if n is None or int(n) < 1:
+        raise ValueError("LHS / rastgele tasarımda nokta sayısı (n) gerekli.")
+    n = int(n)
+    rng = np.random.default_rng(seed)
+    if method == "lhs":
+        u = np.column_stack([
+            (rng.permutation(n) + rng.random(n)) / n for _ in factors
+        ])
+    else:
+        u = rng.random((n, len(factors)))
+    return np.column_stack([_to_scale(f, u[:, j]) for j, f in enumerate(factors)])
+
+
+def apply_point(components, factors, values, t_max):
+    # Nokta değerleri bileşen kopyasına yazılır; t_max faktörü ayrı döner
+    components = copy.deepcopy(components)
+    for f, value in zip(factors, values):
+        target = f["target"]
+        if target == "t_max":
+            t_max = float(value)
+            continue
+        comp, _, param = target.partition(".")
+        if components[comp].get("dist") == "static":
+            components[comp]["R"] = float(value)
+        else:
+            components[comp]["params"][param] = float(value)
+    return components, t_max
+
+
+# =========================================================
+# 3) Değerlendirme (işçi süreçler)
+#    Model ve ayarlar süreç başına bir kez yüklenir; motor önbelleği
+#    (yol kümeleri, survival signature, modül eğrileri) aynı süreçteki
+#    tüm noktalarca paylaşılır: topoloji bir kez derlenir.
+# =========================================================
+_WORKER = {}
+
+
+def _init_worker(model_data, ccf_beta, factors, settings):
+    _WORKER.clear()
+    _WORKER.update(
+        model=Model.from_dict(model_data, ccf_beta=ccf_beta),
+        factors=factors,
+        settings=settings,
+        cache={},
+    )
+
+
+def _evaluate(index, values):
+    model, settings = _WORKER["model"], _WORKER["settings"]
+    components, t_max = apply_point(model.components, _WORKER["factors"], values, settings["t_max"])
+    t_star = settings["t_star"] if settings["t_star"] is not None else t_max
+
+    point = Model(
+        components=components,
+        junctions=model.junctions,
+        connections=model.connections,
+        ccf_beta=model.ccf_beta,
+        ccf_groups=model.ccf_groups,
+        repair_groups=model.repair_groups
+    )
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = analyze_dynamic(
+                point, max(t_max, t_star), cache=_WORKER["cache"], **settings["options"]
+            )
+        row = {
+            "R_t_star": float(np.interp(t_star, result["t"], result["R"])),
+            "MTTF": float(result["MTTF"]) if result["MTTF"] is not None else np.nan,
+            "MTTF_error": float(result["MTTF_error"] or 0.0),
+            "error": "",
+        }
+    except Exception as e:
+        row = {"R_t_star": np.nan, "MTTF": np.nan, "MTTF_error": np.nan, "error": f"{type(e).__name__}: {e}"}
+    row["runtime_sec"] = time.perf_counter() - start
+    return index, row
+
+
+def _evaluate_chunk(chunk):
+    return [_evaluate(i, values) for i, values in chunk]
+
+
+def run_sweep(model, factors, method="grid", n=None, t_max=1000.0, t_star=None,
+              seed=42, options=None, workers=None, mp_context=None, progress=None):
+    """
+    Faktör uzayını tarar; her nokta için R(t*) ve MTTF. workers=1 iken
+    süreç açılmaz (aynı süreçte, aynı önbellekle). Sonuç sütunlu bir
+    sözlük: faktör sütunları + METRICS + "error". mp_context: çok iş
+    parçacıklı süreçlerden (GUI) çağrılırken "spawn".
+    """
+    validate_factors(factors, model.components)
+    points = design_points(factors, method=method, n=n, seed=seed)
+    settings = {"t_max": float(t_max), "t_star": t_star, "options": dict(options or {})}
+    init_args = (model.to_dict(), model.ccf_beta, factors, settings)
+
+    start = time.perf_counter()
+    rows = [None] * len(points)
+    indexed = list(enumerate(points.tolist()))
+    workers = workers or os.cpu_count() or 1
+
+    def done(k):
+        if progress is not None:
+            progress(f"{k}/{len(points)} nokta", k / len(points))
+
+    if workers == 1 or len(points) == 1:
+        _init_worker(*init_args)
+        for k, (i, values) in enumerate(indexed, 1):
+            rows[i] = _evaluate(i, values)[1]
+            done(k)
+    else:
+        # Parçalar küçük tutulur: ilerleme/iptal sık, süreçler dengeli
+        size = max(1, len(points) // (workers * 8))
+        chunks = [indexed[i:i + size] for i in range(0, len(indexed), size)]
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        pool = ProcessPoolExecutor(
+            max_workers=workers, mp_context=mp_context,
+            initializer=_init_worker, initargs=init_args
+        )
+        try:
+            futures = [pool.submit(_evaluate_chunk, chunk) for chunk in chunks]
+            k = 0
+            for future in as_completed(futures):
+                for i, row in future.result():
+                    rows[i] = row
+                    k += 1
+                done(k)
+        except (Cancelled, BrokenProcessPool):
+            for future in futures:
+                future.cancel()
+            raise
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    dataset = {
+        "factors": [f["target"] for f in factors],
+        "scales": {f["target"]: f["scale"] for f in factors},
+        "columns": {f["target"]: points[:, j] for j, f in enumerate(factors)},
+        "method": method,
+        "t_max": float(t_max),
+        "t_star": t_star,
+        "runtime_sec": time.perf_counter() - start,
+    }
+    for metric in METRICS:
+        dataset["columns"][metric] = np.array([r[metric] for r in rows], dtype=float)
+    dataset["columns"]["error"] = np.array([r["error"] for r in rows])
+
+    failed = int(np.count_nonzero(dataset["columns"]["error"] != ""))
+    if failed:
+        print(f"[WARN] {failed}/{len(points)} noktada analiz başarısız (error sütunu).")
+    return dataset
+
+
+# =========================================================
+# 4) Sütunlu veri kümesi (.npz): sütun başına bir dizi + meta
+# =========================================================
+def save_dataset(dataset, path):
+    meta = {k: v for k, v in dataset.items() if k != "columns"}
+    arrays = {f"col:{name}": values for name, values in dataset["columns"].items()}
+    np.savez_compressed(path, __meta__=np.array(json.dumps(meta)), **arrays)
+    return path
+
+
+def load_dataset(path):
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["__meta__"]))
+        meta["columns"] = {k[4:]: data[k] for k in data.files if k.startswith("col:")}
+    return meta
+
+
+def to_frame(dataset):
+    import pandas as pd
+    return pd.DataFrame(dataset["columns"])
+
+
+# =========================================================
+# 5) Görünümler: iki faktör üzerinde R(t*) / MTTF
+#    Izgara tasarımında hücreler doğrudan; LHS / rastgelede
+#    üçgenleme ile (tricontourf). Diğer faktörler ortalanır.
+# =========================================================
+def _pivot(dataset, x, y, metric):
+    cols = dataset["columns"]
+    xs, ys, zs = cols[x], cols[y], cols[metric]
+    ux, uy = np.unique(xs), np.unique(ys)
+    if dataset["method"] != "grid" or ux.size * uy.size > xs.size:
+        return None
+    Z = np.full((uy.size, ux.size), np.nan)
+    for i, yv in enumerate(uy):
+        for j, xv in enumerate(ux):
+            mask = (xs == xv) & (ys == yv) & np.isfinite(zs)
+            if mask.any():
+                Z[i, j] = zs[mask].mean()
+    return ux, uy, Z
+
+
+def _metric_label(dataset, metric):
+    if metric == "R_t_star":
+        t_star = dataset.get("t_star")
+        return f"R(t* = {t_star:g})" if t_star is not None else "R(t_max)"
+    return metric
+
+
+def plot_sweep_heatmap(dataset, x, y, metric="MTTF", title=None):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(7, 5.5))
+    label = _metric_label(dataset, metric)
+    grid = _pivot(dataset, x, y, metric)
+    if grid is not None:
+        ux, uy, Z = grid
+        mesh = ax.pcolormesh(ux, uy, Z, shading="nearest", cmap="viridis")
+    else:
+        cols = dataset["columns"]
+        mesh = ax.scatter(cols[x], cols[y], c=cols[metric], cmap="viridis", s=28)
+    fig.colorbar(mesh, ax=ax, label=label)
+    _log_axes(ax, dataset, x, y)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title(title or f"{label} — {x} × {y}")
+    fig.tight_layout()
+    plt.show()
+
+
+def plot_sweep_contour(dataset, x, y, metric="MTTF", levels=12, title=None):
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(7, 5.5))
+    label = _metric_label(dataset, metric)
+    grid = _pivot(dataset, x, y, metric)
+    if grid is not None:
+        ux, uy, Z = grid
+        filled = ax.contourf(ux, uy, Z, levels=levels, cmap="viridis")
+        lines = ax.contour(ux, uy, Z, levels=levels, colors="k", linewidths=0.5)
+    else:
+        cols = dataset["columns"]
+        ok = np.isfinite(cols[metric])
+        filled = ax.tricontourf(cols[x][ok], cols[y][ok], cols[metric][ok], levels=levels, cmap="viridis")
+        lines = ax.tricontour(cols[x][ok], cols[y][ok], cols[metric][ok], levels=levels, colors="k", linewidths=0.5)
+    ax.clabel(lines, fontsize=7, fmt="%.3g")
+    fig.colorbar(filled, ax=ax, label=label)
+    _log_axes(ax, dataset, x, y)
+    ax.set_xlabel(x)
+    ax.set_ylabel(y)
+    ax.set_title(title or f"{label} eş-değer eğrileri — {x} × {y}")
+    fig.tight_layout()
+    plt.show()
+
+
+def plot_sweep_curve(dataset, x, metric="MTTF", title=None):
+    # Tek faktörlü tarama: metrik – faktör
+    import matplotlib.pyplot as plt
+
+    cols = dataset["columns"]
+    order = np.argsort(cols[x])
+    fig, ax = plt.subplots(figsize=(7, 4.5))
+    ax.plot(cols[x][order], cols[metric][order], "o-", ms=3)
+    _log_axes(ax, dataset, x, None)
+    ax.set_xlabel(x)
+    ax.set_ylabel(_metric_label(dataset, metric))
+    ax.set_title(title or f"{_metric_label(dataset, metric)} — {x}")
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    plt.show()
+
+
+def _log_axes(ax, dataset, x, y):
+    # Log ölçekli faktörler eksende de log
+    scales = dataset.get("scales", {})
+    if scales.get(x) == "log":
+        ax.set_xscale("log")
+    if y is not None and scales.get(y) == "log":
+        ax.set_yscale("log")
+
+
+# =========================================================
+# 6) Komut satırı
+#    python sweep.py model.json -p a3.lambda=1e-4:1e-2:log \
+#        -p a5.eta=500:2000 --method grid --levels 9 --out tarama.npz --plot
+# =========================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Bileşen parametreleri ve t_max üzerinde tarama / deney tasarımı (R(t*), MTTF)."
+    )
+    parser.add_argument("model", help="Model JSON dosyası")
+    parser.add_argument("-p", "--param", action="append", required=True,
+                        help="Faktör: bileşen.parametre=alt:üst[:log][:düzey] ya da t_max=alt:üst")
+    parser.add_argument("--method", choices=tuple(SWEEP_METHODS), default="grid")
+    parser.add_argument("--levels", type=int, default=5, help="Izgara düzey sayısı (faktör başına)")
+    parser.add_argument("-n", "--n-points", type=int, default=None, help="LHS / rastgele nokta sayısı")
+    parser.add_argument("--t-max", type=float, default=1000.0)
+    parser.add_argument("--t-star", type=float, default=None, help="R(t*) anı (varsayılan: noktanın t_max'ı)")
+    parser.add_argument("--grid-tol", type=float, default=None)
+    parser.add_argument("--ccf-beta", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--out", default="sweep.npz", help="Sütunlu çıktı (.npz)")
+    parser.add_argument("--csv", default=None, help="Ayrıca CSV olarak yaz")
+    parser.add_argument("--plot", action="store_true", help="Isı haritası ve eş-değer eğrilerini göster")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        model = Model.from_json(args.model, ccf_beta=args.ccf_beta)
+        factors = [parse_factor(spec, levels=args.levels) for spec in args.param]
+        dataset = run_sweep(
+            model, factors, method=args.method, n=args.n_points, t_max=args.t_max,
+            t_star=args.t_star, seed=args.seed, options={"grid_tol": args.grid_tol},
+            workers=args.workers,
+            progress=lambda message, fraction: print(f"\r[{fraction:6.1%}] {message}", end="", flush=True)
+        )
+        print()
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] {e}")
+        return 2
+
+    save_dataset(dataset, args.out)
+    if args.csv:
+        to_frame(dataset).to_csv(args.csv, index=False)
+    print(f"[INFO] {len(dataset['columns']['MTTF'])} nokta, {dataset['runtime_sec']:.2f} s -> {args.out}")
+
+    if args.plot:
+        names = dataset["factors"]
+        for metric in ("R_t_star", "MTTF"):
+            if len(names) == 1:
+                plot_sweep_curve(dataset, names[0], metric)
+            else:
+                plot_sweep_heatmap(dataset, names[0], names[1], metric)
+                plot_sweep_contour(dataset, names[0], names[1], metric)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+from itertools import product
+from math import comb
+
+import numpy as np
+
+from analytic import component_descriptor, path_bitmasks, union_coefficients, _mask_rows
+from cut_sets import eliminate_supersets
+
+
+# =========================================================
+# 1) Etiketler: bileşen -> tanımlayıcı (dağılım + parametre),
+#    atom (alt ağaç) -> kanonik biçim. Aynı etiket = aynı R(t).
+# =========================================================
+def component_labels(components):
+    return {c: "C" + repr(component_descriptor(data)) for c, data in components.items()}
+
+
+def _element_labels(node, labels, forms):
+    return {
+        e: canonical_form(node["atoms"][e], labels, forms) if e in node["atoms"] else labels[e]
+        for e in frozenset().union(*node["paths"])
+    }
+
+
+# =========================================================
+# 2) Renk iyileştirme (Weisfeiler–Lehman benzeri) ile kanonik biçim
+#    Renk = (etiket, içinde bulunduğu kümelerdeki diğer renklerin
+#    çoklu kümesi); sınıf sayısı artmayana kadar tekrarlanır.
+#    Biçim aileyi (etiket, renk, sınıf içi sıra) ile yeniden yazar:
+#    eşit biçim -> etiket koruyan bir eşleme vardır -> aynı R(t)
+#    (güvenli; renk sınıfı simetrik değilse bazı eşler kaçabilir).
+# =========================================================
+def _refine(family, labels):
+    ranks = {s: i for i, s in enumerate(sorted(set(labels.values())))}
+    colour = {e: ranks[labels[e]] for e in labels}
+
+    while True:
+        sig = {
+            e: (colour[e], tuple(sorted(
+                tuple(sorted(colour[x] for x in s if x != e))
+                for s in family if e in s
+            )))
+            for e in colour
+        }
+        ranks = {s: i for i, s in enumerate(sorted(set(sig.values())))}
+        refined = {e: ranks[sig[e]] for e in colour}
+        if len(set(refined.values())) == len(set(colour.values())):
+            return refined
+        colour = refined
+
+
+def canonical_form(node, labels, forms=None):
+    forms = {} if forms is None else forms
+    if id(node) in forms:
+        return forms[id(node)]
+
+    if node["type"] == "component":
+        form = labels[node["name"]]
+    elif node["type"] in ("series", "parallel"):
+        form = node["type"] + "(" + ",".join(
+            sorted(canonical_form(ch, labels, forms) for ch in node["children"])
+        ) + ")"
+    else:
+        elem = _element_labels(node, labels, forms)
+        colour = _refine(node["paths"], elem)
+        rank, seen = {}, {}
+        for e in sorted(elem, key=lambda e: (colour[e], e)):
+            rank[e] = seen.get(colour[e], 0)
+            seen[colour[e]] = rank[e] + 1
+        form = "module(" + repr(sorted(
+            tuple(sorted((colour[e], elem[e], rank[e]) for e in s))
+            for s in node["paths"]
+        )) + ")"
+
+    forms[id(node)] = form
+    return form
+
+
+# =========================================================
+# 3) Yer değiştirebilir eleman grupları
+#    a ile b aynı etiketli ve (a b) takası aileyi kendine eşliyorsa
+#    yer değiştirebilir; bu bağıntı geçişlidir ((a c) = (a b)(b c)(a b)),
+#    sınıfın bir temsilcisiyle karşılaştırmak yeterli. Adaylar
+#    (etiket, içinde bulunduğu küme boyutları) özetiyle kovalanır.
+# =========================================================
+def _swap_preserves(masks, mask_set, a, b):
+    both = (1 << a) | (1 << b)
+    for m in masks:
+        if ((m >> a) ^ (m >> b)) & 1 and (m ^ both) not in mask_set:
+            return False
+    return True
+
+
+def interchangeable_groups(family, labels):
+    names, masks = path_bitmasks(family)
+    mask_set = set(masks)
+
+    buckets = {}
+    for i, c in enumerate(names):
+        sizes = tuple(sorted(bin(m).count("1") for m in masks if (m >> i) & 1))
+        buckets.setdefault((labels[c], sizes), []).append(i)
+
+    groups = []
+    for bucket in buckets.values():
+        classes = []
+        for i in bucket:
+            for cls in classes:
+                if _swap_preserves(masks, mask_set, cls[0], i):
+                    cls.append(i)
+                    break
+            else:
+                classes.append([i])
+        groups += [[names[i] for i in cls] for cls in classes if len(cls) > 1]
+
+    return groups
+
+
+# =========================================================
+# 4) Ağaç üzerinde ön geçiş (yerinde işaretleme)
+#    seri / paralel düğüm: aynı kanonik biçimli çocuklar -> "classes"
+#      (bir kez hesaplanır, R^m ya da 1 − (1 − R)^m)
+#    modül: yer değiştirebilir gruplar -> "symmetry"
+#      (yalnız Π(m_g + 1) < 2^|aile| ise, yani kombinatorik sayım
+#       en kötü durum IE'den ucuzsa)
+# =========================================================
+def annotate_symmetry(tree, components):
+    labels = component_labels(components)
+    forms = {}
+    stats = {"collapsed_branches": 0, "groups": 0, "grouped_elements": 0}
+
+    def walk(node):
+        if node["type"] == "component":
+            return
+
+        if node["type"] in ("series", "parallel"):
+            for ch in node["children"]:
+                walk(ch)
+            by_form = {}
+            for i, ch in enumerate(node["children"]):
+                by_form.setdefault(canonical_form(ch, labels, forms), []).append(i)
+            node["classes"] = list(by_form.values())
+            stats["collapsed_branches"] += len(node["children"]) - len(by_form)
+            return
+
+        for sub in node["atoms"].values():
+            walk(sub)
+
+        family = node["paths"] if node["engine"] == "paths" else node["cuts"]
+        groups = interchangeable_groups(family, _element_labels(node, labels, forms))
+        configs = int(np.prod([len(g) + 1 for g in groups])) if groups else 0
+
+        if groups and configs < 2 ** len(family):
+            node["symmetry"] = groups
+            stats["groups"] += len(groups)
+            stats["grouped_elements"] += sum(len(g) for g in groups)
+        else:
+            node.pop("symmetry", None)
+
+    walk(tree)
+    return stats
+
+
+# =========================================================
+# 5) Çokluk ağırlıklı birleşim olasılığı
+#    U = P(ailedeki en az bir kümenin tüm elemanları "açık"),
+#    x: (n, T) açık olma olasılıkları (yol ailesinde R, kesimde Q).
+#    Grup g'de tam j_g eleman açıkken değer, hangi j_g elemanın açık
+#    olduğundan bağımsızdır (simetri) ->
+#      U = Σ_{j} Π_g C(m_g, j_g) p_g^{j_g} (1 − p_g)^{m_g − j_g} · U(j)
+#    U(j): ilk j_g eleman açık, kalanlar kapalı sabitlenmiş, indirgenmiş
+#    (minimal) ailenin IE'si; aynı indirgenmiş aileler bir kez açılır.
+#    progress(done, total): işlenen j konfigürasyonu (iptal noktası)
+# =========================================================
+def symmetric_union(family, x, groups, progress=None):
+    names, masks = path_bitmasks(family)
+    index = {c: i for i, c in enumerate(names)}
+    x = np.clip(np.asarray(x, dtype=float), 0.0, 1.0)
+    log_x = np.log(np.clip(x, 1e-300, None))
+
+    members = [[index[c] for c in g] for g in groups]
+    coef_cache = {}
+    n_terms = 0
+    U = np.zeros(x.shape[1:])
+    n_configs = int(np.prod([len(g) + 1 for g in members]))
+
+    for done, counts in enumerate(product(*(range(len(g) + 1) for g in members))):
+        if progress is not None:
+            progress(done, n_configs)
+        weight = np.ones(x.shape[1:])
+        on = off = 0
+        for g, j in zip(members, counts):
+            p = x[g[0]]
+            weight = weight * comb(len(g), j) * p ** j * (1.0 - p) ** (len(g) - j)
+            for r, i in enumerate(g):
+                if r < j:
+                    on |= 1 << i
+                else:
+                    off |= 1 << i
+
+        reduced = [m & ~on for m in masks if not m & off]
+        if not reduced:
+            continue
+        if 0 in reduced:
+            U += weight
+            continue
+
+        key = tuple(eliminate_supersets(reduced))
+        if key not in coef_cache:
+            coefs = union_coefficients(
+                list(key), progress=None if progress is None else (lambda *_: progress(done, n_configs))
+            )
+            M = np.zeros((len(coefs), len(names)))
+            for r, mask in enumerate(coefs):
+                M[r, _mask_rows(mask, len(names))] = 1.0
+            coef_cache[key] = (np.array(list(coefs.values()), dtype=float), M)
+
+        c, M = coef_cache[key]
+        n_terms += len(c)
+        U += weight * (c @ np.exp(M @ log_x))
+
+    return np.clip(U, 0.0, 1.0), n_terms
@@ -0,0 +1,122 @@
+import numpy as np
+
+
+# =========================================================
+# 1) Başlangıç gridi
+#    Kaba lineer grid + (opsiyonel) erken zaman için log aralıklı
+#    noktalar. t = 0 kullanılmaz (log-güvenli), t_min'den başlar.
+# =========================================================
+def initial_time_grid(t_max, t_min=1e-6, n_linear=32, n_log=16, log_early=True):
+    t_lin = np.linspace(t_min, t_max, n_linear)
+
+    if log_early and n_log > 0:
+        t_early_end = t_max / max(n_linear - 1, 1)
+        if t_early_end > t_min:
+            t_log = np.geomspace(t_min, t_early_end, n_log)
+            t_lin = np.concatenate([t_lin, t_log])
+
+    return np.unique(t_lin)
+
+
+# =========================================================
+# 2) Hata kontrollü adaptif grid
+#    Her aralığın orta noktasında R(t) hesaplanır; lineer
+#    interpolasyon hatası |R(m) - (R(a)+R(b))/2| tol'u geçerse
+#    orta nokta grid'e eklenir. R'nin 0.9 / 0.1 seviyelerini kestiği
+#    aralıklar (t90 / t10 bölgeleri) daha sıkı tol·crossing_factor
+#    ile incelir. Düz bölgelerde kaba grid olduğu gibi kalır.
+#
+#    curve_fn(t_array) -> R(t_array)   (vektörel)
+#    Dönüş: (t_grid, R(t_grid))
+# =========================================================
+def adaptive_time_grid(
+    curve_fn,
+    t_max,
+    tol=1e-4,
+    t_min=1e-6,
+    n_linear=32,
+    n_log=16,
+    log_early=True,
+    levels=(0.9, 0.1),
+    crossing_factor=0.1,
+    max_points=4000,
+    max_iter=40
+):
+    t = initial_time_grid(t_max, t_min=t_min, n_linear=n_linear, n_log=n_log, log_early=log_early)
+    R = np.asarray(curve_fn(t), dtype=float)
+
+    for _ in range(max_iter):
+        if t.size >= max_points:
+            print(f"[WARN] adaptive_time_grid: nokta sınırına ulaşıldı ({max_points}).")
+            break
+
+        mid = 0.5 * (t[:-1] + t[1:])
+        R_mid = np.asarray(curve_fn(mid), dtype=float)
+        err = np.abs(R_mid - 0.5 * (R[:-1] + R[1:]))
+
+        refine = err > tol
+        for level in levels:
+            crosses = (R[:-1] - level) * (R[1:] - level) <= 0
+            refine |= crosses & (err > tol * crossing_factor)
+
+        # çok dar aralıkları bölmeye devam etme
+        refine &= np.diff(t) > 1e-12 * max(t_max, 1.0)
+
+        if not np.any(refine):
+            break
+
+        budget = max_points - t.size
+        idx = np.flatnonzero(refine)
+        if idx.size > budget:
+            idx = idx[np.argsort(err[idx])[::-1][:budget]]
+
+        t = np.concatenate([t, mid[idx]])
+        R = np.concatenate([R, R_mid[idx]])
+        order = np.argsort(t)
+        t = t[order]
+        R = R[order]
+
+    return t, R
+
+
+# =========================================================
+# 3) Uniform olmayan grid için trapez ağırlıkları
+#    Σ w_i f(t_i) ≈ ∫ f dt
+# =========================================================
+def trapezoid_weights(t):
+    t = np.asarray(t, dtype=float)
+    w = np.zeros_like(t)
+
+    if t.size < 2:
+        return w
+
+    dt = np.diff(t)
+    w[:-1] += 0.5 * dt
+    w[1:] += 0.5 * dt
+    return w
+
+
+# =========================================================
+# 4) R(t) eğrisinin bir seviyeyi ilk kestiği an (lineer interpolasyon)
+#    t90 / t10 gibi kritik anlar; hiç kesmiyorsa None
+# =========================================================
+def find_crossing_time(t, R, level):
+    t = np.asarray(t, dtype=float)
+    R = np.asarray(R, dtype=float)
+
+    mask = np.isfinite(t) & np.isfinite(R)
+    t = t[mask]
+    R = R[mask]
+
+    if np.all(R > level):
+        return None
+
+    k = np.argmax(R <= level)
+
+    if k == 0:
+        return t[0]
+
+    t1, t2 = t[k-1], t[k]
+    r1, r2 = R[k-1], R[k]
+
+    return t1 + (level - r1) * (t2 - t1) / (r2 - r1)
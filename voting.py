@@ -0,0 +1,84 @@
+import numpy as np
+
+VOTING_DIST = "k-out-of-n"
+
+
+# =========================================================
+# 1) k-out-of-n oylama kapısı (model düğümü)
+#    components[name] = {
+#        "dist": "k-out-of-n",
+#        "k": 3,
+#        "members": {"p1": {...bileşen verisi...}, "p2": {...}, ...}
+#    }
+#    Üyeler farklı dağılımlarda olabilir (heterojen); grafikte kapı
+#    tek bir bileşen gibi görünür -> C(n, k) yol üretilmez.
+# =========================================================
+def is_voting(data):
+    return data.get("dist") == VOTING_DIST
+
+
+def make_voting_gate(k, members):
+    members = dict(members)
+    n = len(members)
+
+    if n == 0:
+        raise ValueError("k-out-of-n kapısı için en az bir üye gerekli.")
+    if not (1 <= int(k) <= n):
+        raise ValueError(f"k değeri 1 ile {n} arasında olmalı, {k} verildi.")
+
+    return {"dist": VOTING_DIST, "k": int(k), "members": members}
+
+
+# =========================================================
+# 2) Poisson-binomial DP:  P(en az k üye çalışıyor)
+#    member_curves: (n, ...) üye R değerleri (zaman gridi ya da
+#    herhangi bir şekil). Durum: tam j çalışan (j < k) + "≥ k" yutucu
+#    durum. Maliyet O(n · k) grid noktası başına.
+# =========================================================
+def at_least_k_survival(member_curves, k):
+    member_curves = np.clip(np.asarray(member_curves, dtype=float), 0.0, 1.0)
+    n = member_curves.shape[0]
+    shape = member_curves.shape[1:]
+
+    if k <= 0:
+        return np.ones(shape)
+    if k > n:
+        return np.zeros(shape)
+
+    exact = np.zeros((k,) + shape)
+    exact[0] = 1.0
+    at_least = np.zeros(shape)
+
+    for p in member_curves:
+        at_least += exact[k - 1] * p
+        exact[1:] = exact[1:] * (1.0 - p) + exact[:-1] * p
+        exact[0] *= 1.0 - p
+
+    return at_least
+
+
+# =========================================================
+# 3) Üye Birnbaum önemi: ∂R_kapı/∂R_m = P(diğerlerinden tam k−1'i çalışıyor)
+#    (duyarlılıkta zincir kuralı için)
+# =========================================================
+def member_birnbaum(member_curves, k):
+    member_curves = np.clip(np.asarray(member_curves, dtype=float), 0.0, 1.0)
+    n = member_curves.shape[0]
+    out = np.zeros_like(member_curves)
+
+    for m in range(n):
+        others = np.delete(member_curves, m, axis=0)
+        # P(≥ k−1) − P(≥ k) = P(tam k−1)
+        out[m] = at_least_k_survival(others, k - 1) - at_least_k_survival(others, k)
+
+    return out
+
+
+# =========================================================
+# 4) Monte Carlo: kapı ömrü = üye ömürlerinin k'ıncı en büyüğü
+#    lifetimes: (..., n) -> (...)   (np.partition, sıralamasız)
+# =========================================================
+def kth_largest(lifetimes, k):
+    lifetimes = np.asarray(lifetimes, dtype=float)
+    n = lifetimes.shape[-1]
+    return np.partition(lifetimes, n - k, axis=-1)[..., n - k]